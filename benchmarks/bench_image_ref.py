@@ -0,0 +1,62 @@
+"""이미지 레퍼런스 파서 마이크로 벤치마크.
+
+100,000개 레퍼런스를 파싱해 레퍼런스당 비용을 측정합니다. 캐시 없는 파싱
+(최초 등장)과 캐시 적중(차트 렌더링처럼 같은 이미지가 반복 등장)을 나눠
+출력합니다.
+
+사용법:
+    python benchmarks/bench_image_ref.py [개수]
+"""
+
+import random
+import sys
+import time
+from typing import Callable, List
+
+from cli_onprem.services.docker import normalize_image_name
+from cli_onprem.utils.image_ref import parse_image_ref
+
+TEMPLATES = [
+    "nginx",
+    "nginx:{n}",
+    "bitnami/redis:{n}",
+    "docker.io/library/postgres:{n}",
+    "ghcr.io/org/team/app-{n}:v1.{n}",
+    "registry.example.com:5000/platform/svc-{n}:1.0",
+    "localhost:5000/app-{n}",
+    "quay.io/prometheus/node-exporter@sha256:{digest}",
+]
+
+
+def make_references(count: int, unique: int) -> List[str]:
+    """unique개의 서로 다른 레퍼런스를 섞어 count개를 만듭니다."""
+    rng = random.Random(0)
+    pool = [
+        rng.choice(TEMPLATES).format(n=i, digest=f"{i:064x}") for i in range(unique)
+    ]
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def measure(label: str, func: Callable[[str], object], references: List[str]) -> None:
+    started = time.perf_counter()
+    for reference in references:
+        func(reference)
+    elapsed = time.perf_counter() - started
+    per_ref = elapsed / len(references) * 1e6
+    print(f"{label:<28} {elapsed * 1000:8.1f} ms  {per_ref:6.2f} µs/ref")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    unique_refs = make_references(count, count)
+    repeated_refs = make_references(count, 500)
+
+    print(f"레퍼런스 {count:,}개")
+    measure("파싱 (캐시 없음)", parse_image_ref.__wrapped__, unique_refs)
+    parse_image_ref.cache_clear()
+    measure("파싱 (500종 반복, 캐시)", parse_image_ref, repeated_refs)
+    measure("정규화 (500종 반복, 캐시)", normalize_image_name, repeated_refs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""명령어별 CLI 콜드 스타트 벤치마크.
+
+명령어마다 새 파이썬 프로세스를 `-X importtime`으로 실행해 벽시계 시간과
+import 누적 시간, 불러온 모듈 수를 측정합니다. boto3처럼 특정 명령어에서만
+필요한 무거운 모듈이 다른 명령어에서 불러와지는지도 함께 표시합니다.
+
+사용법:
+    python benchmarks/bench_startup.py [반복 횟수]
+"""
+
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# 프로그램 이름을 cli-onprem으로 고정해야 자동완성 환경 변수가 맞음
+LAUNCHER = (
+    "import sys; sys.argv[0] = 'cli-onprem'; "
+    "from cli_onprem.__main__ import main_cli; main_cli()"
+)
+
+CASES: List[Tuple[str, List[str], Dict[str, str]]] = [
+    ("--version", ["--version"], {}),
+    ("--help", ["--help"], {}),
+    ("docker-tar --help", ["docker-tar", "--help"], {}),
+    ("helm-local --help", ["helm-local", "--help"], {}),
+    ("tar-fat32 --help", ["tar-fat32", "--help"], {}),
+    ("s3-share --help", ["s3-share", "--help"], {}),
+    (
+        "자동완성 (명령어 이름)",
+        [],
+        {
+            "_CLI_ONPREM_COMPLETE": "complete_bash",
+            "COMP_WORDS": "cli-onprem d",
+            "COMP_CWORD": "1",
+        },
+    ),
+]
+
+HEAVY_MODULES = ("boto3", "botocore", "yaml")
+
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def run_once(args: List[str], env: Dict[str, str]) -> Tuple[float, float, List[str]]:
+    """(벽시계 ms, 최상위 import 누적 ms, 불러온 모듈 목록)을 반환합니다."""
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", LAUNCHER, *args],
+        capture_output=True,
+        text=True,
+        env={**os.environ, **env},
+        check=False,
+    )
+    wall = (time.perf_counter() - started) * 1000
+
+    imported = 0
+    modules = []
+    for line in completed.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if not match:
+            continue
+        modules.append(match.group(4))
+        # 들여쓰기가 한 칸인 항목이 최상위 import
+        if len(match.group(3)) == 1:
+            imported += int(match.group(2))
+    return wall, imported / 1000, modules
+
+
+def main() -> None:
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    print(f"반복 {repeat}회 (중앙값)")
+    print(f"{'명령어':<24} {'전체':>9} {'import':>9} {'모듈':>6}  무거운 모듈")
+    for label, args, env in CASES:
+        walls = []
+        imports = []
+        modules: List[str] = []
+        for _ in range(repeat):
+            wall, imported, modules = run_once(args, env)
+            walls.append(wall)
+            imports.append(imported)
+        heavy = ", ".join(name for name in HEAVY_MODULES if name in modules) or "-"
+        print(
+            f"{label:<24} {statistics.median(walls):7.1f}ms "
+            f"{statistics.median(imports):7.1f}ms {len(modules):6d}  {heavy}"
+        )
+
+
+if __name__ == "__main__":
+    main()
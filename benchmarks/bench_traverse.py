@@ -0,0 +1,90 @@
+"""매니페스트 순회 벤치마크.
+
+대표적인 차트 렌더링 결과(워크로드, 서비스/ConfigMap, 큰 CRD 스키마)를
+만들어 전체 탐색과 빠른 모드(워크로드 컨테이너 경로만 탐색)의 순회 시간을
+비교합니다. YAML 파싱 시간은 제외합니다.
+
+사용법:
+    python benchmarks/bench_traverse.py [차트 서비스 수]
+"""
+
+import sys
+import time
+from typing import Any, Dict, List, Set
+
+from cli_onprem.services.docker import collect_images_from_document
+
+
+def workload(n: int) -> Dict[str, Any]:
+    container = {
+        "name": "app",
+        "image": f"registry.example.com/platform/svc-{n}:1.0",
+        "env": [{"name": f"VAR_{i}", "value": str(i)} for i in range(30)],
+        "resources": {"limits": {"cpu": "1", "memory": "1Gi"}},
+        "volumeMounts": [{"name": f"v{i}", "mountPath": f"/m/{i}"} for i in range(10)],
+    }
+    return {
+        "kind": "Deployment",
+        "metadata": {"name": f"svc-{n}", "labels": {f"l{i}": "x" for i in range(10)}},
+        "spec": {
+            "template": {
+                "metadata": {"annotations": {f"a{i}": "x" for i in range(10)}},
+                "spec": {
+                    "initContainers": [dict(container, name="init")],
+                    "containers": [container, dict(container, name="proxy")],
+                    "volumes": [{"name": f"v{i}", "emptyDir": {}} for i in range(10)],
+                },
+            }
+        },
+    }
+
+
+def crd_schema(depth: int, width: int) -> Dict[str, Any]:
+    node: Dict[str, Any] = {"type": "string"}
+    for level in range(depth):
+        node = {
+            "type": "object",
+            "properties": {f"field{level}_{i}": node for i in range(width)},
+        }
+    return {"kind": "CustomResourceDefinition", "spec": {"versions": [node]}}
+
+
+def make_render(services: int) -> List[Any]:
+    docs: List[Any] = []
+    for n in range(services):
+        docs.append(workload(n))
+        docs.append({"kind": "Service", "spec": {"ports": [{"port": 80}]}})
+        docs.append({"kind": "ConfigMap", "data": {f"k{i}": "v" for i in range(50)}})
+    docs.extend(crd_schema(depth=8, width=3) for _ in range(5))
+    return docs
+
+
+def measure(label: str, docs: List[Any], fast: bool, rounds: int = 5) -> Set[str]:
+    images: Set[str] = set()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        images = set()
+        for doc in docs:
+            collect_images_from_document(doc, images, fast)
+    elapsed = (time.perf_counter() - started) / rounds
+    print(f"{label:<10} {elapsed * 1000:8.1f} ms/렌더링  이미지 {len(images)}개")
+    return images
+
+
+def main() -> None:
+    services = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    docs = make_render(services)
+    print(f"문서 {len(docs):,}개 (서비스 {services}개 + CRD 5개)")
+
+    full = measure("전체 탐색", docs, fast=False)
+    fast = measure("빠른 모드", docs, fast=True)
+    assert full == fast
+
+    deep: Dict[str, Any] = {"image": "nginx"}
+    for _ in range(50_000):
+        deep = {"nested": [deep]}
+    measure("깊이 5만", [deep], fast=False, rounds=1)
+
+
+if __name__ == "__main__":
+    main()
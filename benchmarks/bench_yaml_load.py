@@ -0,0 +1,82 @@
+"""렌더링된 매니페스트 YAML 파싱 벤치마크.
+
+umbrella 차트의 helm template 출력과 비슷한 다중 문서 YAML을 만들어 순수
+Python SafeLoader와 libyaml CSafeLoader의 초당 처리 문서 수를 비교합니다.
+
+사용법:
+    python benchmarks/bench_yaml_load.py [문서 수]
+"""
+
+import sys
+import time
+from typing import Any, Type
+
+import yaml
+
+DOCUMENT = """\
+---
+# Source: umbrella/charts/svc-{n}/templates/deployment.yaml
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: svc-{n}
+  labels:
+    app.kubernetes.io/name: svc-{n}
+    app.kubernetes.io/instance: umbrella
+    helm.sh/chart: svc-{n}-1.2.3
+spec:
+  replicas: 2
+  selector:
+    matchLabels:
+      app.kubernetes.io/name: svc-{n}
+  template:
+    metadata:
+      annotations:
+        checksum/config: "{n:064x}"
+    spec:
+      containers:
+        - name: app
+          image: "registry.example.com/platform/svc-{n}:1.2.{n}"
+          imagePullPolicy: IfNotPresent
+          args: ["--port=8080", "--log-level=info"]
+          ports:
+            - containerPort: 8080
+              protocol: TCP
+          env:
+            - name: POD_NAME
+              valueFrom:
+                fieldRef:
+                  fieldPath: metadata.name
+          resources:
+            limits: {{cpu: 500m, memory: 512Mi}}
+            requests: {{cpu: 100m, memory: 128Mi}}
+        - name: proxy
+          image: docker.io/envoyproxy/envoy:v1.29.{n}
+"""
+
+
+def measure(label: str, loader: Type[Any], text: str, documents: int) -> float:
+    started = time.perf_counter()
+    parsed = sum(1 for doc in yaml.load_all(text, Loader=loader) if doc is not None)
+    elapsed = time.perf_counter() - started
+    assert parsed == documents
+    rate = documents / elapsed
+    print(f"{label:<16} {elapsed:7.2f} s  {rate:10,.0f} 문서/s")
+    return rate
+
+
+def main() -> None:
+    documents = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    text = "".join(DOCUMENT.format(n=n) for n in range(documents))
+    print(f"문서 {documents:,}개, {len(text) / 1024 / 1024:.1f} MB")
+
+    python_rate = measure("SafeLoader", yaml.SafeLoader, text, documents)
+    if not yaml.__with_libyaml__:
+        print("libyaml을 사용할 수 없어 CSafeLoader 측정을 건너뜁니다")
+        return
+    c_rate = measure("CSafeLoader", yaml.CSafeLoader, text, documents)
+    print(f"속도 향상: {c_rate / python_rate:.1f}배")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,40 @@
 """CLI-ONPREM 애플리케이션의 메인 진입점."""
 
-import importlib
 import sys
-from typing import Any, cast
+from typing import Any, Dict
 
 import typer
 from rich.console import Console
 
 from cli_onprem import __version__
+from cli_onprem.core.lazy_group import LazyCommandSpec, LazyTyperGroup
+
+# 하위 명령어 모듈은 호출될 때만 import (boto3 등 무거운 의존성 지연 로딩)
+LAZY_COMMANDS: Dict[str, LazyCommandSpec] = {
+    "docker-tar": {
+        "import_path": "cli_onprem.commands.docker_tar:app",
+        "help": "Docker 이미지를 tar 파일로 저장",
+    },
+    "tar-fat32": {
+        "import_path": "cli_onprem.commands.tar_fat32:app",
+        "help": "파일 압축과 분할 관리",
+    },
+    "helm-local": {
+        "import_path": "cli_onprem.commands.helm_local:app",
+        "help": "Helm 차트 관련 작업 수행",
+    },
+    "s3-share": {
+        "import_path": "cli_onprem.commands.s3_share:app",
+        "help": "S3 공유 관련 작업 수행",
+    },
+}
+
+
+class CLIGroup(LazyTyperGroup):
+    """cli-onprem 최상위 명령어 그룹."""
+
+    lazy_commands = LAZY_COMMANDS
 
-# from cli_onprem.commands import docker_tar, tar_fat32, helm, s3_share
 
 context_settings = {
     "ignore_unknown_options": True,  # Always allow unknown options
@@ -23,24 +48,12 @@ app = typer.Typer(
     context_settings=context_settings,
     no_args_is_help=True,
     invoke_without_command=True,
+    cls=CLIGroup,
 )
 
 console = Console()
 
 
-def get_command(import_path: str) -> typer.Typer:
-    """지정된 경로에서 명령어 모듈을 로드합니다."""
-    module_path, attr_name = import_path.split(":")
-    module = importlib.import_module(module_path)
-    return cast(typer.Typer, getattr(module, attr_name))
-
-
-app.add_typer(get_command("cli_onprem.commands.docker_tar:app"), name="docker-tar")
-app.add_typer(get_command("cli_onprem.commands.tar_fat32:app"), name="tar-fat32")
-app.add_typer(get_command("cli_onprem.commands.helm_local:app"), name="helm-local")
-app.add_typer(get_command("cli_onprem.commands.s3_share:app"), name="s3-share")
-
-
 @app.callback()
 def main(
     ctx: typer.Context,
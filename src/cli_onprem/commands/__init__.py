@@ -1,5 +1,6 @@
-"""Command modules for CLI-ONPREM."""
+"""Command modules for CLI-ONPREM.
 
-from . import docker_tar, helm_local, s3_share, tar_fat32
+각 모듈은 `cli_onprem.__main__`의 지연 로딩 그룹이 필요할 때 import 합니다.
+"""
 
 __all__ = ["docker_tar", "tar_fat32", "helm_local", "s3_share"]
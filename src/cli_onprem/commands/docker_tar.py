@@ -1,7 +1,10 @@
 """CLI-ONPREM을 위한 Docker 이미지 tar 명령어."""
 
+import sys
+import time
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, NoReturn, Optional, Set, Tuple
 
 import typer
 from rich.console import Console
@@ -10,16 +13,28 @@ from typing_extensions import Annotated
 
 from cli_onprem.core.errors import CommandError, DependencyError
 from cli_onprem.core.logging import get_logger, init_logging, set_log_level
+from cli_onprem.services import image_archive
+from cli_onprem.services.blob_cache import BlobCache
 from cli_onprem.services.docker import (
     check_docker_daemon,
     check_docker_installed,
     generate_tar_filename,
-    list_local_images,
+    load_image,
     parse_image_reference,
     pull_image,
+    pull_platforms,
     save_image,
     save_image_to_stdout,
 )
+from cli_onprem.services.image_index import ImageIndex
+from cli_onprem.services.pipeline import format_stage_stats, run_two_stage
+from cli_onprem.services.pull_scheduler import PullScheduler
+from cli_onprem.services.registry import export_image
+from cli_onprem.utils.progress import (
+    TransferReporter,
+    append_jsonl,
+    format_transfer_report,
+)
 from cli_onprem.utils.shell import check_command_exists
 
 context_settings = {
@@ -32,6 +47,7 @@ app = typer.Typer(
     context_settings=context_settings,
 )
 console = Console()
+err_console = Console(stderr=True)
 logger = get_logger("commands.docker_tar")
 
 
@@ -46,30 +62,20 @@ def _check_docker_cli() -> None:
 
 
 def complete_docker_reference(incomplete: str) -> List[str]:
-    """도커 이미지 레퍼런스 자동완성: 로컬에 있는 이미지 제안"""
+    """도커 이미지 레퍼런스 자동완성: 로컬에 있는 이미지 제안
+
+    정렬된 로컬 이미지 색인에서 접두사로 찾으며, 색인은 이미지 목록이 바뀐
+    경우에만 다시 만듭니다. 레지스트리를 포함한 입력도 같은 접두사 검색으로
+    처리됩니다.
+    """
     if not check_command_exists("docker"):
         return []
 
     try:
-        all_images = list_local_images()
+        return ImageIndex().complete(incomplete)
     except CommandError:
         return []
 
-    registry_filter = None
-    if "/" in incomplete:
-        parts = incomplete.split("/", 1)
-        if "." in parts[0] or ":" in parts[0]:  # 레지스트리로 판단
-            registry_filter = parts[0]
-
-    filtered_images = [img for img in all_images if img.startswith(incomplete)]
-
-    if registry_filter:
-        filtered_images = [
-            img for img in filtered_images if img.startswith(registry_filter)
-        ]
-
-    return filtered_images
-
 
 REFERENCE_ARG = Annotated[
     str,
@@ -81,23 +87,31 @@ REFERENCE_ARG = Annotated[
 ]
 
 
-def _validate_arch(value: str) -> str:
+def _validate_arch(value: List[str]) -> List[str]:
     """`--arch` 옵션 값을 검증한다.
 
+    여러 번 지정하거나 쉼표로 구분하여 복수의 플랫폼을 받을 수 있다.
+
     Args:
-        value: 사용자가 입력한 플랫폼 문자열.
+        value: 사용자가 입력한 플랫폼 문자열 목록.
 
     Returns:
-        검증된 플랫폼 문자열.
+        중복을 제거한 검증된 플랫폼 목록 (입력 순서 유지).
 
     Raises:
         typer.BadParameter: 허용되지 않은 값이 입력된 경우.
     """
     allowed = {"linux/amd64", "linux/arm64"}
-    if value not in allowed:
-        msg = "linux/amd64 또는 linux/arm64만 지원합니다."
-        raise typer.BadParameter(msg)
-    return value
+    platforms: List[str] = []
+    for item in value:
+        for platform in item.split(","):
+            platform = platform.strip()
+            if platform not in allowed:
+                msg = "linux/amd64 또는 linux/arm64만 지원합니다."
+                raise typer.BadParameter(msg)
+            if platform not in platforms:
+                platforms.append(platform)
+    return platforms
 
 
 def complete_arch(incomplete: str) -> List[str]:
@@ -107,9 +121,9 @@ def complete_arch(incomplete: str) -> List[str]:
 
 
 ARCH_OPTION = typer.Option(
-    "linux/amd64",
+    ["linux/amd64"],
     "--arch",
-    help="추출 플랫폼 지정 (linux/amd64 또는 linux/arm64)",
+    help="추출 플랫폼 지정 (linux/amd64, linux/arm64, 여러 개 지정 시 병렬 pull)",
     callback=_validate_arch,
     autocompletion=complete_arch,
 )
@@ -128,6 +142,87 @@ DRY_RUN_OPTION = typer.Option(
     False, "--dry-run", help="실제 저장하지 않고 파일명만 출력"
 )
 VERBOSE_OPTION = typer.Option(False, "--verbose", "-v", help="DEBUG 로그 출력")
+KNOWN_LAYERS_OPTION = typer.Option(
+    [],
+    "--known-layers",
+    help="목적지에 이미 있는 레이어 목록 파일 (지정 시 누락 레이어만 저장)",
+)
+LAYERS_OUTPUT_OPTION = typer.Option(
+    None, "--output", "-o", help="레이어 목록 파일 경로 (미지정 시 표준 출력)"
+)
+RESTORE_FROM_OPTION = typer.Option(
+    ...,
+    "--from",
+    help="생략된 레이어를 가진 기존 docker save 아카이브 (여러 개 지정 가능)",
+)
+RESTORE_OUTPUT_OPTION = typer.Option(
+    ..., "--output", "-o", help="재구성할 완전한 아카이브 경로"
+)
+LOAD_OPTION = typer.Option(False, "--load", help="재구성 후 docker load로 이미지 적재")
+PROGRESS_OPTION = typer.Option(
+    None,
+    "--progress/--no-progress",
+    help="pull/save 진행률 표시 (기본: stderr가 터미널일 때)",
+    show_default=False,
+)
+REPORT_JSONL_OPTION = typer.Option(
+    None,
+    "--report-jsonl",
+    help="이미지별 pull/save 시간, 크기, MB/s 리포트를 JSON Lines로 추가 기록",
+)
+BATCH_FILE_OPTION = typer.Option(
+    None,
+    "--file",
+    "-i",
+    help="이미지 레퍼런스 목록 파일 (한 줄에 하나, '-'는 표준 입력)",
+)
+BATCH_ARCH_OPTION = typer.Option(
+    ["linux/amd64"],
+    "--arch",
+    help="추출 플랫폼 지정 (linux/amd64, linux/arm64)",
+    callback=_validate_arch,
+    autocompletion=complete_arch,
+)
+BATCH_DEST_OPTION = typer.Option(
+    None, "--destination", "-d", help="저장 디렉터리 (기본: 현재 디렉터리)"
+)
+WORKERS_OPTION = typer.Option(4, "--workers", min=1, help="동시 pull 작업자 수")
+REGISTRY_CONCURRENCY_OPTION = typer.Option(
+    2, "--registry-concurrency", min=1, help="레지스트리별 최대 동시 pull 수"
+)
+REGISTRY_RATE_OPTION = typer.Option(
+    1.0,
+    "--registry-rate",
+    min=0.0,
+    help="레지스트리별 초당 pull 시작 수 (0이면 무제한)",
+)
+MAX_RETRIES_OPTION = typer.Option(
+    4, "--max-retries", min=0, help="일시적 오류 시 이미지별 최대 재시도 횟수"
+)
+DAEMONLESS_OPTION = typer.Option(
+    False,
+    "--daemonless",
+    help="Docker 데몬 없이 레지스트리에서 직접 내려받아 아카이브 작성",
+)
+INSECURE_REGISTRY_OPTION = typer.Option(
+    False, "--insecure-registry", help="--daemonless 사용 시 HTTP 레지스트리 접속"
+)
+BLOB_CACHE_OPTION = typer.Option(
+    True,
+    "--blob-cache/--no-blob-cache",
+    help="--daemonless 사용 시 레이어 블롭 캐시(~/.cli-onprem/cache/blobs) 사용",
+)
+SAVE_WORKERS_OPTION = typer.Option(
+    1, "--save-workers", min=1, help="동시 docker save 작업자 수"
+)
+QUEUE_SIZE_OPTION = typer.Option(
+    2, "--queue-size", min=1, help="pull 완료 후 save를 기다릴 수 있는 이미지 수"
+)
+OCI_INDEX_OPTION = typer.Option(
+    False,
+    "--oci-index",
+    help="여러 플랫폼을 공유 레이어를 한 번만 담은 단일 OCI 인덱스 아카이브로 저장",
+)
 
 
 # 삭제 - 서비스 모듈로 이동
@@ -142,17 +237,37 @@ def save(
             autocompletion=complete_docker_reference,
         ),
     ],
-    arch: str = ARCH_OPTION,
+    arch: List[str] = ARCH_OPTION,
     destination: Optional[Path] = DEST_OPTION,
     stdout: bool = STDOUT_OPTION,
     force: bool = FORCE_OPTION,
     quiet: bool = QUIET_OPTION,
     dry_run: bool = DRY_RUN_OPTION,
     verbose: bool = VERBOSE_OPTION,
+    known_layers: List[Path] = KNOWN_LAYERS_OPTION,
+    oci_index: bool = OCI_INDEX_OPTION,
+    progress: Optional[bool] = PROGRESS_OPTION,
+    report_jsonl: Optional[Path] = REPORT_JSONL_OPTION,
+    daemonless: bool = DAEMONLESS_OPTION,
+    insecure_registry: bool = INSECURE_REGISTRY_OPTION,
+    blob_cache: bool = BLOB_CACHE_OPTION,
 ) -> None:
     """Docker 이미지를 tar 파일로 저장합니다.
 
     이미지 레퍼런스 구문: [<registry>/][<namespace>/]<image>[:<tag>]
+
+    --arch를 여러 번 지정하면 플랫폼별 이미지를 병렬로 pull한 뒤 플랫폼마다
+    별도 파일로 저장하며, --oci-index를 함께 주면 하나의 OCI 인덱스 아카이브로
+    저장합니다.
+
+    진행률(pull 레이어 수, save 처리량)은 stderr에 표시되며, 완료 후 이미지별
+    pull/save 시간과 크기, MB/s 리포트를 출력합니다 (--report-jsonl로 기록 가능).
+
+    --known-layers로 이전 내보내기의 레이어 목록을 지정하면 목적지에 없는
+    레이어만 담은 씬 아카이브를 생성합니다 (복원: docker-tar restore).
+
+    --daemonless는 Docker 데몬 없이 레지스트리에서 블롭을 직접 병렬로 내려받아
+    docker load 호환 아카이브를 작성합니다.
     """
     # 로깅 초기화
     init_logging()
@@ -162,15 +277,40 @@ def save(
     elif verbose:
         set_log_level("DEBUG")
 
-    _check_docker_cli()  # Docker CLI 의존성 확인
+    platforms = arch or ["linux/amd64"]
+    multi_platform = len(platforms) > 1
+
+    if known_layers and stdout:
+        _fail("--known-layers는 --stdout과 함께 사용할 수 없습니다")
+    if multi_platform and stdout:
+        _fail("--stdout은 단일 플랫폼에서만 사용할 수 있습니다")
+    if oci_index and known_layers:
+        _fail("--oci-index는 --known-layers와 함께 사용할 수 없습니다")
+    if oci_index and stdout:
+        _fail("--oci-index는 --stdout과 함께 사용할 수 없습니다")
+
+    if daemonless and stdout:
+        _fail("--daemonless는 --stdout과 함께 사용할 수 없습니다")
+
+    if not daemonless:
+        _check_docker_cli()  # Docker CLI 의존성 확인
 
     registry, namespace, image, tag = parse_image_reference(reference)
 
-    architecture = "amd64"
-    if arch:
-        architecture = arch.split("/")[-1]  # linux/arm64 -> arm64
+    # linux/arm64 -> arm64
+    architectures = [platform.split("/")[-1] for platform in platforms]
 
-    filename = generate_tar_filename(registry, namespace, image, tag, architecture)
+    if oci_index:
+        filenames = [
+            generate_tar_filename(
+                registry, namespace, image, tag, "-".join(architectures)
+            )
+        ]
+    else:
+        filenames = [
+            generate_tar_filename(registry, namespace, image, tag, architecture)
+            for architecture in architectures
+        ]
 
     dest_path = Path.cwd() if destination is None else destination
 
@@ -179,47 +319,542 @@ def save(
     ):
         if not dest_path.exists():
             dest_path.mkdir(parents=True, exist_ok=True)
-        full_path = dest_path / filename
+        full_paths = [dest_path / filename for filename in filenames]
+    elif len(filenames) > 1:
+        _fail("여러 플랫폼을 저장할 때는 --destination에 디렉터리를 지정하세요")
     else:
-        full_path = dest_path
+        full_paths = [dest_path]
 
     if verbose:
         console.print(f"[bold blue]레퍼런스: {reference}[/bold blue]")
         console.print(f"[blue]분해: {registry}/{namespace}/{image}:{tag}[/blue]")
-        console.print(f"[blue]아키텍처: {architecture}[/blue]")
-        console.print(f"[blue]파일명: {filename}[/blue]")
-        console.print(f"[blue]저장 경로: {full_path}[/blue]")
+        console.print(f"[blue]아키텍처: {', '.join(architectures)}[/blue]")
+        for full_path in full_paths:
+            console.print(f"[blue]파일명: {full_path.name}[/blue]")
+            console.print(f"[blue]저장 경로: {full_path}[/blue]")
 
     if dry_run:
         if not quiet:
-            console.print(f"[yellow]다음 파일을 생성할 예정: {full_path}[/yellow]")
+            for full_path in full_paths:
+                console.print(f"[yellow]다음 파일을 생성할 예정: {full_path}[/yellow]")
         return
 
-    if not stdout and full_path.exists() and not force:
-        if not Confirm.ask(
-            f"[yellow]파일 {full_path}이(가) 이미 존재합니다. "
-            f"덮어쓰시겠습니까?[/yellow]"
-        ):
-            console.print("[yellow]작업이 취소되었습니다.[/yellow]")
-            return
+    if not stdout:
+        for full_path in full_paths:
+            if full_path.exists() and not force:
+                if not Confirm.ask(
+                    f"[yellow]파일 {full_path}이(가) 이미 존재합니다. "
+                    f"덮어쓰시겠습니까?[/yellow]"
+                ):
+                    console.print("[yellow]작업이 취소되었습니다.[/yellow]")
+                    return
+
+    show_progress = _should_show_progress(progress, quiet)
+    reporter = TransferReporter(show_progress)
+    metered = show_progress or report_jsonl is not None
 
     try:
-        # 이미지 pull
-        pull_image(reference, arch=f"linux/{architecture}")
+        with reporter:
+            if daemonless:
+                _save_daemonless(
+                    reporter,
+                    reference,
+                    platforms,
+                    full_paths,
+                    oci_index,
+                    known_layers,
+                    insecure_registry,
+                    BlobCache() if blob_cache else None,
+                    show_progress,
+                    quiet,
+                )
+            else:
+                _save_with_daemon(
+                    reporter,
+                    reference,
+                    platforms,
+                    full_paths,
+                    stdout,
+                    oci_index,
+                    known_layers,
+                    show_progress,
+                    metered,
+                    quiet,
+                )
+    except (CommandError, DependencyError) as e:
+        console.print(f"[bold red]Error: {e}[/bold red]")
+        raise typer.Exit(code=1) from e
+
+    _report(reporter, report_jsonl, quiet)
+
+
+def _save_with_daemon(
+    reporter: TransferReporter,
+    reference: str,
+    platforms: List[str],
+    full_paths: List[Path],
+    stdout: bool,
+    oci_index: bool,
+    known_layers: List[Path],
+    show_progress: bool,
+    metered: bool,
+    quiet: bool,
+) -> None:
+    """Docker 데몬으로 이미지를 pull한 뒤 docker save로 저장합니다."""
+    multi_platform = len(platforms) > 1
+    # 이미지 pull
+    if multi_platform:
+        pull_callback = reporter.pull_progress if show_progress else None
+        durations = pull_platforms(
+            reference,
+            platforms,
+            on_progress=(partial(pull_callback, reference) if pull_callback else None),
+        )
+        for platform, seconds in durations.items():
+            reporter.record_pull(reference, platform, seconds)
+    else:
+        _pull(reporter, reference, platforms[0], show_progress)
 
+    if not quiet:
+        console.print(f"[green]이미지 {reference} 저장 중...[/green]")
+
+    # 이미지 저장
+    if stdout:
+        _save(reporter, reference, platforms[0], None, metered)
+    elif oci_index:
+        _save_oci_index(reporter, reference, platforms, full_paths[0], quiet, metered)
+    else:
+        for index, platform in enumerate(platforms):
+            full_path = full_paths[index]
+            if multi_platform:
+                # 병렬 pull 이후 태그를 해당 플랫폼으로 재지정
+                _pull(reporter, reference, platform, show_progress)
+
+            if known_layers:
+                export = partial(
+                    _save,
+                    reporter,
+                    reference,
+                    platform,
+                    metered=metered,
+                    report_path=full_path,
+                )
+                _save_thin(full_path, known_layers, quiet, export)
+            else:
+                _save(reporter, reference, platform, full_path, metered)
+                if not quiet:
+                    console.print(
+                        f"[bold green]이미지가 성공적으로 저장되었습니다: "
+                        f"{full_path}[/bold green]"
+                    )
+
+
+def _export_from_registry(
+    reporter: TransferReporter,
+    reference: str,
+    platforms: List[str],
+    docker_manifest: bool,
+    insecure: bool,
+    cache: Optional[BlobCache],
+    show_progress: bool,
+    output: Path,
+    report_path: Optional[Path] = None,
+) -> None:
+    """레지스트리에서 직접 내려받아 아카이브를 작성하고 소요 시간을 기록합니다.
+
+    report_path를 주면 리포트에는 임시 파일 대신 이 최종 경로를 기록합니다.
+    """
+    label = ",".join(platforms)
+    callback = partial(reporter.pull_progress, reference, label)
+    result = export_image(
+        reference,
+        platforms,
+        output,
+        docker_manifest=docker_manifest,
+        insecure=insecure,
+        on_progress=callback if show_progress else None,
+        cache=cache,
+    )
+    reporter.record_pull(reference, label, result["download_seconds"])
+    reporter.record_save(
+        reference,
+        label,
+        report_path or output,
+        result["write_seconds"],
+        output.stat().st_size,
+    )
+
+
+def _save_daemonless(
+    reporter: TransferReporter,
+    reference: str,
+    platforms: List[str],
+    full_paths: List[Path],
+    oci_index: bool,
+    known_layers: List[Path],
+    insecure: bool,
+    cache: Optional[BlobCache],
+    show_progress: bool,
+    quiet: bool,
+) -> None:
+    """Docker 데몬 없이 레지스트리에서 직접 이미지 아카이브를 작성합니다."""
+    if oci_index:
+        groups = [(platforms, full_paths[0])]
+    else:
+        groups = [([platform], full_paths[i]) for i, platform in enumerate(platforms)]
+
+    for group, full_path in groups:
+        export = partial(
+            _export_from_registry,
+            reporter,
+            reference,
+            group,
+            not oci_index,
+            insecure,
+            cache,
+            show_progress,
+            report_path=full_path,
+        )
+        if known_layers:
+            _save_thin(full_path, known_layers, quiet, export)
+            continue
+
+        export(full_path)
         if not quiet:
-            console.print(f"[green]이미지 {reference} 저장 중...[/green]")
+            console.print(
+                f"[bold green]이미지가 성공적으로 저장되었습니다: "
+                f"{full_path}[/bold green]"
+            )
+
+
+def _fail(message: str) -> NoReturn:
+    """오류 메시지를 출력하고 종료합니다."""
+    console.print(f"[bold red]오류: {message}[/bold red]")
+    raise typer.Exit(code=1)
+
+
+def _should_show_progress(progress: Optional[bool], quiet: bool) -> bool:
+    """진행률 표시 여부를 결정합니다 (기본: stderr가 터미널일 때만)."""
+    if progress is not None:
+        return progress
+    return not quiet and sys.stderr.isatty()
+
+
+def _pull(
+    reporter: TransferReporter, reference: str, platform: str, show_progress: bool
+) -> None:
+    """이미지를 pull하고 소요 시간을 기록합니다."""
+    callback = partial(reporter.pull_progress, reference, platform)
+    started = time.monotonic()
+    pull_image(
+        reference, arch=platform, on_progress=callback if show_progress else None
+    )
+    reporter.record_pull(reference, platform, time.monotonic() - started)
+
+
+def _save(
+    reporter: TransferReporter,
+    reference: str,
+    platform: str,
+    output: Optional[Path],
+    metered: bool,
+    report_path: Optional[Path] = None,
+) -> None:
+    """이미지를 저장(output이 None이면 표준 출력)하고 처리량을 기록합니다.
+
+    임시 파일로 저장한 뒤 변환하는 경우 report_path에 최종 아카이브 경로를 주면
+    리포트에는 그 경로를 기록합니다.
+    """
+    started = time.monotonic()
+    written = 0
 
-        # 이미지 저장
-        if stdout:
-            save_image_to_stdout(reference)
-        else:
-            save_image(reference, str(full_path))
+    def _on_bytes(total: int) -> None:
+        nonlocal written
+        written = total
+        reporter.save_progress(reference, platform, started, total)
+
+    callback = _on_bytes if metered else None
+    if output is None:
+        save_image_to_stdout(reference, on_progress=callback)
+    else:
+        save_image(reference, str(output), on_progress=callback)
+        if not metered and output.exists():
+            written = output.stat().st_size
+
+    reporter.record_save(
+        reference, platform, report_path or output, time.monotonic() - started, written
+    )
+
+
+def _report(
+    reporter: TransferReporter, report_jsonl: Optional[Path], quiet: bool
+) -> None:
+    """이미지별 최종 리포트를 출력하고 JSON Lines로 기록합니다."""
+    if not quiet:
+        for report in reporter.reports:
+            err_console.print(f"[blue]{format_transfer_report(report)}[/blue]")
+
+    if report_jsonl is not None:
+        append_jsonl(report_jsonl, reporter.reports)
+
+
+def _save_oci_index(
+    reporter: TransferReporter,
+    reference: str,
+    platforms: List[str],
+    full_path: Path,
+    quiet: bool,
+    metered: bool,
+) -> None:
+    """플랫폼별로 저장한 뒤 하나의 OCI 인덱스 아카이브로 합칩니다."""
+    archives: List[Tuple[str, Path]] = []
+    try:
+        for platform in platforms:
+            platform_tmp = full_path.with_name(
+                f".{full_path.name}.{platform.replace('/', '_')}.tmp"
+            )
+            archives.append((platform, platform_tmp))
+            _pull(reporter, reference, platform, show_progress=False)
+            _save(
+                reporter,
+                reference,
+                platform,
+                platform_tmp,
+                metered,
+                report_path=full_path,
+            )
+
+        skipped = image_archive.merge_to_oci_index(archives, full_path, reference)
+    finally:
+        for _, platform_tmp in archives:
+            platform_tmp.unlink(missing_ok=True)
+
+    if not quiet:
+        console.print(
+            f"[bold green]OCI 인덱스 아카이브가 저장되었습니다: {full_path} "
+            f"({len(platforms)}개 플랫폼, 공유 블롭 {skipped}개 중복 제거)"
+            "[/bold green]"
+        )
+
+
+def _save_thin(
+    full_path: Path,
+    known_layers: List[Path],
+    quiet: bool,
+    export: Callable[[Path], None],
+) -> None:
+    """export로 이미지를 저장한 뒤 알려진 레이어를 제외한 씬 아카이브로 변환합니다."""
+    known: Set[str] = set()
+    for layer_file in known_layers:
+        known |= image_archive.load_layer_list(layer_file)
+
+    full_tmp = full_path.with_name(f".{full_path.name}.full.tmp")
+    try:
+        export(full_tmp)
+        result = image_archive.create_thin_archive(full_tmp, full_path, known)
+    finally:
+        full_tmp.unlink(missing_ok=True)
+
+    if not quiet:
+        saved_mb = sum(layer["size"] for layer in result["omitted"]) / (1024 * 1024)
+        console.print(
+            f"[bold green]씬 아카이브가 저장되었습니다: {full_path} "
+            f"({len(result['omitted'])}개 레이어 생략, {saved_mb:.1f}MB 절약)"
+            "[/bold green]"
+        )
+
+
+@app.command()
+def layers(
+    archives: Annotated[
+        List[Path],
+        typer.Argument(help="레이어를 수집할 docker save 아카이브 경로"),
+    ],
+    output: Optional[Path] = LAYERS_OUTPUT_OPTION,
+) -> None:
+    """아카이브에 포함된 레이어 다이제스트 목록을 출력합니다.
+
+    출력된 목록은 다음 내보내기에서 save --known-layers로 사용합니다.
+    """
+    init_logging()
+
+    try:
+        digests = image_archive.collect_layer_digests(archives)
+    except (CommandError, OSError) as e:
+        console.print(f"[bold red]오류: {e}[/bold red]")
+        raise typer.Exit(code=1) from e
+
+    if output is None:
+        for digest in sorted(digests):
+            typer.echo(digest)
+    else:
+        image_archive.write_layer_list(digests, output)
+        console.print(
+            f"[bold green]레이어 목록 저장됨: {output} ({len(digests)}개)[/bold green]"
+        )
+
+
+@app.command()
+def restore(
+    thin_archive: Annotated[
+        Path, typer.Argument(help="save --known-layers로 생성한 씬 아카이브")
+    ],
+    sources: List[Path] = RESTORE_FROM_OPTION,
+    output: Path = RESTORE_OUTPUT_OPTION,
+    load: bool = LOAD_OPTION,
+    force: bool = FORCE_OPTION,
+) -> None:
+    """씬 아카이브와 현장의 기존 아카이브로 완전한 이미지 아카이브를 재구성합니다."""
+    init_logging()
+
+    if output.exists() and not force:
+        console.print(
+            f"[bold red]오류: 파일 {output}이(가) 이미 존재합니다 "
+            "(--force로 덮어쓰기)[/bold red]"
+        )
+        raise typer.Exit(code=1)
+
+    try:
+        restored = image_archive.restore_thin_archive(thin_archive, sources, output)
+        console.print(
+            f"[bold green]아카이브 재구성 완료: {output} "
+            f"({restored}개 레이어 복원)[/bold green]"
+        )
+
+        if load:
+            _check_docker_cli()
+            load_image(str(output))
+            console.print("[bold green]docker load 완료[/bold green]")
+    except (CommandError, OSError) as e:
+        console.print(f"[bold red]오류: {e}[/bold red]")
+        raise typer.Exit(code=1) from e
+
+
+def _read_references(references: List[str], file: Optional[str]) -> List[str]:
+    """인자와 목록 파일에서 이미지 레퍼런스를 모읍니다 (중복 제거, 순서 유지)."""
+    lines = list(references)
+    if file == "-":
+        lines.extend(sys.stdin.read().splitlines())
+    elif file is not None:
+        lines.extend(Path(file).read_text(encoding="utf-8").splitlines())
+
+    collected: List[str] = []
+    for line in lines:
+        reference = line.strip()
+        if reference and not reference.startswith("#") and reference not in collected:
+            collected.append(reference)
+    return collected
+
+
+@app.command("save-batch")
+def save_batch(
+    references: Annotated[
+        Optional[List[str]],
+        typer.Argument(
+            help="컨테이너 이미지 레퍼런스 목록",
+            autocompletion=complete_docker_reference,
+        ),
+    ] = None,
+    file: Optional[str] = BATCH_FILE_OPTION,
+    arch: List[str] = BATCH_ARCH_OPTION,
+    destination: Optional[Path] = BATCH_DEST_OPTION,
+    workers: int = WORKERS_OPTION,
+    registry_concurrency: int = REGISTRY_CONCURRENCY_OPTION,
+    registry_rate: float = REGISTRY_RATE_OPTION,
+    max_retries: int = MAX_RETRIES_OPTION,
+    save_workers: int = SAVE_WORKERS_OPTION,
+    queue_size: int = QUEUE_SIZE_OPTION,
+    force: bool = FORCE_OPTION,
+    quiet: bool = QUIET_OPTION,
+    verbose: bool = VERBOSE_OPTION,
+) -> None:
+    """여러 이미지를 레지스트리 제한을 지키며 pull한 뒤 각각 tar 파일로 저장합니다.
+
+    레지스트리별 동시 pull 수와 초당 요청 수를 제한하며, 한 작업자가 레이트
+    리밋(429)을 받으면 해당 레지스트리의 모든 작업자가 함께 백오프합니다.
+    pull과 save는 파이프라인으로 겹쳐 실행하며, 완료 후 단계별 가동률을
+    출력합니다. 한 이미지가 실패해도 나머지 이미지는 계속 처리합니다.
+    """
+    init_logging()
+
+    if quiet:
+        set_log_level("ERROR")
+    elif verbose:
+        set_log_level("DEBUG")
+
+    if len(arch) > 1:
+        _fail("save-batch는 단일 플랫폼만 지원합니다")
+    platform = arch[0] if arch else "linux/amd64"
+
+    try:
+        batch = _read_references(references or [], file)
+    except OSError as e:
+        _fail(f"레퍼런스 목록을 읽을 수 없습니다: {e}")
+    if not batch:
+        _fail("저장할 이미지 레퍼런스가 없습니다")
+
+    dest_dir = Path.cwd() if destination is None else destination
+    dest_dir.mkdir(parents=True, exist_ok=True)
+
+    targets: List[Tuple[str, Path]] = []
+    for reference in batch:
+        filename = generate_tar_filename(
+            *parse_image_reference(reference), platform.split("/")[-1]
+        )
+        full_path = dest_dir / filename
+        if full_path.exists() and not force:
             if not quiet:
                 console.print(
-                    f"[bold green]이미지가 성공적으로 저장되었습니다: "
-                    f"{full_path}[/bold green]"
+                    f"[yellow]건너뜀 (이미 존재, --force로 덮어쓰기): "
+                    f"{full_path}[/yellow]"
                 )
-    except (CommandError, DependencyError) as e:
-        console.print(f"[bold red]Error: {e}[/bold red]")
-        raise typer.Exit(code=1) from e
+            continue
+        targets.append((reference, full_path))
+
+    if not targets:
+        return
+
+    _check_docker_cli()
+
+    scheduler = PullScheduler(
+        registry_concurrency=registry_concurrency,
+        registry_rate=registry_rate,
+        max_retries=max_retries,
+    )
+
+    def _pull_target(target: Tuple[str, Path]) -> int:
+        return scheduler.pull(target[0], platform)
+
+    def _save_target(target: Tuple[str, Path], attempts: int) -> None:
+        reference, full_path = target
+        save_image(reference, str(full_path))
+        if not quiet:
+            console.print(
+                f"[green]저장 완료: {full_path} (pull 시도 {attempts}회)[/green]"
+            )
+
+    # pull과 save를 겹쳐 실행: 다음 이미지를 받는 동안 이전 이미지를 저장
+    report = run_two_stage(
+        targets,
+        _pull_target,
+        _save_target,
+        first_workers=workers,
+        second_workers=save_workers,
+        queue_size=queue_size,
+    )
+
+    failures = report["failures"]
+    for index, (stage, error) in failures.items():
+        console.print(
+            f"[bold red]실패: {targets[index][0]} ({stage} 단계)\n{error}[/bold red]"
+        )
+
+    if not quiet:
+        for stage_stats in report["stages"]:
+            console.print(f"[blue]{format_stage_stats(stage_stats)}[/blue]")
+        console.print(
+            f"[bold]{len(targets) - len(failures)}/{len(targets)}개 이미지 저장 완료 "
+            f"({report['elapsed_seconds']:.1f}s)[/bold]"
+        )
+    if failures:
+        raise typer.Exit(code=1)
@@ -2,18 +2,30 @@
 
 from __future__ import annotations
 
+import os
 import pathlib
 import subprocess
 import tempfile
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import typer
 from rich.console import Console
 from typing_extensions import Annotated
 
-from cli_onprem.core.errors import handle_error
+from cli_onprem.core.errors import DependencyError, handle_error
 from cli_onprem.core.logging import init_logging, set_log_level
 from cli_onprem.core.types import CONTEXT_SETTINGS
-from cli_onprem.services import docker, helm
+from cli_onprem.services import (
+    archive,
+    chart_cache,
+    chart_values,
+    docker,
+    helm,
+    render_cache,
+)
+from cli_onprem.services.pipeline import format_stage_stats, run_two_stage
+from cli_onprem.services.pull_scheduler import PullScheduler
 from cli_onprem.utils import formatting
 
 app = typer.Typer(
@@ -21,6 +33,7 @@ app = typer.Typer(
     context_settings=CONTEXT_SETTINGS,
 )
 console = Console()
+err_console = Console(stderr=True)
 
 
 def complete_chart_path(incomplete: str) -> list[str]:
@@ -77,6 +90,86 @@ JSON_OPTION = typer.Option(False, "--json", help="JSON 배열 형식으로 출
 RAW_OPTION = typer.Option(
     False, "--raw", help="이미지 이름 표준화 없이 원본 그대로 출력"
 )
+STREAM_OPTION = typer.Option(
+    False,
+    "--stream",
+    help="렌더링 출력을 문서 단위로 처리하며 발견 즉시 출력 (정렬 안 함)",
+)
+FAST_OPTION = typer.Option(
+    False,
+    "--fast",
+    help="워크로드 컨테이너 경로만 탐색 (알 수 없는 kind는 전체 탐색)",
+)
+NO_CACHE_OPTION = typer.Option(
+    False,
+    "--no-cache",
+    help="렌더링/차트 추출 캐시를 사용하지 않고 항상 다시 추출하고 렌더링",
+)
+WORKERS_OPTION = typer.Option(4, "--workers", min=1, help="동시에 렌더링할 차트 수")
+PER_CHART_OPTION = typer.Option(
+    False,
+    "--per-chart",
+    help="차트별 이미지 목록과 실패를 포함한 JSON 객체로 출력",
+)
+OFFLINE_OPTION = typer.Option(
+    False,
+    "--offline",
+    help="서브차트 캐시에 없는 의존성을 내려받지 않고 오류로 처리",
+)
+AXIS_OPTION = typer.Option(
+    [],
+    "--axis",
+    "-a",
+    help="values 축 (이름=파일[,파일...], 여러 번 지정하면 모든 조합을 렌더링)",
+)
+PER_COMBINATION_OPTION = typer.Option(
+    False,
+    "--per-combination",
+    help="조합별 이미지 목록과 실패를 포함한 JSON 객체로 출력",
+)
+VALUES_ONLY_OPTION = typer.Option(
+    False,
+    "--values-only",
+    help="helm template 없이 차트/서브차트 values에서만 이미지 추출",
+)
+VALUES_DIFF_OPTION = typer.Option(
+    False,
+    "--values-diff",
+    help="values 분석 결과와 전체 렌더링 결과의 차이 출력 (차이가 있으면 종료 코드 1)",
+)
+DESTINATION_OPTION = typer.Option(
+    None,
+    "--destination",
+    "-d",
+    help="이미지 tar 파일을 저장할 디렉토리 (기본값: 현재 디렉토리)",
+)
+BUNDLE_OPTION = typer.Option(
+    None,
+    "--bundle",
+    help="저장한 tar 파일과 이미지 목록을 하나의 tar.gz 번들로 묶을 경로",
+)
+ARCH_OPTION = typer.Option("linux/amd64", "--arch", help="pull/저장할 플랫폼")
+PULL_WORKERS_OPTION = typer.Option(
+    4, "--pull-workers", min=1, help="동시 pull 작업자 수"
+)
+SAVE_WORKERS_OPTION = typer.Option(
+    1, "--save-workers", min=1, help="동시 save 작업자 수 (디스크 I/O가 병목이면 1)"
+)
+REGISTRY_CONCURRENCY_OPTION = typer.Option(
+    2, "--registry-concurrency", min=1, help="레지스트리별 최대 동시 pull 수"
+)
+REGISTRY_RATE_OPTION = typer.Option(
+    1.0,
+    "--registry-rate",
+    min=0.0,
+    help="레지스트리별 초당 pull 시작 수 (0이면 무제한)",
+)
+MAX_RETRIES_OPTION = typer.Option(
+    4, "--max-retries", min=0, help="일시적 오류 시 이미지별 최대 재시도 횟수"
+)
+FORCE_OPTION = typer.Option(
+    False, "--force", help="이미 저장된 이미지도 다시 pull/저장"
+)
 SKIP_DEPENDENCY_UPDATE_OPTION = typer.Option(
     False,
     "--skip-dependency-update",
@@ -97,6 +190,12 @@ def extract_images(
     quiet: bool = QUIET_OPTION,
     json_output: bool = JSON_OPTION,
     raw: bool = RAW_OPTION,
+    stream: bool = STREAM_OPTION,
+    fast: bool = FAST_OPTION,
+    no_cache: bool = NO_CACHE_OPTION,
+    offline: bool = OFFLINE_OPTION,
+    values_only: bool = VALUES_ONLY_OPTION,
+    values_diff: bool = VALUES_DIFF_OPTION,
     skip_dependency_update: bool = SKIP_DEPENDENCY_UPDATE_OPTION,
 ) -> None:
     """Helm 차트에서 사용되는 Docker 이미지 참조를 추출합니다.
@@ -107,6 +206,20 @@ def extract_images(
 
     출력은 기본적으로 각 줄마다 하나의 이미지 참조를 표시하며,
     --json 옵션을 사용하면 JSON 배열 형식으로 출력됩니다.
+
+    --stream 옵션을 사용하면 helm template 출력을 문서 단위로 읽으며 처리해
+    대형 차트에서도 메모리 사용량이 가장 큰 문서 크기로 제한됩니다.
+
+    차트, values 파일, helm 버전이 같으면 이전 추출 결과를 캐시에서 바로
+    출력합니다 (--no-cache로 비활성화).
+
+    서브차트는 로컬 캐시에서 먼저 채우고 없는 경우에만 helm dependency
+    update를 실행합니다. --offline 옵션을 사용하면 캐시에 없는 서브차트가
+    있을 때 내려받지 않고 실패합니다.
+
+    --values-only 옵션을 사용하면 helm을 실행하지 않고 values.yaml과
+    서브차트 values의 image 필드만 분석합니다. --values-diff 옵션은 이
+    결과를 전체 렌더링 결과와 비교해 values 분석으로 충분한지 보여 줍니다.
     """
     # 로깅 초기화
     init_logging()
@@ -114,42 +227,705 @@ def extract_images(
     if quiet:
         set_log_level("ERROR")
 
+    if values_only or values_diff:
+        status = _analyze_values(
+            chart,
+            values,
+            raw,
+            json_output,
+            fast,
+            no_cache,
+            skip_dependency_update,
+            diff=values_diff,
+        )
+        if status:
+            raise typer.Exit(code=status)
+        return
+
     try:
         # Helm CLI 확인
         helm.check_helm_installed()
 
-        with tempfile.TemporaryDirectory() as tmp:
-            workdir = pathlib.Path(tmp)
+        cache = None if no_cache else render_cache.RenderCache()
+        extract_cache = None if no_cache else chart_cache.ChartExtractCache()
+
+        if stream:
+            cache_key = (
+                _cache_key(chart, values, raw, fast, skip_dependency_update)
+                if cache is not None
+                else None
+            )
+            cached = cache.get(cache_key) if cache is not None and cache_key else None
+            if cached:
+                _print_images(cached, json_output)
+                return
+
+            with tempfile.TemporaryDirectory() as tmp:
+                chart_root = _prepare(
+                    chart,
+                    pathlib.Path(tmp),
+                    skip_dependency_update,
+                    offline,
+                    extract_cache,
+                )
+                images = _print_streamed_images(
+                    chart_root, values, raw, json_output, fast
+                )
+            if images and cache is not None and cache_key:
+                cache.put(cache_key, str(chart), sorted(images))
+        else:
+            images = _extract_chart_images(
+                chart,
+                values,
+                raw,
+                fast,
+                skip_dependency_update,
+                cache,
+                offline,
+                extract_cache,
+            )
+            if images:
+                _print_images(images, json_output)
 
-            # 차트 준비
-            chart_root = helm.prepare_chart(chart, workdir)
+        if not images:
+            console.print("[bold red]이미지 필드를 찾을 수 없음[/bold red]")
+            raise typer.Exit(code=1)
 
-            # 의존성 업데이트
-            if not skip_dependency_update:
-                helm.update_dependencies(chart_root)
+    except FileNotFoundError as e:
+        handle_error(e)
+    except ValueError as e:
+        handle_error(e)
+    except subprocess.CalledProcessError as e:
+        handle_error(Exception(f"명령어 실행 실패: {e}"))
+    except Exception as e:
+        handle_error(e)
 
-            # 템플릿 렌더링
-            rendered = helm.render_template(chart_root, values)
 
-            # 이미지 추출
-            images = docker.extract_images_from_yaml(rendered, normalize=not raw)
+@app.command("extract-images-batch")
+def extract_images_batch(
+    charts: Annotated[
+        list[pathlib.Path],
+        typer.Argument(
+            help="Helm 차트(.tgz 또는 디렉토리) 또는 .tgz 차트가 들어 있는 디렉토리",
+            autocompletion=complete_chart_path,
+        ),
+    ],
+    values: list[pathlib.Path] = VALUES_OPTION,
+    workers: int = WORKERS_OPTION,
+    quiet: bool = QUIET_OPTION,
+    json_output: bool = JSON_OPTION,
+    per_chart: bool = PER_CHART_OPTION,
+    raw: bool = RAW_OPTION,
+    fast: bool = FAST_OPTION,
+    no_cache: bool = NO_CACHE_OPTION,
+    offline: bool = OFFLINE_OPTION,
+    skip_dependency_update: bool = SKIP_DEPENDENCY_UPDATE_OPTION,
+) -> None:
+    """여러 Helm 차트를 병렬로 렌더링해 이미지 목록을 합쳐 출력합니다.
 
-            if images:
-                # 출력
-                if json_output:
-                    console.print(formatting.format_json(images))
-                else:
-                    for image in images:
-                        console.print(image)
-            else:
-                console.print("[bold red]이미지 필드를 찾을 수 없음[/bold red]")
-                raise typer.Exit(code=1)
+    차트 디렉토리가 아닌 디렉토리를 지정하면 그 안의 .tgz 파일과 차트
+    디렉토리를 모두 처리합니다. values 파일은 모든 차트에 적용됩니다.
 
-    except FileNotFoundError as e:
-        handle_error(e)
+    출력은 중복을 제거한 정렬된 이미지 목록이며, --per-chart 옵션을 사용하면
+    차트별 이미지 목록과 실패 정보를 담은 JSON 객체로 출력됩니다.
+    한 차트가 실패해도 나머지 차트는 계속 처리하며, 실패가 있으면 종료 코드
+    1로 끝납니다.
+    """
+    init_logging()
+
+    if quiet:
+        set_log_level("ERROR")
+
+    targets = _expand_chart_paths(charts)
+    if not targets:
+        handle_error(ValueError("처리할 차트가 없습니다"))
+
+    helm.check_helm_installed()
+    cache = None if no_cache else render_cache.RenderCache()
+    extract_cache = None if no_cache else chart_cache.ChartExtractCache()
+
+    def _run(chart: pathlib.Path) -> list[str]:
+        return _extract_chart_images(
+            chart,
+            values,
+            raw,
+            fast,
+            skip_dependency_update,
+            cache,
+            offline,
+            extract_cache,
+        )
+
+    per_chart_images: dict[str, list[str]] = {}
+    failures: dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {chart: executor.submit(_run, chart) for chart in targets}
+        for chart, future in futures.items():
+            try:
+                per_chart_images[str(chart)] = future.result()
+            except subprocess.CalledProcessError as e:
+                failures[str(chart)] = f"명령어 실행 실패: {e}"
+            except Exception as e:
+                failures[str(chart)] = str(e)
+
+    merged = sorted({image for images in per_chart_images.values() for image in images})
+
+    for chart_name, message in failures.items():
+        err_console.print(f"[bold red]실패: {chart_name}\n{message}[/bold red]")
+
+    if per_chart:
+        report = {"images": merged, "charts": per_chart_images, "failures": failures}
+        # 긴 차트 경로가 줄바꿈되지 않도록 rich를 거치지 않고 출력
+        typer.echo(formatting.format_json(report))
+    elif merged:
+        _print_images(merged, json_output)
+
+    if not quiet:
+        err_console.print(
+            f"[bold]{len(per_chart_images)}/{len(targets)}개 차트에서 "
+            f"{len(merged)}개 이미지 추출[/bold]"
+        )
+
+    if failures:
+        raise typer.Exit(code=1)
+    if not merged:
+        err_console.print("[bold red]이미지 필드를 찾을 수 없음[/bold red]")
+        raise typer.Exit(code=1)
+
+
+@app.command("extract-images-matrix")
+def extract_images_matrix(
+    chart: Annotated[
+        pathlib.Path,
+        typer.Argument(
+            help="Helm 차트 아카이브(.tgz) 또는 디렉토리 경로",
+            autocompletion=complete_chart_path,
+        ),
+    ],
+    axis: list[str] = AXIS_OPTION,
+    values: list[pathlib.Path] = VALUES_OPTION,
+    workers: int = WORKERS_OPTION,
+    quiet: bool = QUIET_OPTION,
+    json_output: bool = JSON_OPTION,
+    per_combination: bool = PER_COMBINATION_OPTION,
+    raw: bool = RAW_OPTION,
+    fast: bool = FAST_OPTION,
+    no_cache: bool = NO_CACHE_OPTION,
+    offline: bool = OFFLINE_OPTION,
+    skip_dependency_update: bool = SKIP_DEPENDENCY_UPDATE_OPTION,
+) -> None:
+    """values 파일 조합(환경 × 리전 등)마다 차트를 렌더링해 이미지를 추출합니다.
+
+    --axis 이름=파일[,파일...]를 여러 번 지정하면 모든 조합을 렌더링합니다.
+    차트 준비와 의존성 동기화는 한 번만 수행하고, 조합별 렌더링은 병렬로
+    실행합니다. -f로 지정한 values 파일은 모든 조합에 먼저 적용됩니다.
+
+    출력은 모든 조합의 이미지 합집합이며, --per-combination 옵션을 사용하면
+    조합별 이미지 목록과 실패 정보를 담은 JSON 객체로 출력됩니다.
+    """
+    init_logging()
+
+    if quiet:
+        set_log_level("ERROR")
+
+    try:
+        combinations = helm.build_values_matrix(
+            [_parse_axis(spec) for spec in axis], values
+        )
     except ValueError as e:
         handle_error(e)
+
+    helm.check_helm_installed()
+    cache = None if no_cache else render_cache.RenderCache()
+    extract_cache = None if no_cache else chart_cache.ChartExtractCache()
+
+    per_combination_images: dict[str, list[str]] = {}
+    failures: dict[str, str] = {}
+    pending: list[tuple[helm.ValuesCombination, str | None]] = []
+    for combination in combinations:
+        cache_key = (
+            _cache_key(chart, combination["values"], raw, fast, skip_dependency_update)
+            if cache is not None
+            else None
+        )
+        cached = cache.get(cache_key) if cache is not None and cache_key else None
+        if cached:
+            per_combination_images[combination["name"]] = cached
+        else:
+            pending.append((combination, cache_key))
+
+    if pending:
+        with tempfile.TemporaryDirectory() as tmp:
+            try:
+                chart_root = _prepare(
+                    chart,
+                    pathlib.Path(tmp),
+                    skip_dependency_update,
+                    offline,
+                    extract_cache,
+                )
+            except Exception as e:
+                handle_error(e)
+
+            def _run(combination: helm.ValuesCombination) -> tuple[list[str], str]:
+                return _render_images(chart_root, combination["values"], raw, fast)
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    (combination, cache_key, executor.submit(_run, combination))
+                    for combination, cache_key in pending
+                ]
+                for combination, cache_key, future in futures:
+                    name = combination["name"]
+                    try:
+                        images, rendered = future.result()
+                    except subprocess.CalledProcessError as e:
+                        failures[name] = f"명령어 실행 실패: {e}"
+                        continue
+                    except Exception as e:
+                        failures[name] = str(e)
+                        continue
+                    per_combination_images[name] = images
+                    if images and cache is not None and cache_key:
+                        cache.put(cache_key, str(chart), images, rendered)
+
+    ordered = {
+        combination["name"]: per_combination_images[combination["name"]]
+        for combination in combinations
+        if combination["name"] in per_combination_images
+    }
+    merged = sorted({image for images in ordered.values() for image in images})
+
+    for name, message in failures.items():
+        err_console.print(f"[bold red]실패: {name}\n{message}[/bold red]")
+
+    if per_combination:
+        report = {
+            "images": merged,
+            "combinations": {
+                combination["name"]: {
+                    "values": [str(path) for path in combination["values"]],
+                    "images": ordered[combination["name"]],
+                }
+                for combination in combinations
+                if combination["name"] in ordered
+            },
+            "failures": failures,
+        }
+        typer.echo(formatting.format_json(report))
+    elif merged:
+        _print_images(merged, json_output)
+
+    if not quiet:
+        err_console.print(
+            f"[bold]{len(ordered)}/{len(combinations)}개 조합에서 "
+            f"{len(merged)}개 이미지 추출[/bold]"
+        )
+
+    if failures:
+        raise typer.Exit(code=1)
+    if not merged:
+        err_console.print("[bold red]이미지 필드를 찾을 수 없음[/bold red]")
+        raise typer.Exit(code=1)
+
+
+@app.command("export-images")
+def export_images(
+    charts: Annotated[
+        list[pathlib.Path],
+        typer.Argument(
+            help="Helm 차트(.tgz 또는 디렉토리) 또는 .tgz 차트가 들어 있는 디렉토리",
+            autocompletion=complete_chart_path,
+        ),
+    ],
+    values: list[pathlib.Path] = VALUES_OPTION,
+    destination: pathlib.Path | None = DESTINATION_OPTION,
+    bundle: pathlib.Path | None = BUNDLE_OPTION,
+    arch: str = ARCH_OPTION,
+    workers: int = WORKERS_OPTION,
+    pull_workers: int = PULL_WORKERS_OPTION,
+    save_workers: int = SAVE_WORKERS_OPTION,
+    registry_concurrency: int = REGISTRY_CONCURRENCY_OPTION,
+    registry_rate: float = REGISTRY_RATE_OPTION,
+    max_retries: int = MAX_RETRIES_OPTION,
+    force: bool = FORCE_OPTION,
+    quiet: bool = QUIET_OPTION,
+    fast: bool = FAST_OPTION,
+    no_cache: bool = NO_CACHE_OPTION,
+    offline: bool = OFFLINE_OPTION,
+    skip_dependency_update: bool = SKIP_DEPENDENCY_UPDATE_OPTION,
+) -> None:
+    """Helm 차트의 이미지를 추출해 곧바로 pull하고 tar 파일로 저장합니다.
+
+    차트 렌더링, 이미지 pull, docker save를 파이프라인으로 겹쳐 실행하므로
+    첫 차트의 이미지가 나오는 즉시 pull이 시작됩니다. 이미지는 정규화 후
+    중복을 제거하며, 대상 디렉토리에 같은 이름의 tar 파일이 있으면 이미
+    내보낸 것으로 보고 건너뜁니다(docker-tar save-batch와 같은 파일 이름).
+
+    완료 후 대상 디렉토리에 images.txt(발견한 이미지 목록)를 기록하고,
+    --bundle을 지정하면 디렉토리 전체를 tar.gz 번들로 묶습니다. 실패한
+    차트나 이미지가 있으면 종료 코드 1로 끝납니다.
+    """
+    init_logging()
+
+    if quiet:
+        set_log_level("ERROR")
+
+    targets = _expand_chart_paths(charts)
+    if not targets:
+        handle_error(ValueError("처리할 차트가 없습니다"))
+
+    try:
+        helm.check_helm_installed()
+        docker.check_docker_installed()
+        docker.check_docker_daemon()
+    except DependencyError as e:
+        handle_error(e)
+
+    dest_dir = pathlib.Path.cwd() if destination is None else destination
+    if bundle is not None and dest_dir.resolve() in bundle.resolve().parents:
+        handle_error(ValueError("번들 경로는 대상 디렉토리 밖에 있어야 합니다"))
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    cache = None if no_cache else render_cache.RenderCache()
+    extract_cache = None if no_cache else chart_cache.ChartExtractCache()
+    arch_suffix = arch.split("/")[-1]
+
+    discovered: list[str] = []
+    skipped: list[str] = []
+    # run_two_stage의 입력 순번과 같은 순서로 기록 (실패 보고에 사용)
+    exports: list[tuple[str, pathlib.Path]] = []
+    chart_failures: dict[str, str] = {}
+
+    def _render(chart: pathlib.Path) -> list[str]:
+        return _extract_chart_images(
+            chart,
+            values,
+            False,
+            fast,
+            skip_dependency_update,
+            cache,
+            offline,
+            extract_cache,
+        )
+
+    def _discover() -> Iterator[tuple[str, pathlib.Path]]:
+        # pull 작업자가 잠금 아래에서 하나씩 꺼내므로 이 생성기는 직렬로 실행됨
+        seen: set[str] = set()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_render, chart): chart for chart in targets}
+            for future in as_completed(futures):
+                chart = futures[future]
+                try:
+                    images = future.result()
+                except subprocess.CalledProcessError as e:
+                    chart_failures[str(chart)] = f"명령어 실행 실패: {e}"
+                    continue
+                except Exception as e:
+                    chart_failures[str(chart)] = str(e)
+                    continue
+
+                for image in images:
+                    if image in seen:
+                        continue
+                    seen.add(image)
+                    discovered.append(image)
+                    filename = docker.generate_tar_filename(
+                        *docker.parse_image_reference(image), arch_suffix
+                    )
+                    output = dest_dir / filename
+                    if output.exists() and not force:
+                        skipped.append(image)
+                        continue
+                    exports.append((image, output))
+                    yield image, output
+
+    scheduler = PullScheduler(
+        registry_concurrency=registry_concurrency,
+        registry_rate=registry_rate,
+        max_retries=max_retries,
+    )
+
+    def _pull_target(target: tuple[str, pathlib.Path]) -> int:
+        return scheduler.pull(target[0], arch)
+
+    def _save_target(target: tuple[str, pathlib.Path], attempts: int) -> None:
+        reference, output = target
+        # 중단된 저장이 "이미 내보냄"으로 보이지 않도록 임시 파일에 쓴 뒤 교체
+        partial = output.with_name(f"{output.name}.part")
+        try:
+            docker.save_image(reference, str(partial))
+            os.replace(partial, output)
+        finally:
+            partial.unlink(missing_ok=True)
+        if not quiet:
+            err_console.print(f"[green]저장 완료: {output}[/green]")
+
+    report = run_two_stage(
+        _discover(),
+        _pull_target,
+        _save_target,
+        first_workers=pull_workers,
+        second_workers=save_workers,
+    )
+
+    failures = report["failures"]
+    for chart_name, message in chart_failures.items():
+        err_console.print(f"[bold red]실패: {chart_name}\n{message}[/bold red]")
+    for index, (stage, error) in failures.items():
+        err_console.print(
+            f"[bold red]실패: {exports[index][0]} ({stage} 단계)\n{error}[/bold red]"
+        )
+
+    (dest_dir / "images.txt").write_text(
+        "".join(f"{image}\n" for image in sorted(discovered)), encoding="utf-8"
+    )
+
+    if not quiet:
+        for stage_stats in report["stages"]:
+            err_console.print(f"[blue]{format_stage_stats(stage_stats)}[/blue]")
+        err_console.print(
+            f"[bold]{len(targets) - len(chart_failures)}/{len(targets)}개 차트, "
+            f"이미지 {len(discovered)}개 중 {len(exports) - len(failures)}개 저장, "
+            f"{len(skipped)}개 건너뜀 ({report['elapsed_seconds']:.1f}s)[/bold]"
+        )
+
+    if chart_failures or failures:
+        if bundle is not None:
+            err_console.print("[yellow]실패가 있어 번들을 만들지 않습니다[/yellow]")
+        raise typer.Exit(code=1)
+    if not discovered:
+        err_console.print("[bold red]이미지 필드를 찾을 수 없음[/bold red]")
+        raise typer.Exit(code=1)
+
+    if bundle is not None:
+        try:
+            archive.create_tar_archive(
+                dest_dir.resolve(), bundle.resolve(), dest_dir.resolve().parent
+            )
+        except Exception as e:
+            handle_error(e)
+        if not quiet:
+            err_console.print(f"[bold green]번들 생성 완료: {bundle}[/bold green]")
+
+
+def _analyze_values(
+    chart: pathlib.Path,
+    values: list[pathlib.Path],
+    raw: bool,
+    json_output: bool,
+    fast: bool,
+    no_cache: bool,
+    skip_dependency_update: bool,
+    diff: bool,
+) -> int:
+    """values 분석(과 선택적으로 렌더링 결과 비교)을 실행하고 종료 코드를 반환합니다.
+
+    서브차트는 네트워크 없이 charts/와 서브차트 캐시에 있는 것만 사용합니다.
+    """
+    extract_cache = None if no_cache else chart_cache.ChartExtractCache()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            chart_root = helm.prepare_chart(
+                chart, pathlib.Path(tmp), extract_cache=extract_cache
+            )
+            if not skip_dependency_update:
+                try:
+                    helm.sync_dependencies(chart_root, offline=True)
+                except DependencyError as e:
+                    err_console.print(
+                        f"[yellow]경고: {e} (해당 서브차트는 values 분석에서 "
+                        "제외됩니다)[/yellow]"
+                    )
+            values_images = chart_values.extract_images_from_values(
+                chart_root, values, normalize=not raw
+            )
+
+        if not diff:
+            if not values_images:
+                console.print("[bold red]이미지 필드를 찾을 수 없음[/bold red]")
+                return 1
+            _print_images(values_images, json_output)
+            return 0
+
+        helm.check_helm_installed()
+        cache = None if no_cache else render_cache.RenderCache()
+        rendered_images = _extract_chart_images(
+            chart,
+            values,
+            raw,
+            fast,
+            skip_dependency_update,
+            cache,
+            extract_cache=extract_cache,
+        )
     except subprocess.CalledProcessError as e:
         handle_error(Exception(f"명령어 실행 실패: {e}"))
     except Exception as e:
         handle_error(e)
+
+    result = chart_values.diff_image_sets(values_images, rendered_images)
+    if json_output:
+        typer.echo(formatting.format_json(result))
+    else:
+        for image in result["render_only"]:
+            console.print(f"+ {image}")
+        for image in result["values_only"]:
+            console.print(f"- {image}")
+    err_console.print(
+        f"[bold]일치 {len(result['common'])}개, "
+        f"렌더링에만 {len(result['render_only'])}개(+), "
+        f"values에만 {len(result['values_only'])}개(-)[/bold]"
+    )
+    return 1 if result["render_only"] or result["values_only"] else 0
+
+
+def _parse_axis(spec: str) -> tuple[str, list[pathlib.Path]]:
+    """'이름=파일[,파일...]' 형식의 values 축을 파싱합니다.
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 파일이 없는 경우
+    """
+    name, separator, files = spec.partition("=")
+    name = name.strip()
+    if not separator or not name:
+        raise ValueError(f"values 축 형식이 잘못되었습니다 (이름=파일,...): {spec}")
+
+    paths = [pathlib.Path(item.strip()) for item in files.split(",") if item.strip()]
+    for path in paths:
+        if not path.is_file():
+            raise ValueError(f"Values 파일을 찾을 수 없습니다: {path}")
+    return name, paths
+
+
+def _expand_chart_paths(paths: list[pathlib.Path]) -> list[pathlib.Path]:
+    """차트 경로 목록을 펼칩니다 (중복 제거, 순서 유지).
+
+    차트 디렉토리(Chart.yaml 포함)와 파일은 그대로 사용하고, 그 외 디렉토리는
+    안의 .tgz 파일과 차트 디렉토리로 대체합니다.
+    """
+    expanded: list[pathlib.Path] = []
+    for path in paths:
+        if path.is_dir() and not (path / "Chart.yaml").exists():
+            expanded.extend(
+                sorted(
+                    child
+                    for child in path.iterdir()
+                    if (child.is_file() and child.name.endswith(".tgz"))
+                    or (child.is_dir() and (child / "Chart.yaml").exists())
+                )
+            )
+        else:
+            expanded.append(path)
+    return list(dict.fromkeys(expanded))
+
+
+def _prepare(
+    chart: pathlib.Path,
+    workdir: pathlib.Path,
+    skip_dependency_update: bool,
+    offline: bool = False,
+    extract_cache: chart_cache.ChartExtractCache | None = None,
+) -> pathlib.Path:
+    """차트를 준비하고 필요하면 서브차트 캐시로 의존성을 채웁니다."""
+    chart_root = helm.prepare_chart(chart, workdir, extract_cache=extract_cache)
+    if not skip_dependency_update:
+        helm.sync_dependencies(chart_root, offline=offline)
+    return chart_root
+
+
+def _cache_key(
+    chart: pathlib.Path,
+    values: list[pathlib.Path],
+    raw: bool,
+    fast: bool,
+    skip_dependency_update: bool,
+) -> str | None:
+    """추출 결과에 영향을 주는 입력으로 렌더링 캐시 키를 계산합니다."""
+    return render_cache.render_cache_key(
+        chart,
+        values,
+        {
+            "normalize": not raw,
+            "fast": fast,
+            "registries": list(docker.get_image_scanner().registries),
+            "dependency_update": not skip_dependency_update,
+        },
+    )
+
+
+def _extract_chart_images(
+    chart: pathlib.Path,
+    values: list[pathlib.Path],
+    raw: bool,
+    fast: bool,
+    skip_dependency_update: bool,
+    cache: render_cache.RenderCache | None,
+    offline: bool = False,
+    extract_cache: chart_cache.ChartExtractCache | None = None,
+) -> list[str]:
+    """차트 하나를 렌더링해 이미지 목록을 반환합니다 (캐시 적중 시 렌더링 생략)."""
+    cache_key = (
+        _cache_key(chart, values, raw, fast, skip_dependency_update)
+        if cache is not None
+        else None
+    )
+    if cache is not None and cache_key:
+        cached = cache.get(cache_key)
+        if cached:
+            return cached
+
+    with tempfile.TemporaryDirectory() as tmp:
+        chart_root = _prepare(
+            chart, pathlib.Path(tmp), skip_dependency_update, offline, extract_cache
+        )
+        images, rendered = _render_images(chart_root, values, raw, fast)
+
+    if images and cache is not None and cache_key:
+        cache.put(cache_key, str(chart), images, rendered)
+    return images
+
+
+def _render_images(
+    chart_root: pathlib.Path, values: list[pathlib.Path], raw: bool, fast: bool
+) -> tuple[list[str], str]:
+    """준비된 차트를 렌더링해 (이미지 목록, 매니페스트)를 반환합니다."""
+    rendered = helm.render_template(chart_root, values)
+    images = docker.extract_images_from_yaml(rendered, normalize=not raw, fast=fast)
+    return images, rendered
+
+
+def _print_images(images: list[str], json_output: bool) -> None:
+    """이미지 목록을 줄 단위 또는 JSON 배열로 출력합니다."""
+    if json_output:
+        console.print(formatting.format_json(images))
+    else:
+        for image in images:
+            console.print(image)
+
+
+def _print_streamed_images(
+    chart_root: pathlib.Path,
+    values: list[pathlib.Path],
+    raw: bool,
+    json_output: bool,
+    fast: bool,
+) -> list[str]:
+    """helm template 출력을 문서 단위로 처리하며 이미지를 출력합니다.
+
+    Returns:
+        출력한 이미지 목록
+    """
+    documents = helm.stream_template(chart_root, values)
+    found = docker.iter_images_from_documents(documents, normalize=not raw, fast=fast)
+
+    if json_output:
+        images = sorted(found)
+        if images:
+            console.print(formatting.format_json(images))
+        return images
+
+    images = []
+    for image in found:
+        images.append(image)
+        console.print(image)
+    return images
@@ -1,7 +1,8 @@
 """CLI-ONPREM을 위한 S3 공유 관련 명령어.
 
 이 모듈은 하이브리드 접근법을 사용합니다:
-- sync 명령: AWS CLI 직접 사용 (더 안정적이고 기능이 풍부함)
+- sync 명령: AWS CLI 직접 사용 (더 안정적이고 기능이 풍부함), AWS CLI가 없거나
+  --engine boto3를 지정하면 내장 병렬 업로드 엔진(services.s3.sync_to_s3) 사용
 - presign, init-* 명령: boto3 사용 (복잡한 로직과 자동완성 기능 때문)
 """
 
@@ -12,7 +13,7 @@ import subprocess
 import sys
 from datetime import timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 
 import typer
 from rich.console import Console
@@ -21,6 +22,7 @@ from typing_extensions import Annotated
 
 from cli_onprem.core.errors import CLIError
 from cli_onprem.core.logging import get_logger, init_logging
+from cli_onprem.services.completion_cache import CompletionCache, cached_completions
 from cli_onprem.services.credential import (
     DEFAULT_PROFILE,
     create_or_update_profile,
@@ -29,13 +31,18 @@ from cli_onprem.services.credential import (
     profile_exists,
 )
 from cli_onprem.services.s3 import (
+    DEFAULT_CHUNK_SIZE,
     create_s3_client,
+    create_transfer_config,
     generate_presigned_url,
     generate_s3_path,
     head_object,
     list_buckets,
     list_objects,
+    sync_pool_size,
+    sync_to_s3,
 )
+from cli_onprem.services.sync_state import open_sync_state
 
 context_settings = {
     "ignore_unknown_options": True,  # Always allow unknown options
@@ -74,6 +81,73 @@ def complete_profile(incomplete: str) -> List[str]:
         return []
 
 
+def _fetch_buckets(profile: str, scope: str) -> List[str]:
+    """접근 가능한 버킷 목록을 조회합니다."""
+    creds = get_profile_credentials(profile, check_bucket=False)
+    s3_client = create_s3_client(
+        creds["aws_access_key"], creds["aws_secret_key"], creds["region"]
+    )
+    return list_buckets(s3_client)
+
+
+def _fetch_prefixes(profile: str, scope: str) -> List[str]:
+    """`버킷/경로` 범위 바로 아래의 프리픽스 목록을 조회합니다."""
+    bucket, _, current_path = scope.partition("/")
+    creds = get_profile_credentials(profile, check_bucket=False)
+    s3_client = create_s3_client(
+        creds["aws_access_key"], creds["aws_secret_key"], creds["region"]
+    )
+    prefixes, _ = list_objects(s3_client, bucket, current_path)
+    return prefixes
+
+
+def _fetch_cli_onprem_paths(profile: str, scope: str) -> List[str]:
+    """`버킷/프리픽스` 아래의 cli-onprem- 폴더와 파일 이름을 조회합니다."""
+    bucket, _, prefix = scope.partition("/")
+    creds = get_profile_credentials(profile, check_bucket=False)
+    s3_client = create_s3_client(
+        creds["aws_access_key"], creds["aws_secret_key"], creds["region"]
+    )
+
+    prefixes, objects = list_objects(s3_client, bucket, f"{prefix}cli-onprem-")
+
+    paths = []
+
+    # 폴더
+    for folder_path in prefixes:
+        folder_name = folder_path.rstrip("/").split("/")[-1]
+        if folder_name.startswith("cli-onprem-"):
+            paths.append(folder_name)
+
+    # 파일
+    for obj in objects:
+        if not obj["Key"].endswith("/"):
+            file_name = obj["Key"].split("/")[-1]
+            if file_name.startswith("cli-onprem-"):
+                paths.append(file_name)
+
+    return paths
+
+
+# 자동완성 종류 → 후보 조회 함수 (profile, scope)
+COMPLETION_FETCHERS: Dict[str, Callable[[str, str], List[str]]] = {
+    "buckets": _fetch_buckets,
+    "prefixes": _fetch_prefixes,
+    "paths": _fetch_cli_onprem_paths,
+}
+
+
+def _cached_completions(kind: str, profile: str, scope: str) -> List[str]:
+    """자동완성 캐시를 우선 사용하고, 오래된 항목은 백그라운드로 갱신합니다."""
+    return cached_completions(
+        kind,
+        profile,
+        scope,
+        lambda: COMPLETION_FETCHERS[kind](profile, scope),
+        ["s3-share", "refresh-completion", kind, scope, "--profile", profile],
+    )
+
+
 def complete_bucket(incomplete: str) -> List[str]:
     """S3 버킷 자동완성: 접근 가능한 버킷 제안"""
     try:
@@ -82,12 +156,7 @@ def complete_bucket(incomplete: str) -> List[str]:
         if not profiles:
             return []
 
-        creds = get_profile_credentials(profiles[0], check_bucket=False)
-        s3_client = create_s3_client(
-            creds["aws_access_key"], creds["aws_secret_key"], creds["region"]
-        )
-
-        buckets = list_buckets(s3_client)
+        buckets = _cached_completions("buckets", profiles[0], "")
         return [b for b in buckets if b.startswith(incomplete)]
     except Exception as e:
         logger.warning(f"버킷 자동완성 오류: {e}")
@@ -101,24 +170,21 @@ def complete_prefix(incomplete: str, bucket: str = "") -> List[str]:
         if not profiles:
             return []
 
-        creds = get_profile_credentials(profiles[0], check_bucket=False)
-
         if not bucket:
+            creds = get_profile_credentials(profiles[0], check_bucket=False)
             bucket = creds.get("bucket", "")
             if not bucket:
                 return []
 
-        s3_client = create_s3_client(
-            creds["aws_access_key"], creds["aws_secret_key"], creds["region"]
-        )
-
         current_path = ""
         if "/" in incomplete:
             last_slash_index = incomplete.rfind("/")
             if last_slash_index >= 0:
                 current_path = incomplete[: last_slash_index + 1]
 
-        prefixes, _ = list_objects(s3_client, bucket, current_path)
+        prefixes = _cached_completions(
+            "prefixes", profiles[0], f"{bucket}/{current_path}"
+        )
         return [p for p in prefixes if p.startswith(incomplete)]
 
     except Exception as e:
@@ -134,32 +200,12 @@ def complete_cli_onprem_paths(incomplete: str) -> List[str]:
             return []
 
         creds = get_profile_credentials(profiles[0], check_bucket=True)
-        s3_client = create_s3_client(
-            creds["aws_access_key"], creds["aws_secret_key"], creds["region"]
-        )
-
         bucket = creds.get("bucket", "")
         prefix = creds.get("prefix", "")
         if prefix and not prefix.endswith("/"):
             prefix = f"{prefix}/"
 
-        prefixes, objects = list_objects(s3_client, bucket, f"{prefix}cli-onprem-")
-
-        paths = []
-
-        # 폴더
-        for folder_path in prefixes:
-            folder_name = folder_path.rstrip("/").split("/")[-1]
-            if folder_name.startswith("cli-onprem-"):
-                paths.append(folder_name)
-
-        # 파일
-        for obj in objects:
-            if not obj["Key"].endswith("/"):
-                file_name = obj["Key"].split("/")[-1]
-                if file_name.startswith("cli-onprem-"):
-                    paths.append(file_name)
-
+        paths = _cached_completions("paths", profiles[0], f"{bucket}/{prefix}")
         return [p for p in paths if p.startswith(incomplete)]
 
     except Exception:
@@ -185,7 +231,29 @@ PREFIX_OPTION = typer.Option(
 DELETE_OPTION = typer.Option(
     False, "--delete/--no-delete", help="원본에 없는 객체 삭제 여부 (기본: --no-delete)"
 )
-PARALLEL_OPTION = typer.Option(8, "--parallel", help="동시 업로드 쓰레드 수 (기본: 8)")
+PARALLEL_OPTION = typer.Option(
+    8, "--parallel", min=1, help="동시 업로드 쓰레드 수, boto3 엔진에 적용 (기본: 8)"
+)
+SYNC_ENGINES = ("auto", "aws", "boto3")
+ENGINE_OPTION = typer.Option(
+    "auto",
+    "--engine",
+    help="동기화 엔진: auto(AWS CLI가 있으면 aws), aws, boto3 (기본: auto)",
+)
+CHUNK_SIZE_OPTION = typer.Option(
+    DEFAULT_CHUNK_SIZE // (1024 * 1024),
+    "--chunk-size",
+    min=5,
+    help="boto3 엔진의 멀티파트 파트 크기(MB) (기본: 8)",
+)
+REHASH_OPTION = typer.Option(
+    False,
+    "--rehash",
+    help="sync 상태 DB에 저장된 해시를 무시하고 모든 파일을 다시 해시 (boto3 엔진)",
+)
+COMPLETION_PROFILE_OPTION = typer.Option(
+    DEFAULT_PROFILE, "--profile", help="자동완성 후보를 조회할 프로파일"
+)
 
 
 @app.command()
@@ -283,15 +351,21 @@ def sync(
     delete: bool = DELETE_OPTION,
     parallel: int = PARALLEL_OPTION,
     profile: str = PROFILE_OPTION,
+    engine: str = ENGINE_OPTION,
+    chunk_size: int = CHUNK_SIZE_OPTION,
+    rehash: bool = REHASH_OPTION,
 ) -> None:
     """로컬 파일/디렉터리와 S3 프리픽스 간 증분 동기화를 수행합니다.
 
-    AWS CLI의 s3 sync 명령을 사용하여 더 안정적인 동기화를 제공합니다.
-    추가 옵션은 -- 뒤에 전달할 수 있습니다.
+    기본적으로 AWS CLI의 s3 sync 명령을 사용하며, AWS CLI가 없거나
+    --engine boto3를 지정하면 내장 병렬 업로드 엔진을 사용합니다. boto3 엔진은
+    계산한 해시를 로컬 상태 DB에 저장해 변경 없는 파일을 다시 읽지 않습니다.
+    AWS CLI 추가 옵션은 -- 뒤에 전달할 수 있습니다 (aws 엔진 전용).
 
     예시:
         cli-onprem s3-share sync mydir -- --size-only
         cli-onprem s3-share sync myfile.pack -- --exclude "*.tmp"
+        cli-onprem s3-share sync mydir --engine boto3 --parallel 16
     """
     init_logging()
 
@@ -301,17 +375,34 @@ def sync(
         )
         raise typer.Exit(code=1)
 
+    engine = engine.lower()
+    if engine not in SYNC_ENGINES:
+        console.print(
+            f"[bold red]오류: 지원하지 않는 엔진입니다: {engine} "
+            f"({', '.join(SYNC_ENGINES)})[/bold red]"
+        )
+        raise typer.Exit(code=1)
+
     try:
         # AWS CLI 설치 확인
         from cli_onprem.utils.shell import check_command_exists, run_command
 
-        if not check_command_exists("aws"):
+        if engine == "auto":
+            engine = "aws" if check_command_exists("aws") else "boto3"
+        elif engine == "aws" and not check_command_exists("aws"):
             console.print(
                 "[bold red]오류: AWS CLI가 설치되어 있지 않습니다.\n"
                 "설치: https://aws.amazon.com/cli/[/bold red]"
             )
             raise typer.Exit(code=1)
 
+        if engine == "boto3" and ctx.args:
+            console.print(
+                "[bold red]오류: boto3 엔진은 -- 뒤의 AWS CLI 옵션을 지원하지 "
+                f"않습니다: {' '.join(ctx.args)}[/bold red]"
+            )
+            raise typer.Exit(code=1)
+
         creds = get_profile_credentials(profile, check_bucket=True)
 
         s3_bucket = bucket or creds.get("bucket", "")
@@ -327,27 +418,63 @@ def sync(
         final_s3_path = generate_s3_path(src_path, s3_prefix)
         s3_uri = f"s3://{s3_bucket}/{final_s3_path}"
 
-        # AWS CLI 명령 구성
-        cmd = ["aws", "s3", "sync", str(src_path), s3_uri, "--region", creds["region"]]
-
-        if delete:
-            cmd.append("--delete")
-
-        # 추가 인자 처리 (-- 뒤의 모든 인자)
-        if ctx.args:
-            cmd.extend(ctx.args)
-
         console.print(f"[bold blue]'{src_path}' → '{s3_uri}' 동기화 중...[/bold blue]")
 
-        # 환경 변수 설정 (AWS 자격증명)
-        import os
-
-        env = os.environ.copy()
-        env["AWS_ACCESS_KEY_ID"] = creds["aws_access_key"]
-        env["AWS_SECRET_ACCESS_KEY"] = creds["aws_secret_key"]
-
-        # AWS CLI 실행
-        run_command(cmd, env=env)
+        if engine == "boto3":
+            # 모든 업로드 쓰레드가 하나의 클라이언트(연결 풀)를 공유
+            s3_client = create_s3_client(
+                creds["aws_access_key"],
+                creds["aws_secret_key"],
+                creds["region"],
+                max_pool_connections=sync_pool_size(parallel),
+            )
+            state = open_sync_state()
+            try:
+                uploaded, skipped, deleted = sync_to_s3(
+                    s3_client,
+                    src_path,
+                    s3_bucket,
+                    final_s3_path,
+                    delete=delete,
+                    workers=parallel,
+                    transfer_config=create_transfer_config(chunk_size * 1024 * 1024),
+                    state=state,
+                    rehash=rehash,
+                )
+            finally:
+                if state is not None:
+                    state.close()
+            console.print(
+                f"업로드 {uploaded}개, 변경 없음 {skipped}개, 삭제 {deleted}개"
+            )
+        else:
+            # AWS CLI 명령 구성
+            cmd = [
+                "aws",
+                "s3",
+                "sync",
+                str(src_path),
+                s3_uri,
+                "--region",
+                creds["region"],
+            ]
+
+            if delete:
+                cmd.append("--delete")
+
+            # 추가 인자 처리 (-- 뒤의 모든 인자)
+            if ctx.args:
+                cmd.extend(ctx.args)
+
+            # 환경 변수 설정 (AWS 자격증명)
+            import os
+
+            env = os.environ.copy()
+            env["AWS_ACCESS_KEY_ID"] = creds["aws_access_key"]
+            env["AWS_SECRET_ACCESS_KEY"] = creds["aws_secret_key"]
+
+            # AWS CLI 실행
+            run_command(cmd, env=env)
 
         console.print("[bold green]동기화 완료[/bold green]")
 
@@ -552,3 +679,21 @@ def presign(
     except CLIError as e:
         console.print(f"[bold red]오류: {e}[/bold red]")
         raise typer.Exit(code=1) from e
+
+
+@app.command("refresh-completion", hidden=True)
+def refresh_completion(
+    kind: Annotated[str, typer.Argument(help="자동완성 종류")],
+    scope: Annotated[str, typer.Argument(help="후보 범위 (버킷/경로)")] = "",
+    profile: str = COMPLETION_PROFILE_OPTION,
+) -> None:
+    """자동완성 캐시를 갱신합니다 (오래된 캐시를 쓴 자동완성이 백그라운드로 실행)."""
+    fetch = COMPLETION_FETCHERS.get(kind)
+    if fetch is None:
+        raise typer.Exit(code=1)
+
+    try:
+        CompletionCache().refresh(kind, profile, scope, lambda: fetch(profile, scope))
+    except Exception as e:
+        logger.debug(f"자동완성 캐시 갱신 실패: {e}")
+        raise typer.Exit(code=1) from e
@@ -0,0 +1,80 @@
+"""하위 명령어 모듈을 실제로 실행할 때만 불러오는 Typer 그룹.
+
+명령어 모듈은 boto3, PyYAML 등 무거운 의존성을 불러오므로, 최상위 그룹에는
+이름과 도움말만 등록해 두고 해당 하위 명령어가 호출될 때 모듈을 import
+합니다. `--help` 목록과 하위 명령어 이름 자동완성은 모듈을 불러오지 않습니다.
+"""
+
+import importlib
+from typing import Any, Dict, List, Optional, TypedDict
+
+import click
+import typer
+from typer.core import TyperGroup
+
+
+class LazyCommandSpec(TypedDict):
+    """지연 로딩할 하위 명령어.
+
+    import_path는 `모듈 경로:Typer 앱 속성` 형식입니다.
+    """
+
+    import_path: str
+    help: str
+
+
+def load_command(import_path: str, name: str) -> click.Command:
+    """`모듈:속성` 경로의 Typer 앱을 불러와 click 그룹으로 변환합니다."""
+    module_path, attr_name = import_path.split(":")
+    module = importlib.import_module(module_path)
+    sub_app: typer.Typer = getattr(module, attr_name)
+    command = typer.main.get_group(sub_app)
+    command.name = name
+    return command
+
+
+class LazyTyperGroup(TyperGroup):
+    """lazy_commands에 등록된 하위 명령어를 처음 사용할 때 불러오는 그룹.
+
+    서브클래스에서 lazy_commands를 지정해 `typer.Typer(cls=...)`로 사용합니다.
+    """
+
+    lazy_commands: Dict[str, LazyCommandSpec] = {}
+
+    def __init__(self, **attrs: Any) -> None:
+        super().__init__(**attrs)
+        # 도움말/이름 자동완성 중에는 모듈을 불러오지 않고 요약만 반환
+        self._summary_only = False
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        names = super().list_commands(ctx)
+        return names + [name for name in self.lazy_commands if name not in names]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in self.lazy_commands:
+            return command
+
+        spec = self.lazy_commands[cmd_name]
+        if self._summary_only:
+            return click.Command(cmd_name, help=spec["help"])
+
+        command = load_command(spec["import_path"], cmd_name)
+        self.add_command(command, cmd_name)
+        return command
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        self._summary_only = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._summary_only = False
+
+    def shell_complete(
+        self, ctx: click.Context, incomplete: str
+    ) -> List[click.shell_completion.CompletionItem]:
+        self._summary_only = True
+        try:
+            return super().shell_complete(ctx, incomplete)
+        finally:
+            self._summary_only = False
@@ -0,0 +1,110 @@
+"""레지스트리 블롭의 콘텐츠 주소 기반 로컬 다운로드 캐시.
+
+블롭은 `<config_dir>/cache/blobs/sha256/<hex>`에 저장하고, 받는 중인 블롭은
+같은 경로의 `.partial` 파일에 이어 씁니다. 다운로드가 중간에 끊기거나 다른
+이미지가 같은 레이어를 공유하면 이미 받은 바이트를 재사용하며, 전체 크기는
+최근 사용 순(LRU)으로 정리해 상한 이하로 유지합니다.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from cli_onprem.core.logging import get_logger
+from cli_onprem.services.credential import get_config_dir
+from cli_onprem.utils.fs import evict_lru
+
+logger = get_logger("services.blob_cache")
+
+MB = 1024 * 1024
+DEFAULT_MAX_BYTES = int(os.getenv("CLI_ONPREM_BLOB_CACHE_MAX_MB", "20480")) * MB
+
+
+def get_blob_cache_dir() -> Path:
+    """기본 블롭 캐시 디렉터리 경로를 반환합니다."""
+    return get_config_dir() / "cache" / "blobs"
+
+
+class BlobCache:
+    """콘텐츠 주소(다이제스트) 기반 블롭 캐시.
+
+    Args:
+        root: 캐시 디렉터리 (기본값: get_blob_cache_dir())
+        max_bytes: 캐시 최대 크기 (바이트). prune 시 적용
+    """
+
+    def __init__(self, root: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = root or get_blob_cache_dir()
+        self.max_bytes = max_bytes
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def path_for(self, digest: str) -> Path:
+        """다이제스트에 해당하는 캐시 파일 경로를 반환합니다."""
+        algorithm, _, hex_digest = digest.partition(":")
+        return self.root / algorithm / hex_digest
+
+    def get(self, digest: str) -> Optional[Path]:
+        """캐시된 블롭 경로를 반환하고 사용 시각을 갱신합니다."""
+        path = self.path_for(digest)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def _lock_for(self, digest: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(digest, threading.Lock())
+
+    def fetch(self, digest: str, download: Callable[[Path], None]) -> bool:
+        """블롭이 캐시에 없으면 download(경로)로 받아 캐시에 넣습니다.
+
+        download는 대상 경로의 `.partial` 파일에 이어 쓰고 검증이 끝나면
+        대상 경로로 옮겨야 합니다 (RegistryClient.download_blob).
+        같은 다이제스트를 동시에 요청하면 한 번만 내려받습니다.
+
+        Args:
+            digest: 블롭 다이제스트
+            download: 블롭을 주어진 경로에 기록하는 함수
+
+        Returns:
+            캐시 적중이면 True
+        """
+        with self._lock_for(digest):
+            if self.get(digest) is not None:
+                logger.debug(f"블롭 캐시 적중: {digest}")
+                return True
+
+            path = self.path_for(digest)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            download(path)
+            return False
+
+    def size(self) -> int:
+        """캐시가 사용 중인 총 바이트 수 (`.partial` 포함)."""
+        return sum(
+            path.stat().st_size for path in self.root.glob("*/*") if path.is_file()
+        )
+
+    def prune(self, keep: Iterable[str] = ()) -> List[Path]:
+        """최근 사용 순으로 오래된 블롭을 삭제해 최대 크기 이하로 맞춥니다.
+
+        Args:
+            keep: 삭제하지 않을 블롭 다이제스트 (방금 사용한 블롭 등)
+
+        Returns:
+            삭제한 파일 경로 리스트
+        """
+        if not self.root.exists():
+            return []
+        removed = evict_lru(
+            self.root,
+            self.max_bytes,
+            pattern="*/*",
+            keep=[self.path_for(digest) for digest in keep],
+        )
+        if removed:
+            logger.info(f"블롭 캐시 정리: {len(removed)}개 파일 삭제")
+        return removed
@@ -0,0 +1,284 @@
+"""Helm 차트 아카이브의 콘텐츠 주소 기반 로컬 캐시.
+
+ChartCache는 `helm dependency update`가 받은 서브차트 아카이브를 저장소 URL,
+이름, 버전을 키로 `<config_dir>/cache/charts/`에 보관합니다. 아카이브 자체는
+SHA256 다이제스트 경로(`blobs/sha256/<hex>.tgz`)에 한 번만 저장하고, 키별 색인
+파일(`index/<key>.json`)이 다이제스트를 가리킵니다. 캐시 디렉터리를 그대로
+복사하면 네트워크가 없는 빌드 환경에서도 같은 서브차트를 복원할 수 있습니다.
+
+ChartExtractCache는 차트 아카이브(.tgz)를 다이제스트별 디렉터리에 한 번만
+풀어 두고 재사용합니다. CLI_ONPREM_CHART_EXTRACT_DIR로 tmpfs(예: /dev/shm)
+경로를 지정할 수 있습니다.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Callable, List, Optional, TypedDict
+
+from cli_onprem.core.logging import get_logger
+from cli_onprem.services.credential import get_config_dir
+from cli_onprem.utils.fs import evict_lru
+from cli_onprem.utils.hash import calculate_file_sha256
+
+logger = get_logger("services.chart_cache")
+
+MB = 1024 * 1024
+DEFAULT_MAX_BYTES = int(os.getenv("CLI_ONPREM_CHART_CACHE_MAX_MB", "1024")) * MB
+DEFAULT_MAX_EXTRACTED = int(os.getenv("CLI_ONPREM_CHART_EXTRACT_MAX_ENTRIES", "64"))
+
+# 추출이 끝난 항목에만 쓰는 표시 파일 (내용은 차트 루트 디렉터리 이름)
+_COMPLETE_MARKER = ".chart-root"
+
+
+class ChartCacheEntry(TypedDict):
+    """색인 항목."""
+
+    repository: str
+    name: str
+    version: str
+    digest: str
+
+
+def get_chart_cache_dir() -> Path:
+    """기본 서브차트 캐시 디렉터리 경로를 반환합니다."""
+    return get_config_dir() / "cache" / "charts"
+
+
+def get_chart_extract_dir() -> Path:
+    """기본 차트 추출 캐시 디렉터리 경로를 반환합니다."""
+    override = os.getenv("CLI_ONPREM_CHART_EXTRACT_DIR")
+    if override:
+        return Path(override)
+    return get_config_dir() / "cache" / "extracted"
+
+
+def chart_cache_key(repository: str, name: str, version: str) -> str:
+    """저장소 URL, 차트 이름, 버전으로 색인 키를 계산합니다.
+
+    저장소 URL 끝의 '/'는 무시합니다.
+    """
+    material = f"{repository.rstrip('/')}\n{name}\n{version}"
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class ChartCache:
+    """서브차트 아카이브 캐시.
+
+    Args:
+        root: 캐시 디렉터리 (기본값: get_chart_cache_dir())
+        max_bytes: 아카이브 총 크기 상한 (바이트)
+    """
+
+    def __init__(self, root: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = root or get_chart_cache_dir()
+        self.max_bytes = max_bytes
+
+    @property
+    def _blob_dir(self) -> Path:
+        return self.root / "blobs" / "sha256"
+
+    def _index_path(self, repository: str, name: str, version: str) -> Path:
+        return (
+            self.root / "index" / f"{chart_cache_key(repository, name, version)}.json"
+        )
+
+    def _blob_path(self, digest: str) -> Path:
+        return self._blob_dir / f"{digest.partition(':')[2]}.tgz"
+
+    def get(self, repository: str, name: str, version: str) -> Optional[Path]:
+        """캐시된 서브차트 아카이브 경로를 반환하고 사용 시각을 갱신합니다.
+
+        아카이브 내용이 색인의 다이제스트와 다르면 삭제하고 없는 것으로
+        처리합니다.
+
+        Returns:
+            아카이브 경로. 캐시에 없거나 손상된 경우 None
+        """
+        index_path = self._index_path(repository, name, version)
+        try:
+            entry: ChartCacheEntry = json.loads(index_path.read_text(encoding="utf-8"))
+            digest = entry["digest"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"손상된 서브차트 캐시 색인 무시: {index_path} ({e})")
+            return None
+
+        blob_path = self._blob_path(digest)
+        if not blob_path.is_file():
+            return None
+        if f"sha256:{calculate_file_sha256(blob_path)}" != digest:
+            logger.warning(f"다이제스트 불일치로 캐시 아카이브 삭제: {blob_path}")
+            blob_path.unlink(missing_ok=True)
+            return None
+
+        os.utime(blob_path)
+        logger.info(f"서브차트 캐시 적중: {name}-{version}")
+        return blob_path
+
+    def put(self, repository: str, name: str, version: str, archive: Path) -> str:
+        """서브차트 아카이브를 저장하고 크기 상한을 적용합니다.
+
+        Args:
+            repository: 차트 저장소 URL
+            name: 차트 이름
+            version: 차트 버전 (정확한 버전)
+            archive: 저장할 아카이브 경로
+
+        Returns:
+            아카이브 다이제스트 (sha256:...)
+        """
+        digest = f"sha256:{calculate_file_sha256(archive, chunk_size=1024 * 1024)}"
+        blob_path = self._blob_path(digest)
+        if not blob_path.exists():
+            self._blob_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = _tmp_path(blob_path)
+            shutil.copyfile(archive, tmp_path)
+            os.replace(tmp_path, blob_path)
+        else:
+            os.utime(blob_path)
+
+        index_path = self._index_path(repository, name, version)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        entry: ChartCacheEntry = {
+            "repository": repository,
+            "name": name,
+            "version": version,
+            "digest": digest,
+        }
+        tmp_path = _tmp_path(index_path)
+        tmp_path.write_text(json.dumps(entry, indent=2), encoding="utf-8")
+        os.replace(tmp_path, index_path)
+
+        removed = evict_lru(
+            self._blob_dir, self.max_bytes, pattern="*.tgz", keep=[blob_path]
+        )
+        if removed:
+            logger.info(f"서브차트 캐시 정리: {len(removed)}개 파일 삭제")
+        return digest
+
+
+class ChartExtractCache:
+    """아카이브 다이제스트별로 풀어 둔 차트 디렉터리 캐시.
+
+    같은 .tgz를 다시 처리하면 압축을 다시 풀지 않습니다. 캐시 항목은 여러
+    실행과 스레드가 공유하므로 읽기 전용으로 다루고, 의존성 동기화처럼 차트를
+    바꾸는 작업은 checkout()으로 작업 디렉터리에 복사한 차트에서 합니다.
+
+    Args:
+        root: 캐시 디렉터리 (기본값: get_chart_extract_dir())
+        max_entries: 보관할 최대 항목 수 (최근 사용 순으로 정리)
+    """
+
+    def __init__(
+        self, root: Optional[Path] = None, max_entries: int = DEFAULT_MAX_EXTRACTED
+    ):
+        self.root = root or get_chart_extract_dir()
+        self.max_entries = max_entries
+
+    def get(self, digest: str) -> Optional[Path]:
+        """다이제스트에 해당하는 차트 루트를 반환하고 사용 시각을 갱신합니다."""
+        entry = self.root / digest
+        try:
+            chart_root = entry / (entry / _COMPLETE_MARKER).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        if not (chart_root / "Chart.yaml").is_file():
+            return None
+        os.utime(entry)
+        return chart_root
+
+    def load(self, archive: Path, extract: Callable[[Path, Path], Path]) -> Path:
+        """아카이브를 추출하거나 캐시된 차트 루트를 반환합니다.
+
+        Args:
+            archive: 차트 아카이브 경로
+            extract: (아카이브, 대상 디렉터리) → 차트 루트 추출 함수
+
+        Returns:
+            차트 루트 디렉터리
+        """
+        digest = calculate_file_sha256(archive, chunk_size=1024 * 1024)
+        if digest is None:
+            raise FileNotFoundError(f"차트 아카이브를 읽을 수 없습니다: {archive}")
+
+        cached = self.get(digest)
+        if cached is not None:
+            logger.info(f"차트 추출 캐시 적중: {archive}")
+            return cached
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        staging = _tmp_path(self.root / digest)
+        try:
+            chart_root = extract(archive, staging)
+            relative = chart_root.relative_to(staging).as_posix()
+            (staging / _COMPLETE_MARKER).write_text(relative, encoding="utf-8")
+            try:
+                os.replace(staging, self.root / digest)
+            except OSError:
+                # 다른 실행이 먼저 같은 아카이브를 추출함
+                logger.debug(f"이미 추출된 차트 사용: {self.root / digest}")
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        self.prune(keep=digest)
+        result = self.get(digest)
+        if result is None:  # pragma: no cover - 추출 직후 삭제된 경우
+            raise FileNotFoundError(f"추출된 차트를 찾을 수 없습니다: {archive}")
+        return result
+
+    def checkout(
+        self, archive: Path, workdir: Path, extract: Callable[[Path, Path], Path]
+    ) -> Path:
+        """캐시된 차트를 workdir에 복사해 수정해도 되는 차트 루트를 반환합니다.
+
+        복사 중에 다른 실행이 항목을 정리하면 workdir에 직접 추출합니다.
+
+        Args:
+            archive: 차트 아카이브 경로
+            workdir: 복사할 작업 디렉터리
+            extract: (아카이브, 대상 디렉터리) → 차트 루트 추출 함수
+
+        Returns:
+            workdir 아래의 차트 루트 디렉터리
+        """
+        cached = self.load(archive, extract)
+        target = workdir / cached.name
+        try:
+            shutil.copytree(cached, target, symlinks=True)
+        except (OSError, shutil.Error) as e:
+            logger.debug(f"캐시된 차트 복사 실패, 다시 추출합니다: {e}")
+            shutil.rmtree(target, ignore_errors=True)
+            return extract(archive, workdir)
+        return target
+
+    def prune(self, keep: Optional[str] = None) -> List[Path]:
+        """최근 사용 순으로 max_entries개만 남기고 나머지 항목을 삭제합니다."""
+        entries = []
+        for path in self.root.iterdir():
+            if path.name.startswith(".") or not path.is_dir():
+                continue
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+
+        entries.sort(key=lambda entry: entry[0], reverse=True)
+        removed: List[Path] = []
+        for _, path in entries[self.max_entries :]:
+            if path.name == keep:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            removed.append(path)
+        if removed:
+            logger.info(f"차트 추출 캐시 정리: {len(removed)}개 항목 삭제")
+        return removed
+
+
+def _tmp_path(path: Path) -> Path:
+    """같은 프로세스의 여러 스레드가 동시에 써도 겹치지 않는 임시 파일 경로."""
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
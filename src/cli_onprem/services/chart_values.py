@@ -0,0 +1,296 @@
+"""helm 없이 values.yaml만으로 차트 이미지를 찾는 분석기.
+
+대부분의 차트는 `image.repository` + `image.tag`처럼 이미지를 values에
+선언하므로, `helm template`을 실행하지 않고 차트와 서브차트(charts/ 아래
+디렉토리 또는 .tgz)의 values를 helm과 같은 방식으로 합쳐 탐색하면 1초 안에
+결과를 얻을 수 있습니다. 템플릿에 직접 쓴 이미지나 조건부 렌더링은 놓칠 수
+있으므로 diff_image_sets()로 전체 렌더링 결과와 비교해 확인합니다.
+"""
+
+import io
+import pathlib
+import tarfile
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TypedDict
+
+from cli_onprem.core.logging import get_logger
+from cli_onprem.core.types import ImageSet
+from cli_onprem.services.docker import (
+    collect_images_from_values,
+    normalize_image_name,
+)
+from cli_onprem.services.helm import find_chart_root
+from cli_onprem.utils import file
+
+logger = get_logger("services.chart_values")
+
+
+class ChartValues(TypedDict):
+    """차트 하나의 최종 values (부모 values와 -f 파일을 적용한 결과).
+
+    values에서 서브차트 항목(`<이름 또는 alias>` 키)은 제외됩니다.
+    """
+
+    chart: str
+    values: Dict[str, Any]
+    app_version: Optional[str]
+
+
+class ImageDiff(TypedDict):
+    """values 분석 결과와 렌더링 결과의 비교."""
+
+    common: List[str]
+    values_only: List[str]
+    render_only: List[str]
+
+
+class _ChartReader(ABC):
+    """차트 파일 읽기 인터페이스 (차트 루트 기준 상대 경로)."""
+
+    @abstractmethod
+    def read(self, relative: str) -> Optional[bytes]:
+        """파일 내용을 반환합니다 (없으면 None)."""
+
+    @abstractmethod
+    def subcharts(self) -> List["_ChartReader"]:
+        """charts/ 아래 서브차트 리더 목록을 반환합니다."""
+
+
+class _DirectoryChartReader(_ChartReader):
+    """차트 디렉토리의 파일을 읽습니다."""
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+
+    def read(self, relative: str) -> Optional[bytes]:
+        try:
+            return (self.path / relative).read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return None
+
+    def subcharts(self) -> List[_ChartReader]:
+        charts_dir = self.path / "charts"
+        if not charts_dir.is_dir():
+            return []
+        readers: List[_ChartReader] = []
+        for child in sorted(charts_dir.iterdir()):
+            if child.is_dir() and (child / "Chart.yaml").is_file():
+                readers.append(_DirectoryChartReader(child))
+            elif child.is_file() and child.name.endswith(".tgz"):
+                archive = _ArchiveChartReader.load(child.read_bytes(), child.name)
+                if archive is not None:
+                    readers.append(archive)
+        return readers
+
+
+class _ArchiveChartReader(_ChartReader):
+    """메모리에 읽은 차트 아카이브의 파일을 읽습니다 (추출하지 않음)."""
+
+    def __init__(self, files: Dict[str, bytes]):
+        self.files = files
+
+    @classmethod
+    def load(cls, data: bytes, label: str) -> Optional["_ArchiveChartReader"]:
+        try:
+            with tarfile.open(fileobj=io.BytesIO(data), mode="r:*") as tar:
+                members = tar.getmembers()
+                root = find_chart_root(member.name for member in members)
+                if root is None:
+                    return None
+                files: Dict[str, bytes] = {}
+                for member in members:
+                    name = file.member_path(member.name)
+                    if name is None or not member.isfile():
+                        continue
+                    if not name.startswith(f"{root}/"):
+                        continue
+                    extracted = tar.extractfile(member)
+                    if extracted is not None:
+                        files[name[len(root) + 1 :]] = extracted.read()
+        except (tarfile.TarError, OSError) as e:
+            logger.warning(f"서브차트 아카이브를 읽을 수 없음: {label} ({e})")
+            return None
+        return cls(files)
+
+    def read(self, relative: str) -> Optional[bytes]:
+        return self.files.get(relative)
+
+    def subcharts(self) -> List[_ChartReader]:
+        readers: List[_ChartReader] = []
+        nested_dirs = set()
+        for name in sorted(self.files):
+            if not name.startswith("charts/"):
+                continue
+            parts = name.split("/")
+            if len(parts) == 2 and name.endswith(".tgz"):
+                archive = _ArchiveChartReader.load(self.files[name], name)
+                if archive is not None:
+                    readers.append(archive)
+            elif len(parts) == 3 and parts[2] == "Chart.yaml":
+                nested_dirs.add(parts[1])
+        for directory in sorted(nested_dirs):
+            prefix = f"charts/{directory}/"
+            readers.append(
+                _ArchiveChartReader(
+                    {
+                        name[len(prefix) :]: data
+                        for name, data in self.files.items()
+                        if name.startswith(prefix)
+                    }
+                )
+            )
+        return readers
+
+
+def _load(data: Optional[bytes]) -> Dict[str, Any]:
+    if data is None:
+        return {}
+    loaded = file.load_yaml(data)
+    return loaded if isinstance(loaded, dict) else {}
+
+
+def merge_values(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """helm처럼 values를 재귀적으로 합칩니다 (override 우선, null은 키 삭제)."""
+    merged = dict(base)
+    for key, value in override.items():
+        if value is None:
+            merged.pop(key, None)
+        elif isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_values(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _condition_enabled(values: Dict[str, Any], condition: str) -> bool:
+    """Chart.yaml의 condition(쉼표로 구분된 values 경로)을 평가합니다.
+
+    처음으로 불리언 값이 나오는 경로가 결과를 정하며, 없으면 활성화로 봅니다.
+    """
+    for path in condition.split(","):
+        current: Any = values
+        for key in path.strip().split("."):
+            if not isinstance(current, dict) or key not in current:
+                current = None
+                break
+            current = current[key]
+        if isinstance(current, bool):
+            return current
+    return True
+
+
+def _walk(
+    reader: _ChartReader,
+    label: str,
+    override: Dict[str, Any],
+    global_values: Dict[str, Any],
+) -> Iterator[ChartValues]:
+    chart = _load(reader.read("Chart.yaml"))
+    values = merge_values(_load(reader.read("values.yaml")), override)
+    if global_values:
+        values["global"] = merge_values(values.get("global") or {}, global_values)
+
+    declared = chart.get("dependencies")
+    if declared is None:
+        declared = _load(reader.read("requirements.yaml")).get("dependencies")
+    dependencies = [dep for dep in declared or [] if isinstance(dep, dict)]
+
+    # (values 키, 서브차트 reader, condition)
+    subcharts = []
+    for subchart in reader.subcharts():
+        name = str(_load(subchart.read("Chart.yaml")).get("name") or "")
+        if not name:
+            continue
+        matches = [dep for dep in dependencies if dep.get("name") == name]
+        for dep in matches or [{"name": name}]:
+            subcharts.append((str(dep.get("alias") or name), subchart, dep))
+
+    # 서브차트 항목은 서브차트 values와 합친 뒤 따로 탐색
+    subchart_keys = {key for key, _, _ in subcharts}
+    app_version = chart.get("appVersion")
+    yield {
+        "chart": label,
+        "values": {k: v for k, v in values.items() if k not in subchart_keys},
+        "app_version": str(app_version) if app_version is not None else None,
+    }
+
+    subchart_globals = values.get("global")
+    if not isinstance(subchart_globals, dict):
+        subchart_globals = {}
+    for key, subchart, dep in subcharts:
+        condition = dep.get("condition")
+        if isinstance(condition, str) and not _condition_enabled(values, condition):
+            logger.info(f"비활성화된 서브차트 건너뜀: {label}/charts/{key}")
+            continue
+        sub_override = values.get(key)
+        yield from _walk(
+            subchart,
+            f"{label}/charts/{key}",
+            sub_override if isinstance(sub_override, dict) else {},
+            subchart_globals,
+        )
+
+
+def iter_chart_values(
+    chart_dir: pathlib.Path, values_files: Sequence[pathlib.Path] = ()
+) -> Iterator[ChartValues]:
+    """차트와 서브차트의 최종 values를 차례로 반환합니다.
+
+    부모 values의 `<서브차트 이름 또는 alias>` 항목과 `global`을 서브차트
+    values에 합치고, condition이 false인 서브차트는 건너뜁니다.
+
+    Args:
+        chart_dir: Helm 차트 디렉토리
+        values_files: 부모 차트에 적용할 추가 values 파일 (순서대로 우선)
+
+    Yields:
+        차트별 최종 values
+
+    Raises:
+        FileNotFoundError: values 파일이 존재하지 않을 경우
+    """
+    override: Dict[str, Any] = {}
+    for values_file in values_files:
+        if not values_file.is_file():
+            raise FileNotFoundError(f"Values 파일을 찾을 수 없습니다: {values_file}")
+        override = merge_values(override, _load(values_file.read_bytes()))
+
+    yield from _walk(_DirectoryChartReader(chart_dir), chart_dir.name, override, {})
+
+
+def extract_images_from_values(
+    chart_dir: pathlib.Path,
+    values_files: Sequence[pathlib.Path] = (),
+    normalize: bool = True,
+) -> List[str]:
+    """helm template 없이 차트 values에서 이미지 목록을 추출합니다.
+
+    Args:
+        chart_dir: Helm 차트 디렉토리
+        values_files: 추가 values 파일
+        normalize: 이미지 이름 정규화 여부
+
+    Returns:
+        정렬된 이미지 목록
+    """
+    images: ImageSet = set()
+    charts = 0
+    for chart in iter_chart_values(chart_dir, values_files):
+        charts += 1
+        collect_images_from_values(chart["values"], images, chart["app_version"])
+    logger.info(f"values 분석: 차트 {charts}개에서 {len(images)}개 이미지 발견")
+
+    if normalize:
+        return sorted({normalize_image_name(image) for image in images})
+    return sorted(images)
+
+
+def diff_image_sets(values_images: List[str], rendered_images: List[str]) -> ImageDiff:
+    """values 분석 결과와 전체 렌더링 결과를 비교합니다."""
+    from_values = set(values_images)
+    rendered = set(rendered_images)
+    return {
+        "common": sorted(from_values & rendered),
+        "values_only": sorted(from_values - rendered),
+        "render_only": sorted(rendered - from_values),
+    }
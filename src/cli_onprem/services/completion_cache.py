@@ -0,0 +1,202 @@
+"""셸 자동완성 후보 디스크 캐시.
+
+TAB을 누를 때마다 S3 API를 호출하지 않도록 자동완성 후보 목록을 종류,
+프로파일, 범위(버킷/경로)별로 `<config_dir>/cache/completion/`에 저장합니다.
+TTL이 지난 항목도 즉시 반환하고, 분리된 백그라운드 프로세스로 갱신합니다
+(stale-while-revalidate). 캐시가 없을 때만 그 자리에서 조회합니다.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple, TypedDict
+
+from cli_onprem.core.logging import get_logger
+from cli_onprem.services.credential import get_config_dir
+
+logger = get_logger("services.completion_cache")
+
+# 0이면 캐시를 사용하지 않고 항상 조회
+DEFAULT_TTL = float(os.getenv("CLI_ONPREM_COMPLETION_TTL", "300"))
+# 갱신 프로세스가 비정상 종료해도 이 시간이 지나면 다시 갱신
+REFRESH_LOCK_SECONDS = 60.0
+
+
+class CompletionEntry(TypedDict):
+    """캐시 항목."""
+
+    kind: str
+    profile: str
+    scope: str
+    created: float
+    values: List[str]
+
+
+def get_completion_cache_dir() -> Path:
+    """기본 자동완성 캐시 디렉터리 경로를 반환합니다."""
+    return get_config_dir() / "cache" / "completion"
+
+
+def completion_cache_key(kind: str, profile: str, scope: str) -> str:
+    """자동완성 종류, 프로파일, 범위로 캐시 키를 계산합니다."""
+    material = json.dumps([kind, profile, scope])
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class CompletionCache:
+    """자동완성 후보 캐시.
+
+    Args:
+        root: 캐시 디렉터리 (기본값: get_completion_cache_dir())
+        ttl: 항목을 새것으로 보는 시간(초)
+        clock: 현재 시각 함수 (테스트용 주입)
+    """
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        ttl: float = DEFAULT_TTL,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.root = root or get_completion_cache_dir()
+        self.ttl = ttl
+        self._clock = clock
+
+    def _path(self, kind: str, profile: str, scope: str, suffix: str) -> Path:
+        return self.root / f"{completion_cache_key(kind, profile, scope)}{suffix}"
+
+    def get(
+        self, kind: str, profile: str, scope: str
+    ) -> Optional[Tuple[List[str], bool]]:
+        """캐시된 후보와 신선도(TTL 이내 여부)를 반환합니다 (없으면 None)."""
+        path = self._path(kind, profile, scope, ".json")
+        try:
+            entry: CompletionEntry = json.loads(path.read_text(encoding="utf-8"))
+            values = [str(value) for value in entry["values"]]
+            created = float(entry["created"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return values, self._clock() - created < self.ttl
+
+    def put(self, kind: str, profile: str, scope: str, values: Sequence[str]) -> None:
+        """후보 목록을 저장합니다."""
+        path = self._path(kind, profile, scope, ".json")
+        entry: CompletionEntry = {
+            "kind": kind,
+            "profile": profile,
+            "scope": scope,
+            "created": self._clock(),
+            "values": list(values),
+        }
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(entry), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"자동완성 캐시 저장 실패: {e}")
+
+    def claim_refresh(self, kind: str, profile: str, scope: str) -> bool:
+        """갱신 잠금을 얻습니다 (이미 다른 프로세스가 갱신 중이면 False)."""
+        lock = self._path(kind, profile, scope, ".refresh")
+        now = self._clock()
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            if lock.exists() and now - _read_claimed(lock) > REFRESH_LOCK_SECONDS:
+                lock.unlink(missing_ok=True)
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except OSError:
+            return False
+        with os.fdopen(fd, "w") as f:
+            f.write(str(now))
+        return True
+
+    def release_refresh(self, kind: str, profile: str, scope: str) -> None:
+        """갱신 잠금을 해제합니다."""
+        self._path(kind, profile, scope, ".refresh").unlink(missing_ok=True)
+
+    def refresh(
+        self, kind: str, profile: str, scope: str, fetch: Callable[[], List[str]]
+    ) -> List[str]:
+        """후보를 조회해 저장하고 잠금을 해제합니다."""
+        try:
+            values = fetch()
+            self.put(kind, profile, scope, values)
+            return values
+        finally:
+            self.release_refresh(kind, profile, scope)
+
+
+def _read_claimed(lock: Path) -> float:
+    """갱신 잠금을 얻은 시각을 읽습니다 (읽을 수 없으면 0)."""
+    try:
+        return float(lock.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return 0.0
+
+
+def spawn_refresh(argv: Sequence[str]) -> None:
+    """`cli-onprem <argv>`를 분리된 백그라운드 프로세스로 실행합니다.
+
+    자동완성 프로세스는 후보를 출력하자마자 종료되므로 스레드 대신 새 세션의
+    프로세스를 사용합니다.
+    """
+    subprocess.Popen(
+        [sys.executable, "-m", "cli_onprem", *argv],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        close_fds=True,
+    )
+
+
+def cached_completions(
+    kind: str,
+    profile: str,
+    scope: str,
+    fetch: Callable[[], List[str]],
+    refresh_argv: Sequence[str],
+    cache: Optional[CompletionCache] = None,
+    spawn: Callable[[Sequence[str]], None] = spawn_refresh,
+) -> List[str]:
+    """캐시를 우선 사용해 자동완성 후보를 반환합니다.
+
+    - 신선한 항목: 그대로 반환
+    - 오래된 항목: 그대로 반환하고 refresh_argv로 백그라운드 갱신 시작
+    - 항목 없음: fetch()로 조회해 저장 (조회 실패 시 예외 전파, 저장 안 함)
+
+    Args:
+        kind: 자동완성 종류 (예: "buckets")
+        profile: 자격증명 프로파일
+        scope: 후보 범위 (예: 버킷/경로)
+        fetch: 후보 조회 함수
+        refresh_argv: 백그라운드 갱신에 사용할 cli-onprem 인자
+        cache: 사용할 캐시 (기본값: CompletionCache())
+        spawn: 백그라운드 실행 함수 (테스트용 주입)
+
+    Returns:
+        후보 목록 (접두사 필터링 전)
+    """
+    cache = cache or CompletionCache()
+    if cache.ttl <= 0:
+        return fetch()
+
+    cached = cache.get(kind, profile, scope)
+    if cached is None:
+        values = fetch()
+        cache.put(kind, profile, scope, values)
+        return values
+
+    values, fresh = cached
+    if not fresh and cache.claim_refresh(kind, profile, scope):
+        try:
+            spawn(refresh_argv)
+        except OSError as e:
+            logger.debug(f"자동완성 캐시 갱신 시작 실패: {e}")
+            cache.release_refresh(kind, profile, scope)
+    return values
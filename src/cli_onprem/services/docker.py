@@ -3,10 +3,21 @@
 import os
 import re
 import subprocess
+import sys
 import time
-from typing import Any, List, Optional, Set, Tuple
-
-import yaml
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from cli_onprem.core.errors import (
     CommandError,
@@ -16,14 +27,32 @@ from cli_onprem.core.errors import (
 )
 from cli_onprem.core.logging import get_logger
 from cli_onprem.core.types import ImageSet
+from cli_onprem.utils.file import load_yaml_all
+from cli_onprem.utils.image_ref import (
+    DEFAULT_TAG,
+    DOCKER_HUB_NAMESPACE,
+    parse_image_ref,
+    split_reference,
+)
 from cli_onprem.utils.shell import (
     QUICK_TIMEOUT,
     VERY_LONG_TIMEOUT,
     check_command_exists,
+    stream_command_lines,
+    stream_command_output,
 )
 
 logger = get_logger("services.docker")
 
+# pull 진행률 콜백: (완료된 레이어 수, 전체 레이어 수)
+PullProgressCallback = Callable[[int, int], None]
+# save 진행률 콜백: 누적 기록 바이트 수
+SaveProgressCallback = Callable[[int], None]
+
+# docker pull 비-TTY 출력의 레이어 상태 줄 (예: "a1b2c3d4e5f6: Pull complete")
+_PULL_LAYER_LINE = re.compile(r"^([0-9a-f]{12}): (.+)$")
+_PULL_LAYER_DONE = ("Pull complete", "Already exists")
+
 # 기본 레지스트리 목록
 DEFAULT_REGISTRIES = [
     "docker.io",
@@ -36,6 +65,116 @@ DEFAULT_REGISTRIES = [
 ]
 
 
+# 이미지 참조 정규식 패턴
+# 형식: (registry/)?(namespace/)?image(:tag|@digest)?
+# 앞뒤 경계는 소비하지 않도록 전후방 탐색으로 검사해, 공백 하나로 구분된
+# 인접 이미지와 청크 경계에서도 같은 결과를 얻습니다.
+_IMAGE_PATTERN_TEMPLATE = r"""
+    (?:^|(?<=[\s"'=]))                     # 시작 또는 공백, 따옴표, = 뒤
+    ((?:{registries})/)                     # 레지스트리
+    ([a-z0-9_-]+(?:/[a-z0-9_-]+)*)          # 네임스페이스/이미지
+    (?::([a-z0-9_.-]+)|@(sha256:[a-f0-9]{{64}}))?  # 태그 또는 다이제스트
+    (?=$|[\s"'])                           # 끝 또는 공백, 따옴표
+"""
+
+
+class ImageScanner:
+    """레지스트리 목록별로 한 번 컴파일한 정규식으로 이미지 참조를 찾습니다.
+
+    인스턴스는 get_image_scanner()로 얻으면 레지스트리 조합마다 재사용됩니다.
+
+    Args:
+        registries: 검색할 레지스트리 목록
+    """
+
+    def __init__(self, registries: Tuple[str, ...]):
+        self.registries = registries
+        registry_pattern = "|".join(re.escape(reg) for reg in registries)
+        self._pattern = re.compile(
+            _IMAGE_PATTERN_TEMPLATE.format(registries=registry_pattern),
+            re.VERBOSE | re.IGNORECASE,
+        )
+
+    def _scan_into(self, text: str, images: Set[str]) -> None:
+        for match in self._pattern.finditer(text):
+            registry = match.group(1).rstrip("/")
+            full_image = f"{registry}/{match.group(2)}"
+            digest = match.group(4)
+            if digest:
+                full_image = f"{full_image}@{digest}"
+            else:
+                full_image = f"{full_image}:{match.group(3) or 'latest'}"
+            images.add(full_image)
+
+    def scan(self, text: str) -> Set[str]:
+        """텍스트에서 이미지 참조를 찾습니다.
+
+        Args:
+            text: 검색할 텍스트
+
+        Returns:
+            발견된 이미지 세트
+        """
+        images: Set[str] = set()
+        self._scan_into(text, images)
+        return images
+
+    def scan_chunks(self, chunks: Iterable[str]) -> Set[str]:
+        """스트리밍되는 텍스트 조각에서 이미지 참조를 찾습니다.
+
+        이미지 참조는 공백을 포함하지 않으므로 마지막 공백 문자까지만 검사하고
+        나머지는 다음 조각과 이어 붙여 검사합니다. 전체 텍스트를 한 번에
+        scan()한 결과와 같습니다.
+
+        Args:
+            chunks: 텍스트 조각 이터러블 (예: 명령 출력 줄)
+
+        Returns:
+            발견된 이미지 세트
+        """
+        images: Set[str] = set()
+        carry = ""
+        for chunk in chunks:
+            buffer = carry + chunk
+            cut = max(buffer.rfind("\n"), buffer.rfind(" "), buffer.rfind("\t"))
+            if cut < 0:
+                carry = buffer
+                continue
+            self._scan_into(buffer[: cut + 1], images)
+            carry = buffer[cut + 1 :]
+        if carry:
+            self._scan_into(carry, images)
+        return images
+
+
+@lru_cache(maxsize=32)
+def _cached_scanner(registries: Tuple[str, ...]) -> ImageScanner:
+    return ImageScanner(registries)
+
+
+@lru_cache(maxsize=8)
+def _registries_from_env(env_value: str) -> Tuple[str, ...]:
+    extra = [r.strip() for r in env_value.split(",") if r.strip()]
+    return tuple(DEFAULT_REGISTRIES + extra)
+
+
+def get_image_scanner(registries: Optional[Iterable[str]] = None) -> ImageScanner:
+    """레지스트리 목록에 해당하는 캐시된 ImageScanner를 반환합니다.
+
+    Args:
+        registries: 검색할 레지스트리 목록
+            (기본값: 일반적인 레지스트리 + CLI_ONPREM_REGISTRIES 환경변수)
+
+    Returns:
+        레지스트리 조합별로 공유되는 ImageScanner
+    """
+    if registries is None:
+        key = _registries_from_env(os.environ.get("CLI_ONPREM_REGISTRIES", ""))
+    else:
+        key = tuple(registries)
+    return _cached_scanner(key)
+
+
 def extract_images_from_text(
     text: str, registries: Optional[List[str]] = None
 ) -> Set[str]:
@@ -48,49 +187,7 @@ def extract_images_from_text(
     Returns:
         발견된 이미지 세트
     """
-    if registries is None:
-        # 환경변수에서 추가 레지스트리 읽기
-        env_registries = os.environ.get("CLI_ONPREM_REGISTRIES", "")
-        registries = DEFAULT_REGISTRIES.copy()
-        if env_registries:
-            registries.extend(
-                [r.strip() for r in env_registries.split(",") if r.strip()]
-            )
-
-    # 레지스트리 패턴 생성
-    registry_pattern = "|".join(re.escape(reg) for reg in registries)
-
-    # 이미지 참조 정규식 패턴
-    # 형식: (registry/)?(namespace/)?image(:tag|@digest)?
-    image_pattern = rf"""
-        (?:^|[\s"'=])                           # 시작 또는 공백, 따옴표, = 뒤
-        ((?:{registry_pattern})/)                # 레지스트리
-        ([a-z0-9_-]+(?:/[a-z0-9_-]+)*)          # 네임스페이스/이미지
-        (?::([a-z0-9_.-]+)|@(sha256:[a-f0-9]{{64}}))?  # 태그 또는 다이제스트
-        (?:$|[\s"'])                            # 끝 또는 공백, 따옴표
-    """
-
-    pattern = re.compile(image_pattern, re.VERBOSE | re.IGNORECASE)
-    images = set()
-
-    for match in pattern.finditer(text):
-        registry = match.group(1).rstrip("/") if match.group(1) else ""
-        image_path = match.group(2)
-        tag = match.group(3)
-        digest = match.group(4)
-
-        if registry and image_path:
-            full_image = f"{registry}/{image_path}"
-            if digest:
-                full_image = f"{full_image}@{digest}"
-            elif tag:
-                full_image = f"{full_image}:{tag}"
-            else:
-                full_image = f"{full_image}:latest"
-
-            images.add(full_image)
-
-    return images
+    return get_image_scanner(registries).scan(text)
 
 
 def normalize_image_name(image: str) -> str:
@@ -114,61 +211,16 @@ def normalize_image_name(image: str) -> str:
         user/repo → docker.io/user/repo:latest
         nvcr.io/nvidia → nvcr.io/nvidia:latest
         nvcr.io/nvidia/cuda → nvcr.io/nvidia/cuda:latest
+        docker.io/nginx → docker.io/library/nginx:latest
     """
-    has_digest = "@" in image
-    digest_part = ""
-
-    if has_digest:
-        base_part, digest_part = image.split("@", 1)
-        image = base_part
-
-    has_tag = ":" in image and not (
-        ":" in image.split("/", 1)[0] if "/" in image else False
-    )
-    tag_part = "latest"  # 기본값
-
-    if has_tag:
-        image_part, tag_part = image.split(":", 1)
-        image = image_part
-
-    has_domain = False
-    domain_part = ""
-    remaining_part = image
-
-    if "/" in image:
-        domain_candidate, remaining = image.split("/", 1)
-        if (
-            ("." in domain_candidate)
-            or (domain_candidate == "localhost")
-            or (":" in domain_candidate)
-        ):
-            has_domain = True
-            domain_part = domain_candidate
-            remaining_part = remaining
-
-    if has_domain:
-        normalized = f"{domain_part}/{remaining_part}"
-    else:
-        # Docker Hub 처리
-        slash_count = remaining_part.count("/")
-        if slash_count == 0:
-            # 공식 이미지 (예: nginx)
-            normalized = f"docker.io/library/{remaining_part}"
-        else:
-            # 사용자/조직 이미지 (예: user/repo)
-            normalized = f"docker.io/{remaining_part}"
-
-    # 태그 추가
-    if has_digest:
-        normalized = f"{normalized}@{digest_part}"
-    else:
-        normalized = f"{normalized}:{tag_part}"
-
-    return normalized
+    return parse_image_ref(image).normalized()
 
 
 def extract_images_from_yaml(
-    yaml_content: str, normalize: bool = True, extract_from_text: bool = True
+    yaml_content: str,
+    normalize: bool = True,
+    extract_from_text: bool = True,
+    fast: bool = False,
 ) -> List[str]:
     """YAML 문서에서 이미지 참조를 파싱하고 정렬된 목록을 반환합니다.
 
@@ -176,6 +228,7 @@ def extract_images_from_yaml(
         yaml_content: 렌더링된 Kubernetes 매니페스트
         normalize: 이미지 이름 정규화 여부
         extract_from_text: 텍스트 패턴 매칭으로 추가 이미지 추출 여부
+        fast: 워크로드 컨테이너 경로만 탐색 (collect_images_from_document 참고)
 
     Returns:
         정렬된 이미지 목록
@@ -184,10 +237,10 @@ def extract_images_from_yaml(
     images: ImageSet = set()
     doc_count = 0
 
-    for doc in yaml.safe_load_all(yaml_content):
+    for doc in load_yaml_all(yaml_content):
         if doc is not None:
             doc_count += 1
-            _traverse(doc, images)
+            collect_images_from_document(doc, images, fast)
 
     logger.info(f"총 {doc_count}개 문서 처리, {len(images)}개 고유 이미지 발견")
 
@@ -206,49 +259,306 @@ def extract_images_from_yaml(
         return sorted(images)
 
 
-def _traverse(obj: Any, images: ImageSet) -> None:
-    """객체를 재귀적으로 순회하여 이미지 참조를 수집합니다.
+def iter_images_from_documents(
+    documents: Iterable[str],
+    normalize: bool = True,
+    extract_from_text: bool = True,
+    fast: bool = False,
+) -> Iterator[str]:
+    """YAML 문서를 하나씩 처리하며 새로 발견한 이미지를 바로 내보냅니다.
+
+    helm.stream_template()과 함께 사용하면 렌더링이 끝나기 전에 첫 결과를
+    얻을 수 있고, 한 번에 한 문서만 메모리에 유지합니다.
+
+    Args:
+        documents: YAML 문서 문자열 이터러블
+        normalize: 이미지 이름 정규화 여부
+        extract_from_text: 텍스트 패턴 매칭으로 추가 이미지 추출 여부
+        fast: 워크로드 컨테이너 경로만 탐색
+
+    Yields:
+        처음 발견된 이미지 (중복 제외, 문서 내에서는 정렬 순)
+    """
+    scanner = get_image_scanner() if extract_from_text else None
+    seen: Set[str] = set()
+    doc_count = 0
+
+    for document in documents:
+        found: ImageSet = set()
+        for doc in load_yaml_all(document):
+            if doc is not None:
+                doc_count += 1
+                collect_images_from_document(doc, found, fast)
+        if scanner is not None:
+            found.update(scanner.scan(document))
+
+        names = {normalize_image_name(img) for img in found} if normalize else found
+        for name in sorted(names - seen):
+            seen.add(name)
+            yield name
+
+    logger.info(f"총 {doc_count}개 문서 처리, {len(seen)}개 고유 이미지 발견")
+
+
+def extract_images_from_documents(
+    documents: Iterable[str],
+    normalize: bool = True,
+    extract_from_text: bool = True,
+    fast: bool = False,
+) -> List[str]:
+    """YAML 문서 스트림에서 이미지 참조를 모아 정렬된 목록을 반환합니다.
+
+    결과는 같은 문서를 이어 붙여 extract_images_from_yaml()에 넘긴 것과
+    같습니다.
+
+    Args:
+        documents: YAML 문서 문자열 이터러블
+        normalize: 이미지 이름 정규화 여부
+        extract_from_text: 텍스트 패턴 매칭으로 추가 이미지 추출 여부
+        fast: 워크로드 컨테이너 경로만 탐색
+
+    Returns:
+        정렬된 이미지 목록
+    """
+    return sorted(
+        iter_images_from_documents(documents, normalize, extract_from_text, fast)
+    )
+
+
+# PodSpec의 컨테이너 목록 키 (sidecars는 Argo Workflows 템플릿)
+_CONTAINER_KEYS = ("containers", "initContainers", "ephemeralContainers", "sidecars")
+# 빠른 모드에서 따라가는 경로 키
+# (spec.template.spec, spec.jobTemplate.spec.template.spec,
+#  Argo spec.workflowSpec.templates[].container/script, Prometheus spec.thanos 등)
+_WORKLOAD_PATH_KEYS = (
+    "spec",
+    "template",
+    "jobTemplate",
+    "workflowSpec",
+    "templates",
+    "container",
+    "script",
+    "thanos",
+)
+# 빠른 모드에서 위 경로만 탐색하는 kind
+_WORKLOAD_KINDS = frozenset(
+    {
+        "Pod",
+        "PodTemplate",
+        "Deployment",
+        "StatefulSet",
+        "DaemonSet",
+        "ReplicaSet",
+        "ReplicationController",
+        "Job",
+        "CronJob",
+        # CRD
+        "Rollout",
+        "Workflow",
+        "WorkflowTemplate",
+        "ClusterWorkflowTemplate",
+        "CronWorkflow",
+        "Prometheus",
+        "Alertmanager",
+        "ThanosRuler",
+    }
+)
+# 빠른 모드에서 건너뛰는, 이미지 필드가 없는 kind
+_IMAGELESS_KINDS = frozenset(
+    {
+        "Namespace",
+        "Service",
+        "Endpoints",
+        "ConfigMap",
+        "Secret",
+        "ServiceAccount",
+        "Role",
+        "RoleBinding",
+        "ClusterRole",
+        "ClusterRoleBinding",
+        "Ingress",
+        "IngressClass",
+        "NetworkPolicy",
+        "PersistentVolume",
+        "PersistentVolumeClaim",
+        "StorageClass",
+        "PriorityClass",
+        "PodDisruptionBudget",
+        "HorizontalPodAutoscaler",
+        "LimitRange",
+        "ResourceQuota",
+        "CustomResourceDefinition",
+        "APIService",
+        "MutatingWebhookConfiguration",
+        "ValidatingWebhookConfiguration",
+        "ServiceMonitor",
+        "PodMonitor",
+        "PrometheusRule",
+    }
+)
+
+
+def collect_images_from_document(
+    doc: Any, images: ImageSet, fast: bool = False
+) -> None:
+    """파싱된 매니페스트 문서 하나에서 이미지 참조를 수집합니다.
+
+    빠른 모드에서는 알려진 워크로드 kind의 컨테이너 경로만 탐색하고, 이미지가
+    없는 kind(Service, ConfigMap 등)는 건너뜁니다. 알 수 없는 kind는 전체
+    탐색으로 대체합니다.
+
+    Args:
+        doc: 파싱된 YAML 문서
+        images: 발견된 이미지를 저장할 세트
+        fast: 빠른 모드 사용 여부
+    """
+    if fast and isinstance(doc, dict):
+        kind = doc.get("kind")
+        if kind in _IMAGELESS_KINDS:
+            return
+        if kind in _WORKLOAD_KINDS:
+            _traverse_workload(doc, images)
+            return
+    _traverse(doc, images)
+
+
+def _collect_from_dict(obj: Dict[str, Any], images: ImageSet) -> None:
+    """딕셔너리 하나의 이미지 관련 필드를 검사합니다.
 
     다음 패턴들을 찾습니다:
     1. 완전한 이미지 문자열 필드 (image: "repo:tag")
     2. 분리된 필드 조합:
        - repository + tag/version/digest
        - repository + image + tag/version
+    """
+    img = obj.get("image")
+    repo = obj.get("repository")
+
+    if isinstance(img, str) and not repo:
+        images.add(img)
+
+    if isinstance(repo, str):
+        tag = obj.get("tag") or obj.get("version")
+        digest = obj.get("digest")
+        if isinstance(tag, str) or isinstance(digest, str):
+            full_repo = f"{repo}/{img}" if isinstance(img, str) else repo
+            _add_repo_tag_digest(
+                images,
+                full_repo,
+                tag if isinstance(tag, str) else None,
+                digest if isinstance(digest, str) else None,
+            )
+
+
+def collect_images_from_values(
+    values: Any, images: ImageSet, default_tag: Optional[str] = None
+) -> None:
+    """helm values 트리에서 이미지 참조를 수집합니다.
+
+    매니페스트와 같은 규칙에 values.yaml 관례를 더합니다.
+    - registry + repository (+ tag) 조합은 레지스트리를 붙입니다.
+    - tag 키가 있지만 비어 있으면(보통 appVersion 사용) default_tag를 씁니다.
+    - 숫자로 파싱된 tag(예: 1.25)는 문자열로 바꿉니다.
+    - 템플릿 표현식({{ ... }})이 들어 있는 값은 무시합니다.
+
+    Args:
+        values: 파싱된 values 트리
+        images: 발견된 이미지를 저장할 세트
+        default_tag: 빈 tag에 사용할 태그 (차트 appVersion)
+    """
+
+    def _collect(obj: Dict[str, Any], found: ImageSet) -> None:
+        _collect_from_values_dict(obj, found, default_tag)
+
+    _traverse(values, images, _collect)
+
+
+def _collect_from_values_dict(
+    obj: Dict[str, Any], images: ImageSet, default_tag: Optional[str]
+) -> None:
+    repo = obj.get("repository")
+    if not isinstance(repo, str) or not repo:
+        found: ImageSet = set()
+        _collect_from_dict(obj, found)
+        images.update(image for image in found if "{{" not in image)
+        return
+
+    registry = obj.get("registry")
+    if isinstance(registry, str) and registry and not repo.startswith(f"{registry}/"):
+        repo = f"{registry}/{repo}"
+    img = obj.get("image")
+    if isinstance(img, str) and img:
+        repo = f"{repo}/{img}"
+
+    tag = obj.get("tag") or obj.get("version")
+    if isinstance(tag, (int, float)) and not isinstance(tag, bool):
+        tag = str(tag)
+    if not tag and "tag" in obj and default_tag:
+        tag = default_tag
+    digest = obj.get("digest")
+
+    if not isinstance(tag, str) and not isinstance(digest, str):
+        return
+    if "{{" in repo or "{{" in str(tag or "") or "{{" in str(digest or ""):
+        return
+    _add_repo_tag_digest(
+        images,
+        repo,
+        tag if isinstance(tag, str) else None,
+        digest if isinstance(digest, str) else None,
+    )
+
+
+def _traverse(
+    obj: Any,
+    images: ImageSet,
+    collect: Callable[[Dict[str, Any], ImageSet], None] = _collect_from_dict,
+) -> None:
+    """객체 전체를 명시적 스택으로 순회하여 이미지 참조를 수집합니다.
+
+    재귀를 사용하지 않으므로 깊게 중첩된 CRD에서도 재귀 한도에 걸리지
+    않습니다.
 
     Args:
         obj: 순회할 객체 (딕셔너리 또는 리스트)
         images: 발견된 이미지를 저장할 세트
+        collect: 딕셔너리 하나를 검사하는 함수
     """
-    if isinstance(obj, dict):
-        img_val = obj.get("image")
-        if isinstance(img_val, str) and not obj.get("repository"):
-            images.add(img_val)
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            collect(current, images)
+            stack.extend(
+                value for value in current.values() if isinstance(value, (dict, list))
+            )
+        elif isinstance(current, list):
+            stack.extend(item for item in current if isinstance(item, (dict, list)))
 
-        repo = obj.get("repository")
-        img = obj.get("image")
-        tag = obj.get("tag") or obj.get("version")
-        digest = obj.get("digest")
 
-        if isinstance(repo, str):
-            if isinstance(img, str):
-                full_repo = f"{repo}/{img}"
-            else:
-                full_repo = repo
-
-            if isinstance(tag, str) or isinstance(digest, str):
-                _add_repo_tag_digest(
-                    images,
-                    full_repo,
-                    tag if isinstance(tag, str) else None,
-                    digest if isinstance(digest, str) else None,
-                )
+def _traverse_workload(doc: Dict[str, Any], images: ImageSet) -> None:
+    """워크로드 문서에서 컨테이너 관련 경로만 따라가며 이미지를 수집합니다.
 
-        for value in obj.values():
-            _traverse(value, images)
+    Args:
+        doc: kind가 _WORKLOAD_KINDS에 속하는 문서
+        images: 발견된 이미지를 저장할 세트
+    """
+    stack = [doc]
+    while stack:
+        current = stack.pop()
+        _collect_from_dict(current, images)
 
-    elif isinstance(obj, list):
-        for item in obj:
-            _traverse(item, images)
+        for key in _CONTAINER_KEYS:
+            containers = current.get(key)
+            if isinstance(containers, list):
+                stack.extend(c for c in containers if isinstance(c, dict))
+
+        for key in _WORKLOAD_PATH_KEYS:
+            child = current.get(key)
+            if isinstance(child, dict):
+                stack.append(child)
+            elif isinstance(child, list):
+                stack.extend(c for c in child if isinstance(c, dict))
 
 
 def _add_repo_tag_digest(
@@ -256,18 +566,25 @@ def _add_repo_tag_digest(
 ) -> None:
     """저장소와 태그 또는 다이제스트를 결합하여 이미지 세트에 추가합니다.
 
+    저장소 값에 이미 태그나 다이제스트가 붙어 있으면 (예: repository:
+    nginx:1.0) 별도 필드의 값으로 교체합니다. 포트가 있는 레지스트리
+    (예: registry:5000/app)의 ':'은 태그로 취급하지 않습니다.
+
     Args:
         images: 이미지 세트
         repo: 이미지 저장소
         tag: 이미지 태그 (선택적)
         digest: 이미지 다이제스트 (선택적)
     """
+    if not tag and not digest:
+        images.add(repo)
+        return
+
+    name = split_reference(repo)[0]
     if tag:
-        images.add(f"{repo}:{tag}")
-    elif digest:
-        images.add(f"{repo}@{digest}")
+        images.add(f"{name}:{tag}")
     else:
-        images.add(repo)
+        images.add(f"{name}@{digest}")
 
 
 def check_docker_installed() -> None:
@@ -384,6 +701,17 @@ def _parse_docker_error(stderr: str, reference: str) -> str:
     return f"이미지 작업 실패: {reference}\n\n상세 오류:\n{stderr}"
 
 
+# 레지스트리 레이트 리밋 응답. Docker Hub는 "toomanyrequests: You have reached
+# your pull rate limit"을 반환하며, 429는 다이제스트 안의 숫자와 구분하도록
+# 단어 경계로 찾습니다.
+_RATE_LIMIT_PATTERN = re.compile(r"too many requests|toomanyrequests|\b429\b")
+
+
+def is_rate_limited(stderr: Optional[str]) -> bool:
+    """오류 출력이 레지스트리 레이트 리밋인지 판단합니다."""
+    return bool(_RATE_LIMIT_PATTERN.search((stderr or "").lower()))
+
+
 def _is_retryable_error(stderr: str) -> bool:
     """에러가 재시도 가능한지 판단.
 
@@ -399,24 +727,25 @@ def _is_retryable_error(stderr: str) -> bool:
         "connection reset",
         "temporary failure",
         "service unavailable",
-        "too many requests",  # Rate limiting
         "503",  # HTTP 503
         "i/o timeout",
         "network",
     ]
 
     stderr_lower = stderr.lower()
-    return any(pattern in stderr_lower for pattern in retryable_patterns)
+    return is_rate_limited(stderr) or any(
+        pattern in stderr_lower for pattern in retryable_patterns
+    )
 
 
 def parse_image_reference(reference: str) -> Tuple[str, str, str, str]:
     """Docker 이미지 레퍼런스를 분해합니다.
 
-    형식: [<registry>/][<namespace>/]<image>[:<tag>]
+    형식: [<registry>[:<port>]/][<namespace>/]<image>[:<tag>][@<digest>]
     누락 시 기본값:
     - registry: docker.io
     - namespace: library
-    - tag: latest
+    - tag: latest (태그 없이 다이제스트만 있으면 sha256-<hex>)
 
     Args:
         reference: Docker 이미지 레퍼런스
@@ -424,33 +753,18 @@ def parse_image_reference(reference: str) -> Tuple[str, str, str, str]:
     Returns:
         (registry, namespace, image, tag) 튜플
     """
-    registry = "docker.io"
-    namespace = "library"
-    image = ""
-    tag = "latest"
-
-    if ":" in reference:
-        ref_parts = reference.split(":")
-        tag = ref_parts[-1]
-        reference = ":".join(ref_parts[:-1])
-
-    parts = reference.split("/")
-
-    if len(parts) == 1:
-        image = parts[0]
-    elif len(parts) == 2:
-        if "." in parts[0] or ":" in parts[0]:  # 레지스트리로 판단
-            registry = parts[0]
-            image = parts[1]
-        else:  # 네임스페이스/이미지로 판단
-            namespace = parts[0]
-            image = parts[1]
-    elif len(parts) >= 3:
-        registry = parts[0]
-        namespace = parts[1]
-        image = "/".join(parts[2:])
-
-    return registry, namespace, image, tag
+    ref = parse_image_ref(reference)
+    if ref.tag:
+        tag = ref.tag
+    elif ref.digest:
+        # 파일명에 ':'을 쓰지 않도록 sha256:... → sha256-...
+        tag = ref.digest.replace(":", "-")
+    else:
+        tag = DEFAULT_TAG
+
+    # 네임스페이스 없는 비 Docker Hub 이미지(quay.io/image)는 파일명에서
+    # 네임스페이스를 생략하도록 library로 반환
+    return ref.registry, ref.namespace or DOCKER_HUB_NAMESPACE, ref.repo, tag
 
 
 def generate_tar_filename(
@@ -512,7 +826,73 @@ def check_image_exists(reference: str) -> bool:
         return False
 
 
-def pull_image(reference: str, arch: str = "linux/amd64", max_retries: int = 3) -> None:
+class PullProgressParser:
+    """docker pull 출력 줄에서 레이어 진행 상태를 추적합니다.
+
+    비-TTY 환경의 docker pull은 바이트 단위 진행률을 출력하지 않으므로
+    레이어 단위(완료/전체)로 진행률을 계산합니다.
+    """
+
+    def __init__(self) -> None:
+        self._layers: Dict[str, bool] = {}
+
+    def feed(self, line: str) -> bool:
+        """출력 한 줄을 반영합니다.
+
+        Args:
+            line: docker pull 출력 줄
+
+        Returns:
+            진행 상태가 바뀌었으면 True
+        """
+        match = _PULL_LAYER_LINE.match(line.strip())
+        if not match:
+            return False
+
+        layer_id, status = match.groups()
+        done = status.startswith(_PULL_LAYER_DONE)
+        previous = self._layers.get(layer_id)
+        self._layers[layer_id] = done or bool(previous)
+        return previous is None or (done and not previous)
+
+    @property
+    def completed(self) -> int:
+        """완료된 레이어 수."""
+        return sum(1 for done in self._layers.values() if done)
+
+    @property
+    def total(self) -> int:
+        """지금까지 확인된 전체 레이어 수."""
+        return len(self._layers)
+
+
+def _run_pull(cmd: List[str], on_progress: Optional[PullProgressCallback]) -> None:
+    """docker pull을 실행합니다. 콜백이 있으면 출력을 스트리밍으로 해석합니다."""
+    if on_progress is None:
+        subprocess.run(
+            cmd,
+            check=True,
+            capture_output=True,
+            text=True,
+            timeout=VERY_LONG_TIMEOUT,
+        )
+        return
+
+    parser = PullProgressParser()
+
+    def _on_line(line: str) -> None:
+        if parser.feed(line):
+            on_progress(parser.completed, parser.total)
+
+    stream_command_lines(cmd, _on_line, timeout=VERY_LONG_TIMEOUT)
+
+
+def pull_image(
+    reference: str,
+    arch: str = "linux/amd64",
+    max_retries: int = 3,
+    on_progress: Optional[PullProgressCallback] = None,
+) -> None:
     """이미지를 Docker Hub에서 가져옵니다 (재시도 로직 포함).
 
     네트워크 관련 일시적 오류는 자동으로 재시도합니다.
@@ -521,6 +901,7 @@ def pull_image(reference: str, arch: str = "linux/amd64", max_retries: int = 3)
         reference: Docker 이미지 레퍼런스
         arch: 타겟 아키텍처
         max_retries: 최대 재시도 횟수
+        on_progress: 레이어 진행률 콜백 (완료 수, 전체 수)
 
     Raises:
         TransientError: 재시도 가능한 일시적 오류
@@ -533,13 +914,7 @@ def pull_image(reference: str, arch: str = "linux/amd64", max_retries: int = 3)
     # 첫 시도(0) + 재시도(1, 2, 3) = 총 max_retries + 1번 시도
     for attempt in range(0, max_retries + 1):
         try:
-            subprocess.run(
-                cmd,
-                check=True,
-                capture_output=True,
-                text=True,
-                timeout=VERY_LONG_TIMEOUT,
-            )
+            _run_pull(cmd, on_progress)
             logger.info(f"이미지 {reference} 다운로드 완료")
             return  # 성공
 
@@ -569,17 +944,99 @@ def pull_image(reference: str, arch: str = "linux/amd64", max_retries: int = 3)
                 ) from e
 
 
-def save_image(reference: str, output_path: str) -> None:
+def pull_platforms(
+    reference: str,
+    platforms: List[str],
+    max_workers: Optional[int] = None,
+    max_retries: int = 3,
+    on_progress: Optional[Callable[[str, int, int], None]] = None,
+) -> Dict[str, float]:
+    """여러 플랫폼의 이미지를 병렬로 가져옵니다.
+
+    레이어 다운로드는 플랫폼별로 독립적이므로 동시에 진행합니다. 다만 로컬 태그는
+    마지막으로 완료된 플랫폼을 가리키므로, 저장 직전에 해당 플랫폼으로 다시
+    pull_image를 호출해 태그를 재지정해야 합니다 (레이어는 이미 로컬에 있어 빠름).
+
+    Args:
+        reference: Docker 이미지 레퍼런스
+        platforms: 타겟 플랫폼 목록 (예: ["linux/amd64", "linux/arm64"])
+        max_workers: 최대 동시 pull 수 (기본값: 플랫폼 수)
+        max_retries: 플랫폼별 최대 재시도 횟수
+        on_progress: 레이어 진행률 콜백 (플랫폼, 완료 수, 전체 수)
+
+    Returns:
+        플랫폼별 pull 소요 시간(초)
+
+    Raises:
+        TransientError: 재시도 가능한 일시적 오류
+        PermanentError: 재시도 불가능한 영구적 오류
+    """
+    workers = max_workers or len(platforms)
+    logger.info(f"이미지 {reference} 병렬 다운로드: {', '.join(platforms)}")
+
+    def _pull(platform: str) -> float:
+        callback: Optional[PullProgressCallback] = None
+        if on_progress is not None:
+
+            def callback(done: int, total: int) -> None:
+                on_progress(platform, done, total)
+
+        started = time.monotonic()
+        pull_image(reference, platform, max_retries, on_progress=callback)
+        return time.monotonic() - started
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {platform: executor.submit(_pull, platform) for platform in platforms}
+        # 모든 pull이 끝날 때까지 기다린 뒤 첫 번째 오류를 전달
+        errors = [future.exception() for future in futures.values()]
+
+    for error in errors:
+        if error is not None:
+            raise error
+
+    return {platform: future.result() for platform, future in futures.items()}
+
+
+def save_image(
+    reference: str,
+    output_path: str,
+    on_progress: Optional[SaveProgressCallback] = None,
+) -> None:
     """Docker 이미지를 tar 파일로 저장합니다.
 
+    진행률 콜백이 주어지면 `docker save`의 출력 파이프를 `<output_path>.part`에
+    기록하며 누적 바이트 수를 전달하고, 끝까지 기록한 경우에만 output_path로
+    교체합니다 (중단되어도 잘린 파일이 최종 이름으로 남지 않음).
+
     Args:
         reference: Docker 이미지 레퍼런스
         output_path: 출력 파일 경로
+        on_progress: 누적 기록 바이트 수 콜백
 
     Raises:
         CommandError: 이미지 저장 실패
     """
     logger.info(f"이미지 {reference}를 {output_path}로 저장 중")
+
+    if on_progress is not None:
+        partial = f"{output_path}.part"
+        try:
+            with open(partial, "wb") as f:
+                stream_command_output(
+                    ["docker", "save", reference],
+                    f,
+                    on_bytes=on_progress,
+                    timeout=VERY_LONG_TIMEOUT,
+                )
+            os.replace(partial, output_path)
+            logger.info(f"이미지 저장 완료: {output_path}")
+            return
+        except subprocess.CalledProcessError as e:
+            raise CommandError(f"이미지 저장 실패: {e.stderr}") from e
+        finally:
+            if os.path.exists(partial):
+                os.unlink(partial)
+
     cmd = ["docker", "save", "-o", output_path, reference]
 
     try:
@@ -595,17 +1052,29 @@ def save_image(reference: str, output_path: str) -> None:
         raise CommandError(f"이미지 저장 실패: {e.stderr}") from e
 
 
-def save_image_to_stdout(reference: str) -> None:
+def save_image_to_stdout(
+    reference: str, on_progress: Optional[SaveProgressCallback] = None
+) -> None:
     """Docker 이미지를 표준 출력으로 내보냅니다.
 
     Args:
         reference: Docker 이미지 레퍼런스
+        on_progress: 누적 기록 바이트 수 콜백 (지정 시 파이프를 경유해 계측)
 
     Raises:
         CommandError: 이미지 저장 실패
     """
     cmd = ["docker", "save", reference]
 
+    if on_progress is not None:
+        try:
+            stream_command_output(
+                cmd, sys.stdout.buffer, on_bytes=on_progress, timeout=VERY_LONG_TIMEOUT
+            )
+            return
+        except subprocess.CalledProcessError as e:
+            raise CommandError(f"이미지 저장 실패: {e.stderr}") from e
+
     try:
         subprocess.run(
             cmd,
@@ -618,6 +1087,31 @@ def save_image_to_stdout(reference: str) -> None:
         raise CommandError(f"이미지 저장 실패: {e.stderr}") from e
 
 
+def load_image(archive_path: str) -> None:
+    """tar 아카이브의 이미지를 Docker에 적재합니다.
+
+    Args:
+        archive_path: docker save 형식의 tar 파일 경로
+
+    Raises:
+        CommandError: 이미지 적재 실패
+    """
+    logger.info(f"이미지 아카이브 {archive_path} 적재 중")
+    cmd = ["docker", "load", "-i", archive_path]
+
+    try:
+        subprocess.run(
+            cmd,
+            check=True,
+            capture_output=True,
+            text=True,
+            timeout=VERY_LONG_TIMEOUT,
+        )
+        logger.info(f"이미지 적재 완료: {archive_path}")
+    except subprocess.CalledProcessError as e:
+        raise CommandError(f"이미지 적재 실패: {e.stderr}") from e
+
+
 def list_local_images() -> List[str]:
     """로컬에 있는 Docker 이미지 목록을 반환합니다.
 
@@ -638,3 +1132,45 @@ def list_local_images() -> List[str]:
         return result.stdout.splitlines()
     except subprocess.CalledProcessError as e:
         raise CommandError(f"이미지 목록 조회 실패: {e.stderr}") from e
+
+
+def has_image_events(since: float, until: float) -> bool:
+    """두 시각 사이에 이미지 이벤트(pull, tag, delete 등)가 있었는지 확인합니다.
+
+    `docker images` 전체를 다시 읽지 않고 로컬 이미지 목록이 바뀌었는지
+    확인하는 데 사용합니다.
+
+    Args:
+        since: 시작 시각 (유닉스 시간)
+        until: 종료 시각 (유닉스 시간)
+
+    Returns:
+        이미지 이벤트가 하나라도 있으면 True
+
+    Raises:
+        CommandError: 이벤트 조회 실패
+    """
+    try:
+        result = subprocess.run(
+            [
+                "docker",
+                "events",
+                "--since",
+                f"{since:.3f}",
+                "--until",
+                f"{until:.3f}",
+                "--filter",
+                "type=image",
+                "--format",
+                "{{.Action}}",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=QUICK_TIMEOUT,
+        )
+    except subprocess.CalledProcessError as e:
+        raise CommandError(f"이미지 이벤트 조회 실패: {e.stderr}") from e
+    except subprocess.TimeoutExpired as e:
+        raise CommandError("이미지 이벤트 조회 시간 초과") from e
+    return bool(result.stdout.strip())
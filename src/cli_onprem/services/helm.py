@@ -1,11 +1,26 @@
 """Helm 관련 비즈니스 로직."""
 
+import itertools
 import pathlib
-import subprocess
-from typing import List, Optional
-
-from cli_onprem.core.errors import check_command_installed
+import re
+import shutil
+import tarfile
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypedDict,
+)
+
+import yaml
+
+from cli_onprem.core.errors import DependencyError, check_command_installed
 from cli_onprem.core.logging import get_logger
+from cli_onprem.services.chart_cache import ChartCache, ChartExtractCache
 from cli_onprem.utils import file, shell
 from cli_onprem.utils.shell import DEFAULT_TIMEOUT, MEDIUM_TIMEOUT
 
@@ -21,9 +36,34 @@ def check_helm_installed() -> None:
     check_command_installed("helm", "https://helm.sh/docs/intro/install/")
 
 
+def find_chart_root(names: Iterable[str]) -> Optional[str]:
+    """tar 항목 이름 목록에서 차트 루트 디렉토리 이름을 찾습니다.
+
+    helm package는 `<차트 이름>/Chart.yaml` 형태로 묶으므로 최상위 디렉토리
+    바로 아래의 Chart.yaml을 찾습니다 (서브차트의 Chart.yaml은 무시).
+
+    Args:
+        names: tar 항목 이름
+
+    Returns:
+        차트 루트 디렉토리 이름. 없으면 None
+    """
+    roots = sorted(
+        normalized.split("/")[0]
+        for normalized in (file.member_path(name) for name in names)
+        if normalized is not None
+        and normalized.count("/") == 1
+        and normalized.endswith("/Chart.yaml")
+    )
+    return roots[0] if roots else None
+
+
 def extract_chart(archive_path: pathlib.Path, dest_dir: pathlib.Path) -> pathlib.Path:
     """압축된 Helm 차트를 추출하고 차트 루트 디렉토리를 반환합니다.
 
+    아카이브 목록을 한 번 읽어 차트 루트를 찾은 뒤 그 아래 항목만 검증해
+    추출합니다 (디렉토리 탐색 없음).
+
     Args:
         archive_path: 차트 아카이브 경로 (.tgz)
         dest_dir: 추출할 대상 디렉토리
@@ -32,23 +72,36 @@ def extract_chart(archive_path: pathlib.Path, dest_dir: pathlib.Path) -> pathlib
         차트 루트 디렉토리 경로
 
     Raises:
-        ValueError: 차트 디렉토리를 찾을 수 없는 경우
+        ValueError: 차트 디렉토리를 찾을 수 없거나 안전하지 않은 항목이 있는 경우
     """
     logger.info(f"차트 추출 중: {archive_path} → {dest_dir}")
 
-    # tar 파일 추출
-    file.extract_tar(archive_path, dest_dir)
-
-    # 차트 루트 디렉토리 찾기 (Chart.yaml이 있는 디렉토리)
-    for item in dest_dir.iterdir():
-        if item.is_dir() and (item / "Chart.yaml").exists():
-            logger.info(f"차트 루트 발견: {item}")
-            return item
-
-    raise ValueError(f"차트 디렉토리를 찾을 수 없습니다 (Chart.yaml 없음): {dest_dir}")
-
-
-def prepare_chart(chart_path: pathlib.Path, workdir: pathlib.Path) -> pathlib.Path:
+    with tarfile.open(archive_path, "r:*") as tar:
+        members = tar.getmembers()
+        root = find_chart_root(member.name for member in members)
+        if root is None:
+            raise ValueError(
+                f"차트 디렉토리를 찾을 수 없습니다 (Chart.yaml 없음): {archive_path}"
+            )
+
+        selected = []
+        for member in members:
+            normalized = file.member_path(member.name)
+            if normalized is None:
+                raise ValueError(f"안전하지 않은 tar 항목 경로: {member.name}")
+            if normalized == root or normalized.startswith(f"{root}/"):
+                selected.append(member)
+        file.extract_members(tar, selected, dest_dir)
+
+    logger.info(f"차트 루트 발견: {dest_dir / root}")
+    return dest_dir / root
+
+
+def prepare_chart(
+    chart_path: pathlib.Path,
+    workdir: pathlib.Path,
+    extract_cache: Optional[ChartExtractCache] = None,
+) -> pathlib.Path:
     """차트 경로를 준비합니다.
 
     디렉토리인 경우 그대로 사용하고, 아카이브인 경우 추출합니다.
@@ -56,6 +109,8 @@ def prepare_chart(chart_path: pathlib.Path, workdir: pathlib.Path) -> pathlib.Pa
     Args:
         chart_path: 차트 경로 (디렉토리 또는 .tgz 파일)
         workdir: 작업 디렉토리 (아카이브 추출 시 사용)
+        extract_cache: 지정하면 아카이브 다이제스트별 추출 캐시에서 workdir로
+            복사 (같은 아카이브는 다시 추출하지 않음)
 
     Returns:
         사용 가능한 차트 디렉토리 경로
@@ -73,6 +128,8 @@ def prepare_chart(chart_path: pathlib.Path, workdir: pathlib.Path) -> pathlib.Pa
 
     elif chart_path.is_file() and chart_path.suffix in [".tgz", ".tar.gz"]:
         logger.info(f"압축된 차트 사용: {chart_path}")
+        if extract_cache is not None:
+            return extract_cache.checkout(chart_path, workdir, extract_chart)
         return extract_chart(chart_path, workdir)
 
     else:
@@ -92,33 +149,336 @@ def update_dependencies(chart_dir: pathlib.Path) -> None:
     """
     logger.info(f"차트 의존성 업데이트: {chart_dir}")
 
-    shell.run_command(
+    result = shell.run_command(
         ["helm", "dependency", "update", str(chart_dir)],
         check=False,
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
+        capture_output=True,
         timeout=MEDIUM_TIMEOUT,  # 차트 다운로드에 최대 10분
     )
+    if result.returncode != 0:
+        # 실패해도 렌더링 단계에서 누락된 의존성을 다시 보고하므로 경고만 남김
+        logger.warning(
+            f"의존성 업데이트 실패 (종료 코드 {result.returncode}): "
+            f"{(result.stderr or '').strip()}"
+        )
+        return
 
     logger.info("의존성 업데이트 완료")
 
 
-def render_template(
-    chart_dir: pathlib.Path, values_files: Optional[List[pathlib.Path]] = None
-) -> str:
-    """차트 디렉토리에 대해 helm template 명령을 실행하고 렌더링된 매니페스트를
-    반환합니다.
+class ChartDependency(TypedDict):
+    """차트 의존성 (Chart.lock이 있으면 잠긴 버전)."""
+
+    name: str
+    version: str
+    repository: str
+
+
+class DependencyState(TypedDict):
+    """check_dependencies() 결과.
+
+    present는 charts/에 있는 의존성('이름-버전'), missing은 없는 의존성,
+    unexpected는 선언된 차트의 다른 버전 아카이브(charts/ 기준 파일 이름)입니다.
+    """
+
+    dependencies: List[ChartDependency]
+    present: List[str]
+    missing: List[ChartDependency]
+    unexpected: List[str]
+    satisfied: bool
+
+
+class DependencySyncReport(TypedDict):
+    """sync_dependencies() 결과 (각 항목은 '이름-버전')."""
+
+    present: List[str]
+    restored: List[str]
+    fetched: List[str]
+
+
+_EXACT_VERSION_RE = re.compile(
+    r"v?\d+\.\d+\.\d+(?:-[0-9A-Za-z.-]+)?(?:\+[0-9A-Za-z.-]+)?"
+)
+
+
+def read_dependencies(chart_dir: pathlib.Path) -> Optional[List[ChartDependency]]:
+    """차트의 의존성 목록을 읽습니다.
+
+    Chart.lock(또는 apiVersion v1의 requirements.lock)이 Chart.yaml과 일치하면
+    잠긴 버전을 사용하고, 아니면 Chart.yaml의 버전 제약을 그대로 반환합니다.
 
     Args:
         chart_dir: Helm 차트 디렉토리
-        values_files: 추가 values 파일 목록
 
     Returns:
-        렌더링된 Kubernetes 매니페스트
+        의존성 목록. Chart.yaml을 읽을 수 없으면 None
+    """
+    try:
+        chart = file.read_yaml(chart_dir / "Chart.yaml")
+        declared = chart.get("dependencies")
+        lock_name = "Chart.lock"
+        if declared is None and (chart_dir / "requirements.yaml").is_file():
+            declared = file.read_yaml(chart_dir / "requirements.yaml").get(
+                "dependencies"
+            )
+            lock_name = "requirements.lock"
+    except (OSError, AttributeError, yaml.YAMLError) as e:
+        logger.warning(f"Chart.yaml을 읽을 수 없음: {chart_dir} ({e})")
+        return None
+
+    dependencies = _parse_dependencies(declared)
+    lock_path = chart_dir / lock_name
+    if not dependencies or not lock_path.is_file():
+        return dependencies
+
+    try:
+        locked = _parse_dependencies(file.read_yaml(lock_path).get("dependencies"))
+    except (OSError, AttributeError, yaml.YAMLError) as e:
+        logger.warning(f"{lock_name}을 읽을 수 없음: {lock_path} ({e})")
+        return dependencies
+
+    if _lock_matches(dependencies, locked):
+        return locked
+    logger.info(f"{lock_name}이 Chart.yaml과 맞지 않아 버전 제약을 사용합니다")
+    return dependencies
+
+
+def _parse_dependencies(entries: Any) -> List[ChartDependency]:
+    if not isinstance(entries, list):
+        return []
+    return [
+        {
+            "name": str(entry["name"]),
+            "version": str(entry.get("version") or ""),
+            "repository": str(entry.get("repository") or ""),
+        }
+        for entry in entries
+        if isinstance(entry, dict) and entry.get("name")
+    ]
+
+
+def _lock_matches(
+    declared: List[ChartDependency], locked: List[ChartDependency]
+) -> bool:
+    """잠금 파일이 Chart.yaml의 의존성(이름, 저장소, 정확한 버전)과 맞는지 확인합니다.
+
+    버전 범위는 helm이 해석하므로 비교하지 않습니다.
+    """
+    locked_by_name = {dep["name"]: dep for dep in locked}
+    if {dep["name"] for dep in declared} != set(locked_by_name):
+        return False
+    for dep in declared:
+        lock = locked_by_name[dep["name"]]
+        if dep["repository"].rstrip("/") != lock["repository"].rstrip("/"):
+            return False
+        if _is_exact(dep["version"]) and dep["version"] != lock["version"]:
+            return False
+    return True
+
+
+def _is_exact(version: str) -> bool:
+    return _EXACT_VERSION_RE.fullmatch(version) is not None
+
+
+def _is_cacheable(dependency: ChartDependency) -> bool:
+    """원격 저장소의 정확한 버전만 캐시 키로 사용할 수 있습니다."""
+    repository = dependency["repository"]
+    return (
+        bool(repository)
+        and not repository.startswith("file://")
+        and _is_exact(dependency["version"])
+    )
+
+
+def _archive_name(dependency: ChartDependency) -> str:
+    """helm이 charts/에 저장하는 아카이브 파일 이름."""
+    return f"{dependency['name']}-{dependency['version']}.tgz"
+
+
+def _archive_version(archive_name: str, chart_name: str) -> Optional[str]:
+    """'이름-버전.tgz' 형식 아카이브 이름에서 chart_name의 버전을 꺼냅니다."""
+    prefix = f"{chart_name}-"
+    if not (archive_name.startswith(prefix) and archive_name.endswith(".tgz")):
+        return None
+    version = archive_name[len(prefix) : -len(".tgz")]
+    return version if _is_exact(version) else None
+
+
+def _is_vendored(
+    charts_dir: pathlib.Path, dependency: ChartDependency, archives: List[str]
+) -> bool:
+    """charts/에 이미 해당 의존성이 아카이브 또는 디렉토리로 있는지 확인합니다.
+
+    버전 범위(잠금 파일 없음)인 경우 같은 이름의 어떤 버전이든 인정합니다.
+    """
+    exact = _is_exact(dependency["version"])
+    if exact:
+        if _archive_name(dependency) in archives:
+            return True
+    elif any(_archive_version(a, dependency["name"]) for a in archives):
+        return True
+
+    subchart = charts_dir / dependency["name"] / "Chart.yaml"
+    if not subchart.is_file():
+        return False
+    if not exact:
+        return True
+    try:
+        version = str(file.read_yaml(subchart).get("version"))
+    except (OSError, AttributeError, yaml.YAMLError):
+        return False
+    return version == dependency["version"]
+
+
+def check_dependencies(chart_dir: pathlib.Path) -> Optional[DependencyState]:
+    """Chart.yaml/Chart.lock과 charts/의 내용을 비교해 의존성 상태를 확인합니다.
+
+    네트워크나 helm 호출 없이 파일만 읽습니다. 모든 의존성이 charts/에 있고
+    선언된 차트의 다른 버전 아카이브가 남아 있지 않으면 satisfied입니다.
+
+    Args:
+        chart_dir: Helm 차트 디렉토리
+
+    Returns:
+        의존성 상태. Chart.yaml을 읽을 수 없으면 None
+    """
+    dependencies = read_dependencies(chart_dir)
+    if dependencies is None:
+        return None
+
+    charts_dir = chart_dir / "charts"
+    archives = (
+        sorted(p.name for p in charts_dir.glob("*.tgz")) if charts_dir.is_dir() else []
+    )
+    present: List[str] = []
+    missing: List[ChartDependency] = []
+    for dependency in dependencies:
+        if _is_vendored(charts_dir, dependency, archives):
+            present.append(f"{dependency['name']}-{dependency['version']}")
+        else:
+            missing.append(dependency)
+
+    expected = {_archive_name(dep) for dep in dependencies}
+    unexpected = [
+        archive
+        for archive in archives
+        if archive not in expected
+        and any(
+            _is_exact(dep["version"]) and _archive_version(archive, dep["name"])
+            for dep in dependencies
+        )
+    ]
+
+    return {
+        "dependencies": dependencies,
+        "present": present,
+        "missing": missing,
+        "unexpected": unexpected,
+        "satisfied": not missing and not unexpected,
+    }
+
+
+def dependencies_satisfied(chart_dir: pathlib.Path) -> bool:
+    """의존성 업데이트 없이 바로 렌더링할 수 있는지 확인합니다."""
+    state = check_dependencies(chart_dir)
+    return state is not None and state["satisfied"]
+
+
+def sync_dependencies(
+    chart_dir: pathlib.Path,
+    cache: Optional[ChartCache] = None,
+    offline: bool = False,
+) -> DependencySyncReport:
+    """서브차트 캐시로 charts/를 채우고 부족한 경우에만 의존성을 업데이트합니다.
+
+    charts/가 Chart.lock과 이미 일치하면 아무것도 하지 않습니다. 아니면 선언된
+    차트의 다른 버전 아카이브를 지우고 캐시에 있는 의존성을 복사하며, 그래도
+    빠진 의존성이 있을 때만 `helm dependency update`를 실행한 뒤 받은
+    아카이브를 캐시에 저장합니다.
+
+    Args:
+        chart_dir: Helm 차트 디렉토리
+        cache: 서브차트 캐시 (기본값: ChartCache())
+        offline: True이면 의존성 업데이트 대신 오류 발생
+
+    Returns:
+        의존성별 처리 결과
+
+    Raises:
+        DependencyError: 오프라인 모드에서 캐시에 없는 의존성이 있는 경우
+    """
+    report: DependencySyncReport = {"present": [], "restored": [], "fetched": []}
+    state = check_dependencies(chart_dir)
+    if state is None:
+        # Chart.yaml을 해석할 수 없으면 helm에 맡김
+        if not offline:
+            update_dependencies(chart_dir)
+        return report
+
+    report["present"] = state["present"]
+    if state["satisfied"]:
+        if state["dependencies"]:
+            logger.info(
+                f"의존성 {len(state['dependencies'])}개가 charts/와 일치하여 "
+                "업데이트 생략"
+            )
+        return report
+
+    charts_dir = chart_dir / "charts"
+    for archive in state["unexpected"]:
+        logger.info(f"잠긴 버전과 다른 서브차트 아카이브 제거: {archive}")
+        (charts_dir / archive).unlink(missing_ok=True)
+
+    cache = cache or ChartCache()
+    missing: List[ChartDependency] = []
+    for dependency in state["missing"]:
+        cached = (
+            cache.get(
+                dependency["repository"], dependency["name"], dependency["version"]
+            )
+            if _is_cacheable(dependency)
+            else None
+        )
+        if cached is None:
+            missing.append(dependency)
+            continue
+        charts_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(cached, charts_dir / _archive_name(dependency))
+        report["restored"].append(f"{dependency['name']}-{dependency['version']}")
+
+    if not missing:
+        logger.info(f"의존성 {len(state['dependencies'])}개 모두 로컬에서 준비됨")
+        return report
+
+    labels = [f"{dep['name']}-{dep['version']}" for dep in missing]
+    if offline:
+        raise DependencyError(
+            f"오프라인 모드에서 캐시에 없는 서브차트가 있습니다: {', '.join(labels)}"
+        )
+
+    update_dependencies(chart_dir)
+    report["fetched"] = labels
+
+    # 업데이트 후 Chart.lock의 잠긴 버전으로 받은 아카이브를 모두 캐시에 저장
+    for dependency in read_dependencies(chart_dir) or []:
+        archive_path = charts_dir / _archive_name(dependency)
+        if _is_cacheable(dependency) and archive_path.is_file():
+            cache.put(
+                dependency["repository"],
+                dependency["name"],
+                dependency["version"],
+                archive_path,
+            )
+    return report
+
+
+def _template_command(
+    chart_dir: pathlib.Path, values_files: Optional[List[pathlib.Path]]
+) -> List[str]:
+    """helm template 명령어를 구성합니다.
 
     Raises:
         FileNotFoundError: values 파일이 존재하지 않을 경우
-        subprocess.CalledProcessError: helm template 명령 실행 실패 시
     """
     cmd: List[str] = ["helm", "template", "dummy", str(chart_dir)]
 
@@ -139,6 +499,28 @@ def render_template(
         else:
             logger.info("사용 가능한 values 파일 없음")
 
+    return cmd
+
+
+def render_template(
+    chart_dir: pathlib.Path, values_files: Optional[List[pathlib.Path]] = None
+) -> str:
+    """차트 디렉토리에 대해 helm template 명령을 실행하고 렌더링된 매니페스트를
+    반환합니다.
+
+    Args:
+        chart_dir: Helm 차트 디렉토리
+        values_files: 추가 values 파일 목록
+
+    Returns:
+        렌더링된 Kubernetes 매니페스트
+
+    Raises:
+        FileNotFoundError: values 파일이 존재하지 않을 경우
+        subprocess.CalledProcessError: helm template 명령 실행 실패 시
+    """
+    cmd = _template_command(chart_dir, values_files)
+
     logger.info(f"차트 템플릿 렌더링 중: {chart_dir}")
     logger.info(f"실행 명령어: {' '.join(cmd)}")
 
@@ -146,3 +528,100 @@ def render_template(
         cmd, capture_output=True, timeout=DEFAULT_TIMEOUT
     )  # 템플릿 렌더링에 최대 5분
     return result.stdout if result.stdout else ""
+
+
+def _is_document_separator(line: str) -> bool:
+    """YAML 문서 구분선(`---`, `--- # 주석`)인지 확인합니다."""
+    if not line.startswith("---"):
+        return False
+    rest = line[3:].strip()
+    return not rest or rest.startswith("#")
+
+
+def stream_template(
+    chart_dir: pathlib.Path, values_files: Optional[List[pathlib.Path]] = None
+) -> Iterator[str]:
+    """helm template 출력을 읽는 대로 YAML 문서 단위로 내보냅니다.
+
+    전체 렌더링 결과를 메모리에 모으지 않으므로 최대 메모리 사용량은 가장 큰
+    문서 하나 크기로 제한되며, 렌더링이 끝나기 전에 첫 문서를 처리할 수
+    있습니다.
+
+    Args:
+        chart_dir: Helm 차트 디렉토리
+        values_files: 추가 values 파일 목록
+
+    Yields:
+        구분선을 제외한 YAML 문서 문자열 (빈 문서 제외)
+
+    Raises:
+        FileNotFoundError: values 파일이 존재하지 않을 경우
+        subprocess.CalledProcessError: helm template 명령 실행 실패 시
+    """
+    cmd = _template_command(chart_dir, values_files)
+    logger.info(f"차트 템플릿 스트리밍 렌더링 중: {chart_dir}")
+    logger.info(f"실행 명령어: {' '.join(cmd)}")
+
+    lines: List[str] = []
+    documents = 0
+    for line in shell.iter_command_lines(cmd, timeout=DEFAULT_TIMEOUT):
+        if _is_document_separator(line):
+            if any(item.strip() for item in lines):
+                documents += 1
+                yield "\n".join(lines)
+            lines = []
+        else:
+            lines.append(line)
+
+    if any(item.strip() for item in lines):
+        documents += 1
+        yield "\n".join(lines)
+    logger.info(f"총 {documents}개 문서 렌더링")
+
+
+class ValuesCombination(TypedDict):
+    """values 행렬의 조합 하나 (values는 적용 순서대로)."""
+
+    name: str
+    values: List[pathlib.Path]
+
+
+def build_values_matrix(
+    axes: Sequence[Tuple[str, Sequence[pathlib.Path]]],
+    base_values: Sequence[pathlib.Path] = (),
+) -> List[ValuesCombination]:
+    """values 축들의 모든 조합(데카르트 곱)을 만듭니다.
+
+    각 조합은 base_values 뒤에 축 순서대로 값 파일을 붙이므로 뒤에 오는 축이
+    앞의 설정을 덮어씁니다. 조합 이름은 '축=파일 이름(확장자 제외)'을 '/'로
+    이은 문자열입니다 (예: env=prod/region=eu).
+
+    Args:
+        axes: (축 이름, 값 파일 목록) 리스트
+        base_values: 모든 조합에 먼저 적용할 values 파일
+
+    Returns:
+        조합 리스트. 축이 없으면 base_values만 사용하는 default 조합 하나
+
+    Raises:
+        ValueError: 축 이름이 중복되거나 값 파일이 없는 축이 있는 경우
+    """
+    names = [name for name, _ in axes]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"중복된 values 축: {', '.join(duplicates)}")
+    for name, files in axes:
+        if not files:
+            raise ValueError(f"values 축에 파일이 없습니다: {name}")
+
+    if not axes:
+        return [{"name": "default", "values": list(base_values)}]
+
+    combinations: List[ValuesCombination] = []
+    for choice in itertools.product(*(files for _, files in axes)):
+        label = "/".join(
+            f"{names[index]}={values_file.name.split('.')[0]}"
+            for index, values_file in enumerate(choice)
+        )
+        combinations.append({"name": label, "values": [*base_values, *choice]})
+    return combinations
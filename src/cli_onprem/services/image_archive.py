@@ -0,0 +1,763 @@
+"""docker save 아카이브 분석 및 재구성 관련 비즈니스 로직.
+
+docker save 결과물(레거시 형식과 OCI 레이아웃 형식 모두)은 최상위에
+`manifest.json`을 가지며, 각 항목의 `Layers`는 아카이브 내부 경로를,
+`Config`의 `rootfs.diff_ids`는 같은 순서의 레이어 다이제스트를 나타냅니다.
+레이어 식별에는 아카이브 형식과 무관하게 동일한 diff_id를 사용합니다.
+"""
+
+import hashlib
+import io
+import json
+import tarfile
+from pathlib import Path
+from typing import IO, Dict, Iterable, List, Optional, Set, Tuple, TypedDict, cast
+
+from cli_onprem.core.errors import CommandError
+from cli_onprem.core.logging import get_logger
+from cli_onprem.utils.image_ref import DEFAULT_TAG, parse_image_ref
+
+logger = get_logger("services.image_archive")
+
+MANIFEST_NAME = "manifest.json"
+THIN_METADATA_NAME = "cli-onprem-thin.json"
+THIN_METADATA_VERSION = 1
+
+
+class ArchiveImage(TypedDict):
+    """docker save 아카이브에 포함된 이미지 하나의 정보."""
+
+    config: str
+    repo_tags: List[str]
+    layers: List[str]
+    diff_ids: List[str]
+
+
+class OmittedLayer(TypedDict):
+    """씬 아카이브에서 생략된 레이어 정보."""
+
+    path: str
+    digest: str
+    size: int
+
+
+class ThinArchiveResult(TypedDict):
+    """씬 아카이브 생성 결과."""
+
+    kept: int
+    omitted: List[OmittedLayer]
+
+
+class _HashingReader:
+    """읽은 바이트의 SHA256을 함께 계산하는 파일 래퍼."""
+
+    def __init__(self, fileobj: IO[bytes]) -> None:
+        self._fileobj = fileobj
+        self._hash = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fileobj.read(size)
+        self._hash.update(data)
+        return data
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+def _read_json_member(tar: tarfile.TarFile, name: str) -> object:
+    """tar 멤버를 JSON으로 읽습니다."""
+    try:
+        member = tar.getmember(name)
+    except KeyError as e:
+        raise CommandError(f"아카이브에 '{name}' 항목이 없습니다") from e
+
+    fileobj = tar.extractfile(member)
+    if fileobj is None:
+        raise CommandError(f"아카이브 항목을 읽을 수 없습니다: {name}")
+
+    with fileobj:
+        return json.load(fileobj)
+
+
+def _read_images(tar: tarfile.TarFile) -> List[ArchiveImage]:
+    """열린 tar에서 이미지 목록을 읽습니다."""
+    manifest = _read_json_member(tar, MANIFEST_NAME)
+    if not isinstance(manifest, list):
+        raise CommandError(f"올바르지 않은 {MANIFEST_NAME} 형식입니다")
+
+    images: List[ArchiveImage] = []
+    for entry in manifest:
+        config_path = entry["Config"]
+        config = cast(Dict[str, object], _read_json_member(tar, config_path))
+        rootfs = cast(Dict[str, List[str]], config.get("rootfs") or {})
+        diff_ids = list(rootfs.get("diff_ids", []))
+        layers = list(entry.get("Layers") or [])
+
+        if len(diff_ids) != len(layers):
+            raise CommandError(
+                f"레이어 수와 diff_id 수가 일치하지 않습니다: {config_path} "
+                f"(레이어 {len(layers)}개, diff_id {len(diff_ids)}개)"
+            )
+
+        images.append(
+            {
+                "config": config_path,
+                "repo_tags": list(entry.get("RepoTags") or []),
+                "layers": layers,
+                "diff_ids": diff_ids,
+            }
+        )
+
+    return images
+
+
+def read_archive_images(archive_path: Path) -> List[ArchiveImage]:
+    """docker save 아카이브의 이미지 목록을 읽습니다.
+
+    Args:
+        archive_path: docker save로 생성한 tar 파일 경로
+
+    Returns:
+        아카이브에 포함된 이미지 정보 목록
+
+    Raises:
+        CommandError: 아카이브를 읽을 수 없거나 형식이 올바르지 않은 경우
+    """
+    try:
+        with tarfile.open(archive_path, "r:*") as tar:
+            return _read_images(tar)
+    except (OSError, tarfile.TarError, ValueError, KeyError) as e:
+        raise CommandError(f"이미지 아카이브 읽기 실패: {archive_path}: {e}") from e
+
+
+def collect_layer_digests(archive_paths: Iterable[Path]) -> Set[str]:
+    """아카이브들에 포함된 모든 레이어 다이제스트(diff_id)를 수집합니다.
+
+    Args:
+        archive_paths: docker save 아카이브 경로 목록
+
+    Returns:
+        레이어 다이제스트 세트
+    """
+    digests: Set[str] = set()
+    for archive_path in archive_paths:
+        for image in read_archive_images(archive_path):
+            digests.update(image["diff_ids"])
+    return digests
+
+
+def load_layer_list(path: Path) -> Set[str]:
+    """레이어 목록 파일을 읽습니다.
+
+    한 줄에 하나의 다이제스트를 기록하며 빈 줄과 `#` 주석은 무시합니다.
+
+    Args:
+        path: 레이어 목록 파일 경로
+
+    Returns:
+        레이어 다이제스트 세트
+    """
+    digests: Set[str] = set()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                digests.add(line)
+    return digests
+
+
+def write_layer_list(digests: Iterable[str], output_path: Path) -> None:
+    """레이어 목록 파일을 작성합니다.
+
+    Args:
+        digests: 레이어 다이제스트 목록
+        output_path: 출력 파일 경로
+    """
+    with open(output_path, "w", encoding="utf-8") as f:
+        for digest in sorted(set(digests)):
+            f.write(f"{digest}\n")
+
+    logger.info(f"레이어 목록 파일 생성: {output_path}")
+
+
+def _layer_paths(images: List[ArchiveImage]) -> Dict[str, str]:
+    """레이어 경로 → 다이제스트 매핑을 만듭니다."""
+    mapping: Dict[str, str] = {}
+    for image in images:
+        for index, path in enumerate(image["layers"]):
+            mapping[path] = image["diff_ids"][index]
+    return mapping
+
+
+def _expected_blob_digest(path: str, diff_id: str) -> str:
+    """아카이브 항목에 저장된 바이트의 예상 SHA256을 반환합니다.
+
+    OCI 레이아웃(`blobs/sha256/<hex>`)은 경로 자체가 저장 바이트의 다이제스트이고,
+    레거시 형식(`<id>/layer.tar`)은 비압축 레이어이므로 diff_id와 같습니다.
+    """
+    parts = path.split("/")
+    if len(parts) == 3 and parts[0] == "blobs":
+        return parts[2]
+    return diff_id.split(":", 1)[-1]
+
+
+def create_thin_archive(
+    source_path: Path, output_path: Path, known_layers: Set[str]
+) -> ThinArchiveResult:
+    """목적지에 이미 존재하는 레이어를 제외한 씬(thin) 아카이브를 만듭니다.
+
+    이미지 설정과 매니페스트는 모두 유지하고, 생략한 레이어 정보는
+    `cli-onprem-thin.json`에 기록하여 복원 시 사용합니다.
+
+    Args:
+        source_path: 원본 docker save 아카이브
+        output_path: 생성할 씬 아카이브 경로
+        known_layers: 목적지에 이미 존재하는 레이어 다이제스트
+
+    Returns:
+        유지한 항목 수와 생략한 레이어 목록
+
+    Raises:
+        CommandError: 아카이브 처리 실패
+    """
+    logger.info(f"씬 아카이브 생성 중: {source_path} → {output_path}")
+
+    omitted: List[OmittedLayer] = []
+    kept = 0
+
+    try:
+        with tarfile.open(source_path, "r:*") as src:
+            layer_paths = _layer_paths(_read_images(src))
+
+            with tarfile.open(output_path, "w") as dst:
+                for member in src:
+                    digest = layer_paths.get(member.name)
+                    if digest is not None and digest in known_layers:
+                        omitted.append(
+                            {"path": member.name, "digest": digest, "size": member.size}
+                        )
+                        continue
+
+                    fileobj = src.extractfile(member) if member.isfile() else None
+                    dst.addfile(member, fileobj)
+                    kept += 1
+
+                metadata = json.dumps(
+                    {"version": THIN_METADATA_VERSION, "omitted": omitted}, indent=2
+                ).encode("utf-8")
+                info = tarfile.TarInfo(THIN_METADATA_NAME)
+                info.size = len(metadata)
+                info.mode = 0o644
+                dst.addfile(info, io.BytesIO(metadata))
+    except (OSError, tarfile.TarError) as e:
+        raise CommandError(f"씬 아카이브 생성 실패: {e}") from e
+
+    saved = sum(layer["size"] for layer in omitted)
+    logger.info(
+        f"씬 아카이브 생성 완료: {len(omitted)}개 레이어 생략 "
+        f"({saved / (1024 * 1024):.1f}MB 절약)"
+    )
+    return {"kept": kept, "omitted": omitted}
+
+
+def read_thin_metadata(archive_path: Path) -> Optional[List[OmittedLayer]]:
+    """씬 아카이브의 생략 레이어 목록을 읽습니다.
+
+    Args:
+        archive_path: 아카이브 경로
+
+    Returns:
+        생략된 레이어 목록. 씬 아카이브가 아니면 None
+    """
+    with tarfile.open(archive_path, "r:*") as tar:
+        try:
+            tar.getmember(THIN_METADATA_NAME)
+        except KeyError:
+            return None
+        metadata = cast(Dict[str, object], _read_json_member(tar, THIN_METADATA_NAME))
+
+    if metadata.get("version") != THIN_METADATA_VERSION:
+        raise CommandError(
+            f"지원하지 않는 씬 아카이브 버전입니다: {metadata.get('version')}"
+        )
+    return cast(List[OmittedLayer], metadata.get("omitted", []))
+
+
+def _index_layer_sources(sources: Iterable[Path]) -> Dict[str, Tuple[Path, str]]:
+    """레이어 제공 아카이브에서 다이제스트 → (아카이브, 경로) 색인을 만듭니다.
+
+    씬 아카이브도 제공원이 될 수 있으므로 실제로 존재하는 항목만 색인합니다.
+    """
+    index: Dict[str, Tuple[Path, str]] = {}
+    for source in sources:
+        with tarfile.open(source, "r:*") as tar:
+            names = set(tar.getnames())
+            for path, digest in _layer_paths(_read_images(tar)).items():
+                if path in names and digest not in index:
+                    index[digest] = (source, path)
+    logger.debug(f"레이어 제공원 색인: {len(index)}개 레이어")
+    return index
+
+
+def restore_thin_archive(
+    thin_path: Path, sources: Iterable[Path], output_path: Path
+) -> int:
+    """씬 아카이브와 현장에 있는 레이어로 완전한 아카이브를 재구성합니다.
+
+    복원된 레이어는 저장 바이트의 SHA256으로 무결성을 검증합니다.
+
+    Args:
+        thin_path: 씬 아카이브 경로
+        sources: 생략된 레이어를 가진 기존 docker save 아카이브 목록
+        output_path: 생성할 완전한 아카이브 경로
+
+    Returns:
+        복원한 레이어 수
+
+    Raises:
+        CommandError: 씬 아카이브가 아니거나 레이어를 찾을 수 없거나
+            무결성 검증에 실패한 경우
+    """
+    omitted = read_thin_metadata(thin_path)
+    if omitted is None:
+        raise CommandError(f"씬 아카이브가 아닙니다: {thin_path}")
+
+    index = _index_layer_sources(sources)
+    missing = sorted({layer["digest"] for layer in omitted} - set(index))
+    if missing:
+        raise CommandError(
+            "제공된 아카이브에서 다음 레이어를 찾을 수 없습니다:\n  "
+            + "\n  ".join(missing)
+        )
+
+    logger.info(f"씬 아카이브 복원 중: {thin_path} → {output_path}")
+
+    try:
+        with tarfile.open(thin_path, "r:*") as thin:
+            with tarfile.open(output_path, "w") as dst:
+                for member in thin:
+                    if member.name == THIN_METADATA_NAME:
+                        continue
+                    fileobj = thin.extractfile(member) if member.isfile() else None
+                    dst.addfile(member, fileobj)
+
+                for layer in omitted:
+                    source, source_path = index[layer["digest"]]
+                    _copy_layer(source, source_path, layer, dst)
+    except (OSError, tarfile.TarError) as e:
+        output_path.unlink(missing_ok=True)
+        raise CommandError(f"씬 아카이브 복원 실패: {e}") from e
+    except CommandError:
+        output_path.unlink(missing_ok=True)
+        raise
+
+    logger.info(f"씬 아카이브 복원 완료: {len(omitted)}개 레이어 복원")
+    return len(omitted)
+
+
+def _copy_layer(
+    source: Path, source_path: str, layer: OmittedLayer, dst: tarfile.TarFile
+) -> None:
+    """제공 아카이브의 레이어를 생략된 경로로 복사하고 검증합니다."""
+    with tarfile.open(source, "r:*") as src:
+        member = src.getmember(source_path)
+        fileobj = src.extractfile(member)
+        if fileobj is None:
+            raise CommandError(f"레이어를 읽을 수 없습니다: {source}:{source_path}")
+
+        info = tarfile.TarInfo(layer["path"])
+        info.size = member.size
+        info.mode = member.mode
+        info.mtime = member.mtime
+
+        reader = _HashingReader(fileobj)
+        dst.addfile(info, reader)
+
+    expected = _expected_blob_digest(layer["path"], layer["digest"])
+    if reader.hexdigest() != expected:
+        raise CommandError(
+            f"레이어 무결성 검증 실패: {layer['digest']} ({source}:{source_path})"
+        )
+
+
+OCI_LAYOUT_NAME = "oci-layout"
+OCI_INDEX_NAME = "index.json"
+OCI_INDEX_MEDIA_TYPE = "application/vnd.oci.image.index.v1+json"
+OCI_MANIFEST_MEDIA_TYPE = "application/vnd.oci.image.manifest.v1+json"
+OCI_CONFIG_MEDIA_TYPE = "application/vnd.oci.image.config.v1+json"
+OCI_LAYER_MEDIA_TYPES = {
+    "tar": "application/vnd.oci.image.layer.v1.tar",
+    "gzip": "application/vnd.oci.image.layer.v1.tar+gzip",
+    "zstd": "application/vnd.oci.image.layer.v1.tar+zstd",
+}
+
+
+def _detect_compression(header: bytes) -> str:
+    """레이어 앞부분 바이트로 압축 형식을 판별합니다."""
+    if header.startswith(b"\x1f\x8b"):
+        return "gzip"
+    if header.startswith(b"\x28\xb5\x2f\xfd"):
+        return "zstd"
+    return "tar"
+
+
+def _add_bytes(tar: tarfile.TarFile, name: str, data: bytes) -> None:
+    """바이트 데이터를 tar 항목으로 추가합니다."""
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mode = 0o644
+    tar.addfile(info, io.BytesIO(data))
+
+
+def _split_platform(platform: str) -> Dict[str, str]:
+    """`linux/arm64/v8` 형식의 플랫폼 문자열을 OCI platform 객체로 변환합니다."""
+    parts = platform.split("/")
+    result = {"os": parts[0], "architecture": parts[1] if len(parts) > 1 else ""}
+    if len(parts) > 2:
+        result["variant"] = parts[2]
+    return result
+
+
+def _copy_image_blobs(
+    src: tarfile.TarFile,
+    archive_path: Path,
+    dst: tarfile.TarFile,
+    written: Set[str],
+) -> Tuple[Dict[str, object], int]:
+    """아카이브 하나의 설정/레이어를 블롭으로 복사하고 OCI 매니페스트를 만듭니다.
+
+    Returns:
+        (OCI 이미지 매니페스트, 중복으로 생략한 블롭 수) 튜플
+    """
+    images = _read_images(src)
+    if len(images) != 1:
+        raise CommandError(f"아카이브에 이미지가 하나만 있어야 합니다: {archive_path}")
+    image = images[0]
+    skipped = 0
+
+    config_member = src.extractfile(image["config"])
+    if config_member is None:
+        raise CommandError(f"이미지 설정을 읽을 수 없습니다: {archive_path}")
+    config_data = config_member.read()
+    config_digest = hashlib.sha256(config_data).hexdigest()
+    if config_digest in written:
+        skipped += 1
+    else:
+        _add_bytes(dst, f"blobs/sha256/{config_digest}", config_data)
+        written.add(config_digest)
+
+    layers: List[Dict[str, object]] = []
+    for index, layer_path in enumerate(image["layers"]):
+        member = src.getmember(layer_path)
+        fileobj = src.extractfile(member)
+        if fileobj is None:
+            raise CommandError(
+                f"레이어를 읽을 수 없습니다: {archive_path}:{layer_path}"
+            )
+
+        blob_digest = _expected_blob_digest(layer_path, image["diff_ids"][index])
+        compression = _detect_compression(fileobj.read(4))
+        layers.append(
+            {
+                "mediaType": OCI_LAYER_MEDIA_TYPES[compression],
+                "digest": f"sha256:{blob_digest}",
+                "size": member.size,
+            }
+        )
+
+        if blob_digest in written:
+            skipped += 1
+            continue
+
+        fileobj.seek(0)
+        info = tarfile.TarInfo(f"blobs/sha256/{blob_digest}")
+        info.size = member.size
+        info.mode = 0o644
+        info.mtime = member.mtime
+        reader = _HashingReader(fileobj)
+        dst.addfile(info, reader)
+        if reader.hexdigest() != blob_digest:
+            raise CommandError(f"레이어 무결성 검증 실패: {archive_path}:{layer_path}")
+        written.add(blob_digest)
+
+    manifest: Dict[str, object] = {
+        "schemaVersion": 2,
+        "mediaType": OCI_MANIFEST_MEDIA_TYPE,
+        "config": {
+            "mediaType": OCI_CONFIG_MEDIA_TYPE,
+            "digest": f"sha256:{config_digest}",
+            "size": len(config_data),
+        },
+        "layers": layers,
+    }
+    return manifest, skipped
+
+
+def _add_json_blob(tar: tarfile.TarFile, data: Dict[str, object]) -> Tuple[str, int]:
+    """JSON 문서를 블롭으로 추가하고 (다이제스트, 크기)를 반환합니다."""
+    encoded = json.dumps(data).encode("utf-8")
+    digest = f"sha256:{hashlib.sha256(encoded).hexdigest()}"
+    _add_bytes(tar, f"blobs/sha256/{digest.split(':', 1)[1]}", encoded)
+    return digest, len(encoded)
+
+
+def _tagged_reference(reference: str) -> Optional[str]:
+    """docker save처럼 기본 태그를 적용한 표준 레퍼런스를 반환합니다.
+
+    태그 없이 다이제스트만 있으면 태그를 붙일 수 없으므로 None을 반환합니다.
+    """
+    ref = parse_image_ref(reference)
+    if ref.digest and not ref.tag:
+        return None
+    return f"{ref.name}:{ref.tag or DEFAULT_TAG}"
+
+
+def _reference_annotations(reference: str) -> Dict[str, str]:
+    """OCI 인덱스 최상위 항목에 기록할 이미지 이름 어노테이션을 만듭니다."""
+    ref = parse_image_ref(reference)
+    annotations = {"io.containerd.image.name": ref.normalized()}
+    if _tagged_reference(reference) is not None:
+        annotations["org.opencontainers.image.ref.name"] = ref.tag or DEFAULT_TAG
+    return annotations
+
+
+def merge_to_oci_index(
+    archives: List[Tuple[str, Path]], output_path: Path, reference: str
+) -> int:
+    """플랫폼별 docker save 아카이브를 하나의 멀티 플랫폼 OCI 인덱스로 합칩니다.
+
+    플랫폼 간 공유되는 레이어(및 설정)는 다이제스트 기준으로 한 번만 저장합니다.
+
+    Args:
+        archives: (플랫폼, 아카이브 경로) 목록. 각 아카이브는 이미지 하나를 포함
+        output_path: 생성할 OCI 레이아웃 tar 경로
+        reference: 인덱스에 기록할 이미지 레퍼런스
+
+    Returns:
+        중복 제거로 생략된 블롭 수
+
+    Raises:
+        CommandError: 아카이브 처리 실패
+    """
+    logger.info(f"멀티 플랫폼 OCI 인덱스 생성 중: {output_path}")
+
+    written: Set[str] = set()
+    skipped = 0
+    descriptors: List[Dict[str, object]] = []
+
+    try:
+        with tarfile.open(output_path, "w") as dst:
+            _add_bytes(
+                dst,
+                OCI_LAYOUT_NAME,
+                json.dumps({"imageLayoutVersion": "1.0.0"}).encode("utf-8"),
+            )
+
+            for platform, archive_path in archives:
+                with tarfile.open(archive_path, "r:*") as src:
+                    manifest, image_skipped = _copy_image_blobs(
+                        src, archive_path, dst, written
+                    )
+                skipped += image_skipped
+
+                digest, size = _add_json_blob(dst, manifest)
+                descriptors.append(
+                    {
+                        "mediaType": OCI_MANIFEST_MEDIA_TYPE,
+                        "digest": digest,
+                        "size": size,
+                        "platform": _split_platform(platform),
+                    }
+                )
+
+            index_digest, index_size = _add_json_blob(
+                dst,
+                {
+                    "schemaVersion": 2,
+                    "mediaType": OCI_INDEX_MEDIA_TYPE,
+                    "manifests": descriptors,
+                },
+            )
+            top_level = {
+                "schemaVersion": 2,
+                "mediaType": OCI_INDEX_MEDIA_TYPE,
+                "manifests": [
+                    {
+                        "mediaType": OCI_INDEX_MEDIA_TYPE,
+                        "digest": index_digest,
+                        "size": index_size,
+                        "annotations": _reference_annotations(reference),
+                    }
+                ],
+            }
+            _add_bytes(
+                dst, OCI_INDEX_NAME, json.dumps(top_level, indent=2).encode("utf-8")
+            )
+    except (OSError, tarfile.TarError) as e:
+        output_path.unlink(missing_ok=True)
+        raise CommandError(f"OCI 인덱스 생성 실패: {e}") from e
+    except CommandError:
+        output_path.unlink(missing_ok=True)
+        raise
+
+    logger.info(
+        f"OCI 인덱스 생성 완료: {len(archives)}개 플랫폼, "
+        f"공유 블롭 {skipped}개 중복 제거"
+    )
+    return skipped
+
+
+class LayoutBlob(TypedDict):
+    """디스크에 내려받은 레이어 블롭."""
+
+    path: Path
+    digest: str
+    size: int
+    media_type: str
+
+
+class LayoutImage(TypedDict):
+    """레지스트리에서 가져온 플랫폼 하나의 이미지 구성 요소."""
+
+    platform: str
+    config: bytes
+    layers: List[LayoutBlob]
+
+
+def _oci_layer_media_type(media_type: str) -> str:
+    """Docker/OCI 레이어 미디어 타입을 OCI 레이어 미디어 타입으로 변환합니다."""
+    if "zstd" in media_type:
+        return OCI_LAYER_MEDIA_TYPES["zstd"]
+    if "gzip" in media_type:
+        return OCI_LAYER_MEDIA_TYPES["gzip"]
+    return OCI_LAYER_MEDIA_TYPES["tar"]
+
+
+def _add_layout_image(
+    tar: tarfile.TarFile, image: LayoutImage, written: Set[str]
+) -> Tuple[Dict[str, object], str]:
+    """이미지 블롭을 추가하고 (OCI 매니페스트, 설정 블롭 경로)를 반환합니다."""
+    config_hex = hashlib.sha256(image["config"]).hexdigest()
+    if config_hex not in written:
+        _add_bytes(tar, f"blobs/sha256/{config_hex}", image["config"])
+        written.add(config_hex)
+
+    for layer in image["layers"]:
+        layer_hex = layer["digest"].split(":", 1)[1]
+        if layer_hex in written:
+            continue
+        tar.add(str(layer["path"]), arcname=f"blobs/sha256/{layer_hex}")
+        written.add(layer_hex)
+
+    manifest: Dict[str, object] = {
+        "schemaVersion": 2,
+        "mediaType": OCI_MANIFEST_MEDIA_TYPE,
+        "config": {
+            "mediaType": OCI_CONFIG_MEDIA_TYPE,
+            "digest": f"sha256:{config_hex}",
+            "size": len(image["config"]),
+        },
+        "layers": [
+            {
+                "mediaType": _oci_layer_media_type(layer["media_type"]),
+                "digest": layer["digest"],
+                "size": layer["size"],
+            }
+            for layer in image["layers"]
+        ],
+    }
+    return manifest, f"blobs/sha256/{config_hex}"
+
+
+def write_layout_archive(
+    images: List[LayoutImage],
+    output_path: Path,
+    reference: str,
+    docker_manifest: bool = True,
+) -> None:
+    """내려받은 블롭으로 OCI 레이아웃 아카이브를 작성합니다.
+
+    이미지가 하나이고 docker_manifest가 True이면 `manifest.json`도 함께 기록하여
+    `docker load`로 바로 적재할 수 있는 docker save 호환 아카이브를 만듭니다.
+    여러 플랫폼은 merge_to_oci_index와 같은 멀티 플랫폼 인덱스로 기록합니다.
+
+    Args:
+        images: 플랫폼별 이미지 구성 요소
+        output_path: 생성할 아카이브 경로
+        reference: 아카이브에 기록할 이미지 레퍼런스
+        docker_manifest: docker save 호환 manifest.json 기록 여부
+
+    Raises:
+        CommandError: 아카이브 작성 실패
+    """
+    written: Set[str] = set()
+    annotations = _reference_annotations(reference)
+
+    try:
+        with tarfile.open(output_path, "w") as tar:
+            _add_bytes(
+                tar,
+                OCI_LAYOUT_NAME,
+                json.dumps({"imageLayoutVersion": "1.0.0"}).encode("utf-8"),
+            )
+
+            descriptors: List[Dict[str, object]] = []
+            config_paths: List[str] = []
+            for image in images:
+                manifest, config_path = _add_layout_image(tar, image, written)
+                digest, size = _add_json_blob(tar, manifest)
+                descriptors.append(
+                    {
+                        "mediaType": OCI_MANIFEST_MEDIA_TYPE,
+                        "digest": digest,
+                        "size": size,
+                        "platform": _split_platform(image["platform"]),
+                    }
+                )
+                config_paths.append(config_path)
+
+            if len(descriptors) == 1:
+                top_manifests = [{**descriptors[0], "annotations": annotations}]
+            else:
+                index_digest, index_size = _add_json_blob(
+                    tar,
+                    {
+                        "schemaVersion": 2,
+                        "mediaType": OCI_INDEX_MEDIA_TYPE,
+                        "manifests": descriptors,
+                    },
+                )
+                top_manifests = [
+                    {
+                        "mediaType": OCI_INDEX_MEDIA_TYPE,
+                        "digest": index_digest,
+                        "size": index_size,
+                        "annotations": annotations,
+                    }
+                ]
+
+            top_level = {
+                "schemaVersion": 2,
+                "mediaType": OCI_INDEX_MEDIA_TYPE,
+                "manifests": top_manifests,
+            }
+            _add_bytes(
+                tar, OCI_INDEX_NAME, json.dumps(top_level, indent=2).encode("utf-8")
+            )
+
+            if docker_manifest and len(images) == 1:
+                tagged = _tagged_reference(reference)
+                docker_entry = {
+                    "Config": config_paths[0],
+                    "RepoTags": [tagged] if tagged else [],
+                    "Layers": [
+                        f"blobs/sha256/{layer['digest'].split(':', 1)[1]}"
+                        for layer in images[0]["layers"]
+                    ],
+                }
+                _add_bytes(
+                    tar, MANIFEST_NAME, json.dumps([docker_entry]).encode("utf-8")
+                )
+    except (OSError, tarfile.TarError) as e:
+        output_path.unlink(missing_ok=True)
+        raise CommandError(f"이미지 아카이브 작성 실패: {e}") from e
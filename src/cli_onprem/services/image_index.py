@@ -0,0 +1,126 @@
+"""로컬 Docker 이미지 이름 색인 (자동완성용).
+
+`docker images`는 로컬 이미지가 수천 개인 빌드 서버에서 느리므로, 정렬된
+이미지 이름 목록을 `<config_dir>/cache/images/`에 저장해 두고 접두사 질의는
+bisect로 처리합니다. 색인을 만든 뒤 `docker events`에 이미지 이벤트(pull, tag,
+delete 등)가 있을 때만 다시 만들며, 이벤트 버퍼가 넘쳐 변경을 놓치는 경우에
+대비해 max_age가 지나면 무조건 다시 만듭니다. Docker 호스트/컨텍스트마다
+색인 파일을 따로 둡니다.
+"""
+
+import bisect
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, TypedDict
+
+from cli_onprem.core.errors import CommandError
+from cli_onprem.core.logging import get_logger
+from cli_onprem.services.credential import get_config_dir
+from cli_onprem.services.docker import has_image_events, list_local_images
+
+logger = get_logger("services.image_index")
+
+DEFAULT_MAX_AGE = float(os.getenv("CLI_ONPREM_IMAGE_INDEX_MAX_AGE", "3600"))
+
+
+class ImageIndexData(TypedDict):
+    """색인 파일 내용."""
+
+    built: float
+    images: List[str]
+
+
+def get_image_index_path() -> Path:
+    """현재 Docker 호스트/컨텍스트의 색인 파일 경로를 반환합니다."""
+    target = f"{os.getenv('DOCKER_HOST', '')}\n{os.getenv('DOCKER_CONTEXT', '')}"
+    key = hashlib.sha256(target.encode()).hexdigest()[:16]
+    return get_config_dir() / "cache" / "images" / f"index-{key}.json"
+
+
+def prefix_range(images: List[str], prefix: str) -> List[str]:
+    """정렬된 목록에서 prefix로 시작하는 항목을 bisect로 찾습니다."""
+    start = bisect.bisect_left(images, prefix)
+    end = start
+    while end < len(images) and images[end].startswith(prefix):
+        end += 1
+    return images[start:end]
+
+
+class ImageIndex:
+    """로컬 이미지 이름 색인.
+
+    Args:
+        path: 색인 파일 경로 (기본값: get_image_index_path())
+        max_age: 이벤트와 관계없이 색인을 다시 만드는 주기(초)
+        list_images: 로컬 이미지 목록 조회 함수 (테스트용 주입)
+        changed: 두 시각 사이 이미지 변경 여부 조회 함수 (테스트용 주입)
+        clock: 현재 시각 함수 (테스트용 주입)
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_age: float = DEFAULT_MAX_AGE,
+        list_images: Callable[[], List[str]] = list_local_images,
+        changed: Callable[[float, float], bool] = has_image_events,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path or get_image_index_path()
+        self.max_age = max_age
+        self._list_images = list_images
+        self._changed = changed
+        self._clock = clock
+
+    def _read(self) -> Optional[ImageIndexData]:
+        try:
+            data: ImageIndexData = json.loads(self.path.read_text(encoding="utf-8"))
+            return {"built": float(data["built"]), "images": list(data["images"])}
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def rebuild(self) -> List[str]:
+        """`docker images`로 색인을 다시 만들어 저장합니다.
+
+        Raises:
+            CommandError: 이미지 목록 조회 실패
+        """
+        built = self._clock()
+        images = sorted(
+            {image for image in self._list_images() if image and "<none>" not in image}
+        )
+        data: ImageIndexData = {"built": built, "images": images}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.debug(f"이미지 색인 저장 실패: {e}")
+        return images
+
+    def images(self) -> List[str]:
+        """최신 상태의 정렬된 이미지 목록을 반환합니다.
+
+        이벤트 조회에 실패하면(데몬 중단 등) 저장된 색인을 그대로 사용합니다.
+
+        Raises:
+            CommandError: 색인이 없고 이미지 목록 조회도 실패한 경우
+        """
+        data = self._read()
+        now = self._clock()
+        if data is None or now - data["built"] > self.max_age:
+            return self.rebuild()
+
+        try:
+            changed = self._changed(data["built"], now)
+        except CommandError as e:
+            logger.debug(f"이미지 이벤트 확인 실패, 저장된 색인 사용: {e}")
+            return data["images"]
+        return self.rebuild() if changed else data["images"]
+
+    def complete(self, prefix: str) -> List[str]:
+        """prefix로 시작하는 이미지 이름을 반환합니다."""
+        return prefix_range(self.images(), prefix)
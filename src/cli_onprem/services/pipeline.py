@@ -0,0 +1,196 @@
+"""두 단계 파이프라인 실행기.
+
+여러 이미지를 내보낼 때 N+1번째 이미지의 pull(네트워크)과 N번째 이미지의
+save(디스크)를 겹쳐 실행합니다. 두 단계 사이에는 크기가 제한된 큐를 두어
+save가 밀리면 pull이 앞서 나가지 않도록 하고(백프레셔), 단계별 작업자 수와
+가동률을 집계해 튜닝에 사용할 수 있게 합니다.
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, TypedDict
+
+from cli_onprem.core.logging import get_logger
+
+logger = get_logger("services.pipeline")
+
+_DONE = object()
+
+
+class StageStats(TypedDict):
+    """단계 하나의 실행 통계.
+
+    blocked_seconds는 1단계에서는 큐가 가득 차 기다린 시간(2단계가 병목),
+    2단계에서는 입력을 기다린 시간(1단계가 병목)입니다.
+    """
+
+    name: str
+    workers: int
+    completed: int
+    failed: int
+    busy_seconds: float
+    blocked_seconds: float
+    utilization: float
+
+
+class PipelineReport(TypedDict):
+    """파이프라인 실행 결과.
+
+    failures는 입력 순번 → (실패한 단계 이름, 오류 메시지) 매핑입니다.
+    """
+
+    elapsed_seconds: float
+    stages: List[StageStats]
+    failures: Dict[int, Tuple[str, str]]
+
+
+class _Stage:
+    """단계별 작업자 수와 바쁜/대기 시간을 스레드 안전하게 집계합니다."""
+
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = workers
+        self.completed = 0
+        self.failed = 0
+        self.busy = 0.0
+        self.blocked = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, busy: float, ok: bool) -> None:
+        with self._lock:
+            self.busy += busy
+            if ok:
+                self.completed += 1
+            else:
+                self.failed += 1
+
+    def record_blocked(self, seconds: float) -> None:
+        with self._lock:
+            self.blocked += seconds
+
+    def stats(self, elapsed: float) -> StageStats:
+        capacity = max(elapsed * self.workers, 1e-9)
+        return {
+            "name": self.name,
+            "workers": self.workers,
+            "completed": self.completed,
+            "failed": self.failed,
+            "busy_seconds": round(self.busy, 3),
+            "blocked_seconds": round(self.blocked, 3),
+            "utilization": round(min(self.busy / capacity, 1.0), 3),
+        }
+
+
+def run_two_stage(
+    items: Iterable[Any],
+    first: Callable[[Any], Any],
+    second: Callable[[Any, Any], None],
+    first_workers: int = 2,
+    second_workers: int = 1,
+    queue_size: int = 2,
+    names: Tuple[str, str] = ("pull", "save"),
+) -> PipelineReport:
+    """항목마다 first를 실행한 뒤 그 결과로 second를 실행하는 파이프라인.
+
+    한 항목이 실패해도 나머지 항목은 계속 처리하며, first가 실패한 항목은
+    second로 넘기지 않습니다.
+
+    Args:
+        items: 처리할 항목 (지연 이터러블 가능)
+        first: 1단계 함수 (항목 → 중간 결과)
+        second: 2단계 함수 (항목, 중간 결과)
+        first_workers: 1단계 작업자 수
+        second_workers: 2단계 작업자 수
+        queue_size: 단계 사이 큐 크기 (가득 차면 1단계가 대기)
+        names: 통계에 표시할 단계 이름
+
+    Returns:
+        단계별 가동률과 실패 목록을 담은 리포트
+    """
+    stage1 = _Stage(names[0], max(1, first_workers))
+    stage2 = _Stage(names[1], max(1, second_workers))
+    handoff: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, queue_size))
+    source: Iterator[Tuple[int, Any]] = enumerate(items)
+    source_lock = threading.Lock()
+    failures: Dict[int, Tuple[str, str]] = {}
+    failures_lock = threading.Lock()
+
+    def _fail(index: int, stage: _Stage, error: Exception) -> None:
+        logger.warning(f"파이프라인 {stage.name} 단계 실패 (#{index}): {error}")
+        with failures_lock:
+            failures[index] = (stage.name, str(error))
+
+    def _first_worker() -> None:
+        while True:
+            with source_lock:
+                entry = next(source, None)
+            if entry is None:
+                return
+            index, item = entry
+
+            started = time.monotonic()
+            try:
+                result = first(item)
+            except Exception as e:
+                stage1.record(time.monotonic() - started, ok=False)
+                _fail(index, stage1, e)
+                continue
+            stage1.record(time.monotonic() - started, ok=True)
+
+            waited = time.monotonic()
+            handoff.put((index, item, result))
+            stage1.record_blocked(time.monotonic() - waited)
+
+    def _second_worker() -> None:
+        while True:
+            waited = time.monotonic()
+            entry = handoff.get()
+            stage2.record_blocked(time.monotonic() - waited)
+            if entry is _DONE:
+                return
+            index, item, result = entry
+
+            started = time.monotonic()
+            try:
+                second(item, result)
+            except Exception as e:
+                stage2.record(time.monotonic() - started, ok=False)
+                _fail(index, stage2, e)
+                continue
+            stage2.record(time.monotonic() - started, ok=True)
+
+    started = time.monotonic()
+    first_threads = [
+        threading.Thread(target=_first_worker, name=f"{stage1.name}-{n}")
+        for n in range(stage1.workers)
+    ]
+    second_threads = [
+        threading.Thread(target=_second_worker, name=f"{stage2.name}-{n}")
+        for n in range(stage2.workers)
+    ]
+    for thread in first_threads + second_threads:
+        thread.start()
+    for thread in first_threads:
+        thread.join()
+    for _ in second_threads:
+        handoff.put(_DONE)
+    for thread in second_threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+
+    return {
+        "elapsed_seconds": round(elapsed, 3),
+        "stages": [stage1.stats(elapsed), stage2.stats(elapsed)],
+        "failures": dict(sorted(failures.items())),
+    }
+
+
+def format_stage_stats(stats: StageStats) -> str:
+    """단계 통계를 한 줄로 포맷팅합니다."""
+    return (
+        f"{stats['name']}: 작업자 {stats['workers']}개, "
+        f"완료 {stats['completed']}개, 실패 {stats['failed']}개, "
+        f"가동률 {stats['utilization'] * 100:.0f}%, "
+        f"대기 {stats['blocked_seconds']:.1f}s"
+    )
@@ -0,0 +1,246 @@
+"""레지스트리별 동시성/속도 제한을 적용하는 이미지 pull 스케줄러.
+
+여러 이미지를 동시에 pull할 때 레지스트리마다 동시 실행 수(세마포어)와
+요청 속도(토큰 버킷)를 제한합니다. 한 작업자가 레이트 리밋(429, "too many
+requests")을 받으면 해당 레지스트리의 공유 백오프 시각이 갱신되어 모든
+작업자가 함께 대기합니다.
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, TypedDict
+
+from cli_onprem.core.errors import TransientError
+from cli_onprem.core.logging import get_logger
+from cli_onprem.services.docker import is_rate_limited, pull_image
+from cli_onprem.utils.image_ref import parse_image_ref
+
+logger = get_logger("services.pull_scheduler")
+
+PullFunction = Callable[..., None]
+
+
+class PullResult(TypedDict):
+    """이미지 하나의 pull 결과."""
+
+    reference: str
+    seconds: float
+    attempts: int
+    error: Optional[str]
+
+
+class TokenBucket:
+    """초당 rate개의 토큰을 최대 capacity개까지 채우는 토큰 버킷."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """토큰 하나를 예약하고 기다려야 할 시간을 반환합니다."""
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def acquire(self) -> None:
+        """토큰을 하나 얻을 때까지 대기합니다."""
+        if self._rate <= 0:
+            return
+        wait = self._reserve()
+        if wait > 0:
+            self._sleep(wait)
+
+
+class _RegistryState:
+    """레지스트리 하나의 동시성 제한, 토큰 버킷, 공유 백오프 상태."""
+
+    def __init__(self, concurrency: int, bucket: TokenBucket):
+        self.semaphore = threading.BoundedSemaphore(concurrency)
+        self.bucket = bucket
+        self.backoff_until = 0.0
+        self.rate_limit_hits = 0
+        self.lock = threading.Lock()
+
+
+class PullScheduler:
+    """레지스트리 인지형 pull 스케줄러.
+
+    Args:
+        registry_concurrency: 레지스트리별 최대 동시 pull 수
+        registry_rate: 레지스트리별 초당 pull 시작 수 (0이면 무제한)
+        max_retries: 일시적 오류 시 이미지별 최대 재시도 횟수
+        base_delay: 백오프 기본 대기 시간(초)
+        max_delay: 백오프 최대 대기 시간(초)
+        pull: 실제 pull 함수 (테스트용 주입)
+        clock: 단조 시계 (테스트용 주입)
+        sleep: 대기 함수 (테스트용 주입)
+        rng: 지터용 난수 생성기 (테스트용 주입)
+    """
+
+    def __init__(
+        self,
+        registry_concurrency: int = 2,
+        registry_rate: float = 1.0,
+        max_retries: int = 4,
+        base_delay: float = 2.0,
+        max_delay: float = 60.0,
+        pull: PullFunction = pull_image,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None,
+    ):
+        self._registry_concurrency = max(1, registry_concurrency)
+        self._registry_rate = registry_rate
+        self._max_retries = max_retries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._pull = pull
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self._registries: Dict[str, _RegistryState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, registry: str) -> _RegistryState:
+        with self._lock:
+            if registry not in self._registries:
+                bucket = TokenBucket(
+                    self._registry_rate,
+                    capacity=self._registry_concurrency,
+                    clock=self._clock,
+                    sleep=self._sleep,
+                )
+                self._registries[registry] = _RegistryState(
+                    self._registry_concurrency, bucket
+                )
+            return self._registries[registry]
+
+    def _jittered_delay(self, level: int) -> float:
+        """지수 백오프 상한 내에서 지터를 적용한 대기 시간 (equal jitter)."""
+        ceiling = min(self._max_delay, self._base_delay * (2.0**level))
+        return ceiling / 2 + self._rng.uniform(0, ceiling / 2)
+
+    def _wait_for_backoff(self, state: _RegistryState) -> None:
+        """레지스트리 공유 백오프가 끝날 때까지 대기합니다."""
+        while True:
+            with state.lock:
+                remaining = state.backoff_until - self._clock()
+            if remaining <= 0:
+                return
+            self._sleep(remaining)
+
+    def _start_registry_backoff(self, registry: str, state: _RegistryState) -> None:
+        """레지스트리 전체 백오프를 시작합니다 (모든 작업자가 같은 시각까지 대기)."""
+        with state.lock:
+            delay = self._jittered_delay(state.rate_limit_hits)
+            state.rate_limit_hits += 1
+            state.backoff_until = max(state.backoff_until, self._clock() + delay)
+        logger.warning(
+            f"레지스트리 {registry} 레이트 리밋 감지. "
+            f"{delay:.1f}초 동안 해당 레지스트리 pull 중지"
+        )
+
+    def pull(self, reference: str, arch: str = "linux/amd64") -> int:
+        """레지스트리 제한을 지키며 이미지를 pull합니다.
+
+        Args:
+            reference: Docker 이미지 레퍼런스
+            arch: 타겟 플랫폼
+
+        Returns:
+            시도 횟수
+
+        Raises:
+            TransientError: 재시도 횟수를 초과한 일시적 오류
+            PermanentError: 재시도 불가능한 오류
+        """
+        registry = parse_image_ref(reference).registry
+        state = self._state(registry)
+
+        attempt = 0
+        while True:
+            self._wait_for_backoff(state)
+            with state.semaphore:
+                self._wait_for_backoff(state)
+                state.bucket.acquire()
+                try:
+                    self._pull(reference, arch=arch, max_retries=0)
+                except TransientError as e:
+                    if attempt >= self._max_retries:
+                        raise
+                    rate_limited = is_rate_limited(e.stderr or str(e))
+                else:
+                    with state.lock:
+                        state.rate_limit_hits = 0
+                    return attempt + 1
+
+            if rate_limited:
+                self._start_registry_backoff(registry, state)
+            else:
+                # 레이트 리밋이 아닌 일시적 오류는 이 작업자만 백오프
+                delay = self._jittered_delay(attempt)
+                logger.warning(
+                    f"이미지 {reference} pull 실패 (시도 {attempt + 1}/"
+                    f"{self._max_retries + 1}). {delay:.1f}초 후 재시도"
+                )
+                self._sleep(delay)
+            attempt += 1
+
+    def pull_all(
+        self,
+        references: Iterable[str],
+        arch: str = "linux/amd64",
+        max_workers: int = 4,
+    ) -> List[PullResult]:
+        """여러 이미지를 병렬로 pull하고 이미지별 결과를 반환합니다.
+
+        한 이미지의 실패가 다른 이미지의 pull을 중단시키지 않습니다.
+
+        Args:
+            references: 이미지 레퍼런스 목록
+            arch: 타겟 플랫폼
+            max_workers: 전체 작업자 수
+
+        Returns:
+            입력 순서대로 정렬된 pull 결과 목록
+        """
+
+        def _run(reference: str) -> PullResult:
+            started = self._clock()
+            try:
+                attempts = self.pull(reference, arch)
+                error = None
+            except TransientError as e:
+                attempts = self._max_retries + 1
+                error = str(e)
+            except Exception as e:
+                attempts = 1
+                error = str(e)
+            return {
+                "reference": reference,
+                "seconds": self._clock() - started,
+                "attempts": attempts,
+                "error": error,
+            }
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            return list(executor.map(_run, references))
@@ -0,0 +1,486 @@
+"""Docker 데몬 없이 레지스트리에서 직접 이미지를 내려받는 비즈니스 로직.
+
+Registry HTTP API V2로 매니페스트와 블롭을 가져와 docker save 호환(또는 OCI)
+아카이브를 바로 작성합니다. 데몬 저장소를 거치지 않으므로 레이어 바이트를 한
+번만 기록하며, 블롭은 병렬로 내려받고 연결이 끊기면 HTTP Range로 이어받습니다.
+받은 블롭은 블롭 캐시(services.blob_cache)에 보관해 재시도와 다른 이미지의
+내보내기에서 재사용합니다.
+"""
+
+import base64
+import hashlib
+import http.client
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, TypedDict, cast
+
+from cli_onprem.core.errors import CommandError, PermanentError, TransientError
+from cli_onprem.core.logging import get_logger
+from cli_onprem.services.blob_cache import BlobCache
+from cli_onprem.services.image_archive import (
+    LayoutBlob,
+    LayoutImage,
+    write_layout_archive,
+)
+from cli_onprem.utils.image_ref import DOCKER_HUB, parse_image_ref
+from cli_onprem.utils.shell import DEFAULT_TIMEOUT
+
+logger = get_logger("services.registry")
+
+DOCKER_HUB_API_HOST = "registry-1.docker.io"
+DOCKER_HUB_AUTH_KEY = "https://index.docker.io/v1/"
+
+DOCKER_MANIFEST_V2 = "application/vnd.docker.distribution.manifest.v2+json"
+DOCKER_MANIFEST_LIST = "application/vnd.docker.distribution.manifest.list.v2+json"
+OCI_MANIFEST = "application/vnd.oci.image.manifest.v1+json"
+OCI_INDEX = "application/vnd.oci.image.index.v1+json"
+MANIFEST_ACCEPT = ", ".join(
+    [OCI_INDEX, DOCKER_MANIFEST_LIST, OCI_MANIFEST, DOCKER_MANIFEST_V2]
+)
+INDEX_MEDIA_TYPES = {OCI_INDEX, DOCKER_MANIFEST_LIST}
+
+CHUNK_SIZE = 1024 * 1024
+
+_CHALLENGE_PARAM = re.compile(r'(\w+)="([^"]*)"')
+
+LayerProgressCallback = Callable[[int, int], None]
+
+
+class Descriptor(TypedDict):
+    """매니페스트가 가리키는 콘텐츠 기술자."""
+
+    mediaType: str
+    digest: str
+    size: int
+
+
+class RegistryExportResult(TypedDict):
+    """레지스트리 내보내기 결과."""
+
+    blobs: int
+    cached_blobs: int
+    downloaded_bytes: int
+    download_seconds: float
+    write_seconds: float
+
+
+def parse_registry_reference(reference: str) -> Tuple[str, str, str]:
+    """이미지 레퍼런스를 (레지스트리, 저장소, 태그 또는 다이제스트)로 분해합니다.
+
+    Docker Hub의 단일 이름 이미지는 `library/` 네임스페이스를 붙입니다.
+
+    Args:
+        reference: 이미지 레퍼런스 (예: nginx:1.25, localhost:5000/app@sha256:...)
+
+    Returns:
+        (registry, repository, tag_or_digest) 튜플
+    """
+    ref = parse_image_ref(reference)
+    return ref.registry, ref.path, ref.tag_or_digest
+
+
+def load_docker_credentials(registry: str) -> Optional[Tuple[str, str]]:
+    """docker login으로 저장된 정적 자격증명(`auths`)을 조회합니다.
+
+    credsStore/credHelpers 기반 자격증명은 지원하지 않습니다.
+
+    Args:
+        registry: 레지스트리 호스트
+
+    Returns:
+        (사용자, 비밀번호) 또는 None
+    """
+    config_dir = os.environ.get("DOCKER_CONFIG") or str(Path.home() / ".docker")
+    config_path = Path(config_dir) / "config.json"
+    try:
+        config = json.loads(config_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    auths = config.get("auths") or {}
+    keys = [registry, f"https://{registry}", f"http://{registry}"]
+    if registry == DOCKER_HUB:
+        keys.insert(0, DOCKER_HUB_AUTH_KEY)
+
+    for key in keys:
+        encoded = (auths.get(key) or {}).get("auth")
+        if encoded:
+            user, _, password = base64.b64decode(encoded).decode().partition(":")
+            return user, password
+    return None
+
+
+def _http_error(error: urllib.error.HTTPError, what: str) -> CommandError:
+    """HTTP 오류를 재시도 가능 여부에 맞는 예외로 변환합니다."""
+    message = f"레지스트리 요청 실패 ({error.code} {error.reason}): {what}"
+    if error.code == 429 or error.code >= 500:
+        return TransientError(message, stderr=f"{error.code} {error.reason}")
+    if error.code == 404:
+        return PermanentError(f"이미지 또는 블롭을 찾을 수 없습니다: {what}")
+    if error.code in (401, 403):
+        return PermanentError(
+            f"레지스트리 접근 권한이 없습니다: {what}\n\n"
+            "해결 방법:\n"
+            "  1. docker login으로 레지스트리에 로그인하세요\n"
+            "  2. 이미지 이름과 권한을 확인하세요"
+        )
+    return PermanentError(message)
+
+
+class RegistryClient:
+    """Registry HTTP API V2 클라이언트 (Bearer 토큰/Basic 인증 지원).
+
+    Args:
+        registry: 레지스트리 호스트 (docker.io는 registry-1.docker.io로 접속)
+        insecure: HTTPS 대신 HTTP 사용
+        credentials: (사용자, 비밀번호). None이면 docker 설정에서 조회
+        timeout: 요청 타임아웃 (초)
+    """
+
+    def __init__(
+        self,
+        registry: str,
+        insecure: bool = False,
+        credentials: Optional[Tuple[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        host = DOCKER_HUB_API_HOST if registry == DOCKER_HUB else registry
+        scheme = "http" if insecure else "https"
+        self._base_url = f"{scheme}://{host}/v2"
+        self._credentials = credentials or load_docker_credentials(registry)
+        self._timeout = timeout
+        self._authorization: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def _authenticate(self, challenge: str) -> None:
+        """WWW-Authenticate 챌린지에 따라 인증 헤더를 준비합니다."""
+        scheme, _, params_text = challenge.partition(" ")
+        basic = None
+        if self._credentials is not None:
+            raw = ":".join(self._credentials).encode()
+            basic = f"Basic {base64.b64encode(raw).decode()}"
+
+        if scheme.lower() == "basic":
+            if basic is None:
+                raise PermanentError("레지스트리가 Basic 인증을 요구합니다")
+            with self._lock:
+                self._authorization = basic
+            return
+
+        params = dict(_CHALLENGE_PARAM.findall(params_text))
+        query = {k: v for k, v in params.items() if k in ("service", "scope")}
+        url = f"{params['realm']}?{urllib.parse.urlencode(query)}"
+        request = urllib.request.Request(url)
+        if basic is not None:
+            request.add_unredirected_header("Authorization", basic)
+
+        try:
+            with urllib.request.urlopen(request, timeout=self._timeout) as response:
+                body = json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            raise _http_error(e, "토큰 발급") from e
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            raise TransientError(f"레지스트리 토큰 발급 실패: {e}") from e
+
+        token = body.get("token") or body.get("access_token")
+        if not token:
+            raise PermanentError("레지스트리 토큰 응답에 토큰이 없습니다")
+        with self._lock:
+            self._authorization = f"Bearer {token}"
+
+    def _open(
+        self, path: str, headers: Optional[Dict[str, str]] = None
+    ) -> http.client.HTTPResponse:
+        """인증을 처리하며 GET 요청을 보냅니다."""
+        url = f"{self._base_url}/{path}"
+        for attempt in range(2):
+            request = urllib.request.Request(url, headers=headers or {})
+            with self._lock:
+                authorization = self._authorization
+            if authorization is not None:
+                # 블롭 저장소로 리다이렉트될 때는 인증 헤더를 전달하지 않는다
+                request.add_unredirected_header("Authorization", authorization)
+            try:
+                return cast(
+                    http.client.HTTPResponse,
+                    urllib.request.urlopen(request, timeout=self._timeout),
+                )
+            except urllib.error.HTTPError as e:
+                challenge = e.headers.get("WWW-Authenticate")
+                if e.code == 401 and attempt == 0 and challenge:
+                    self._authenticate(challenge)
+                    continue
+                raise _http_error(e, path) from e
+            except (urllib.error.URLError, OSError) as e:
+                raise TransientError(f"레지스트리 연결 실패: {url}: {e}") from e
+        raise PermanentError(f"레지스트리 인증 실패: {path}")
+
+    def get_manifest(self, repository: str, reference: str) -> Tuple[bytes, str]:
+        """매니페스트를 가져옵니다.
+
+        Returns:
+            (매니페스트 바이트, 미디어 타입) 튜플
+        """
+        with self._open(
+            f"{repository}/manifests/{reference}", {"Accept": MANIFEST_ACCEPT}
+        ) as response:
+            body = response.read()
+            media_type = response.headers.get("Content-Type", "").split(";")[0]
+
+        if not media_type or media_type == "application/json":
+            media_type = json.loads(body).get("mediaType", "")
+        return body, media_type
+
+    def get_blob(self, repository: str, digest: str) -> bytes:
+        """작은 블롭(이미지 설정 등)을 메모리로 가져와 검증합니다."""
+        with self._open(f"{repository}/blobs/{digest}") as response:
+            data = response.read()
+        if f"sha256:{hashlib.sha256(data).hexdigest()}" != digest:
+            raise CommandError(f"블롭 무결성 검증 실패: {digest}")
+        return data
+
+    def download_blob(
+        self,
+        repository: str,
+        descriptor: Descriptor,
+        dest: Path,
+        on_bytes: Optional[Callable[[int], None]] = None,
+        max_retries: int = 3,
+    ) -> None:
+        """블롭을 파일로 내려받습니다. 끊기면 `.partial` 파일에서 이어받습니다.
+
+        Args:
+            repository: 저장소 경로
+            descriptor: 블롭 기술자
+            dest: 저장할 파일 경로
+            on_bytes: 새로 받은 바이트 수 콜백
+            max_retries: 연결 오류 시 최대 재시도 횟수
+
+        Raises:
+            TransientError: 재시도 후에도 다운로드 실패
+            CommandError: 무결성 검증 실패
+        """
+        partial = dest.with_name(dest.name + ".partial")
+        digest = descriptor["digest"]
+
+        for attempt in range(max_retries + 1):
+            offset = partial.stat().st_size if partial.exists() else 0
+            if offset >= descriptor["size"]:
+                break
+            headers = {"Range": f"bytes={offset}-"} if offset else {}
+            try:
+                with self._open(f"{repository}/blobs/{digest}", headers) as response:
+                    # Range를 무시하고 전체를 보내면 처음부터 다시 쓴다
+                    mode = "ab" if offset and response.status == 206 else "wb"
+                    with open(partial, mode) as f:
+                        while chunk := response.read(CHUNK_SIZE):
+                            f.write(chunk)
+                            if on_bytes is not None:
+                                on_bytes(len(chunk))
+                received = partial.stat().st_size
+                if received < descriptor["size"]:
+                    # 연결이 조기 종료되면 read()가 오류 없이 끝날 수 있다
+                    raise http.client.IncompleteRead(b"", descriptor["size"] - received)
+                break
+            except (TransientError, http.client.HTTPException, OSError) as e:
+                if attempt >= max_retries:
+                    raise TransientError(f"블롭 다운로드 실패: {digest}: {e}") from e
+                wait_time = 2 ** (attempt + 1)
+                logger.warning(
+                    f"블롭 {digest[:19]} 다운로드 중단 (시도 {attempt + 1}/"
+                    f"{max_retries + 1}). {wait_time}초 후 이어받기"
+                )
+                time.sleep(wait_time)
+
+        hasher = hashlib.sha256()
+        with open(partial, "rb") as f:
+            while chunk := f.read(CHUNK_SIZE):
+                hasher.update(chunk)
+        if f"sha256:{hasher.hexdigest()}" != digest:
+            partial.unlink(missing_ok=True)
+            raise CommandError(f"블롭 무결성 검증 실패: {digest}")
+        os.replace(partial, dest)
+
+
+def _platform_matches(platform: Dict[str, str], wanted: str) -> bool:
+    """매니페스트 목록의 platform 항목이 요청 플랫폼과 일치하는지 확인합니다."""
+    parts = wanted.split("/")
+    if platform.get("os") != parts[0] or platform.get("architecture") != parts[1]:
+        return False
+    if len(parts) > 2:
+        return platform.get("variant") == parts[2]
+    return True
+
+
+def resolve_image_manifest(
+    client: RegistryClient, repository: str, reference: str, platform: str
+) -> Dict[str, object]:
+    """태그/다이제스트에서 지정 플랫폼의 이미지 매니페스트를 찾습니다.
+
+    Raises:
+        PermanentError: 플랫폼이 없거나 지원하지 않는 매니페스트 형식
+    """
+    body, media_type = client.get_manifest(repository, reference)
+    manifest = cast(Dict[str, object], json.loads(body))
+
+    if media_type in INDEX_MEDIA_TYPES:
+        entries = cast(List[Dict[str, object]], manifest.get("manifests") or [])
+        available = []
+        for entry in entries:
+            entry_platform = cast(Dict[str, str], entry.get("platform") or {})
+            if _platform_matches(entry_platform, platform):
+                body, media_type = client.get_manifest(repository, str(entry["digest"]))
+                manifest = cast(Dict[str, object], json.loads(body))
+                break
+            available.append(
+                f"{entry_platform.get('os')}/{entry_platform.get('architecture')}"
+            )
+        else:
+            raise PermanentError(
+                f"{repository}:{reference}에 {platform} 플랫폼이 없습니다 "
+                f"(사용 가능: {', '.join(available)})"
+            )
+
+    if media_type not in (OCI_MANIFEST, DOCKER_MANIFEST_V2):
+        raise PermanentError(f"지원하지 않는 매니페스트 형식입니다: {media_type}")
+    return manifest
+
+
+def export_image(
+    reference: str,
+    platforms: List[str],
+    output_path: Path,
+    docker_manifest: bool = True,
+    insecure: bool = False,
+    max_workers: int = 4,
+    on_progress: Optional[LayerProgressCallback] = None,
+    cache: Optional[BlobCache] = None,
+) -> RegistryExportResult:
+    """레지스트리에서 이미지를 내려받아 아카이브를 작성합니다 (Docker 데몬 불필요).
+
+    레이어 블롭은 cache에 받아 두고 재사용합니다. 중단된 다운로드는 캐시의
+    `.partial` 파일에서 이어받으며, 작성 후 캐시를 최대 크기 이하로 정리합니다.
+    cache가 None이면 작성 후 삭제되는 임시 캐시를 사용합니다.
+
+    Args:
+        reference: 이미지 레퍼런스
+        platforms: 내려받을 플랫폼 목록 (여러 개면 멀티 플랫폼 OCI 인덱스)
+        output_path: 생성할 아카이브 경로
+        docker_manifest: docker load 호환 manifest.json 포함 여부 (단일 플랫폼)
+        insecure: HTTP 레지스트리 사용
+        max_workers: 동시 블롭 다운로드 수
+        on_progress: 레이어 진행률 콜백 (완료 수, 전체 수)
+        cache: 블롭 캐시
+
+    Returns:
+        블롭 수, 캐시 적중 수, 내려받은 바이트, 다운로드/작성 시간
+
+    Raises:
+        TransientError: 네트워크/레이트 리밋 등 일시적 오류
+        PermanentError: 권한, 존재하지 않는 이미지/플랫폼 등 영구적 오류
+        CommandError: 무결성 검증 또는 아카이브 작성 실패
+    """
+    if cache is None:
+        with tempfile.TemporaryDirectory(
+            prefix=f".{output_path.name}.", dir=output_path.parent
+        ) as work_dir:
+            return export_image(
+                reference,
+                platforms,
+                output_path,
+                docker_manifest,
+                insecure,
+                max_workers,
+                on_progress,
+                cache=BlobCache(Path(work_dir)),
+            )
+
+    registry, repository, tag_or_digest = parse_registry_reference(reference)
+    client = RegistryClient(registry, insecure=insecure)
+    logger.info(f"레지스트리에서 직접 다운로드: {registry}/{repository}")
+
+    started = time.monotonic()
+    manifests = [
+        resolve_image_manifest(client, repository, tag_or_digest, platform)
+        for platform in platforms
+    ]
+
+    blobs: Dict[str, Descriptor] = {}
+    for manifest in manifests:
+        for layer in cast(List[Descriptor], manifest["layers"]):
+            blobs.setdefault(layer["digest"], layer)
+
+    downloaded = 0
+    completed = 0
+    cached = 0
+    lock = threading.Lock()
+
+    def _on_bytes(count: int) -> None:
+        nonlocal downloaded
+        with lock:
+            downloaded += count
+
+    def _download(descriptor: Descriptor) -> None:
+        nonlocal completed, cached
+        hit = cache.fetch(
+            descriptor["digest"],
+            partial(client.download_blob, repository, descriptor, on_bytes=_on_bytes),
+        )
+        with lock:
+            completed += 1
+            cached += int(hit)
+            done = completed
+        if on_progress is not None:
+            on_progress(done, len(blobs))
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        for future in [executor.submit(_download, d) for d in blobs.values()]:
+            future.result()
+
+    images: List[LayoutImage] = []
+    for index, manifest in enumerate(manifests):
+        config = cast(Descriptor, manifest["config"])
+        layers: List[LayoutBlob] = [
+            {
+                "path": cache.path_for(layer["digest"]),
+                "digest": layer["digest"],
+                "size": layer["size"],
+                "media_type": layer["mediaType"],
+            }
+            for layer in cast(List[Descriptor], manifest["layers"])
+        ]
+        images.append(
+            {
+                "platform": platforms[index],
+                "config": client.get_blob(repository, config["digest"]),
+                "layers": layers,
+            }
+        )
+    download_seconds = time.monotonic() - started
+
+    write_started = time.monotonic()
+    write_layout_archive(images, output_path, reference, docker_manifest)
+    write_seconds = time.monotonic() - write_started
+    cache.prune(keep=blobs)
+
+    logger.info(
+        f"레지스트리 다운로드 완료: {len(blobs)}개 블롭 (캐시 적중 {cached}개), "
+        f"{downloaded / (1024 * 1024):.1f}MB"
+    )
+    return {
+        "blobs": len(blobs),
+        "cached_blobs": cached,
+        "downloaded_bytes": downloaded,
+        "download_seconds": download_seconds,
+        "write_seconds": write_seconds,
+    }
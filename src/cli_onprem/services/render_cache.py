@@ -0,0 +1,235 @@
+"""helm-local 렌더링 결과 캐시.
+
+차트 내용, values 파일 내용, helm 버전과 추출 옵션의 해시를 키로 추출된 이미지
+목록(선택적으로 렌더링된 매니페스트)을 `<config_dir>/cache/render/`에 저장합니다.
+같은 차트를 반복 처리하는 CI에서 `helm dependency update`와 `helm template`을
+건너뛸 수 있으며, 전체 크기는 최근 사용 순(LRU)으로 정리해 상한 이하로
+유지합니다.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, TypedDict
+
+from cli_onprem.core.errors import CommandError
+from cli_onprem.core.logging import get_logger
+from cli_onprem.services.credential import get_config_dir
+from cli_onprem.utils.fs import evict_lru
+from cli_onprem.utils.hash import calculate_file_sha256
+from cli_onprem.utils.shell import QUICK_TIMEOUT, run_command
+
+logger = get_logger("services.render_cache")
+
+MB = 1024 * 1024
+DEFAULT_MAX_BYTES = int(os.getenv("CLI_ONPREM_RENDER_CACHE_MAX_MB", "256")) * MB
+# 1이면 이미지 목록과 함께 렌더링된 매니페스트도 저장
+STORE_MANIFEST = os.getenv("CLI_ONPREM_RENDER_CACHE_MANIFEST", "0") == "1"
+
+# 캐시 형식이 바뀌면 올려서 이전 항목을 무효화
+# (2: charts/와 Chart.lock을 항상 키에 포함)
+CACHE_FORMAT_VERSION = 2
+
+
+class RenderCacheEntry(TypedDict):
+    """캐시 항목."""
+
+    chart: str
+    images: List[str]
+    created: float
+
+
+def get_render_cache_dir() -> Path:
+    """기본 렌더링 캐시 디렉터리 경로를 반환합니다."""
+    return get_config_dir() / "cache" / "render"
+
+
+@lru_cache(maxsize=1)
+def get_helm_version() -> str:
+    """helm 버전 문자열을 반환합니다 (확인할 수 없으면 unknown)."""
+    try:
+        result = run_command(
+            ["helm", "version", "--short"], capture_output=True, timeout=QUICK_TIMEOUT
+        )
+    except (OSError, subprocess.CalledProcessError, CommandError):
+        return "unknown"
+    return result.stdout.strip() or "unknown"
+
+
+def hash_chart_source(chart_path: Path) -> Optional[str]:
+    """차트 아카이브 또는 디렉터리 내용의 SHA256 해시를 계산합니다.
+
+    charts/와 Chart.lock도 포함합니다. Chart.yaml에 선언하지 않은 서브차트를
+    charts/에 두는 umbrella 차트는 `helm dependency update`가 그 파일을 다시
+    만들지 않으므로, 빼면 서브차트 수정이 키에 반영되지 않습니다.
+
+    Args:
+        chart_path: 차트 경로 (디렉터리 또는 .tgz 파일)
+
+    Returns:
+        해시 문자열. 차트를 읽을 수 없으면 None
+    """
+    if chart_path.is_file():
+        return calculate_file_sha256(chart_path, chunk_size=1024 * 1024)
+    if not chart_path.is_dir():
+        return None
+
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(chart_path):
+        root_path = Path(root)
+        relative_root = root_path.relative_to(chart_path)
+        dirs[:] = sorted(d for d in dirs if not d.startswith(".git"))
+
+        for name in sorted(files):
+            file_hash = calculate_file_sha256(root_path / name, chunk_size=1024 * 1024)
+            if file_hash is None:
+                return None
+            digest.update(
+                f"{(relative_root / name).as_posix()}\0{file_hash}\n".encode()
+            )
+    return digest.hexdigest()
+
+
+def render_cache_key(
+    chart_path: Path,
+    values_files: Sequence[Path],
+    options: Dict[str, Any],
+) -> Optional[str]:
+    """렌더링 결과 캐시 키를 계산합니다.
+
+    Args:
+        chart_path: 차트 경로 (디렉터리 또는 .tgz 파일)
+        values_files: 추가 values 파일 목록 (순서 유지)
+        options: 결과에 영향을 주는 추출 옵션 (JSON 직렬화 가능해야 함)
+
+    Returns:
+        캐시 키. 차트나 values 파일을 읽을 수 없으면 None (캐시 사용 안 함)
+    """
+    chart_hash = hash_chart_source(chart_path)
+    if chart_hash is None:
+        return None
+
+    values_hashes = []
+    for values_file in values_files:
+        values_hash = (
+            calculate_file_sha256(values_file) if values_file.is_file() else None
+        )
+        if values_hash is None:
+            return None
+        values_hashes.append(values_hash)
+
+    material = {
+        "format": CACHE_FORMAT_VERSION,
+        "helm": get_helm_version(),
+        "chart": chart_hash,
+        "values": values_hashes,
+        "options": options,
+    }
+    encoded = json.dumps(material, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class RenderCache:
+    """렌더링 결과(이미지 목록) 캐시.
+
+    Args:
+        root: 캐시 디렉터리 (기본값: get_render_cache_dir())
+        max_bytes: 캐시 최대 크기 (바이트)
+        store_manifest: 렌더링된 매니페스트도 저장할지 여부
+    """
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        store_manifest: bool = STORE_MANIFEST,
+    ):
+        self.root = root or get_render_cache_dir()
+        self.max_bytes = max_bytes
+        self.store_manifest = store_manifest
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def _manifest_path(self, key: str) -> Path:
+        return self.root / f"{key}.yaml"
+
+    def get(self, key: str) -> Optional[List[str]]:
+        """캐시된 이미지 목록을 반환하고 사용 시각을 갱신합니다.
+
+        Args:
+            key: render_cache_key()로 계산한 키
+
+        Returns:
+            이미지 목록. 캐시에 없거나 손상된 경우 None
+        """
+        path = self._entry_path(key)
+        try:
+            entry: RenderCacheEntry = json.loads(path.read_text(encoding="utf-8"))
+            images = entry["images"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"손상된 렌더링 캐시 항목 무시: {path} ({e})")
+            return None
+
+        os.utime(path)
+        logger.info(f"렌더링 캐시 적중: {entry.get('chart', key)}")
+        return list(images)
+
+    def get_manifest(self, key: str) -> Optional[str]:
+        """캐시된 렌더링 매니페스트를 반환합니다 (저장하지 않았으면 None)."""
+        path = self._manifest_path(key)
+        try:
+            manifest = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        os.utime(path)
+        return manifest
+
+    def put(
+        self,
+        key: str,
+        chart: str,
+        images: List[str],
+        manifest: Optional[str] = None,
+    ) -> None:
+        """이미지 목록(과 매니페스트)을 저장하고 크기 상한을 적용합니다.
+
+        Args:
+            key: render_cache_key()로 계산한 키
+            chart: 로그용 차트 경로
+            images: 추출된 이미지 목록
+            manifest: 렌더링된 매니페스트 (store_manifest일 때만 저장)
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        entry: RenderCacheEntry = {
+            "chart": chart,
+            "images": images,
+            "created": time.time(),
+        }
+        kept = [self._entry_path(key)]
+        _write_atomic(self._entry_path(key), json.dumps(entry, indent=2))
+        if self.store_manifest and manifest is not None:
+            _write_atomic(self._manifest_path(key), manifest)
+            kept.append(self._manifest_path(key))
+
+        removed = evict_lru(self.root, self.max_bytes, pattern="*.*", keep=kept)
+        if removed:
+            logger.info(f"렌더링 캐시 정리: {len(removed)}개 파일 삭제")
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    """임시 파일에 쓴 뒤 이름을 바꿔 동시 실행 중에도 부분 파일이 보이지 않게 합니다.
+
+    임시 파일 이름에 프로세스와 스레드 ID를 넣어 같은 키를 여러 스레드가 동시에
+    써도 겹치지 않습니다.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)
@@ -2,37 +2,99 @@
 
 import datetime
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
-import boto3
 from botocore.exceptions import ClientError  # type: ignore[import-untyped]
 
 from cli_onprem.core.errors import CLIError
 from cli_onprem.core.logging import get_logger
 
-logger = get_logger("services.s3")
+if TYPE_CHECKING:
+    from cli_onprem.services.sync_state import SyncState
 
+logger = get_logger("services.s3")
 
-def create_s3_client(aws_access_key: str, aws_secret_key: str, region: str) -> Any:
+DEFAULT_SYNC_WORKERS = 8
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+# 파일 하나를 멀티파트로 올릴 때 동시에 전송하는 파트 수
+DEFAULT_PART_CONCURRENCY = 4
+# botocore 표준 재시도 모드의 요청별 최대 시도 횟수 (스로틀링, 5xx, 연결 오류만
+# 재시도하고 AccessDenied 같은 4xx는 바로 실패)
+DEFAULT_MAX_ATTEMPTS = 5
+
+
+def create_s3_client(
+    aws_access_key: str,
+    aws_secret_key: str,
+    region: str,
+    max_pool_connections: Optional[int] = None,
+) -> Any:
     """S3 클라이언트를 생성합니다.
 
     Args:
         aws_access_key: AWS Access Key
         aws_secret_key: AWS Secret Key
         region: AWS 리전
+        max_pool_connections: HTTP 연결 풀 크기 (여러 쓰레드가 클라이언트를
+            공유할 때 지정, 기본값: botocore 기본값 10). 지정하면 botocore 표준
+            재시도 모드도 함께 설정합니다.
 
     Returns:
         S3 클라이언트 객체
     """
+    # boto3는 import 비용이 커서(~150ms) 클라이언트가 필요할 때 불러옴
+    import boto3
+
+    kwargs: Dict[str, Any] = {}
+    if max_pool_connections is not None:
+        from botocore.config import Config  # type: ignore[import-untyped]
+
+        kwargs["config"] = Config(
+            max_pool_connections=max_pool_connections,
+            retries={"max_attempts": DEFAULT_MAX_ATTEMPTS, "mode": "standard"},
+        )
+
     return boto3.client(
         "s3",
         aws_access_key_id=aws_access_key,
         aws_secret_access_key=aws_secret_key,
         region_name=region,
+        **kwargs,
+    )
+
+
+def create_transfer_config(
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    part_concurrency: int = DEFAULT_PART_CONCURRENCY,
+) -> Any:
+    """멀티파트 업로드 설정(TransferConfig)을 생성합니다.
+
+    Args:
+        chunk_size: 멀티파트 기준 크기이자 파트 크기 (바이트)
+        part_concurrency: 파일 하나에서 동시에 전송하는 파트 수
+
+    Returns:
+        boto3 TransferConfig 객체
+    """
+    from boto3.s3.transfer import TransferConfig
+
+    return TransferConfig(
+        multipart_threshold=chunk_size,
+        multipart_chunksize=chunk_size,
+        max_concurrency=part_concurrency,
+        use_threads=part_concurrency > 1,
     )
 
 
+def sync_pool_size(
+    workers: int, part_concurrency: int = DEFAULT_PART_CONCURRENCY
+) -> int:
+    """sync 동시 실행에 필요한 HTTP 연결 풀 크기를 계산합니다."""
+    return max(1, workers) * max(1, part_concurrency)
+
+
 def list_buckets(s3_client: Any) -> List[str]:
     """S3 버킷 목록을 조회합니다.
 
@@ -109,6 +171,7 @@ def upload_file(
     bucket: str,
     key: str,
     callback: Optional[Callable[[int], None]] = None,
+    config: Optional[Any] = None,
 ) -> None:
     """파일을 S3에 업로드합니다.
 
@@ -118,13 +181,15 @@ def upload_file(
         bucket: 대상 버킷
         key: S3 키
         callback: 진행률 콜백 함수
+        config: boto3 TransferConfig (멀티파트 설정)
 
     Raises:
         CLIError: 업로드 실패
     """
+    extra: Dict[str, Any] = {} if config is None else {"Config": config}
     try:
         logger.info(f"{local_path} -> s3://{bucket}/{key} 업로드 중")
-        s3_client.upload_file(str(local_path), bucket, key, Callback=callback)
+        s3_client.upload_file(str(local_path), bucket, key, Callback=callback, **extra)
         logger.info(f"업로드 완료: {key}")
     except ClientError as e:
         raise CLIError(f"'{local_path}' 업로드 실패: {e}") from e
@@ -236,62 +301,103 @@ def sync_to_s3(
     prefix: str,
     delete: bool = False,
     upload_callback: Optional[Callable[[Path, str, int], None]] = None,
+    workers: int = DEFAULT_SYNC_WORKERS,
+    transfer_config: Optional[Any] = None,
+    state: Optional["SyncState"] = None,
+    rehash: bool = False,
 ) -> Tuple[int, int, int]:
     """로컬 디렉터리를 S3와 동기화합니다.
 
+    변경 확인(MD5 계산 포함)과 업로드를 workers개의 쓰레드가 하나의 클라이언트를
+    공유해 동시에 처리합니다. 일시적 오류(스로틀링, 5xx, 연결 오류)는 클라이언트의
+    botocore 재시도 설정이 요청 단위로 처리하므로 여기서는 다시 시도하지 않으며,
+    실패한 파일이 있으면 삭제 단계를 건너뛰고 오류를 냅니다.
+
+    state를 주면 계산한 해시와 업로드한 ETag를 저장해 두고, 다음 sync에서
+    메타데이터가 그대로인 파일은 다시 읽지 않고 판단합니다.
+
     Args:
-        s3_client: S3 클라이언트
+        s3_client: S3 클라이언트 (쓰레드 간 공유)
         local_path: 로컬 경로
         bucket: 대상 버킷
         prefix: S3 프리픽스
         delete: 원본에 없는 객체 삭제 여부
         upload_callback: 업로드 콜백 (로컬 경로, S3 키, 크기)
+        workers: 동시 업로드 파일 수
+        transfer_config: boto3 TransferConfig (멀티파트 설정)
+        state: 해시/업로드 상태 DB (없으면 매번 해시 계산)
+        rehash: 저장된 상태를 무시하고 모든 파일을 다시 해시 (결과는 다시 저장)
 
     Returns:
         (업로드 수, 스킵 수, 삭제 수) 튜플
+
+    Raises:
+        CLIError: 객체 목록 조회 실패 또는 업로드에 실패한 파일 존재
     """
     # S3 객체 목록 조회
     _, s3_objects = list_objects(s3_client, bucket, prefix, delimiter="")
     s3_object_map = {obj["Key"]: obj for obj in s3_objects}
 
+    if local_path.is_dir():
+        files = [
+            (file_path, f"{prefix}{file_path.relative_to(local_path).as_posix()}")
+            for file_path in sorted(local_path.glob("**/*"))
+            if file_path.is_file()
+        ]
+    else:
+        # 단일 파일인 경우
+        files = [(local_path, prefix)]
+
+    def _upload(file_path: Path, s3_key: str) -> None:
+        if upload_callback:
+            upload_callback(file_path, s3_key, file_path.stat().st_size)
+        else:
+            upload_file(s3_client, file_path, bucket, s3_key, config=transfer_config)
+
+    part_size = getattr(transfer_config, "multipart_chunksize", DEFAULT_CHUNK_SIZE)
+
+    def _sync_file(file_path: Path, s3_key: str) -> bool:
+        if not _should_upload(
+            file_path, s3_key, s3_object_map, state, bucket, rehash, part_size
+        ):
+            return False
+        stat = file_path.stat()
+        _upload(file_path, s3_key)
+        if state is not None and upload_callback is None:
+            _record_upload(s3_client, state, bucket, s3_key, file_path, stat)
+        return True
+
     upload_count = 0
     skip_count = 0
     delete_count = 0
-    local_keys = set()
+    failures: Dict[str, str] = {}
 
-    # 디렉터리인 경우
-    if local_path.is_dir():
-        for file_path in local_path.glob("**/*"):
-            if file_path.is_file():
-                rel_path = file_path.relative_to(local_path)
-                s3_key = f"{prefix}{str(rel_path).replace(os.sep, '/')}"
-                local_keys.add(s3_key)
-
-                # 업로드 필요 여부 확인
-                if _should_upload(file_path, s3_key, s3_object_map):
-                    if upload_callback:
-                        upload_callback(file_path, s3_key, file_path.stat().st_size)
-                    else:
-                        upload_file(s3_client, file_path, bucket, s3_key)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {
+            executor.submit(_sync_file, file_path, s3_key): s3_key
+            for file_path, s3_key in files
+        }
+        for future in as_completed(futures):
+            s3_key = futures[future]
+            try:
+                if future.result():
                     upload_count += 1
                 else:
                     skip_count += 1
-    else:
-        # 단일 파일인 경우
-        s3_key = prefix
-        local_keys.add(s3_key)
-
-        if _should_upload(local_path, s3_key, s3_object_map):
-            if upload_callback:
-                upload_callback(local_path, s3_key, local_path.stat().st_size)
-            else:
-                upload_file(s3_client, local_path, bucket, s3_key)
-            upload_count += 1
-        else:
-            skip_count += 1
+            except Exception as e:
+                logger.error(f"'{s3_key}' 업로드 실패: {e}")
+                failures[s3_key] = str(e)
+
+    if failures:
+        failed = sorted(failures)
+        shown = ", ".join(failed[:5]) + (" 외" if len(failed) > 5 else "")
+        raise CLIError(
+            f"{len(failed)}개 파일 업로드 실패 (업로드 {upload_count}개 완료): {shown}"
+        )
 
     # 삭제 처리
     if delete:
+        local_keys = {s3_key for _, s3_key in files}
         keys_to_delete = [key for key in s3_object_map if key not in local_keys]
         if keys_to_delete:
             delete_count = delete_objects(s3_client, bucket, keys_to_delete)
@@ -299,8 +405,31 @@ def sync_to_s3(
     return upload_count, skip_count, delete_count
 
 
+def _record_upload(
+    s3_client: Any,
+    state: "SyncState",
+    bucket: str,
+    s3_key: str,
+    file_path: Path,
+    stat: os.stat_result,
+) -> None:
+    """업로드한 객체의 ETag를 상태 DB에 기록합니다 (실패해도 sync는 계속)."""
+    try:
+        etag = head_object(s3_client, bucket, s3_key)["ETag"]
+    except CLIError as e:
+        logger.debug(f"'{s3_key}' ETag 조회 실패, 상태 기록 건너뜀: {e}")
+        return
+    state.record_upload(bucket, s3_key, file_path, stat, etag)
+
+
 def _should_upload(
-    local_path: Path, s3_key: str, s3_object_map: Dict[str, Dict[str, Any]]
+    local_path: Path,
+    s3_key: str,
+    s3_object_map: Dict[str, Dict[str, Any]],
+    state: Optional["SyncState"] = None,
+    bucket: str = "",
+    rehash: bool = False,
+    part_size: int = DEFAULT_CHUNK_SIZE,
 ) -> bool:
     """파일 업로드가 필요한지 확인합니다.
 
@@ -308,6 +437,10 @@ def _should_upload(
         local_path: 로컬 파일 경로
         s3_key: S3 키
         s3_object_map: S3 객체 정보 맵
+        state: 해시/업로드 상태 DB
+        bucket: 대상 버킷 (상태 DB 조회용)
+        rehash: 상태 DB에 저장된 값을 무시할지 여부
+        part_size: 멀티파트 ETag 비교에 먼저 시도할 파트 크기
 
     Returns:
         업로드 필요 여부
@@ -316,29 +449,91 @@ def _should_upload(
         return True
 
     s3_obj = s3_object_map[s3_key]
-    local_size = local_path.stat().st_size
+    stat = local_path.stat()
 
     # 크기가 다르면 업로드
-    if local_size != s3_obj["Size"]:
+    if stat.st_size != s3_obj["Size"]:
         return True
 
-    # ETag로 비교 (작은 파일만)
-    if local_size < 5 * 1024 * 1024 * 1024:  # 5GB 미만
-        from cli_onprem.utils.hash import calculate_file_md5
-
-        local_md5 = calculate_file_md5(local_path)
-        if local_md5 and local_md5 != s3_obj["ETag"]:
-            return True
+    # 마지막 sync 이후 로컬 파일과 원격 객체가 모두 그대로면 파일을 읽지 않음
+    if state is not None and not rehash:
+        if state.uploaded_etag(bucket, s3_key, local_path, stat) == s3_obj["ETag"]:
+            return False
+
+    # ETag로 비교 (일치하는 ETag를 계산하지 못하면 수정 시간으로 비교)
+    local_etag = _local_etag(local_path, stat, s3_obj["ETag"], part_size, state, rehash)
+    if local_etag is not None:
+        if local_etag == s3_obj["ETag"]:
+            if state is not None:
+                state.record_upload(bucket, s3_key, local_path, stat, local_etag)
+            return False
+        return True
 
     # 수정 시간으로 비교
-    local_mtime = local_path.stat().st_mtime
     s3_mtime = s3_obj["LastModified"].timestamp()
-    if local_mtime > s3_mtime:
+    if stat.st_mtime > s3_mtime:
         return True
 
     return False
 
 
+def _local_etag(
+    local_path: Path,
+    stat: os.stat_result,
+    s3_etag: str,
+    part_size: int,
+    state: Optional["SyncState"],
+    rehash: bool,
+) -> Optional[str]:
+    """원격 ETag와 같은 방식으로 로컬 파일의 ETag를 계산합니다.
+
+    단일 업로드 ETag는 파일 MD5(5GB 미만만)이고, 멀티파트 ETag
+    ("<md5>-<파트 수>")는 파트 크기를 알아야 하므로 설정된 파트 크기와 파트
+    수로 추정한 MiB 단위 크기를 차례로 시도합니다. 어느 것도 원격 ETag와
+    같지 않으면 멀티파트의 경우 None(판단 불가)을 반환합니다.
+    """
+    if "-" not in s3_etag:
+        if stat.st_size >= 5 * 1024 * 1024 * 1024:
+            return None
+        return _file_digest(local_path, stat, 0, state, rehash)
+
+    count = s3_etag.rsplit("-", 1)[1]
+    if not count.isdigit() or int(count) == 0:
+        return None
+    mib = 1024 * 1024
+    guessed = -(-stat.st_size // int(count) // mib) * mib
+    for size in dict.fromkeys([part_size, guessed]):
+        if size <= 0 or -(-stat.st_size // size) != int(count):
+            continue
+        if _file_digest(local_path, stat, size, state, rehash) == s3_etag:
+            return s3_etag
+    return None
+
+
+def _file_digest(
+    local_path: Path,
+    stat: os.stat_result,
+    part_size: int,
+    state: Optional["SyncState"],
+    rehash: bool,
+) -> Optional[str]:
+    """파일 MD5(part_size 0) 또는 멀티파트 ETag를 상태 DB를 거쳐 계산합니다."""
+    from cli_onprem.utils.hash import calculate_file_md5, calculate_multipart_etag
+
+    if state is not None and not rehash:
+        cached = state.digest(local_path, stat, part_size)
+        if cached is not None:
+            return cached
+
+    if part_size == 0:
+        digest = calculate_file_md5(local_path)
+    else:
+        digest = calculate_multipart_etag(local_path, part_size)
+    if digest and state is not None:
+        state.store_digest(local_path, stat, part_size, digest)
+    return digest
+
+
 def generate_s3_path(src_path: Path, s3_prefix: str) -> str:
     """S3 업로드 경로를 생성합니다.
 
@@ -0,0 +1,153 @@
+"""s3-share sync 로컬 상태 데이터베이스.
+
+변경 없는 파일을 sync할 때마다 전부 다시 읽어 MD5를 계산하지 않도록, 파일
+메타데이터(경로, 크기, mtime, inode)별로 계산한 MD5/멀티파트 ETag와 마지막으로
+업로드(또는 동일함을 확인)한 객체의 ETag를 `<config_dir>/cache/sync-state.db`
+(SQLite)에 저장합니다. 메타데이터가 하나라도 바뀌면 저장된 값은 쓰지 않습니다.
+
+상태 DB는 캐시일 뿐이므로 읽기/쓰기에 실패해도 sync는 해시 계산으로 계속합니다.
+"""
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from cli_onprem.core.logging import get_logger
+from cli_onprem.services.credential import get_config_dir
+
+logger = get_logger("services.sync_state")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS digests (
+    path TEXT NOT NULL,
+    part_size INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    PRIMARY KEY (path, part_size)
+);
+CREATE TABLE IF NOT EXISTS uploads (
+    bucket TEXT NOT NULL,
+    key TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    etag TEXT NOT NULL,
+    PRIMARY KEY (bucket, key)
+);
+"""
+
+
+def get_sync_state_path() -> Path:
+    """기본 sync 상태 DB 경로를 반환합니다."""
+    return get_config_dir() / "cache" / "sync-state.db"
+
+
+def _file_key(path: Path, stat: os.stat_result) -> Tuple[str, int, int, int]:
+    """파일 식별 정보 (절대 경로, 크기, mtime(ns), inode)."""
+    return str(path.absolute()), stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+class SyncState:
+    """sync 상태 DB.
+
+    여러 업로드 쓰레드가 하나의 연결을 공유하므로 모든 질의를 잠금으로
+    직렬화합니다.
+
+    Args:
+        path: DB 파일 경로 (기본값: get_sync_state_path())
+
+    Raises:
+        OSError, sqlite3.Error: DB를 열 수 없는 경우
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or get_sync_state_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=30, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def __enter__(self) -> "SyncState":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """DB 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
+
+    def _fetch_one(self, sql: str, params: Tuple[Any, ...]) -> Optional[str]:
+        try:
+            with self._lock:
+                row = self._conn.execute(sql, params).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"sync 상태 조회 실패: {e}")
+            return None
+        return str(row[0]) if row else None
+
+    def _write(self, sql: str, params: Tuple[Any, ...]) -> None:
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(sql, params)
+        except sqlite3.Error as e:
+            logger.debug(f"sync 상태 저장 실패: {e}")
+
+    def digest(self, path: Path, stat: os.stat_result, part_size: int) -> Optional[str]:
+        """저장된 해시를 반환합니다 (part_size 0은 MD5, 그 외는 멀티파트 ETag)."""
+        return self._fetch_one(
+            "SELECT digest FROM digests WHERE path = ? AND size = ?"
+            " AND mtime_ns = ? AND inode = ? AND part_size = ?",
+            (*_file_key(path, stat), part_size),
+        )
+
+    def store_digest(
+        self, path: Path, stat: os.stat_result, part_size: int, digest: str
+    ) -> None:
+        """계산한 해시를 저장합니다."""
+        self._write(
+            "INSERT OR REPLACE INTO digests"
+            " (path, size, mtime_ns, inode, part_size, digest)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (*_file_key(path, stat), part_size, digest),
+        )
+
+    def uploaded_etag(
+        self, bucket: str, key: str, path: Path, stat: os.stat_result
+    ) -> Optional[str]:
+        """이 파일(같은 메타데이터)을 마지막으로 올린 객체의 ETag를 반환합니다."""
+        return self._fetch_one(
+            "SELECT etag FROM uploads WHERE bucket = ? AND key = ?"
+            " AND path = ? AND size = ? AND mtime_ns = ? AND inode = ?",
+            (bucket, key, *_file_key(path, stat)),
+        )
+
+    def record_upload(
+        self, bucket: str, key: str, path: Path, stat: os.stat_result, etag: str
+    ) -> None:
+        """파일을 업로드했거나 원격 객체와 같음을 확인한 결과를 저장합니다."""
+        self._write(
+            "INSERT OR REPLACE INTO uploads"
+            " (bucket, key, path, size, mtime_ns, inode, etag)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (bucket, key, *_file_key(path, stat), etag),
+        )
+
+
+def open_sync_state(path: Optional[Path] = None) -> Optional[SyncState]:
+    """sync 상태 DB를 엽니다 (열 수 없으면 경고 후 None)."""
+    try:
+        return SyncState(path)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"sync 상태 DB를 열 수 없어 모든 파일을 해시합니다: {e}")
+        return None
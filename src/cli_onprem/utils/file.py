@@ -1,11 +1,21 @@
 """파일 작업 유틸리티."""
 
 import pathlib
+import posixpath
 import tarfile
-from typing import Any, Dict, cast
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence, Type, Union, cast
 
 import yaml
 
+# libyaml C 확장이 있으면 C 로더를 사용 (순수 Python 로더보다 수십 배 빠름)
+SafeLoader: Type[yaml.SafeLoader]
+try:
+    SafeLoader = yaml.CSafeLoader  # type: ignore[assignment]
+except AttributeError:  # libyaml 없이 빌드된 PyYAML
+    SafeLoader = yaml.SafeLoader
+
+YamlSource = Union[str, bytes, IO[str], IO[bytes]]
+
 
 def ensure_dir(path: pathlib.Path) -> pathlib.Path:
     """디렉토리가 존재하도록 보장합니다.
@@ -20,6 +30,30 @@ def ensure_dir(path: pathlib.Path) -> pathlib.Path:
     return path
 
 
+def load_yaml(source: YamlSource) -> Any:
+    """YAML 문서 하나를 안전하게 파싱합니다 (yaml.safe_load와 동일).
+
+    Args:
+        source: YAML 문자열 또는 파일 객체
+
+    Returns:
+        파싱된 데이터
+    """
+    return yaml.load(source, Loader=SafeLoader)
+
+
+def load_yaml_all(source: YamlSource) -> Iterator[Any]:
+    """여러 YAML 문서를 차례로 파싱합니다 (yaml.safe_load_all과 동일).
+
+    Args:
+        source: YAML 문자열 또는 파일 객체
+
+    Returns:
+        문서별 파싱 결과 이터레이터
+    """
+    return yaml.load_all(source, Loader=SafeLoader)
+
+
 def read_yaml(path: pathlib.Path) -> Dict[str, Any]:
     """YAML 파일을 읽습니다.
 
@@ -30,7 +64,7 @@ def read_yaml(path: pathlib.Path) -> Dict[str, Any]:
         파싱된 YAML 데이터
     """
     with open(path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = load_yaml(f)
         if data is None:
             return {}
         return cast(Dict[str, Any], data)
@@ -50,9 +84,76 @@ def write_yaml(path: pathlib.Path, data: Dict[str, Any]) -> None:
 def extract_tar(archive_path: pathlib.Path, dest_dir: pathlib.Path) -> None:
     """tar 아카이브를 추출합니다.
 
+    대상 디렉토리 밖을 가리키는 항목이 있으면 아무것도 추출하지 않고 실패합니다.
+
     Args:
         archive_path: tar 파일 경로
         dest_dir: 추출할 디렉토리
+
+    Raises:
+        ValueError: 안전하지 않은 항목이 있는 경우
     """
     with tarfile.open(archive_path, "r:*") as tar:
-        tar.extractall(dest_dir)
+        extract_members(tar, tar.getmembers(), dest_dir)
+
+
+def member_path(name: str) -> Optional[str]:
+    """tar 항목 이름을 정규화합니다 (선행 './' 제거).
+
+    Returns:
+        정규화된 상대 경로. 절대 경로이거나 상위 디렉토리로 벗어나면 None
+    """
+    if name.startswith("/"):
+        return None
+    normalized = posixpath.normpath(name)
+    if normalized == ".." or normalized.startswith("../"):
+        return None
+    return normalized
+
+
+def _check_member(member: tarfile.TarInfo) -> None:
+    name = member_path(member.name)
+    if name is None:
+        raise ValueError(f"안전하지 않은 tar 항목 경로: {member.name}")
+    if member.issym() or member.islnk():
+        base = posixpath.dirname(name) if member.issym() else ""
+        target = member_path(posixpath.join(base, member.linkname))
+        if member.linkname.startswith("/") or target is None:
+            raise ValueError(
+                f"대상 디렉토리 밖을 가리키는 링크: {member.name} → {member.linkname}"
+            )
+    elif not (member.isfile() or member.isdir()):
+        raise ValueError(f"지원하지 않는 tar 항목 유형: {member.name}")
+
+
+def extract_members(
+    tar: tarfile.TarFile,
+    members: Sequence[tarfile.TarInfo],
+    dest_dir: pathlib.Path,
+) -> List[tarfile.TarInfo]:
+    """지정한 tar 항목만 검증한 뒤 추출합니다.
+
+    모든 항목을 먼저 검사하므로 위험한 항목이 있으면 파일을 하나도 쓰지
+    않습니다. 지원되는 Python에서는 tarfile의 data 필터도 함께 적용합니다.
+
+    Args:
+        tar: 열린 tar 파일
+        members: 추출할 항목 (tar.getmembers()의 일부)
+        dest_dir: 추출할 디렉토리
+
+    Returns:
+        추출한 항목 리스트
+
+    Raises:
+        ValueError: 절대 경로, 상위 디렉토리 탈출, 외부 링크, 장치 파일 등이
+            포함된 경우
+    """
+    selected = list(members)
+    for member in selected:
+        _check_member(member)
+
+    if hasattr(tarfile, "data_filter"):
+        tar.extractall(dest_dir, members=selected, filter="data")
+    else:  # pragma: no cover - data 필터가 없는 오래된 Python
+        tar.extractall(dest_dir, members=selected)
+    return selected
@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 
 def find_completable_paths(
@@ -124,3 +124,48 @@ def make_executable(file_path: Path) -> None:
         file_path: 대상 파일 경로
     """
     os.chmod(file_path, 0o755)
+
+
+def evict_lru(
+    directory: Path,
+    max_bytes: int,
+    pattern: str = "*",
+    keep: Iterable[Path] = (),
+) -> List[Path]:
+    """수정 시각이 오래된 파일부터 삭제해 총 크기를 max_bytes 이하로 맞춥니다.
+
+    캐시 적중 시 파일의 수정 시각을 갱신(os.utime)해 두면 LRU로 동작합니다.
+
+    Args:
+        directory: 대상 디렉터리
+        max_bytes: 허용할 최대 총 크기 (바이트)
+        pattern: 대상 파일 패턴
+        keep: 삭제하지 않을 파일 (사용 중인 항목)
+
+    Returns:
+        삭제한 파일 경로 리스트
+    """
+    keep_set = {Path(path) for path in keep}
+    entries = []
+    total = 0
+    for path in directory.glob(pattern):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        if not path.is_file():
+            continue
+        total += stat.st_size
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    removed: List[Path] = []
+    for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total <= max_bytes:
+            break
+        if path in keep_set:
+            continue
+        path.unlink(missing_ok=True)
+        total -= size
+        removed.append(path)
+
+    return removed
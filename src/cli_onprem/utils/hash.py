@@ -41,6 +41,42 @@ def calculate_file_md5(file_path: Path, chunk_size: int = 8192) -> Optional[str]
         return None
 
 
+def calculate_multipart_etag(
+    file_path: Path, part_size: int, chunk_size: int = 1024 * 1024
+) -> Optional[str]:
+    """S3 멀티파트 업로드 ETag("<파트 MD5들의 MD5>-<파트 수>")를 계산합니다.
+
+    Args:
+        file_path: 파일 경로
+        part_size: 업로드에 사용한 파트 크기
+        chunk_size: 읽기 청크 크기
+
+    Returns:
+        멀티파트 ETag 문자열 또는 None
+    """
+    try:
+        part_digests = []
+        with open(file_path, "rb") as f:
+            while True:
+                part_hash = hashlib.md5()
+                remaining = part_size
+                while remaining > 0 and (chunk := f.read(min(chunk_size, remaining))):
+                    part_hash.update(chunk)
+                    remaining -= len(chunk)
+                if remaining == part_size:
+                    break
+                part_digests.append(part_hash.digest())
+
+        digest = hashlib.md5(b"".join(part_digests)).hexdigest()
+        result = f"{digest}-{len(part_digests)}"
+        logger.debug(f"{file_path} 멀티파트 ETag: {result}")
+        return result
+
+    except Exception as e:
+        logger.warning(f"{file_path} 멀티파트 ETag 계산 실패: {e}")
+        return None
+
+
 def calculate_file_sha256(file_path: Path, chunk_size: int = 8192) -> Optional[str]:
     """파일의 SHA256 해시를 계산합니다.
 
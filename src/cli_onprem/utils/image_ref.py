@@ -0,0 +1,154 @@
+"""Docker 이미지 레퍼런스 파서.
+
+형식: [REGISTRY_HOST[:PORT]/][NAMESPACE/]REPOSITORY[:TAG][@DIGEST]
+
+docker-tar(파일명 생성, pull 스케줄링, 레지스트리 직접 다운로드)와
+helm-local(이미지 정규화)이 같은 규칙으로 레퍼런스를 해석하도록 한 곳에
+모았습니다. 같은 레퍼런스가 반복해서 등장하는 경우가 많으므로(차트의 여러
+워크로드가 같은 이미지를 사용) 파싱 결과를 LRU 캐시에 보관합니다.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+
+DOCKER_HUB = "docker.io"
+DOCKER_HUB_NAMESPACE = "library"
+DEFAULT_TAG = "latest"
+
+# Docker Hub를 가리키는 다른 호스트 이름
+_DOCKER_HUB_ALIASES = frozenset({"docker.io", "index.docker.io"})
+
+# 태그는 마지막 '/' 뒤에만 올 수 있으므로 ':' 뒤에 '/'가 있으면 포트로 해석
+_REFERENCE_RE = re.compile(
+    r"(?P<name>[^@]*?)(?::(?P<tag>[^:/@]+))?(?:@(?P<digest>.+))?"
+)
+
+
+class ImageRef:
+    """파싱된 이미지 레퍼런스.
+
+    캐시된 인스턴스가 공유되므로 불변 객체로 취급합니다.
+
+    Attributes:
+        registry: 레지스트리 호스트 (포트 포함, 기본값: docker.io)
+        namespace: 첫 번째 경로 요소 (Docker Hub 단일 이름은 library,
+            그 외 레지스트리의 단일 이름은 빈 문자열)
+        repo: 네임스페이스 이후의 경로 (예: deep/path/image)
+        tag: 태그 (없으면 None)
+        digest: 다이제스트 (없으면 None)
+    """
+
+    __slots__ = ("registry", "namespace", "repo", "tag", "digest")
+
+    def __init__(
+        self,
+        registry: str,
+        namespace: str,
+        repo: str,
+        tag: Optional[str] = None,
+        digest: Optional[str] = None,
+    ):
+        self.registry = registry
+        self.namespace = namespace
+        self.repo = repo
+        self.tag = tag
+        self.digest = digest
+
+    @property
+    def path(self) -> str:
+        """레지스트리를 제외한 저장소 경로 (예: library/nginx)."""
+        return f"{self.namespace}/{self.repo}" if self.namespace else self.repo
+
+    @property
+    def name(self) -> str:
+        """레지스트리를 포함한 저장소 이름 (예: docker.io/library/nginx)."""
+        return f"{self.registry}/{self.path}"
+
+    @property
+    def tag_or_digest(self) -> str:
+        """다이제스트가 있으면 다이제스트, 없으면 태그 (기본값: latest)."""
+        return self.digest or self.tag or DEFAULT_TAG
+
+    def normalized(self) -> str:
+        """표준화된 레퍼런스 문자열을 반환합니다.
+
+        다이제스트가 있으면 태그 대신 다이제스트를 사용합니다.
+        """
+        if self.digest:
+            return f"{self.name}@{self.digest}"
+        return f"{self.name}:{self.tag or DEFAULT_TAG}"
+
+    def _key(self) -> Tuple[str, str, str, Optional[str], Optional[str]]:
+        return (self.registry, self.namespace, self.repo, self.tag, self.digest)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ImageRef):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return (
+            f"ImageRef(registry={self.registry!r}, namespace={self.namespace!r}, "
+            f"repo={self.repo!r}, tag={self.tag!r}, digest={self.digest!r})"
+        )
+
+
+def split_reference(reference: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """레퍼런스를 기본값 적용 없이 (이름, 태그, 다이제스트)로 나눕니다.
+
+    Args:
+        reference: 이미지 레퍼런스 (예: localhost:5000/app:1.0)
+
+    Returns:
+        (name, tag, digest) 튜플. 없는 부분은 None
+    """
+    match = _REFERENCE_RE.fullmatch(reference.strip())
+    if match is None:  # pragma: no cover - 패턴이 모든 문자열과 일치
+        return reference, None, None
+    return match.group("name"), match.group("tag"), match.group("digest")
+
+
+def _is_registry_host(component: str) -> bool:
+    return "." in component or ":" in component or component == "localhost"
+
+
+@lru_cache(maxsize=4096)
+def parse_image_ref(reference: str) -> ImageRef:
+    """이미지 레퍼런스를 ImageRef로 파싱합니다.
+
+    첫 번째 경로 요소에 '.' 또는 ':'이 있거나 localhost이면 레지스트리로
+    판단합니다. 잘못된 형식이어도 예외 없이 최대한 해석합니다.
+
+    Args:
+        reference: 이미지 레퍼런스
+
+    Returns:
+        파싱된 ImageRef (캐시에서 공유되는 인스턴스)
+
+    예시:
+        nginx → docker.io / library / nginx
+        localhost:5000/app:1 → localhost:5000 / "" / app, 태그 1
+        ghcr.io/org/team/app@sha256:... → ghcr.io / org / team/app
+    """
+    name, tag, digest = split_reference(reference)
+
+    components = name.split("/")
+    if len(components) > 1 and _is_registry_host(components[0]):
+        registry = components.pop(0)
+        if registry in _DOCKER_HUB_ALIASES:
+            registry = DOCKER_HUB
+    else:
+        registry = DOCKER_HUB
+
+    if len(components) == 1:
+        namespace = DOCKER_HUB_NAMESPACE if registry == DOCKER_HUB else ""
+        repo = components[0]
+    else:
+        namespace = components[0]
+        repo = "/".join(components[1:])
+
+    return ImageRef(registry, namespace, repo, tag, digest)
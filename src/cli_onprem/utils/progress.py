@@ -0,0 +1,149 @@
+"""이미지 전송 진행률 표시 및 처리량 리포트 유틸리티."""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
+
+from rich.console import Console
+from rich.progress import BarColumn, Progress, TaskID, TextColumn, TimeElapsedColumn
+
+MB = 1024 * 1024
+
+
+class ImageTransferReport(TypedDict):
+    """이미지 하나(플랫폼 단위)의 pull/save 결과 리포트."""
+
+    reference: str
+    platform: str
+    output: Optional[str]
+    pull_seconds: float
+    save_seconds: float
+    size_bytes: int
+    save_mb_per_sec: float
+
+
+def format_size(size_bytes: float) -> str:
+    """바이트 수를 MB 단위 문자열로 변환합니다."""
+    return f"{size_bytes / MB:.1f}MB"
+
+
+def format_transfer_report(report: ImageTransferReport) -> str:
+    """리포트를 사람이 읽기 쉬운 한 줄로 포맷팅합니다."""
+    return (
+        f"{report['reference']} ({report['platform']}): "
+        f"pull {report['pull_seconds']:.1f}s, "
+        f"save {report['save_seconds']:.1f}s, "
+        f"{format_size(report['size_bytes'])}, "
+        f"{report['save_mb_per_sec']:.1f}MB/s"
+    )
+
+
+def append_jsonl(path: Path, records: List[ImageTransferReport]) -> None:
+    """리포트를 JSON Lines 형식으로 파일에 추가합니다.
+
+    Args:
+        path: JSON Lines 파일 경로
+        records: 기록할 리포트 목록
+    """
+    with open(path, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+class TransferReporter:
+    """docker pull/save 진행률을 표시하고 이미지별 처리량을 집계합니다.
+
+    진행률은 stderr에 표시하므로 `--stdout` 스트림과 섞이지 않습니다.
+    여러 스레드에서 동시에 호출해도 안전합니다.
+    """
+
+    def __init__(self, show_progress: bool, console: Optional[Console] = None):
+        self._lock = threading.Lock()
+        self._pull_seconds: Dict[Tuple[str, str], float] = {}
+        self._tasks: Dict[Tuple[str, str, str], TaskID] = {}
+        self.reports: List[ImageTransferReport] = []
+        self._progress: Optional[Progress] = None
+        if show_progress:
+            self._progress = Progress(
+                TextColumn("{task.description}"),
+                BarColumn(),
+                TextColumn("{task.fields[detail]}"),
+                TimeElapsedColumn(),
+                console=console or Console(stderr=True),
+                transient=False,
+            )
+
+    def __enter__(self) -> "TransferReporter":
+        if self._progress is not None:
+            self._progress.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._progress is not None:
+            self._progress.stop()
+
+    def _task(self, stage: str, reference: str, platform: str) -> Optional[TaskID]:
+        if self._progress is None:
+            return None
+        key = (stage, reference, platform)
+        with self._lock:
+            if key not in self._tasks:
+                self._tasks[key] = self._progress.add_task(
+                    f"{stage} {reference} ({platform})", total=None, detail=""
+                )
+            return self._tasks[key]
+
+    def pull_progress(
+        self, reference: str, platform: str, done: int, total: int
+    ) -> None:
+        """pull 레이어 진행률을 갱신합니다."""
+        task = self._task("pull", reference, platform)
+        if task is not None and self._progress is not None:
+            self._progress.update(
+                task, completed=done, total=total, detail=f"{done}/{total} layers"
+            )
+
+    def save_progress(
+        self, reference: str, platform: str, started: float, written: int
+    ) -> None:
+        """save 기록 바이트와 속도를 갱신합니다."""
+        task = self._task("save", reference, platform)
+        if task is not None and self._progress is not None:
+            elapsed = max(time.monotonic() - started, 1e-6)
+            self._progress.update(
+                task,
+                completed=written,
+                detail=f"{format_size(written)} {written / elapsed / MB:.1f}MB/s",
+            )
+
+    def record_pull(self, reference: str, platform: str, seconds: float) -> None:
+        """pull 소요 시간을 기록합니다 (같은 이미지의 재호출은 누적)."""
+        with self._lock:
+            key = (reference, platform)
+            self._pull_seconds[key] = self._pull_seconds.get(key, 0.0) + seconds
+
+    def record_save(
+        self,
+        reference: str,
+        platform: str,
+        output: Optional[Path],
+        seconds: float,
+        size_bytes: int,
+    ) -> ImageTransferReport:
+        """save 결과를 기록하고 최종 리포트를 만듭니다."""
+        with self._lock:
+            pull_seconds = self._pull_seconds.get((reference, platform), 0.0)
+        report: ImageTransferReport = {
+            "reference": reference,
+            "platform": platform,
+            "output": str(output) if output is not None else None,
+            "pull_seconds": round(pull_seconds, 3),
+            "save_seconds": round(seconds, 3),
+            "size_bytes": size_bytes,
+            "save_mb_per_sec": round(size_bytes / max(seconds, 1e-6) / MB, 2),
+        }
+        with self._lock:
+            self.reports.append(report)
+        return report
@@ -2,7 +2,10 @@
 
 import os
 import subprocess
-from typing import Any, List, Optional
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import IO, Any, Callable, Iterator, List, Optional
 
 from cli_onprem.core.errors import CommandError
 
@@ -49,15 +52,139 @@ def run_command(
             **kwargs,
         )
     except subprocess.TimeoutExpired as e:
-        # 친절한 에러 메시지 (해결 방법 포함)
-        cmd_str = " ".join(cmd[:3])
-        if len(cmd) > 3:
-            cmd_str += "..."
-        raise CommandError(
-            f"명령어가 {timeout}초 후 타임아웃되었습니다: {cmd_str}\n"
-            "💡 힌트: 대용량 작업의 경우 CLI_ONPREM_LONG_TIMEOUT=7200 으로 "
-            "시간을 늘려보세요."
-        ) from e
+        raise _timeout_error(cmd, timeout) from e
+
+
+def _timeout_error(cmd: List[str], timeout: Optional[float]) -> CommandError:
+    """타임아웃에 대한 친절한 에러 메시지(해결 방법 포함)를 만듭니다."""
+    cmd_str = " ".join(cmd[:3])
+    if len(cmd) > 3:
+        cmd_str += "..."
+    return CommandError(
+        f"명령어가 {timeout}초 후 타임아웃되었습니다: {cmd_str}\n"
+        "💡 힌트: 대용량 작업의 경우 CLI_ONPREM_LONG_TIMEOUT=7200 으로 "
+        "시간을 늘려보세요."
+    )
+
+
+@contextmanager
+def _streaming_process(cmd: List[str], timeout: Optional[int]) -> Iterator[IO[bytes]]:
+    """명령을 실행하고 stdout 파이프를 넘겨주는 컨텍스트 매니저.
+
+    stderr는 파이프 교착을 피하기 위해 임시 파일로 받습니다. 블록이 예외로
+    끝나면(제너레이터가 중간에 닫힌 경우 포함) 프로세스를 종료합니다.
+    """
+    with tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file)
+        timed_out = threading.Event()
+
+        def _kill() -> None:
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(timeout, _kill) if timeout else None
+        if timer is not None:
+            timer.daemon = True
+            timer.start()
+
+        try:
+            assert process.stdout is not None
+            with process.stdout:
+                yield process.stdout
+            returncode = process.wait()
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            if timer is not None:
+                timer.cancel()
+
+        if timed_out.is_set():
+            raise _timeout_error(cmd, timeout)
+
+        if returncode != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode("utf-8", errors="replace")
+            raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr)
+
+
+def iter_command_lines(
+    cmd: List[str], timeout: Optional[int] = DEFAULT_TIMEOUT
+) -> Iterator[str]:
+    """명령을 실행하며 stdout을 한 줄씩 내보내는 제너레이터.
+
+    명령이 끝나기 전에도 출력된 줄을 바로 처리할 수 있으며, 소비자가
+    제너레이터를 중간에 닫으면 프로세스를 종료합니다.
+
+    Args:
+        cmd: 실행할 명령어 리스트
+        timeout: 타임아웃 (초). None이면 무제한 대기
+
+    Yields:
+        stdout의 각 줄 (개행 제외)
+
+    Raises:
+        subprocess.CalledProcessError: 명령이 실패한 경우 (stderr 포함)
+        CommandError: 타임아웃 발생 시
+    """
+    with _streaming_process(cmd, timeout) as stdout:
+        for raw_line in stdout:
+            yield raw_line.decode("utf-8", errors="replace").rstrip("\r\n")
+
+
+def stream_command_lines(
+    cmd: List[str],
+    on_line: Callable[[str], None],
+    timeout: Optional[int] = DEFAULT_TIMEOUT,
+) -> None:
+    """명령을 실행하며 stdout을 한 줄씩 콜백으로 전달합니다.
+
+    Args:
+        cmd: 실행할 명령어 리스트
+        on_line: 줄마다 호출할 콜백 (개행 제외)
+        timeout: 타임아웃 (초). None이면 무제한 대기
+
+    Raises:
+        subprocess.CalledProcessError: 명령이 실패한 경우 (stderr 포함)
+        CommandError: 타임아웃 발생 시
+    """
+    for line in iter_command_lines(cmd, timeout):
+        on_line(line)
+
+
+def stream_command_output(
+    cmd: List[str],
+    dest: IO[bytes],
+    on_bytes: Optional[Callable[[int], None]] = None,
+    timeout: Optional[int] = DEFAULT_TIMEOUT,
+    chunk_size: int = 1024 * 1024,
+) -> int:
+    """명령의 stdout을 dest로 복사하며 누적 바이트 수를 콜백으로 전달합니다.
+
+    Args:
+        cmd: 실행할 명령어 리스트
+        dest: 출력을 기록할 바이너리 파일 객체
+        on_bytes: 청크마다 누적 바이트 수로 호출할 콜백
+        timeout: 타임아웃 (초). None이면 무제한 대기
+        chunk_size: 읽기 청크 크기
+
+    Returns:
+        복사한 총 바이트 수
+
+    Raises:
+        subprocess.CalledProcessError: 명령이 실패한 경우 (stderr 포함)
+        CommandError: 타임아웃 발생 시
+    """
+    total = 0
+    with _streaming_process(cmd, timeout) as stdout:
+        while chunk := stdout.read(chunk_size):
+            dest.write(chunk)
+            total += len(chunk)
+            if on_bytes is not None:
+                on_bytes(total)
+    dest.flush()
+    return total
 
 
 def check_command_exists(command: str) -> bool:
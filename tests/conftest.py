@@ -2,11 +2,14 @@
 
 import tempfile
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator, NamedTuple, Optional
 from unittest import mock
 
 import pytest
 import yaml
+from typer.testing import CliRunner, Result
+
+from cli_onprem.__main__ import app
 
 
 @pytest.fixture
@@ -109,3 +112,66 @@ def mock_s3_error_client() -> Generator[mock.MagicMock, None, None]:
         )
 
         yield mock_client
+
+
+class FakeHelm(NamedTuple):
+    """fake_helm 픽스처가 돌려주는 helm 모킹 객체."""
+
+    prepare: mock.MagicMock
+    render: mock.MagicMock
+
+
+@pytest.fixture
+def fake_helm() -> Generator[FakeHelm, None, None]:
+    """helm 호출을 모킹하는 픽스처.
+
+    helm 설치 확인과 의존성 업데이트는 건너뛰고 prepare_chart는 차트 경로를
+    그대로 돌려줍니다. 렌더링 결과는 테스트에서 render.side_effect로 지정합니다.
+
+    Yields:
+        prepare_chart, render_template 모킹 객체
+    """
+    with mock.patch("cli_onprem.services.helm.check_helm_installed"):
+        with mock.patch("cli_onprem.services.helm.update_dependencies"):
+            with mock.patch(
+                "cli_onprem.services.helm.prepare_chart",
+                side_effect=lambda chart, workdir, **_: chart,
+            ) as mock_prepare:
+                with mock.patch(
+                    "cli_onprem.services.helm.render_template"
+                ) as mock_render:
+                    yield FakeHelm(mock_prepare, mock_render)
+
+
+@pytest.fixture
+def make_chart(tmp_path: Path) -> Callable[..., Path]:
+    """Chart.yaml만 있는 차트 디렉토리를 만드는 픽스처.
+
+    Returns:
+        make(name="chart", root=tmp_path) -> 차트 디렉토리 경로
+    """
+
+    def make(name: str = "chart", root: Optional[Path] = None) -> Path:
+        chart = (root or tmp_path) / name
+        chart.mkdir(parents=True)
+        (chart / "Chart.yaml").write_text(f"name: {name}\nversion: 1.0.0\n")
+        return chart
+
+    return make
+
+
+@pytest.fixture
+def invoke_helm_local() -> Callable[..., Result]:
+    """렌더 캐시 없이 helm-local 하위 명령을 실행하는 픽스처.
+
+    stdout과 stderr는 분리해서 돌려줍니다.
+
+    Returns:
+        invoke(command, *args) -> CLI 실행 결과
+    """
+    runner = CliRunner(mix_stderr=False)
+
+    def invoke(command: str, *args: str) -> Result:
+        return runner.invoke(app, ["helm-local", command, "--no-cache", *args])
+
+    return invoke
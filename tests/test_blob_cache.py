@@ -0,0 +1,83 @@
+"""블롭 다운로드 캐시 테스트."""
+
+import os
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from cli_onprem.services.blob_cache import BlobCache, get_blob_cache_dir
+from cli_onprem.utils.fs import evict_lru
+
+
+def _write(path: Path, size: int, mtime: float) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_evict_lru_removes_oldest_first(tmp_path: Path) -> None:
+    """오래된 파일부터 삭제하고 keep 항목은 남긴다."""
+    oldest = _write(tmp_path / "a", 10, 1000)
+    older = _write(tmp_path / "b", 10, 2000)
+    newest = _write(tmp_path / "c", 10, 3000)
+
+    removed = evict_lru(tmp_path, max_bytes=15, keep=[oldest])
+
+    assert removed == [older, newest]
+    assert oldest.exists()
+
+
+def test_evict_lru_under_limit(tmp_path: Path) -> None:
+    """상한 이하이면 아무것도 삭제하지 않는다."""
+    _write(tmp_path / "a", 10, 1000)
+
+    assert evict_lru(tmp_path, max_bytes=10) == []
+
+
+def test_blob_cache_dir_follows_config_dir(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """캐시 위치는 설정 디렉터리를 따른다."""
+    monkeypatch.setenv("CLI_ONPREM_CONFIG_DIR", str(tmp_path))
+
+    assert get_blob_cache_dir() == tmp_path / "cache" / "blobs"
+
+
+def test_fetch_downloads_once(tmp_path: Path) -> None:
+    """캐시에 없을 때만 download를 호출한다."""
+    cache = BlobCache(tmp_path)
+    calls: List[Path] = []
+
+    def download(path: Path) -> None:
+        calls.append(path)
+        path.write_bytes(b"blob")
+
+    assert cache.fetch("sha256:abc", download) is False
+    assert cache.fetch("sha256:abc", download) is True
+    assert calls == [tmp_path / "sha256" / "abc"]
+    assert cache.size() == 4
+
+
+def test_get_refreshes_lru_order(tmp_path: Path) -> None:
+    """get으로 사용한 블롭은 정리 대상에서 뒤로 밀린다."""
+    cache = BlobCache(tmp_path, max_bytes=10)
+    first = _write(cache.path_for("sha256:first"), 10, 1000)
+    second = _write(cache.path_for("sha256:second"), 10, 2000)
+
+    assert cache.get("sha256:first") == first
+    removed = cache.prune()
+
+    assert removed == [second]
+    assert first.exists()
+
+
+def test_prune_counts_partial_files(tmp_path: Path) -> None:
+    """받다 만 .partial 파일도 크기에 포함되어 정리된다."""
+    cache = BlobCache(tmp_path, max_bytes=10)
+    partial = _write(tmp_path / "sha256" / "stale.partial", 10, 1000)
+    blob = _write(cache.path_for("sha256:kept"), 10, 500)
+
+    assert cache.prune(keep=["sha256:kept"]) == [partial]
+    assert blob.exists()
@@ -0,0 +1,285 @@
+"""서브차트 캐시와 의존성 동기화 테스트."""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from unittest import mock
+
+import pytest
+import yaml
+from typer.testing import CliRunner
+
+from cli_onprem.__main__ import app
+from cli_onprem.core.errors import DependencyError
+from cli_onprem.services.chart_cache import ChartCache, chart_cache_key
+from cli_onprem.services.helm import (
+    check_dependencies,
+    dependencies_satisfied,
+    read_dependencies,
+    sync_dependencies,
+)
+
+runner = CliRunner()
+
+REPO = "https://charts.example.com/stable"
+
+
+def _write_chart(
+    chart_dir: Path,
+    dependencies: List[Dict[str, Any]],
+    lock: Optional[List[Dict[str, Any]]] = None,
+) -> Path:
+    chart_dir.mkdir(parents=True, exist_ok=True)
+    chart = {"apiVersion": "v2", "name": "app", "version": "1.0.0"}
+    if dependencies:
+        chart["dependencies"] = dependencies  # type: ignore[assignment]
+    (chart_dir / "Chart.yaml").write_text(yaml.safe_dump(chart))
+    if lock is not None:
+        (chart_dir / "Chart.lock").write_text(yaml.safe_dump({"dependencies": lock}))
+    return chart_dir
+
+
+def _fake_update(contents: Dict[str, bytes]) -> Any:
+    """helm dependency update처럼 charts/와 Chart.lock을 만드는 가짜 함수."""
+
+    def _update(chart_dir: Path) -> None:
+        charts_dir = chart_dir / "charts"
+        charts_dir.mkdir(exist_ok=True)
+        lock = []
+        for archive_name, content in contents.items():
+            (charts_dir / archive_name).write_bytes(content)
+            name, _, version = archive_name[: -len(".tgz")].rpartition("-")
+            lock.append({"name": name, "version": version, "repository": REPO})
+        (chart_dir / "Chart.lock").write_text(yaml.safe_dump({"dependencies": lock}))
+
+    return _update
+
+
+def test_chart_cache_round_trip(tmp_path: Path) -> None:
+    cache = ChartCache(tmp_path / "cache")
+    archive = tmp_path / "redis-17.0.1.tgz"
+    archive.write_bytes(b"redis chart")
+
+    digest = cache.put(REPO, "redis", "17.0.1", archive)
+
+    assert digest.startswith("sha256:")
+    cached = cache.get(REPO + "/", "redis", "17.0.1")
+    assert cached is not None
+    assert cached.read_bytes() == b"redis chart"
+    assert cache.get(REPO, "redis", "17.0.2") is None
+
+
+def test_chart_cache_shares_identical_archives(tmp_path: Path) -> None:
+    cache = ChartCache(tmp_path / "cache")
+    archive = tmp_path / "common-2.0.0.tgz"
+    archive.write_bytes(b"common chart")
+
+    cache.put(REPO, "common", "2.0.0", archive)
+    cache.put("oci://mirror.local/charts", "common", "2.0.0", archive)
+
+    blobs = list((tmp_path / "cache" / "blobs" / "sha256").glob("*.tgz"))
+    assert len(blobs) == 1
+    assert chart_cache_key(REPO, "common", "2.0.0") != chart_cache_key(
+        "oci://mirror.local/charts", "common", "2.0.0"
+    )
+
+
+def test_chart_cache_drops_corrupted_archive(tmp_path: Path) -> None:
+    cache = ChartCache(tmp_path / "cache")
+    archive = tmp_path / "redis-17.0.1.tgz"
+    archive.write_bytes(b"redis chart")
+    digest = cache.put(REPO, "redis", "17.0.1", archive)
+
+    blob = tmp_path / "cache" / "blobs" / "sha256" / f"{digest[len('sha256:') :]}.tgz"
+    blob.write_bytes(b"tampered")
+
+    assert cache.get(REPO, "redis", "17.0.1") is None
+    assert not blob.exists()
+
+
+def test_read_dependencies_prefers_lock(tmp_path: Path) -> None:
+    chart_dir = _write_chart(
+        tmp_path / "app",
+        [{"name": "redis", "version": "^17.0.0", "repository": REPO}],
+        lock=[{"name": "redis", "version": "17.3.2", "repository": REPO}],
+    )
+
+    assert read_dependencies(chart_dir) == [
+        {"name": "redis", "version": "17.3.2", "repository": REPO}
+    ]
+
+
+def test_read_dependencies_ignores_stale_lock(tmp_path: Path) -> None:
+    chart_dir = _write_chart(
+        tmp_path / "app",
+        [{"name": "redis", "version": "18.0.0", "repository": REPO}],
+        lock=[{"name": "redis", "version": "17.3.2", "repository": REPO}],
+    )
+
+    assert read_dependencies(chart_dir) == [
+        {"name": "redis", "version": "18.0.0", "repository": REPO}
+    ]
+
+
+def test_read_dependencies_unreadable_chart(tmp_path: Path) -> None:
+    assert read_dependencies(tmp_path / "missing") is None
+
+
+def test_sync_fetches_then_restores_from_cache(tmp_path: Path) -> None:
+    cache = ChartCache(tmp_path / "cache")
+    dependencies = [{"name": "redis", "version": "17.3.2", "repository": REPO}]
+    first = _write_chart(tmp_path / "first", dependencies)
+
+    with mock.patch(
+        "cli_onprem.services.helm.update_dependencies",
+        side_effect=_fake_update({"redis-17.3.2.tgz": b"redis chart"}),
+    ) as mock_update:
+        report = sync_dependencies(first, cache)
+    assert mock_update.call_count == 1
+    assert report["fetched"] == ["redis-17.3.2"]
+
+    second = _write_chart(tmp_path / "second", dependencies)
+    with mock.patch("cli_onprem.services.helm.update_dependencies") as mock_update:
+        report = sync_dependencies(second, cache, offline=True)
+
+    mock_update.assert_not_called()
+    assert report == {"present": [], "restored": ["redis-17.3.2"], "fetched": []}
+    assert (second / "charts" / "redis-17.3.2.tgz").read_bytes() == b"redis chart"
+
+
+def test_sync_skips_update_for_vendored_subcharts(tmp_path: Path) -> None:
+    chart_dir = _write_chart(
+        tmp_path / "app",
+        [{"name": "common", "version": "2.0.0", "repository": REPO}],
+    )
+    subchart = chart_dir / "charts" / "common"
+    subchart.mkdir(parents=True)
+    (subchart / "Chart.yaml").write_text("name: common\nversion: 2.0.0\n")
+
+    with mock.patch("cli_onprem.services.helm.update_dependencies") as mock_update:
+        report = sync_dependencies(chart_dir, ChartCache(tmp_path / "cache"))
+
+    mock_update.assert_not_called()
+    assert report["present"] == ["common-2.0.0"]
+
+
+def test_dependencies_satisfied_by_locked_archives(tmp_path: Path) -> None:
+    chart_dir = _write_chart(
+        tmp_path / "app",
+        [
+            {"name": "redis", "version": "^17.0.0", "repository": REPO},
+            {"name": "common", "version": "2.0.0", "repository": REPO},
+        ],
+        lock=[
+            {"name": "redis", "version": "17.3.2", "repository": REPO},
+            {"name": "common", "version": "2.0.0", "repository": REPO},
+        ],
+    )
+    (chart_dir / "charts").mkdir()
+    (chart_dir / "charts" / "redis-17.3.2.tgz").write_bytes(b"redis")
+    (chart_dir / "charts" / "common-2.0.0.tgz").write_bytes(b"common")
+    (chart_dir / "charts" / "common-lib-1.0.0.tgz").write_bytes(b"unrelated")
+
+    assert dependencies_satisfied(chart_dir)
+    with mock.patch("cli_onprem.services.helm.update_dependencies") as mock_update:
+        report = sync_dependencies(chart_dir, ChartCache(tmp_path / "cache"))
+
+    mock_update.assert_not_called()
+    assert report["present"] == ["redis-17.3.2", "common-2.0.0"]
+
+
+def test_dependencies_range_without_lock_accepts_vendored_version(
+    tmp_path: Path,
+) -> None:
+    chart_dir = _write_chart(
+        tmp_path / "app",
+        [{"name": "redis", "version": "~17.3", "repository": REPO}],
+    )
+    (chart_dir / "charts").mkdir()
+    (chart_dir / "charts" / "redis-17.3.9.tgz").write_bytes(b"redis")
+
+    assert dependencies_satisfied(chart_dir)
+
+
+def test_check_dependencies_reports_outdated_archive(tmp_path: Path) -> None:
+    chart_dir = _write_chart(
+        tmp_path / "app",
+        [{"name": "redis", "version": "^17.0.0", "repository": REPO}],
+        lock=[{"name": "redis", "version": "17.3.2", "repository": REPO}],
+    )
+    (chart_dir / "charts").mkdir()
+    (chart_dir / "charts" / "redis-17.0.0.tgz").write_bytes(b"old redis")
+
+    state = check_dependencies(chart_dir)
+
+    assert state is not None
+    assert not state["satisfied"]
+    assert state["unexpected"] == ["redis-17.0.0.tgz"]
+    assert [dep["version"] for dep in state["missing"]] == ["17.3.2"]
+    assert not dependencies_satisfied(chart_dir)
+
+
+def test_sync_replaces_outdated_archive_from_cache(tmp_path: Path) -> None:
+    cache = ChartCache(tmp_path / "cache")
+    archive = tmp_path / "redis-17.3.2.tgz"
+    archive.write_bytes(b"redis chart")
+    cache.put(REPO, "redis", "17.3.2", archive)
+    chart_dir = _write_chart(
+        tmp_path / "app",
+        [{"name": "redis", "version": "^17.0.0", "repository": REPO}],
+        lock=[{"name": "redis", "version": "17.3.2", "repository": REPO}],
+    )
+    (chart_dir / "charts").mkdir()
+    (chart_dir / "charts" / "redis-17.0.0.tgz").write_bytes(b"old redis")
+
+    with mock.patch("cli_onprem.services.helm.update_dependencies") as mock_update:
+        report = sync_dependencies(chart_dir, cache, offline=True)
+
+    mock_update.assert_not_called()
+    assert report["restored"] == ["redis-17.3.2"]
+    assert sorted(p.name for p in (chart_dir / "charts").iterdir()) == [
+        "redis-17.3.2.tgz"
+    ]
+    assert dependencies_satisfied(chart_dir)
+
+
+def test_sync_offline_cache_miss_raises(tmp_path: Path) -> None:
+    chart_dir = _write_chart(
+        tmp_path / "app",
+        [{"name": "redis", "version": "^17.0.0", "repository": REPO}],
+    )
+
+    with mock.patch("cli_onprem.services.helm.update_dependencies") as mock_update:
+        with pytest.raises(DependencyError, match="redis-\\^17.0.0"):
+            sync_dependencies(chart_dir, ChartCache(tmp_path / "cache"), offline=True)
+    mock_update.assert_not_called()
+
+
+def test_sync_without_dependencies_does_nothing(tmp_path: Path) -> None:
+    chart_dir = _write_chart(tmp_path / "app", [])
+
+    with mock.patch("cli_onprem.services.helm.update_dependencies") as mock_update:
+        report = sync_dependencies(chart_dir, ChartCache(tmp_path / "cache"))
+
+    mock_update.assert_not_called()
+    assert report == {"present": [], "restored": [], "fetched": []}
+
+
+def test_extract_images_offline_fails_on_cache_miss(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("CLI_ONPREM_CONFIG_DIR", str(tmp_path / "config"))
+    chart_dir = _write_chart(
+        tmp_path / "app",
+        [{"name": "redis", "version": "17.3.2", "repository": REPO}],
+    )
+
+    with mock.patch("cli_onprem.services.helm.check_helm_installed"):
+        with mock.patch("cli_onprem.services.helm.update_dependencies") as mock_update:
+            result = runner.invoke(
+                app,
+                ["helm-local", "extract-images", str(chart_dir), "--offline"],
+            )
+
+    assert result.exit_code == 1
+    assert "redis-17.3.2" in result.stdout
+    mock_update.assert_not_called()
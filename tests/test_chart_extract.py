@@ -0,0 +1,153 @@
+"""차트 아카이브 추출(선택적/안전 추출, 다이제스트별 추출 캐시) 테스트."""
+
+import io
+import tarfile
+from pathlib import Path
+from typing import Dict
+from unittest import mock
+
+import pytest
+
+from cli_onprem.services.chart_cache import ChartExtractCache
+from cli_onprem.services.helm import extract_chart, find_chart_root, prepare_chart
+
+
+def _make_archive(path: Path, files: Dict[str, str]) -> Path:
+    with tarfile.open(path, "w:gz") as tar:
+        for name, content in files.items():
+            data = content.encode()
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return path
+
+
+def _add_symlink(path: Path, name: str, target: str) -> None:
+    with tarfile.open(path, "w:gz") as tar:
+        info = tarfile.TarInfo(name)
+        info.type = tarfile.SYMTYPE
+        info.linkname = target
+        tar.addfile(info)
+
+
+def test_find_chart_root_ignores_subcharts() -> None:
+    names = [
+        "./app/charts/redis/Chart.yaml",
+        "./app/Chart.yaml",
+        "./app/values.yaml",
+    ]
+    assert find_chart_root(names) == "app"
+    assert find_chart_root(["README.md", "app/templates/x.yaml"]) is None
+
+
+def test_extract_chart_only_extracts_chart_root(tmp_path: Path) -> None:
+    archive = _make_archive(
+        tmp_path / "app.tgz",
+        {
+            "app/Chart.yaml": "name: app\n",
+            "app/templates/deploy.yaml": "kind: Deployment\n",
+            "stray.txt": "not part of the chart",
+        },
+    )
+
+    chart_root = extract_chart(archive, tmp_path / "out")
+
+    assert chart_root == tmp_path / "out" / "app"
+    assert (chart_root / "templates" / "deploy.yaml").is_file()
+    assert not (tmp_path / "out" / "stray.txt").exists()
+
+
+def test_extract_chart_without_chart_yaml(tmp_path: Path) -> None:
+    archive = _make_archive(tmp_path / "bad.tgz", {"app/values.yaml": "a: 1\n"})
+
+    with pytest.raises(ValueError, match="Chart.yaml"):
+        extract_chart(archive, tmp_path / "out")
+
+
+def test_extract_chart_rejects_path_traversal(tmp_path: Path) -> None:
+    archive = _make_archive(
+        tmp_path / "evil.tgz",
+        {"app/Chart.yaml": "name: app\n", "app/../../escaped.txt": "owned"},
+    )
+
+    with pytest.raises(ValueError, match="안전하지 않은"):
+        extract_chart(archive, tmp_path / "out" / "nested")
+    assert not (tmp_path / "out").exists()
+    assert not (tmp_path / "escaped.txt").exists()
+
+
+def test_extract_chart_rejects_external_symlink(tmp_path: Path) -> None:
+    archive = tmp_path / "link.tgz"
+    _add_symlink(archive, "app/Chart.yaml", "/etc/passwd")
+
+    with pytest.raises(ValueError, match="링크"):
+        extract_chart(archive, tmp_path / "out")
+
+
+def test_extract_cache_reuses_previous_extraction(tmp_path: Path) -> None:
+    archive = _make_archive(tmp_path / "app.tgz", {"app/Chart.yaml": "name: app\n"})
+    cache = ChartExtractCache(tmp_path / "extracted")
+
+    first = prepare_chart(archive, tmp_path / "work1", extract_cache=cache)
+    with mock.patch("cli_onprem.services.helm.extract_chart") as mock_extract:
+        second = prepare_chart(archive, tmp_path / "work2", extract_cache=cache)
+
+    mock_extract.assert_not_called()
+    assert first == tmp_path / "work1" / "app"
+    assert second == tmp_path / "work2" / "app"
+    assert (second / "Chart.yaml").read_text() == "name: app\n"
+
+
+def test_extract_cache_checkout_leaves_cache_untouched(tmp_path: Path) -> None:
+    archive = _make_archive(tmp_path / "app.tgz", {"app/Chart.yaml": "name: app\n"})
+    cache = ChartExtractCache(tmp_path / "extracted")
+
+    chart_root = prepare_chart(archive, tmp_path / "work", extract_cache=cache)
+    # 의존성 동기화처럼 작업 사본을 바꿔도 캐시 항목은 그대로
+    (chart_root / "charts").mkdir()
+    (chart_root / "charts" / "redis-1.0.0.tgz").write_bytes(b"x")
+    (chart_root / "Chart.yaml").write_text("name: changed\n")
+
+    cached = cache.load(archive, extract_chart)
+    assert cached != chart_root
+    assert (cached / "Chart.yaml").read_text() == "name: app\n"
+    assert not (cached / "charts").exists()
+
+
+def test_extract_cache_checkout_falls_back_to_extract(tmp_path: Path) -> None:
+    archive = _make_archive(tmp_path / "app.tgz", {"app/Chart.yaml": "name: app\n"})
+    cache = ChartExtractCache(tmp_path / "extracted")
+
+    with mock.patch("shutil.copytree", side_effect=FileNotFoundError("pruned")):
+        chart_root = cache.checkout(archive, tmp_path / "work", extract_chart)
+
+    assert chart_root == tmp_path / "work" / "app"
+    assert (chart_root / "Chart.yaml").read_text() == "name: app\n"
+
+
+def test_extract_cache_keyed_by_content(tmp_path: Path) -> None:
+    cache = ChartExtractCache(tmp_path / "extracted")
+    archive = tmp_path / "app.tgz"
+
+    _make_archive(archive, {"app/Chart.yaml": "version: 1.0.0\n"})
+    first = cache.load(archive, extract_chart)
+    _make_archive(archive, {"app/Chart.yaml": "version: 2.0.0\n"})
+    second = cache.load(archive, extract_chart)
+
+    assert first != second
+    assert (second / "Chart.yaml").read_text() == "version: 2.0.0\n"
+
+
+def test_extract_cache_prunes_least_recently_used(tmp_path: Path) -> None:
+    cache = ChartExtractCache(tmp_path / "extracted", max_entries=2)
+
+    roots = []
+    for version in ("1", "2", "3"):
+        archive = _make_archive(
+            tmp_path / f"app-{version}.tgz", {"app/Chart.yaml": f"version: {version}"}
+        )
+        roots.append(cache.load(archive, extract_chart))
+
+    entries = [p for p in (tmp_path / "extracted").iterdir() if p.is_dir()]
+    assert len(entries) == 2
+    assert roots[2].exists()
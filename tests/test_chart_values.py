@@ -0,0 +1,206 @@
+"""helm 없이 values만으로 이미지를 찾는 분석기 테스트."""
+
+import io
+import json
+import tarfile
+from pathlib import Path
+from typing import Any, Dict
+from unittest import mock
+
+import yaml
+from typer.testing import CliRunner
+
+from cli_onprem.__main__ import app
+from cli_onprem.services.chart_values import (
+    diff_image_sets,
+    extract_images_from_values,
+    iter_chart_values,
+    merge_values,
+)
+
+runner = CliRunner(mix_stderr=False)
+
+
+def _write_chart(
+    chart_dir: Path, chart: Dict[str, Any], values: Dict[str, Any]
+) -> Path:
+    chart_dir.mkdir(parents=True, exist_ok=True)
+    (chart_dir / "Chart.yaml").write_text(yaml.safe_dump(chart))
+    (chart_dir / "values.yaml").write_text(yaml.safe_dump(values))
+    return chart_dir
+
+
+def _chart_archive(path: Path, name: str, values: Dict[str, Any]) -> Path:
+    files = {
+        f"{name}/Chart.yaml": yaml.safe_dump({"name": name, "version": "1.0.0"}),
+        f"{name}/values.yaml": yaml.safe_dump(values),
+    }
+    with tarfile.open(path, "w:gz") as tar:
+        for member, content in files.items():
+            data = content.encode()
+            info = tarfile.TarInfo(member)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return path
+
+
+def test_merge_values_null_removes_key() -> None:
+    base = {"image": {"repository": "nginx", "tag": "1.0"}, "debug": True}
+    override = {"image": {"tag": "2.0"}, "debug": None}
+
+    assert merge_values(base, override) == {
+        "image": {"repository": "nginx", "tag": "2.0"}
+    }
+
+
+def test_values_registry_and_app_version(tmp_path: Path) -> None:
+    chart_dir = _write_chart(
+        tmp_path / "app",
+        {"name": "app", "version": "1.0.0", "appVersion": "3.2.1"},
+        {
+            "image": {"registry": "quay.io", "repository": "org/app", "tag": ""},
+            "sidecar": {"image": {"repository": "busybox", "tag": 1.36}},
+            "templated": {"image": {"repository": "{{ .Values.repo }}"}},
+        },
+    )
+
+    assert extract_images_from_values(chart_dir, normalize=False) == [
+        "busybox:1.36",
+        "quay.io/org/app:3.2.1",
+    ]
+
+
+def test_values_files_override_chart_values(tmp_path: Path) -> None:
+    chart_dir = _write_chart(
+        tmp_path / "app",
+        {"name": "app", "version": "1.0.0"},
+        {"image": {"repository": "nginx", "tag": "1.25"}},
+    )
+    override = tmp_path / "prod.yaml"
+    override.write_text("image:\n  tag: '1.27'\n")
+
+    assert extract_images_from_values(chart_dir, [override]) == [
+        "docker.io/library/nginx:1.27"
+    ]
+
+
+def test_subchart_values_alias_and_condition(tmp_path: Path) -> None:
+    chart_dir = _write_chart(
+        tmp_path / "app",
+        {
+            "name": "app",
+            "version": "1.0.0",
+            "dependencies": [
+                {"name": "redis", "version": "17.0.0", "alias": "cache"},
+                {"name": "postgres", "version": "12.0.0", "condition": "db.enabled"},
+            ],
+        },
+        {
+            "cache": {"image": {"tag": "7.2"}},
+            "db": {"enabled": False},
+        },
+    )
+    _write_chart(
+        chart_dir / "charts" / "redis",
+        {"name": "redis", "version": "17.0.0"},
+        {"image": {"repository": "redis", "tag": "7.0"}},
+    )
+    _write_chart(
+        chart_dir / "charts" / "postgres",
+        {"name": "postgres", "version": "12.0.0"},
+        {"image": {"repository": "postgres", "tag": "16"}},
+    )
+
+    charts = [chart["chart"] for chart in iter_chart_values(chart_dir)]
+
+    assert charts == ["app", "app/charts/cache"]
+    assert extract_images_from_values(chart_dir) == ["docker.io/library/redis:7.2"]
+
+
+def test_subchart_archive_is_read_without_extracting(tmp_path: Path) -> None:
+    chart_dir = _write_chart(
+        tmp_path / "app",
+        {"name": "app", "version": "1.0.0"},
+        {"global": {"imageRegistry": "mirror.local"}},
+    )
+    (chart_dir / "charts").mkdir()
+    _chart_archive(
+        chart_dir / "charts" / "common-1.0.0.tgz",
+        "common",
+        {"image": {"repository": "bitnami/common", "tag": "2.0"}},
+    )
+
+    assert extract_images_from_values(chart_dir, normalize=False) == [
+        "bitnami/common:2.0"
+    ]
+    sub = list(iter_chart_values(chart_dir))[1]
+    assert sub["values"]["global"] == {"imageRegistry": "mirror.local"}
+    assert not (chart_dir / "charts" / "common").exists()
+
+
+def test_diff_image_sets() -> None:
+    assert diff_image_sets(["a:1", "b:1"], ["b:1", "c:1"]) == {
+        "common": ["b:1"],
+        "values_only": ["a:1"],
+        "render_only": ["c:1"],
+    }
+
+
+def test_extract_images_values_only_skips_helm(tmp_path: Path) -> None:
+    chart_dir = _write_chart(
+        tmp_path / "app",
+        {"name": "app", "version": "1.0.0"},
+        {"image": {"repository": "nginx", "tag": "1.25"}},
+    )
+
+    with mock.patch("cli_onprem.services.helm.check_helm_installed") as mock_check:
+        with mock.patch("cli_onprem.services.helm.render_template") as mock_render:
+            result = runner.invoke(
+                app,
+                [
+                    "helm-local",
+                    "extract-images",
+                    str(chart_dir),
+                    "--values-only",
+                    "--no-cache",
+                ],
+            )
+
+    assert result.exit_code == 0, result.stderr
+    assert result.stdout.split() == ["docker.io/library/nginx:1.25"]
+    mock_check.assert_not_called()
+    mock_render.assert_not_called()
+
+
+def test_extract_images_values_diff(tmp_path: Path) -> None:
+    chart_dir = _write_chart(
+        tmp_path / "app",
+        {"name": "app", "version": "1.0.0"},
+        {"image": {"repository": "nginx", "tag": "1.25"}},
+    )
+    rendered = "image: nginx:1.25\n---\nimage: busybox:1.36\n"
+
+    with mock.patch("cli_onprem.services.helm.check_helm_installed"):
+        with mock.patch("cli_onprem.services.helm.update_dependencies"):
+            with mock.patch(
+                "cli_onprem.services.helm.render_template", return_value=rendered
+            ):
+                result = runner.invoke(
+                    app,
+                    [
+                        "helm-local",
+                        "extract-images",
+                        str(chart_dir),
+                        "--values-diff",
+                        "--json",
+                        "--no-cache",
+                    ],
+                )
+
+    assert result.exit_code == 1
+    assert json.loads(result.stdout) == {
+        "common": ["docker.io/library/nginx:1.25"],
+        "values_only": [],
+        "render_only": ["docker.io/library/busybox:1.36"],
+    }
+    assert "렌더링에만 1개(+)" in result.stderr
@@ -0,0 +1,128 @@
+"""자동완성 후보 디스크 캐시 테스트."""
+
+from pathlib import Path
+from typing import List, Sequence
+from unittest import mock
+
+import pytest
+from typer.testing import CliRunner
+
+from cli_onprem.__main__ import app
+from cli_onprem.commands.s3_share import complete_bucket
+from cli_onprem.services.completion_cache import CompletionCache, cached_completions
+
+runner = CliRunner()
+
+CREDENTIALS = """
+test-profile:
+  aws_access_key: key
+  aws_secret_key: secret
+  region: us-east-1
+"""
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cached_completions_miss_fresh_and_stale(tmp_path: Path) -> None:
+    clock = _Clock()
+    cache = CompletionCache(tmp_path, ttl=60, clock=clock)
+    fetch = mock.Mock(return_value=["bucket-a"])
+    spawned: List[Sequence[str]] = []
+
+    def _complete() -> List[str]:
+        return cached_completions(
+            "buckets", "default", "", fetch, ["refresh"], cache, spawned.append
+        )
+
+    assert _complete() == ["bucket-a"]
+    clock.now += 30
+    assert _complete() == ["bucket-a"]
+    assert fetch.call_count == 1
+    assert spawned == []
+
+    # TTL이 지나면 이전 후보를 그대로 반환하고 백그라운드 갱신은 한 번만 시작
+    clock.now += 60
+    assert _complete() == ["bucket-a"]
+    assert _complete() == ["bucket-a"]
+    assert fetch.call_count == 1
+    assert spawned == [["refresh"]]
+
+
+def test_cached_completions_does_not_store_failures(tmp_path: Path) -> None:
+    cache = CompletionCache(tmp_path)
+    failing = mock.Mock(side_effect=RuntimeError("network"))
+
+    with pytest.raises(RuntimeError):
+        cached_completions("buckets", "default", "", failing, [], cache)
+    assert cache.get("buckets", "default", "") is None
+
+
+def test_cache_is_scoped_by_profile_and_bucket(tmp_path: Path) -> None:
+    cache = CompletionCache(tmp_path)
+    cache.put("prefixes", "dev", "bucket-a/", ["logs/"])
+
+    assert cache.get("prefixes", "dev", "bucket-a/") == (["logs/"], True)
+    assert cache.get("prefixes", "prod", "bucket-a/") is None
+    assert cache.get("prefixes", "dev", "bucket-b/") is None
+
+
+def test_refresh_lock_expires(tmp_path: Path) -> None:
+    clock = _Clock()
+    cache = CompletionCache(tmp_path, clock=clock)
+
+    assert cache.claim_refresh("buckets", "default", "")
+    assert not cache.claim_refresh("buckets", "default", "")
+    clock.now += 3600
+    assert cache.claim_refresh("buckets", "default", "")
+
+    cache.refresh("buckets", "default", "", lambda: ["bucket-a"])
+    assert cache.claim_refresh("buckets", "default", "")
+
+
+def test_complete_bucket_served_from_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("CLI_ONPREM_CONFIG_DIR", str(tmp_path))
+    (tmp_path / "credential.yaml").write_text(CREDENTIALS)
+
+    with mock.patch("boto3.client") as mock_client:
+        mock_client.return_value.list_buckets.return_value = {
+            "Buckets": [{"Name": "my-bucket"}, {"Name": "other"}]
+        }
+        assert complete_bucket("my") == ["my-bucket"]
+        assert complete_bucket("o") == ["other"]
+
+    mock_client.assert_called_once()
+
+
+def test_refresh_completion_command(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("CLI_ONPREM_CONFIG_DIR", str(tmp_path))
+    (tmp_path / "credential.yaml").write_text(CREDENTIALS)
+
+    with mock.patch("boto3.client") as mock_client:
+        mock_client.return_value.list_buckets.return_value = {
+            "Buckets": [{"Name": "fresh-bucket"}]
+        }
+        result = runner.invoke(
+            app,
+            [
+                "s3-share",
+                "refresh-completion",
+                "buckets",
+                "",
+                "--profile",
+                "test-profile",
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    cached = CompletionCache().get("buckets", "test-profile", "")
+    assert cached == (["fresh-bucket"], True)
@@ -1,6 +1,16 @@
 """Docker 에러 파싱 테스트."""
 
-from cli_onprem.services.docker import _is_retryable_error, _parse_docker_error
+import subprocess
+from unittest import mock
+
+import pytest
+
+from cli_onprem.core.errors import TransientError
+from cli_onprem.services.docker import (
+    _is_retryable_error,
+    _parse_docker_error,
+    pull_image,
+)
 
 
 def test_parse_auth_error():
@@ -156,3 +166,20 @@ def test_case_insensitive_matching():
 
     assert _is_retryable_error(stderr_upper) is True
     assert _is_retryable_error(stderr_mixed) is True
+
+
+def test_docker_hub_rate_limit_is_transient():
+    """Docker Hub 레이트 리밋(toomanyrequests)은 TransientError로 올라온다."""
+    stderr = (
+        "Error response from daemon: toomanyrequests: You have reached your pull "
+        "rate limit. You may increase the limit by authenticating and upgrading: "
+        "https://www.docker.com/increase-rate-limit"
+    )
+    assert _is_retryable_error(stderr) is True
+    assert _is_retryable_error("unexpected status code 429") is True
+
+    error = subprocess.CalledProcessError(1, ["docker", "pull"], stderr=stderr)
+    with mock.patch("cli_onprem.services.docker._run_pull", side_effect=error):
+        with pytest.raises(TransientError) as exc_info:
+            pull_image("nginx:1.25", max_retries=0)
+    assert exc_info.value.stderr == stderr
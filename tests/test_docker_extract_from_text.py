@@ -6,6 +6,7 @@ from unittest.mock import patch
 from cli_onprem.services.docker import (
     extract_images_from_text,
     extract_images_from_yaml,
+    get_image_scanner,
 )
 
 
@@ -211,3 +212,55 @@ spec:
         assert result == {
             "quay.io/prometheus-operator/prometheus-config-reloader:v0.81.0"
         }
+
+
+class TestImageScanner:
+    """ImageScanner 캐시와 청크 스캔 테스트."""
+
+    TEXT = (
+        "containers:\n"
+        "  - image: docker.io/nginx:1.21\n"
+        '    args: ["--sidecar=quay.io/org/sidecar:v2", "ghcr.io/org/app"]\n'
+        "  - image: gcr.io/proj/tool@sha256:" + "ab" * 32 + "\n"
+    )
+    EXPECTED = {
+        "docker.io/nginx:1.21",
+        "quay.io/org/sidecar:v2",
+        "ghcr.io/org/app:latest",
+        "gcr.io/proj/tool@sha256:" + "ab" * 32,
+    }
+
+    def test_scanner_cached_by_registries(self):
+        """같은 레지스트리 조합이면 같은 스캐너를 재사용."""
+        assert get_image_scanner(["a.io", "b.io"]) is get_image_scanner(
+            ("a.io", "b.io")
+        )
+        assert get_image_scanner(["a.io"]) is not get_image_scanner(["b.io"])
+        assert get_image_scanner() is get_image_scanner()
+
+    def test_env_registries_change_scanner(self):
+        """환경변수가 바뀌면 다른 스캐너를 사용."""
+        default = get_image_scanner()
+        with patch.dict(os.environ, {"CLI_ONPREM_REGISTRIES": "custom.io"}):
+            custom = get_image_scanner()
+        assert custom is not default
+        assert "custom.io" in custom.registries
+
+    def test_adjacent_images_separated_by_space(self):
+        """공백 하나로 구분된 인접 이미지도 모두 찾는다."""
+        result = extract_images_from_text("docker.io/a:1 docker.io/b:2")
+        assert result == {"docker.io/a:1", "docker.io/b:2"}
+
+    def test_scan_chunks_matches_full_scan(self):
+        """어느 위치에서 잘라도 청크 스캔 결과는 전체 스캔과 같다."""
+        scanner = get_image_scanner()
+        assert scanner.scan(self.TEXT) == self.EXPECTED
+
+        for size in (1, 3, 7, 16, 50):
+            chunks = [self.TEXT[i : i + size] for i in range(0, len(self.TEXT), size)]
+            assert scanner.scan_chunks(chunks) == self.EXPECTED
+
+    def test_scan_chunks_lines(self):
+        """줄 단위 이터레이터를 그대로 받는다."""
+        lines = self.TEXT.splitlines(keepends=True)
+        assert get_image_scanner().scan_chunks(iter(lines)) == self.EXPECTED
@@ -218,3 +218,109 @@ def test_docker_cli_not_installed() -> None:
 
             assert result.exit_code == 1
             assert "Docker CLI가 설치되어 있지 않습니다" in result.output
+
+
+def test_save_multiple_platforms(tmp_path: Path) -> None:
+    """여러 플랫폼은 병렬 pull 후 플랫폼별 파일로 저장된다."""
+    with mock.patch("cli_onprem.commands.docker_tar._check_docker_cli"):
+        with mock.patch("cli_onprem.commands.docker_tar.pull_platforms") as mock_pull:
+            with mock.patch("cli_onprem.commands.docker_tar.pull_image") as mock_tag:
+                with mock.patch(
+                    "cli_onprem.commands.docker_tar.save_image"
+                ) as mock_save:
+                    result = runner.invoke(
+                        app,
+                        [
+                            "docker-tar",
+                            "save",
+                            "nginx:1.25",
+                            "--arch",
+                            "linux/amd64,linux/arm64",
+                            "--destination",
+                            str(tmp_path),
+                        ],
+                    )
+
+    assert result.exit_code == 0, result.output
+    mock_pull.assert_called_once_with(
+        "nginx:1.25", ["linux/amd64", "linux/arm64"], on_progress=None
+    )
+    assert [c.kwargs["arch"] for c in mock_tag.call_args_list] == [
+        "linux/amd64",
+        "linux/arm64",
+    ]
+    assert [c.args[1] for c in mock_save.call_args_list] == [
+        str(tmp_path / "nginx__1.25__amd64.tar"),
+        str(tmp_path / "nginx__1.25__arm64.tar"),
+    ]
+
+
+def test_save_multiple_platforms_oci_index(tmp_path: Path) -> None:
+    """--oci-index는 하나의 인덱스 아카이브로 합친다."""
+    with mock.patch("cli_onprem.commands.docker_tar._check_docker_cli"):
+        with mock.patch("cli_onprem.commands.docker_tar.pull_platforms"):
+            with mock.patch("cli_onprem.commands.docker_tar.pull_image"):
+                with mock.patch("cli_onprem.commands.docker_tar.save_image"):
+                    with mock.patch(
+                        "cli_onprem.services.image_archive.merge_to_oci_index",
+                        return_value=3,
+                    ) as mock_merge:
+                        result = runner.invoke(
+                            app,
+                            [
+                                "docker-tar",
+                                "save",
+                                "nginx:1.25",
+                                "--arch",
+                                "linux/amd64",
+                                "--arch",
+                                "linux/arm64",
+                                "--oci-index",
+                                "-d",
+                                str(tmp_path),
+                            ],
+                        )
+
+    assert result.exit_code == 0, result.output
+    archives, output, reference = mock_merge.call_args.args
+    assert [platform for platform, _ in archives] == ["linux/amd64", "linux/arm64"]
+    assert output == tmp_path / "nginx__1.25__amd64-arm64.tar"
+    assert reference == "nginx:1.25"
+
+
+def test_save_multiple_platforms_rejects_stdout() -> None:
+    """여러 플랫폼과 --stdout은 함께 쓸 수 없다."""
+    result = runner.invoke(
+        app,
+        [
+            "docker-tar",
+            "save",
+            "nginx",
+            "--arch",
+            "linux/amd64,linux/arm64",
+            "--stdout",
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert "단일 플랫폼" in result.output
+
+
+def test_pull_platforms_runs_each_platform() -> None:
+    """pull_platforms는 플랫폼마다 pull_image를 호출하고 오류를 전달한다."""
+    from cli_onprem.core.errors import PermanentError
+    from cli_onprem.services.docker import pull_platforms
+
+    with mock.patch("cli_onprem.services.docker.pull_image") as mock_pull:
+        pull_platforms("nginx", ["linux/amd64", "linux/arm64"])
+        assert sorted(c.args[1] for c in mock_pull.call_args_list) == [
+            "linux/amd64",
+            "linux/arm64",
+        ]
+
+        mock_pull.side_effect = [None, PermanentError("denied")]
+        try:
+            pull_platforms("nginx", ["linux/amd64", "linux/arm64"], max_workers=1)
+            raise AssertionError("Expected PermanentError")
+        except PermanentError as e:
+            assert "denied" in str(e)
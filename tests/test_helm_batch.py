@@ -0,0 +1,146 @@
+"""helm-local extract-images-batch 테스트."""
+
+import json
+import pathlib
+import subprocess
+import threading
+import time
+from typing import Any, Callable, List
+
+import pytest
+from typer.testing import Result
+
+from cli_onprem.commands.helm_local import _expand_chart_paths
+
+
+def _make_charts(root: pathlib.Path) -> List[pathlib.Path]:
+    root.mkdir()
+    for name in ("api", "web", "broken"):
+        (root / f"{name}-1.0.0.tgz").write_bytes(name.encode())
+    (root / "README.md").write_text("not a chart")
+    return sorted(root.glob("*.tgz"))
+
+
+def _fake_render(chart_root: pathlib.Path, values: object) -> str:
+    name = chart_root.name.split("-")[0]
+    if name == "broken":
+        raise subprocess.CalledProcessError(1, ["helm", "template"], stderr="bad")
+    return f"image: {name}:1.0\n---\nimage: redis:7\n"
+
+
+def test_expand_chart_paths(tmp_path: pathlib.Path) -> None:
+    """차트가 아닌 디렉토리는 안의 .tgz와 차트 디렉토리로 펼친다."""
+    archives = _make_charts(tmp_path / "charts")
+    chart_dir = tmp_path / "charts" / "local"
+    chart_dir.mkdir()
+    (chart_dir / "Chart.yaml").write_text("name: local\n")
+
+    expanded = _expand_chart_paths([tmp_path / "charts", archives[0]])
+
+    assert expanded == sorted([*archives, chart_dir])
+
+
+@pytest.fixture(autouse=True)
+def _render(fake_helm: Any) -> None:
+    fake_helm.render.side_effect = _fake_render
+
+
+def test_batch_merges_and_reports_per_chart(
+    tmp_path: pathlib.Path,
+    invoke_helm_local: Callable[..., Result],
+) -> None:
+    """차트별 결과를 합치고 실패는 따로 보고한다."""
+    _make_charts(tmp_path / "charts")
+
+    result = invoke_helm_local(
+        "extract-images-batch", str(tmp_path / "charts"), "--per-chart"
+    )
+
+    assert result.exit_code == 1
+    report = json.loads(result.stdout)
+    assert report["images"] == [
+        "docker.io/library/api:1.0",
+        "docker.io/library/redis:7",
+        "docker.io/library/web:1.0",
+    ]
+    assert report["charts"][str(tmp_path / "charts" / "web-1.0.0.tgz")] == [
+        "docker.io/library/redis:7",
+        "docker.io/library/web:1.0",
+    ]
+    assert list(report["failures"]) == [str(tmp_path / "charts" / "broken-1.0.0.tgz")]
+    assert "실패:" in result.stderr
+    assert "2/3개 차트에서 3개 이미지 추출" in result.stderr
+
+
+def test_batch_plain_output(
+    tmp_path: pathlib.Path,
+    invoke_helm_local: Callable[..., Result],
+) -> None:
+    """기본 출력은 중복 없는 정렬된 이미지 목록이다."""
+    charts = tmp_path / "charts"
+    charts.mkdir()
+    for name in ("api", "web"):
+        (charts / f"{name}-1.0.0.tgz").write_bytes(b"x")
+
+    result = invoke_helm_local("extract-images-batch", str(charts), "--quiet")
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.split() == [
+        "docker.io/library/api:1.0",
+        "docker.io/library/redis:7",
+        "docker.io/library/web:1.0",
+    ]
+
+
+def test_batch_renders_in_parallel(
+    tmp_path: pathlib.Path,
+    fake_helm: Any,
+    invoke_helm_local: Callable[..., Result],
+) -> None:
+    """--workers 만큼 차트를 동시에 렌더링한다."""
+    charts = tmp_path / "charts"
+    charts.mkdir()
+    for i in range(4):
+        (charts / f"app{i}-1.0.0.tgz").write_bytes(b"x")
+
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def slow_render(chart_root: pathlib.Path, values: object) -> str:
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.1)
+        with lock:
+            active["now"] -= 1
+        return "image: nginx:1.25\n"
+
+    fake_helm.render.side_effect = slow_render
+    result = invoke_helm_local(
+        "extract-images-batch",
+        str(charts),
+        "--workers",
+        "2",
+        "--skip-dependency-update",
+        "--json",
+    )
+
+    assert result.exit_code == 0, result.stderr
+    assert json.loads(result.stdout) == ["docker.io/library/nginx:1.25"]
+    assert active["peak"] == 2
+
+
+@pytest.mark.parametrize("args", [[], ["--per-chart"]])
+def test_batch_without_charts(
+    tmp_path: pathlib.Path,
+    args: List[str],
+    invoke_helm_local: Callable[..., Result],
+) -> None:
+    """처리할 차트가 없으면 오류로 종료한다."""
+    empty = tmp_path / "empty"
+    empty.mkdir()
+
+    result = invoke_helm_local("extract-images-batch", str(empty), *args)
+
+    assert result.exit_code == 1
+    assert "처리할 차트가 없습니다" in result.stdout + result.stderr
@@ -0,0 +1,173 @@
+"""helm-local export-images(차트 → 이미지 tar 파이프라인) 테스트."""
+
+import contextlib
+import pathlib
+import subprocess
+import tarfile
+from typing import Any, Callable, List, Tuple
+from unittest import mock
+
+import pytest
+from typer.testing import Result
+
+from cli_onprem.core.errors import PermanentError
+from cli_onprem.services.pull_scheduler import PullScheduler
+
+MANIFESTS = {
+    "web": "image: nginx:1.25\n---\nimage: redis:7\n",
+    "api": "image: quay.io/org/api:2.0\n---\nimage: redis:7\n",
+}
+
+
+def _fake_render(chart_root: pathlib.Path, values: List[pathlib.Path]) -> str:
+    if chart_root.name == "broken":
+        raise subprocess.CalledProcessError(1, ["helm", "template"], stderr="bad")
+    return MANIFESTS[chart_root.name]
+
+
+def _fake_save(reference: str, output_path: str) -> None:
+    pathlib.Path(output_path).write_text(reference)
+
+
+@pytest.fixture(autouse=True)
+def _render(fake_helm: Any) -> None:
+    fake_helm.render.side_effect = _fake_render
+
+
+def _invoke(
+    invoke_helm_local: Callable[..., Result], args: List[str], pull: Any = None
+) -> Tuple[Result, mock.MagicMock, mock.MagicMock, mock.MagicMock]:
+    pull = pull or mock.Mock()
+    with contextlib.ExitStack() as stack:
+        for target in (
+            "cli_onprem.services.docker.check_docker_installed",
+            "cli_onprem.services.docker.check_docker_daemon",
+        ):
+            stack.enter_context(mock.patch(target))
+        mock_scheduler = stack.enter_context(
+            mock.patch(
+                "cli_onprem.commands.helm_local.PullScheduler",
+                side_effect=lambda **kwargs: PullScheduler(pull=pull, **kwargs),
+            )
+        )
+        mock_save = stack.enter_context(
+            mock.patch("cli_onprem.services.docker.save_image", side_effect=_fake_save)
+        )
+        result = invoke_helm_local(
+            "export-images",
+            "--skip-dependency-update",
+            "--registry-rate",
+            "0",
+            *args,
+        )
+    return result, pull, mock_save, mock_scheduler
+
+
+def test_export_images_dedupes_and_skips_existing(
+    tmp_path: pathlib.Path,
+    make_chart: Callable[..., pathlib.Path],
+    invoke_helm_local: Callable[..., Result],
+) -> None:
+    charts = tmp_path / "charts"
+    make_chart("web", charts)
+    make_chart("api", charts)
+    dest = tmp_path / "out"
+    dest.mkdir()
+    (dest / "nginx__1.25__amd64.tar").write_text("already exported")
+
+    result, pull, _, _ = _invoke(invoke_helm_local, [str(charts), "-d", str(dest)])
+
+    assert result.exit_code == 0, result.stderr
+    assert sorted(c.args[0] for c in pull.call_args_list) == [
+        "docker.io/library/redis:7",
+        "quay.io/org/api:2.0",
+    ]
+    assert sorted(p.name for p in dest.glob("*.tar")) == [
+        "nginx__1.25__amd64.tar",
+        "quay.io__org__api__2.0__amd64.tar",
+        "redis__7__amd64.tar",
+    ]
+    assert not list(dest.glob("*.part"))
+    assert (dest / "images.txt").read_text().split() == [
+        "docker.io/library/nginx:1.25",
+        "docker.io/library/redis:7",
+        "quay.io/org/api:2.0",
+    ]
+    assert "이미지 3개 중 2개 저장, 1개 건너뜀" in result.stderr
+
+
+def test_export_images_writes_bundle(
+    tmp_path: pathlib.Path,
+    make_chart: Callable[..., pathlib.Path],
+    invoke_helm_local: Callable[..., Result],
+) -> None:
+    chart = make_chart("web")
+    dest = tmp_path / "out"
+    bundle = tmp_path / "images.tar.gz"
+
+    result, _, _, _ = _invoke(
+        invoke_helm_local, [str(chart), "-d", str(dest), "--bundle", str(bundle)]
+    )
+
+    assert result.exit_code == 0, result.stderr
+    with tarfile.open(bundle) as tar:
+        assert sorted(tar.getnames()) == [
+            "out",
+            "out/images.txt",
+            "out/nginx__1.25__amd64.tar",
+            "out/redis__7__amd64.tar",
+        ]
+
+
+def test_export_images_reports_chart_and_pull_failures(
+    tmp_path: pathlib.Path,
+    make_chart: Callable[..., pathlib.Path],
+    invoke_helm_local: Callable[..., Result],
+) -> None:
+    charts = tmp_path / "charts"
+    make_chart("web", charts)
+    make_chart("broken", charts)
+    dest = tmp_path / "out"
+
+    def _pull(reference: str, arch: str, **_: Any) -> None:
+        if "redis" in reference:
+            raise PermanentError("이미지를 찾을 수 없습니다")
+
+    result, _, mock_save, _ = _invoke(
+        invoke_helm_local,
+        [str(charts), "-d", str(dest), "--bundle", str(tmp_path / "b.tgz")],
+        pull=mock.Mock(side_effect=_pull),
+    )
+
+    assert result.exit_code == 1
+    assert "broken" in result.stderr
+    assert "실패: docker.io/library/redis:7 (pull 단계)" in result.stderr
+    assert [c.args[0] for c in mock_save.call_args_list] == [
+        "docker.io/library/nginx:1.25"
+    ]
+    assert not (tmp_path / "b.tgz").exists()
+
+
+def test_export_images_passes_scheduler_options(
+    make_chart: Callable[..., pathlib.Path],
+    invoke_helm_local: Callable[..., Result],
+) -> None:
+    chart = make_chart("web")
+
+    result, _, _, mock_scheduler = _invoke(
+        invoke_helm_local,
+        [
+            str(chart),
+            "-d",
+            str(chart.parent / "out"),
+            "--registry-concurrency",
+            "3",
+            "--max-retries",
+            "1",
+        ],
+    )
+
+    assert result.exit_code == 0, result.stderr
+    mock_scheduler.assert_called_once_with(
+        registry_concurrency=3, registry_rate=0.0, max_retries=1
+    )
@@ -2,6 +2,7 @@
 
 import pathlib
 import subprocess
+import tarfile
 import tempfile
 from unittest import mock
 
@@ -127,25 +128,20 @@ spec:
 def test_extract_chart() -> None:
     """Test extracting a chart archive."""
     with tempfile.TemporaryDirectory() as tmpdir:
-        dest_dir = pathlib.Path(tmpdir)
-
-        with mock.patch("tarfile.open") as mock_open:
-            mock_tarfile = mock.MagicMock()
-            mock_open.return_value.__enter__.return_value = mock_tarfile
-
-            chart_root = mock.MagicMock(spec=pathlib.Path)
-
-            with mock.patch.object(pathlib.Path, "iterdir") as mock_iterdir:
-                mock_iterdir.return_value = [chart_root]
-
-                # Mock is_dir to return True for our chart_root
-                with mock.patch.object(pathlib.Path, "is_dir") as mock_is_dir:
-                    mock_is_dir.return_value = True
+        tmp_path = pathlib.Path(tmpdir)
+        source = tmp_path / "src" / "mychart"
+        (source / "templates").mkdir(parents=True)
+        (source / "Chart.yaml").write_text("name: mychart")
+        (source / "templates" / "deploy.yaml").write_text("kind: Deployment")
+        archive = tmp_path / "mychart-1.0.0.tgz"
+        with tarfile.open(archive, "w:gz") as tar:
+            tar.add(source, arcname="mychart")
 
-                    result = extract_chart(pathlib.Path("chart.tgz"), dest_dir)
+        dest_dir = tmp_path / "dest"
+        result = extract_chart(archive, dest_dir)
 
-                    assert result == chart_root
-                    mock_tarfile.extractall.assert_called_once_with(dest_dir)
+        assert result == dest_dir / "mychart"
+        assert (result / "templates" / "deploy.yaml").read_text() == "kind: Deployment"
 
 
 def test_prepare_chart_with_directory() -> None:
@@ -195,8 +191,7 @@ def test_helm_dependency_update() -> None:
         mock_run.assert_called_once_with(
             ["helm", "dependency", "update", str(chart_dir)],
             check=False,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
+            capture_output=True,
             timeout=MEDIUM_TIMEOUT,
         )
 
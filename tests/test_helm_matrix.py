@@ -0,0 +1,137 @@
+"""helm-local extract-images-matrix 테스트."""
+
+import json
+import pathlib
+import subprocess
+from typing import Any, Callable, List
+
+import pytest
+from typer.testing import Result
+
+from cli_onprem.services.helm import build_values_matrix
+
+
+def _values(root: pathlib.Path, *names: str) -> List[pathlib.Path]:
+    root.mkdir(exist_ok=True)
+    paths = []
+    for name in names:
+        path = root / f"{name}.yaml"
+        path.write_text(f"env: {name}\n")
+        paths.append(path)
+    return paths
+
+
+def test_build_values_matrix_cartesian_product(tmp_path: pathlib.Path) -> None:
+    base = tmp_path / "base.yaml"
+    dev, prod = _values(tmp_path, "dev", "prod")
+    us, eu = _values(tmp_path, "us", "eu")
+
+    combinations = build_values_matrix(
+        [("env", [dev, prod]), ("region", [us, eu])], [base]
+    )
+
+    assert [c["name"] for c in combinations] == [
+        "env=dev/region=us",
+        "env=dev/region=eu",
+        "env=prod/region=us",
+        "env=prod/region=eu",
+    ]
+    assert combinations[3]["values"] == [base, prod, eu]
+
+
+def test_build_values_matrix_without_axes(tmp_path: pathlib.Path) -> None:
+    base = tmp_path / "base.yaml"
+    assert build_values_matrix([], [base]) == [{"name": "default", "values": [base]}]
+
+
+def test_build_values_matrix_rejects_duplicate_axis(tmp_path: pathlib.Path) -> None:
+    dev, prod = _values(tmp_path, "dev", "prod")
+    with pytest.raises(ValueError, match="env"):
+        build_values_matrix([("env", [dev]), ("env", [prod])])
+
+
+def _fake_render(chart_root: pathlib.Path, values: List[pathlib.Path]) -> str:
+    names = [path.stem for path in values]
+    if "broken" in names:
+        raise subprocess.CalledProcessError(1, ["helm", "template"], stderr="bad")
+    return "\n---\n".join(f"image: app-{name}:1.0" for name in names) + (
+        "\n---\nimage: redis:7\n"
+    )
+
+
+@pytest.fixture(autouse=True)
+def _render(fake_helm: Any) -> None:
+    fake_helm.render.side_effect = _fake_render
+
+
+def test_matrix_per_combination_and_union(
+    tmp_path: pathlib.Path,
+    fake_helm: Any,
+    make_chart: Callable[..., pathlib.Path],
+    invoke_helm_local: Callable[..., Result],
+) -> None:
+    chart = make_chart()
+    dev, prod = _values(tmp_path / "env", "dev", "prod")
+    us, eu = _values(tmp_path / "region", "us", "eu")
+
+    result = invoke_helm_local(
+        "extract-images-matrix",
+        str(chart),
+        "--axis",
+        f"env={dev},{prod}",
+        "--axis",
+        f"region={us},{eu}",
+        "--per-combination",
+    )
+
+    assert result.exit_code == 0, result.stderr
+    fake_helm.prepare.assert_called_once()
+    report = json.loads(result.stdout)
+    assert list(report["combinations"]) == [
+        "env=dev/region=us",
+        "env=dev/region=eu",
+        "env=prod/region=us",
+        "env=prod/region=eu",
+    ]
+    assert report["combinations"]["env=prod/region=eu"]["images"] == [
+        "docker.io/library/app-eu:1.0",
+        "docker.io/library/app-prod:1.0",
+        "docker.io/library/redis:7",
+    ]
+    assert len(report["images"]) == 5
+    assert report["failures"] == {}
+    assert "4/4개 조합에서 5개 이미지 추출" in result.stderr
+
+
+def test_matrix_reports_failed_combination(
+    tmp_path: pathlib.Path,
+    make_chart: Callable[..., pathlib.Path],
+    invoke_helm_local: Callable[..., Result],
+) -> None:
+    chart = make_chart()
+    dev, broken = _values(tmp_path / "env", "dev", "broken")
+
+    result = invoke_helm_local(
+        "extract-images-matrix", str(chart), "--axis", f"env={dev},{broken}"
+    )
+
+    assert result.exit_code == 1
+    assert result.stdout.split() == [
+        "docker.io/library/app-dev:1.0",
+        "docker.io/library/redis:7",
+    ]
+    assert "실패: env=broken" in result.stderr
+
+
+def test_matrix_rejects_malformed_axis(
+    make_chart: Callable[..., pathlib.Path],
+    invoke_helm_local: Callable[..., Result],
+) -> None:
+    chart = make_chart()
+
+    result = invoke_helm_local(
+        "extract-images-matrix", str(chart), "--axis", "missing-equals.yaml"
+    )
+
+    assert result.exit_code == 1
+    assert "values 축 형식" in result.stdout + result.stderr
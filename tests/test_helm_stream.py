@@ -0,0 +1,166 @@
+"""helm template 출력 스트리밍 이미지 추출 테스트."""
+
+import pathlib
+import sys
+import time
+from typing import Iterator, List
+from unittest import mock
+
+from typer.testing import CliRunner
+
+from cli_onprem.__main__ import app
+from cli_onprem.services.docker import (
+    extract_images_from_documents,
+    extract_images_from_yaml,
+    iter_images_from_documents,
+)
+from cli_onprem.services.helm import stream_template
+from cli_onprem.utils.shell import iter_command_lines
+
+runner = CliRunner()
+
+RENDERED_LINES = [
+    "---",
+    "# Source: app/templates/deployment.yaml",
+    "apiVersion: apps/v1",
+    "kind: Deployment",
+    "spec:",
+    "  template:",
+    "    spec:",
+    "      containers:",
+    "        - image: nginx:1.25",
+    "          args: ['--sidecar=quay.io/org/sidecar:v2']",
+    "--- # Source: app/templates/empty.yaml",
+    "---",
+    "# Source: app/templates/job.yaml",
+    "kind: Job",
+    "spec:",
+    "  template:",
+    "    spec:",
+    "      containers:",
+    "        - image: busybox",
+    "        - image: nginx:1.25",
+]
+
+
+def test_iter_command_lines_yields_before_exit() -> None:
+    """명령이 끝나기 전에 출력된 줄을 바로 받는다."""
+    script = "import time; print('first', flush=True); time.sleep(3); print('second')"
+    started = time.monotonic()
+    lines = iter_command_lines([sys.executable, "-c", script])
+
+    assert next(lines) == "first"
+    assert time.monotonic() - started < 2.5
+
+    # 중간에 닫으면 프로세스를 종료하고 바로 돌아온다
+    lines.close()
+    assert time.monotonic() - started < 2.5
+
+
+def test_stream_template_splits_documents(tmp_path: pathlib.Path) -> None:
+    """구분선 기준으로 문서를 나누고 빈 문서는 건너뛴다."""
+    with mock.patch(
+        "cli_onprem.services.helm.shell.iter_command_lines",
+        return_value=iter(RENDERED_LINES),
+    ) as mock_iter:
+        documents = list(stream_template(tmp_path))
+
+    assert len(documents) == 2
+    assert documents[0].startswith("# Source: app/templates/deployment.yaml")
+    assert documents[1].endswith("- image: nginx:1.25")
+    cmd = mock_iter.call_args.args[0]
+    assert cmd[:4] == ["helm", "template", "dummy", str(tmp_path)]
+
+
+def test_iter_images_is_incremental() -> None:
+    """다음 문서를 읽기 전에 앞 문서의 이미지를 내보낸다."""
+    consumed: List[int] = []
+
+    def documents() -> Iterator[str]:
+        for index, image in enumerate(["nginx:1.25", "redis:7", "nginx:1.25"]):
+            consumed.append(index)
+            yield f"image: {image}"
+
+    found = iter_images_from_documents(documents())
+
+    assert next(found) == "docker.io/library/nginx:1.25"
+    assert consumed == [0]
+    assert list(found) == ["docker.io/library/redis:7"]
+
+
+def test_streamed_result_matches_whole_render() -> None:
+    """스트리밍 결과는 전체 문자열을 한 번에 처리한 결과와 같다."""
+    whole = "\n".join(RENDERED_LINES)
+    with mock.patch(
+        "cli_onprem.services.helm.shell.iter_command_lines",
+        return_value=iter(RENDERED_LINES),
+    ):
+        documents = stream_template(pathlib.Path("chart"))
+        streamed = extract_images_from_documents(documents)
+
+    assert streamed == extract_images_from_yaml(whole)
+    assert streamed == [
+        "docker.io/library/busybox:latest",
+        "docker.io/library/nginx:1.25",
+        "quay.io/org/sidecar:v2",
+    ]
+
+
+def test_extract_images_stream_option(tmp_path: pathlib.Path) -> None:
+    """--stream은 문서 스트림에서 발견한 이미지를 바로 출력한다."""
+    with mock.patch("cli_onprem.services.helm.check_helm_installed"):
+        with mock.patch(
+            "cli_onprem.services.helm.prepare_chart", return_value=tmp_path
+        ):
+            with mock.patch(
+                "cli_onprem.services.helm.stream_template",
+                return_value=iter(["image: nginx:1.25", "image: redis:7"]),
+            ):
+                with mock.patch(
+                    "cli_onprem.services.helm.render_template"
+                ) as mock_render:
+                    result = runner.invoke(
+                        app,
+                        [
+                            "helm-local",
+                            "extract-images",
+                            str(tmp_path),
+                            "--stream",
+                            "--skip-dependency-update",
+                            "--no-cache",
+                        ],
+                    )
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.split() == [
+        "docker.io/library/nginx:1.25",
+        "docker.io/library/redis:7",
+    ]
+    mock_render.assert_not_called()
+
+
+def test_extract_images_stream_no_images(tmp_path: pathlib.Path) -> None:
+    """스트리밍에서도 이미지가 없으면 종료 코드 1."""
+    with mock.patch("cli_onprem.services.helm.check_helm_installed"):
+        with mock.patch(
+            "cli_onprem.services.helm.prepare_chart", return_value=tmp_path
+        ):
+            with mock.patch(
+                "cli_onprem.services.helm.stream_template",
+                return_value=iter(["kind: ConfigMap"]),
+            ):
+                result = runner.invoke(
+                    app,
+                    [
+                        "helm-local",
+                        "extract-images",
+                        str(tmp_path),
+                        "--stream",
+                        "--json",
+                        "--skip-dependency-update",
+                        "--no-cache",
+                    ],
+                )
+
+    assert result.exit_code == 1
+    assert "이미지 필드를 찾을 수 없음" in result.output
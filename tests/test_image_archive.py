@@ -0,0 +1,338 @@
+"""이미지 아카이브(씬 내보내기/복원) 테스트."""
+
+import hashlib
+import io
+import json
+import tarfile
+from pathlib import Path
+from typing import Dict, List
+from unittest import mock
+
+import pytest
+from typer.testing import CliRunner
+
+from cli_onprem.__main__ import app
+from cli_onprem.core.errors import CommandError
+from cli_onprem.services.image_archive import (
+    THIN_METADATA_NAME,
+    LayoutImage,
+    collect_layer_digests,
+    create_thin_archive,
+    load_layer_list,
+    merge_to_oci_index,
+    read_archive_images,
+    read_thin_metadata,
+    restore_thin_archive,
+    write_layer_list,
+    write_layout_archive,
+)
+
+runner = CliRunner()
+
+
+def _digest(data: bytes) -> str:
+    return f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+
+def _add(tar: tarfile.TarFile, name: str, data: bytes) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    tar.addfile(info, io.BytesIO(data))
+
+
+def build_archive(path: Path, images: Dict[str, List[bytes]]) -> None:
+    """레거시 docker save 형식의 테스트 아카이브를 만듭니다."""
+    manifest = []
+    with tarfile.open(path, "w") as tar:
+        written = set()
+        for tag, layers in images.items():
+            layer_paths = []
+            for data in layers:
+                layer_id = hashlib.sha256(data).hexdigest()
+                layer_path = f"{layer_id}/layer.tar"
+                if layer_path not in written:
+                    _add(tar, layer_path, data)
+                    written.add(layer_path)
+                layer_paths.append(layer_path)
+
+            config = json.dumps(
+                {"rootfs": {"type": "layers", "diff_ids": [_digest(d) for d in layers]}}
+            ).encode()
+            config_path = f"{hashlib.sha256(config).hexdigest()}.json"
+            _add(tar, config_path, config)
+            manifest.append(
+                {"Config": config_path, "RepoTags": [tag], "Layers": layer_paths}
+            )
+
+        _add(tar, "manifest.json", json.dumps(manifest).encode())
+
+
+def test_read_archive_images(tmp_path: Path) -> None:
+    """아카이브의 이미지와 레이어 정보를 읽는다."""
+    archive = tmp_path / "app.tar"
+    build_archive(archive, {"app:1": [b"base", b"app-v1"]})
+
+    images = read_archive_images(archive)
+
+    assert len(images) == 1
+    assert images[0]["repo_tags"] == ["app:1"]
+    assert images[0]["diff_ids"] == [_digest(b"base"), _digest(b"app-v1")]
+
+
+def test_read_archive_images_invalid(tmp_path: Path) -> None:
+    """manifest.json이 없으면 CommandError."""
+    archive = tmp_path / "broken.tar"
+    with tarfile.open(archive, "w") as tar:
+        _add(tar, "other.txt", b"x")
+
+    with pytest.raises(CommandError, match="manifest.json"):
+        read_archive_images(archive)
+
+
+def test_layer_list_roundtrip(tmp_path: Path) -> None:
+    """레이어 목록 파일 쓰기/읽기."""
+    layer_file = tmp_path / "known.txt"
+    write_layer_list(["sha256:b", "sha256:a", "sha256:a"], layer_file)
+
+    assert layer_file.read_text() == "sha256:a\nsha256:b\n"
+
+    layer_file.write_text("# comment\n\nsha256:c\n")
+    assert load_layer_list(layer_file) == {"sha256:c"}
+
+
+def test_thin_archive_and_restore(tmp_path: Path) -> None:
+    """알려진 레이어를 생략한 뒤 이전 아카이브로 복원한다."""
+    previous = tmp_path / "app-v1.tar"
+    build_archive(previous, {"app:1": [b"base", b"app-v1"]})
+    current = tmp_path / "app-v2.tar"
+    build_archive(current, {"app:2": [b"base", b"app-v2"]})
+
+    known = collect_layer_digests([previous])
+    thin = tmp_path / "app-v2.thin.tar"
+    result = create_thin_archive(current, thin, known)
+
+    assert [layer["digest"] for layer in result["omitted"]] == [_digest(b"base")]
+    with tarfile.open(thin) as tar:
+        names = tar.getnames()
+    assert f"{hashlib.sha256(b'base').hexdigest()}/layer.tar" not in names
+    assert THIN_METADATA_NAME in names
+    assert read_thin_metadata(thin) == result["omitted"]
+
+    restored = tmp_path / "app-v2.full.tar"
+    assert restore_thin_archive(thin, [previous], restored) == 1
+
+    with tarfile.open(restored) as tar:
+        assert THIN_METADATA_NAME not in tar.getnames()
+    assert read_thin_metadata(restored) is None
+    assert read_archive_images(restored) == read_archive_images(current)
+
+
+def test_restore_missing_layer(tmp_path: Path) -> None:
+    """제공원에 레이어가 없으면 오류."""
+    current = tmp_path / "app.tar"
+    build_archive(current, {"app:2": [b"base", b"app-v2"]})
+    thin = tmp_path / "thin.tar"
+    create_thin_archive(current, thin, {_digest(b"base")})
+
+    unrelated = tmp_path / "other.tar"
+    build_archive(unrelated, {"other:1": [b"other"]})
+
+    with pytest.raises(CommandError, match=_digest(b"base")):
+        restore_thin_archive(thin, [unrelated], tmp_path / "out.tar")
+
+
+def test_restore_corrupted_layer(tmp_path: Path) -> None:
+    """제공원 레이어의 내용이 다이제스트와 다르면 오류."""
+    current = tmp_path / "app.tar"
+    build_archive(current, {"app:2": [b"base", b"app-v2"]})
+    thin = tmp_path / "thin.tar"
+    create_thin_archive(current, thin, {_digest(b"base")})
+
+    # diff_id는 base지만 실제 레이어 바이트가 다른 아카이브
+    corrupted = tmp_path / "corrupted.tar"
+    layer_path = f"{hashlib.sha256(b'base').hexdigest()}/layer.tar"
+    config = json.dumps({"rootfs": {"diff_ids": [_digest(b"base")]}}).encode()
+    with tarfile.open(corrupted, "w") as tar:
+        _add(tar, layer_path, b"evil")
+        _add(tar, "config.json", config)
+        _add(
+            tar,
+            "manifest.json",
+            json.dumps(
+                [{"Config": "config.json", "RepoTags": [], "Layers": [layer_path]}]
+            ).encode(),
+        )
+
+    output = tmp_path / "out.tar"
+    with pytest.raises(CommandError, match="무결성"):
+        restore_thin_archive(thin, [corrupted], output)
+    assert not output.exists()
+
+
+def test_restore_requires_thin_archive(tmp_path: Path) -> None:
+    """일반 아카이브는 복원 대상이 아니다."""
+    archive = tmp_path / "app.tar"
+    build_archive(archive, {"app:1": [b"base"]})
+
+    with pytest.raises(CommandError, match="씬 아카이브가 아닙니다"):
+        restore_thin_archive(archive, [archive], tmp_path / "out.tar")
+
+
+def test_layers_command(tmp_path: Path) -> None:
+    """layers 명령은 레이어 목록 파일을 생성한다."""
+    archive = tmp_path / "app.tar"
+    build_archive(archive, {"app:1": [b"base", b"app-v1"]})
+    output = tmp_path / "known.txt"
+
+    result = runner.invoke(
+        app, ["docker-tar", "layers", str(archive), "--output", str(output)]
+    )
+
+    assert result.exit_code == 0
+    assert load_layer_list(output) == {_digest(b"base"), _digest(b"app-v1")}
+
+
+def test_save_with_known_layers(tmp_path: Path) -> None:
+    """save --known-layers는 씬 아카이브를 생성한다."""
+    known_file = tmp_path / "known.txt"
+    write_layer_list([_digest(b"base")], known_file)
+    dest = tmp_path / "out"
+
+    def fake_save(reference: str, output_path: str, **kwargs: object) -> None:
+        build_archive(Path(output_path), {reference: [b"base", b"app-v2"]})
+
+    with mock.patch("cli_onprem.commands.docker_tar._check_docker_cli"):
+        with mock.patch("cli_onprem.commands.docker_tar.pull_image"):
+            with mock.patch(
+                "cli_onprem.commands.docker_tar.save_image", side_effect=fake_save
+            ):
+                result = runner.invoke(
+                    app,
+                    [
+                        "docker-tar",
+                        "save",
+                        "app:2",
+                        "--destination",
+                        str(dest),
+                        "--known-layers",
+                        str(known_file),
+                    ],
+                )
+
+    assert result.exit_code == 0, result.output
+    saved = dest / "app__2__amd64.tar"
+    omitted = read_thin_metadata(saved)
+    assert omitted is not None
+    assert [layer["digest"] for layer in omitted] == [_digest(b"base")]
+    assert list(dest.iterdir()) == [saved]
+
+
+def test_save_known_layers_with_stdout(tmp_path: Path) -> None:
+    """--known-layers와 --stdout은 함께 쓸 수 없다."""
+    known_file = tmp_path / "known.txt"
+    known_file.write_text("")
+
+    result = runner.invoke(
+        app,
+        ["docker-tar", "save", "app:2", "--stdout", "--known-layers", str(known_file)],
+    )
+
+    assert result.exit_code == 1
+    assert "--known-layers" in result.output
+
+
+def test_merge_to_oci_index(tmp_path: Path) -> None:
+    """플랫폼별 아카이브를 공유 레이어 한 번만 담은 OCI 인덱스로 합친다."""
+    amd64 = tmp_path / "amd64.tar"
+    build_archive(amd64, {"app:1": [b"shared", b"amd64-bin"]})
+    arm64 = tmp_path / "arm64.tar"
+    build_archive(arm64, {"app:1": [b"shared", b"arm64-bin"]})
+    output = tmp_path / "app__1__amd64-arm64.tar"
+
+    skipped = merge_to_oci_index(
+        [("linux/amd64", amd64), ("linux/arm64", arm64)], output, "app:1"
+    )
+
+    assert skipped == 1
+    with tarfile.open(output) as tar:
+        names = tar.getnames()
+        assert names.count(f"blobs/sha256/{hashlib.sha256(b'shared').hexdigest()}") == 1
+        top = json.load(tar.extractfile("index.json"))  # type: ignore[arg-type]
+        assert (
+            top["manifests"][0]["annotations"]["org.opencontainers.image.ref.name"]
+            == "1"
+        )
+
+        index_blob = top["manifests"][0]["digest"].split(":")[1]
+        index = json.load(tar.extractfile(f"blobs/sha256/{index_blob}"))  # type: ignore[arg-type]
+        platforms = [m["platform"]["architecture"] for m in index["manifests"]]
+        assert platforms == ["amd64", "arm64"]
+
+        manifest_blob = index["manifests"][1]["digest"].split(":")[1]
+        manifest = json.load(tar.extractfile(f"blobs/sha256/{manifest_blob}"))  # type: ignore[arg-type]
+        assert [layer["digest"] for layer in manifest["layers"]] == [
+            _digest(b"shared"),
+            _digest(b"arm64-bin"),
+        ]
+        assert manifest["layers"][0]["mediaType"].endswith(".tar")
+
+
+MANIFEST_DIGEST = _digest(b"manifest")
+
+
+MANIFEST_DIGEST = _digest(b"manifest")
+
+
+@pytest.mark.parametrize(
+    ("reference", "repo_tags", "annotations"),
+    [
+        (
+            "nginx",
+            ["docker.io/library/nginx:latest"],
+            {
+                "io.containerd.image.name": "docker.io/library/nginx:latest",
+                "org.opencontainers.image.ref.name": "latest",
+            },
+        ),
+        (
+            "localhost:5000/team/app:1.0",
+            ["localhost:5000/team/app:1.0"],
+            {
+                "io.containerd.image.name": "localhost:5000/team/app:1.0",
+                "org.opencontainers.image.ref.name": "1.0",
+            },
+        ),
+        (
+            f"nginx@{MANIFEST_DIGEST}",
+            [],
+            {"io.containerd.image.name": f"docker.io/library/nginx@{MANIFEST_DIGEST}"},
+        ),
+    ],
+)
+def test_layout_archive_normalizes_reference(
+    tmp_path: Path, reference: str, repo_tags: List[str], annotations: Dict[str, str]
+) -> None:
+    """docker save처럼 기본 태그를 붙인 표준 레퍼런스를 기록한다."""
+    layer = tmp_path / "layer"
+    layer.write_bytes(b"layer")
+    config = json.dumps({"rootfs": {"diff_ids": [_digest(b"layer")]}}).encode()
+    image: LayoutImage = {
+        "platform": "linux/amd64",
+        "config": config,
+        "layers": [
+            {
+                "path": layer,
+                "digest": _digest(b"layer"),
+                "size": 5,
+                "media_type": "application/vnd.oci.image.layer.v1.tar",
+            }
+        ],
+    }
+    output = tmp_path / "image.tar"
+
+    write_layout_archive([image], output, reference)
+
+    assert read_archive_images(output)[0]["repo_tags"] == repo_tags
+    with tarfile.open(output) as tar:
+        top = json.load(tar.extractfile("index.json"))  # type: ignore[arg-type]
+    assert top["manifests"][0]["annotations"] == annotations
@@ -0,0 +1,117 @@
+"""로컬 Docker 이미지 색인(자동완성) 테스트."""
+
+import subprocess
+from pathlib import Path
+from typing import Tuple
+from unittest import mock
+
+import pytest
+
+from cli_onprem.core.errors import CommandError
+from cli_onprem.services.docker import has_image_events
+from cli_onprem.services.image_index import ImageIndex, prefix_range
+
+IMAGES = [
+    "registry.local:5000/team/api:1.0",
+    "nginx:1.25",
+    "<none>:<none>",
+    "nginx:1.27",
+    "redis:7",
+]
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _index(
+    tmp_path: Path, clock: _Clock, changed: bool = False
+) -> Tuple[ImageIndex, mock.Mock, mock.Mock]:
+    list_images = mock.Mock(return_value=IMAGES)
+    check = mock.Mock(return_value=changed)
+    index = ImageIndex(
+        tmp_path / "index.json",
+        max_age=600,
+        list_images=list_images,
+        changed=check,
+        clock=clock,
+    )
+    return index, list_images, check
+
+
+def test_prefix_range() -> None:
+    images = ["nginx:1.25", "nginx:1.27", "nginxinc/unit:1", "redis:7"]
+
+    assert prefix_range(images, "nginx:") == ["nginx:1.25", "nginx:1.27"]
+    assert prefix_range(images, "") == images
+    assert prefix_range(images, "zz") == []
+
+
+def test_index_is_reused_until_images_change(tmp_path: Path) -> None:
+    clock = _Clock()
+    index, list_images, check = _index(tmp_path, clock)
+
+    assert index.complete("nginx") == ["nginx:1.25", "nginx:1.27"]
+    clock.now += 10
+    assert index.complete("registry.local:5000/") == [
+        "registry.local:5000/team/api:1.0"
+    ]
+
+    assert list_images.call_count == 1
+    check.assert_called_once_with(1000.0, 1010.0)
+
+
+def test_index_rebuilt_after_image_event(tmp_path: Path) -> None:
+    clock = _Clock()
+    _index(tmp_path, clock)[0].images()
+
+    clock.now += 10
+    index, list_images, _ = _index(tmp_path, clock, changed=True)
+    index.images()
+
+    assert list_images.call_count == 1
+
+
+def test_index_rebuilt_after_max_age(tmp_path: Path) -> None:
+    clock = _Clock()
+    _index(tmp_path, clock)[0].images()
+
+    clock.now += 3600
+    index, list_images, check = _index(tmp_path, clock)
+    assert "<none>:<none>" not in index.images()
+
+    check.assert_not_called()
+    assert list_images.call_count == 1
+
+
+def test_index_kept_when_event_check_fails(tmp_path: Path) -> None:
+    clock = _Clock()
+    _index(tmp_path, clock)[0].images()
+
+    index, list_images, check = _index(tmp_path, clock)
+    check.side_effect = CommandError("daemon down")
+
+    assert index.complete("redis") == ["redis:7"]
+    list_images.assert_not_called()
+
+
+def test_has_image_events() -> None:
+    with mock.patch("subprocess.run") as mock_run:
+        mock_run.return_value = subprocess.CompletedProcess([], 0, stdout="pull\n")
+        assert has_image_events(1000.0, 1010.5)
+
+        cmd = mock_run.call_args.args[0]
+        assert cmd[:2] == ["docker", "events"]
+        assert cmd[cmd.index("--until") + 1] == "1010.500"
+        assert "type=image" in cmd
+
+        mock_run.return_value = subprocess.CompletedProcess([], 0, stdout="")
+        assert not has_image_events(1000.0, 1010.5)
+
+        mock_run.side_effect = subprocess.CalledProcessError(1, [], stderr="err")
+        with pytest.raises(CommandError):
+            has_image_events(1000.0, 1010.5)
@@ -0,0 +1,107 @@
+"""이미지 레퍼런스 파서 테스트."""
+
+import pytest
+
+from cli_onprem.services.docker import (
+    _add_repo_tag_digest,
+    generate_tar_filename,
+    normalize_image_name,
+    parse_image_reference,
+)
+from cli_onprem.utils.image_ref import ImageRef, parse_image_ref, split_reference
+
+DIGEST = "sha256:" + "a" * 64
+
+
+@pytest.mark.parametrize(
+    "reference, expected",
+    [
+        ("nginx", ImageRef("docker.io", "library", "nginx")),
+        ("nginx:1.25", ImageRef("docker.io", "library", "nginx", "1.25")),
+        ("bitnami/redis:7", ImageRef("docker.io", "bitnami", "redis", "7")),
+        ("docker.io/nginx", ImageRef("docker.io", "library", "nginx")),
+        ("index.docker.io/user/app", ImageRef("docker.io", "user", "app")),
+        ("a/b/c", ImageRef("docker.io", "a", "b/c")),
+        ("localhost/app", ImageRef("localhost", "", "app")),
+        ("host:5000/img", ImageRef("host:5000", "", "img")),
+        ("host:5000/team/img:1.0", ImageRef("host:5000", "team", "img", "1.0")),
+        (
+            "ghcr.io/org/team/app:v1@" + DIGEST,
+            ImageRef("ghcr.io", "org", "team/app", "v1", DIGEST),
+        ),
+        ("nginx@" + DIGEST, ImageRef("docker.io", "library", "nginx", None, DIGEST)),
+    ],
+)
+def test_parse_image_ref(reference: str, expected: ImageRef) -> None:
+    """레지스트리 포트, 다이제스트, Docker Hub 기본값을 일관되게 해석한다."""
+    assert parse_image_ref(reference) == expected
+
+
+def test_image_ref_properties() -> None:
+    """경로/이름/정규화 문자열을 조합한다."""
+    ref = parse_image_ref("host:5000/img")
+    assert ref.path == "img"
+    assert ref.name == "host:5000/img"
+    assert ref.tag_or_digest == "latest"
+    assert ref.normalized() == "host:5000/img:latest"
+
+    pinned = parse_image_ref("nginx:1.25@" + DIGEST)
+    assert pinned.normalized() == "docker.io/library/nginx@" + DIGEST
+    assert pinned.tag_or_digest == DIGEST
+
+
+def test_parse_image_ref_is_cached() -> None:
+    """같은 레퍼런스는 캐시된 인스턴스를 반환한다."""
+    assert parse_image_ref("redis:7") is parse_image_ref("redis:7")
+
+
+def test_image_ref_has_slots() -> None:
+    """인스턴스마다 __dict__를 만들지 않는다."""
+    assert not hasattr(parse_image_ref("nginx"), "__dict__")
+
+
+def test_split_reference_keeps_raw_name() -> None:
+    """기본값 없이 원래 이름을 유지한다."""
+    assert split_reference("registry:5000/app:1") == ("registry:5000/app", "1", None)
+    assert split_reference("app@" + DIGEST) == ("app", None, DIGEST)
+
+
+def test_parse_image_reference_with_port() -> None:
+    """포트가 있는 레지스트리의 ':'을 태그로 잘못 나누지 않는다."""
+    assert parse_image_reference("host:5000/img") == (
+        "host:5000",
+        "library",
+        "img",
+        "latest",
+    )
+    assert parse_image_reference("host:5000/img:2") == (
+        "host:5000",
+        "library",
+        "img",
+        "2",
+    )
+
+
+def test_parse_image_reference_with_digest() -> None:
+    """다이제스트만 있으면 파일명에 쓸 수 있는 태그로 바꾼다."""
+    registry, namespace, image, tag = parse_image_reference("nginx@" + DIGEST)
+    assert (registry, namespace, image) == ("docker.io", "library", "nginx")
+    assert tag == "sha256-" + "a" * 64
+    filename = generate_tar_filename(registry, namespace, image, tag, "amd64")
+    assert ":" not in filename
+
+
+def test_normalize_image_name_canonical_docker_hub() -> None:
+    """docker.io/nginx와 nginx는 같은 이름으로 정규화된다."""
+    assert normalize_image_name("docker.io/nginx") == normalize_image_name("nginx")
+    assert normalize_image_name("host:5000/img") == "host:5000/img:latest"
+
+
+def test_add_repo_tag_digest_replaces_embedded_tag() -> None:
+    """저장소 값에 붙은 태그는 별도 tag 필드로 교체하고 포트는 유지한다."""
+    images: set = set()
+    _add_repo_tag_digest(images, "registry:5000/app", "1.0", None)
+    _add_repo_tag_digest(images, "nginx:1.0", "1.1", None)
+    _add_repo_tag_digest(images, "redis", None, DIGEST)
+
+    assert images == {"registry:5000/app:1.0", "nginx:1.1", "redis@" + DIGEST}
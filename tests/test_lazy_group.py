@@ -0,0 +1,66 @@
+"""하위 명령어 지연 로딩 테스트."""
+
+import subprocess
+import sys
+
+import click
+from typer.testing import CliRunner
+
+from cli_onprem.__main__ import LAZY_COMMANDS, app
+from cli_onprem.core.lazy_group import LazyTyperGroup
+
+runner = CliRunner()
+
+
+def _loaded_modules(*args: str) -> str:
+    """새 프로세스에서 명령어를 실행한 뒤 불러온 명령어 모듈과 boto3를 반환합니다."""
+    script = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from cli_onprem.__main__ import app\n"
+        f"CliRunner().invoke(app, {list(args)!r})\n"
+        "print(sorted(m for m in sys.modules "
+        "if m.startswith('cli_onprem.commands.') or m == 'boto3'))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return completed.stdout.strip()
+
+
+def test_help_lists_commands_without_importing_them() -> None:
+    assert _loaded_modules("--help") == "[]"
+
+
+def test_only_invoked_command_is_imported() -> None:
+    assert _loaded_modules("tar-fat32", "--help") == "['cli_onprem.commands.tar_fat32']"
+
+
+def test_help_shows_registered_summaries() -> None:
+    result = runner.invoke(app, ["--help"])
+
+    assert result.exit_code == 0
+    for name, spec in LAZY_COMMANDS.items():
+        assert name in result.stdout
+        assert spec["help"] in result.stdout
+
+
+def test_lazy_command_is_loaded_once() -> None:
+    class Group(LazyTyperGroup):
+        lazy_commands = {
+            "tar-fat32": {
+                "import_path": "cli_onprem.commands.tar_fat32:app",
+                "help": "파일 압축과 분할 관리",
+            }
+        }
+
+    group = Group(name="test")
+    ctx = click.Context(group)
+
+    assert group.list_commands(ctx) == ["tar-fat32"]
+    first = group.get_command(ctx, "tar-fat32")
+    assert isinstance(first, click.Group)
+    assert first.name == "tar-fat32"
+    assert "pack" in first.list_commands(ctx)
+    assert group.get_command(ctx, "tar-fat32") is first
+    assert group.get_command(ctx, "missing") is None
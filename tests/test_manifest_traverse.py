@@ -0,0 +1,127 @@
+"""매니페스트 순회(이미지 수집) 테스트."""
+
+from typing import Any, Dict
+
+import pytest
+
+from cli_onprem.services.docker import (
+    collect_images_from_document,
+    extract_images_from_yaml,
+)
+
+POD_SPEC = {
+    "initContainers": [{"name": "init", "image": "busybox:1.36"}],
+    "containers": [{"name": "app", "image": "nginx:1.25"}],
+    "ephemeralContainers": [{"name": "debug", "image": "alpine:3.19"}],
+}
+
+WORKLOADS = [
+    {"kind": "Pod", "spec": POD_SPEC},
+    {"kind": "Deployment", "spec": {"template": {"spec": POD_SPEC}}},
+    {
+        "kind": "CronJob",
+        "spec": {"jobTemplate": {"spec": {"template": {"spec": POD_SPEC}}}},
+    },
+    {
+        "kind": "CronWorkflow",
+        "spec": {
+            "workflowSpec": {
+                "templates": [
+                    {"container": {"image": "nginx:1.25"}},
+                    {"script": {"image": "busybox:1.36"}},
+                    {"sidecars": [{"image": "alpine:3.19"}]},
+                ]
+            }
+        },
+    },
+    {
+        "kind": "Prometheus",
+        "spec": {
+            "image": "nginx:1.25",
+            "thanos": {"image": "busybox:1.36"},
+            "containers": [{"name": "extra", "image": "alpine:3.19"}],
+        },
+    },
+]
+
+
+@pytest.mark.parametrize("doc", WORKLOADS, ids=lambda d: d["kind"])
+def test_fast_mode_matches_full_scan(doc: Dict[str, Any]) -> None:
+    """알려진 워크로드에서 빠른 모드와 전체 탐색 결과가 같다."""
+    fast: set = set()
+    full: set = set()
+    collect_images_from_document(doc, fast, fast=True)
+    collect_images_from_document(doc, full)
+
+    assert fast == full == {"busybox:1.36", "nginx:1.25", "alpine:3.19"}
+
+
+def test_fast_mode_skips_irrelevant_paths() -> None:
+    """빠른 모드는 워크로드의 metadata 등 컨테이너 외 경로를 보지 않는다."""
+    doc = {
+        "kind": "Deployment",
+        "metadata": {"annotations": {"image": "ignored:1"}},
+        "spec": {"template": {"spec": POD_SPEC}},
+    }
+    fast: set = set()
+    collect_images_from_document(doc, fast, fast=True)
+
+    assert "ignored:1" not in fast
+
+
+def test_fast_mode_skips_imageless_kinds_and_falls_back() -> None:
+    """이미지가 없는 kind는 건너뛰고, 알 수 없는 kind는 전체 탐색한다."""
+    config_map = {"kind": "ConfigMap", "data": {"image": "ignored:1"}}
+    custom = {"kind": "MyOperator", "spec": {"deep": {"agent": {"image": "x/y:1"}}}}
+    images: set = set()
+
+    collect_images_from_document(config_map, images, fast=True)
+    collect_images_from_document(custom, images, fast=True)
+
+    assert images == {"x/y:1"}
+
+
+def test_repository_tag_fields() -> None:
+    """repository + tag/digest 조합을 수집한다."""
+    doc = {
+        "image": {"repository": "bitnami/redis", "tag": "7.2"},
+        "sidecar": {"repository": "ghcr.io/org", "image": "agent", "version": "1"},
+        "pinned": {"repository": "nginx", "digest": "sha256:abc"},
+    }
+    images: set = set()
+    collect_images_from_document(doc, images)
+
+    assert images == {"bitnami/redis:7.2", "ghcr.io/org/agent:1", "nginx@sha256:abc"}
+
+
+def test_deeply_nested_document_does_not_recurse() -> None:
+    """재귀 한도보다 깊게 중첩된 문서도 순회한다."""
+    doc: Dict[str, Any] = {"image": "nginx:1.25"}
+    for _ in range(10_000):
+        doc = {"nested": [doc]}
+
+    images: set = set()
+    collect_images_from_document(doc, images)
+
+    assert images == {"nginx:1.25"}
+
+
+def test_extract_images_from_yaml_fast() -> None:
+    """fast 옵션이 YAML 추출까지 전달된다."""
+    content = """
+kind: Deployment
+metadata:
+  labels:
+    image: ignored
+spec:
+  template:
+    spec:
+      containers:
+        - image: nginx:1.25
+"""
+    assert extract_images_from_yaml(content, extract_from_text=False, fast=True) == [
+        "docker.io/library/nginx:1.25"
+    ]
+    assert "docker.io/library/ignored:latest" in extract_images_from_yaml(
+        content, extract_from_text=False
+    )
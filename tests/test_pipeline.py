@@ -0,0 +1,96 @@
+"""두 단계 파이프라인 실행기 테스트."""
+
+import threading
+import time
+from typing import List
+
+from cli_onprem.services.pipeline import format_stage_stats, run_two_stage
+
+
+def test_stages_overlap() -> None:
+    """1단계와 2단계가 겹쳐 실행되어 순차 실행보다 빠르다."""
+
+    def first(item: int) -> int:
+        time.sleep(0.05)
+        return item * 10
+
+    saved: List[int] = []
+
+    def second(item: int, result: int) -> None:
+        time.sleep(0.05)
+        saved.append(result)
+
+    report = run_two_stage(range(6), first, second, first_workers=1)
+
+    assert sorted(saved) == [0, 10, 20, 30, 40, 50]
+    # 순차 실행이면 0.6초, 파이프라인이면 약 0.35초
+    assert report["elapsed_seconds"] < 0.5
+    assert report["failures"] == {}
+    assert [s["completed"] for s in report["stages"]] == [6, 6]
+
+
+def test_bounded_queue_applies_backpressure() -> None:
+    """2단계가 느리면 1단계는 큐 크기 이상 앞서 나가지 않는다."""
+    lock = threading.Lock()
+    state = {"pulled": 0, "saved": 0, "ahead": 0}
+
+    def first(item: int) -> None:
+        with lock:
+            state["pulled"] += 1
+            state["ahead"] = max(state["ahead"], state["pulled"] - state["saved"])
+
+    def second(item: int, result: None) -> None:
+        time.sleep(0.02)
+        with lock:
+            state["saved"] += 1
+
+    report = run_two_stage(range(10), first, second, first_workers=2, queue_size=2)
+
+    # 큐 2개 + 1단계 작업자 2개 + 2단계 처리 중 1개
+    assert state["ahead"] <= 5
+    assert report["stages"][0]["blocked_seconds"] > 0
+
+
+def test_failures_are_isolated() -> None:
+    """한 항목의 실패는 기록되고 나머지는 계속 처리된다."""
+
+    def first(item: str) -> str:
+        if item == "bad-pull":
+            raise RuntimeError("pull 실패")
+        return item
+
+    saved: List[str] = []
+
+    def second(item: str, result: str) -> None:
+        if item == "bad-save":
+            raise RuntimeError("save 실패")
+        saved.append(item)
+
+    report = run_two_stage(["a", "bad-pull", "b", "bad-save"], first, second)
+
+    assert sorted(saved) == ["a", "b"]
+    assert report["failures"] == {1: ("pull", "pull 실패"), 3: ("save", "save 실패")}
+    assert report["stages"][0]["failed"] == 1
+    assert report["stages"][1]["failed"] == 1
+    assert report["stages"][1]["completed"] == 2
+
+
+def test_utilization_report() -> None:
+    """가동률은 0~1 범위이며 한 줄 요약으로 포맷팅된다."""
+    report = run_two_stage(
+        range(3), lambda item: time.sleep(0.01), lambda item, result: None
+    )
+
+    pull_stats, save_stats = report["stages"]
+    assert 0 < pull_stats["utilization"] <= 1
+    assert save_stats["workers"] == 1
+    line = format_stage_stats(pull_stats)
+    assert line.startswith("pull: 작업자 2개, 완료 3개, 실패 0개, 가동률 ")
+
+
+def test_empty_input() -> None:
+    """입력이 없으면 바로 끝난다."""
+    report = run_two_stage([], lambda item: item, lambda item, result: None)
+
+    assert report["failures"] == {}
+    assert [s["completed"] for s in report["stages"]] == [0, 0]
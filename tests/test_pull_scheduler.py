@@ -0,0 +1,266 @@
+"""레지스트리 인지형 pull 스케줄러 테스트."""
+
+import random
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Any, List
+from unittest import mock
+
+import pytest
+from typer.testing import CliRunner
+
+from cli_onprem.__main__ import app
+from cli_onprem.core.errors import PermanentError, TransientError
+from cli_onprem.services.pull_scheduler import (
+    PullScheduler,
+    TokenBucket,
+    is_rate_limited,
+)
+
+runner = CliRunner()
+
+
+class FakeClock:
+    """sleep 호출 시 시간이 흐르는 가짜 시계."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: List[float] = []
+        self._lock = threading.Lock()
+
+    def __call__(self) -> float:
+        with self._lock:
+            return self.now
+
+    def sleep(self, seconds: float) -> None:
+        with self._lock:
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+
+DOCKER_HUB_429 = (
+    "Error response from daemon: toomanyrequests: You have reached your pull rate "
+    "limit. You may increase the limit by authenticating and upgrading: "
+    "https://www.docker.com/increase-rate-limit"
+)
+
+
+def _rate_limit_error() -> TransientError:
+    return TransientError(
+        "rate limited", stderr="toomanyrequests: You have reached your pull rate limit"
+    )
+
+
+def test_is_rate_limited() -> None:
+    """429 계열 오류 출력을 판별한다."""
+    assert is_rate_limited("Error response: 429 Too Many Requests")
+    assert is_rate_limited("toomanyrequests: rate limit")
+    assert not is_rate_limited("connection reset by peer")
+    assert not is_rate_limited(None)
+    assert not is_rate_limited("manifest for app@sha256:0429ab unknown")
+
+
+def test_token_bucket_limits_rate() -> None:
+    """버스트 이후에는 rate에 맞춰 대기한다."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=clock, sleep=clock.sleep)
+
+    for _ in range(4):
+        bucket.acquire()
+
+    assert clock.sleeps == [0.5, 0.5]
+
+
+def test_rate_limit_triggers_shared_backoff() -> None:
+    """429를 받으면 같은 레지스트리의 다음 pull도 백오프 시각까지 기다린다."""
+    clock = FakeClock()
+    calls: List[str] = []
+
+    def fake_pull(reference: str, **kwargs: Any) -> None:
+        calls.append(reference)
+        if len(calls) == 1:
+            raise _rate_limit_error()
+
+    scheduler = PullScheduler(
+        registry_rate=0,
+        base_delay=10.0,
+        pull=fake_pull,
+        clock=clock,
+        sleep=clock.sleep,
+        rng=random.Random(0),
+    )
+
+    assert scheduler.pull("nginx:1.25") == 2
+    backoff = clock.now
+    assert 5.0 <= backoff <= 10.0
+
+    # 다른 이미지라도 같은 레지스트리면 백오프 종료 후에 시작된다
+    scheduler._registries["docker.io"].backoff_until = clock.now + 3.0
+    scheduler.pull("redis:7")
+    assert clock.now == pytest.approx(backoff + 3.0)
+    assert calls == ["nginx:1.25", "nginx:1.25", "redis:7"]
+
+
+def test_docker_hub_rate_limit_from_pull_image_triggers_backoff() -> None:
+    """실제 docker pull의 Docker Hub 레이트 리밋 출력도 공유 백오프를 시작한다."""
+    clock = FakeClock()
+    scheduler = PullScheduler(
+        registry_rate=0,
+        base_delay=10.0,
+        clock=clock,
+        sleep=clock.sleep,
+        rng=random.Random(0),
+    )
+    error = subprocess.CalledProcessError(1, ["docker", "pull"], stderr=DOCKER_HUB_429)
+
+    with mock.patch(
+        "cli_onprem.services.docker._run_pull", side_effect=[error, None]
+    ) as run_pull:
+        assert scheduler.pull("nginx:1.25") == 2
+
+    assert run_pull.call_count == 2
+    assert 5.0 <= clock.now <= 10.0
+
+
+def test_non_rate_limit_error_backs_off_worker_only() -> None:
+    """일반 일시적 오류는 레지스트리 백오프를 설정하지 않는다."""
+    clock = FakeClock()
+    attempts = []
+
+    def fake_pull(reference: str, **kwargs: Any) -> None:
+        attempts.append(kwargs)
+        if len(attempts) < 3:
+            raise TransientError("timeout", stderr="i/o timeout")
+
+    scheduler = PullScheduler(
+        registry_rate=0, pull=fake_pull, clock=clock, sleep=clock.sleep
+    )
+
+    assert scheduler.pull("nginx:1.25", arch="linux/arm64") == 3
+    assert scheduler._registries["docker.io"].backoff_until == 0.0
+    assert len(clock.sleeps) == 2
+    assert attempts[0] == {"arch": "linux/arm64", "max_retries": 0}
+
+
+def test_permanent_error_is_not_retried() -> None:
+    """영구 오류는 즉시 전달된다."""
+    fake_pull = mock.Mock(side_effect=PermanentError("denied"))
+    scheduler = PullScheduler(registry_rate=0, pull=fake_pull, sleep=mock.Mock())
+
+    with pytest.raises(PermanentError):
+        scheduler.pull("private.example.com/app:1")
+    assert fake_pull.call_count == 1
+
+
+def test_retries_exhausted() -> None:
+    """재시도 횟수를 넘기면 TransientError를 전달한다."""
+    fake_pull = mock.Mock(side_effect=_rate_limit_error())
+    clock = FakeClock()
+    scheduler = PullScheduler(
+        registry_rate=0, max_retries=2, pull=fake_pull, clock=clock, sleep=clock.sleep
+    )
+
+    with pytest.raises(TransientError):
+        scheduler.pull("nginx:1.25")
+    assert fake_pull.call_count == 3
+
+
+def test_registry_concurrency_limit() -> None:
+    """레지스트리별 동시 pull 수를 넘지 않는다."""
+    lock = threading.Lock()
+    active = {"docker.io": 0, "ghcr.io": 0}
+    peak = {"docker.io": 0, "ghcr.io": 0}
+
+    def fake_pull(reference: str, **kwargs: Any) -> None:
+        registry = "ghcr.io" if reference.startswith("ghcr.io") else "docker.io"
+        with lock:
+            active[registry] += 1
+            peak[registry] = max(peak[registry], active[registry])
+        time.sleep(0.02)
+        with lock:
+            active[registry] -= 1
+
+    scheduler = PullScheduler(registry_concurrency=2, registry_rate=0, pull=fake_pull)
+    references = [f"app{i}:1" for i in range(6)] + [
+        f"ghcr.io/org/app{i}:1" for i in range(6)
+    ]
+
+    results = scheduler.pull_all(references, max_workers=12)
+
+    assert [r["reference"] for r in results] == references
+    assert all(r["error"] is None for r in results)
+    assert peak == {"docker.io": 2, "ghcr.io": 2}
+
+
+def test_pull_all_collects_errors() -> None:
+    """한 이미지의 실패는 결과에 기록되고 나머지는 계속된다."""
+
+    def fake_pull(reference: str, **kwargs: Any) -> None:
+        if reference == "bad:1":
+            raise PermanentError("not found")
+
+    scheduler = PullScheduler(registry_rate=0, pull=fake_pull)
+
+    results = scheduler.pull_all(["good:1", "bad:1"])
+
+    assert results[0]["error"] is None
+    assert results[1]["error"] == "not found"
+
+
+def test_save_batch_command(tmp_path: Path) -> None:
+    """save-batch는 목록 파일의 이미지를 pull한 뒤 각각 저장한다."""
+    refs = tmp_path / "images.txt"
+    refs.write_text("# 주석\nnginx:1.25\n\nredis:7\nnginx:1.25\n")
+    dest = tmp_path / "out"
+
+    with mock.patch("cli_onprem.commands.docker_tar._check_docker_cli"):
+        with mock.patch(
+            "cli_onprem.commands.docker_tar.PullScheduler",
+            side_effect=lambda **kw: PullScheduler(
+                pull=mock.Mock(), **{**kw, "registry_rate": 0}
+            ),
+        ):
+            with mock.patch("cli_onprem.commands.docker_tar.save_image") as mock_save:
+                result = runner.invoke(
+                    app,
+                    [
+                        "docker-tar",
+                        "save-batch",
+                        "--file",
+                        str(refs),
+                        "--destination",
+                        str(dest),
+                    ],
+                )
+
+    assert result.exit_code == 0, result.output
+    # pull과 save가 파이프라인으로 겹쳐 실행되므로 순서는 보장되지 않는다
+    assert sorted(c.args for c in mock_save.call_args_list) == [
+        ("nginx:1.25", str(dest / "nginx__1.25__amd64.tar")),
+        ("redis:7", str(dest / "redis__7__amd64.tar")),
+    ]
+    assert "2/2개 이미지 저장 완료" in result.output
+    assert "pull: 작업자 4개, 완료 2개" in result.output
+    assert "save: 작업자 1개, 완료 2개" in result.output
+
+
+def test_save_batch_reports_failures(tmp_path: Path) -> None:
+    """실패한 이미지가 있으면 종료 코드 1."""
+    failing = mock.Mock(side_effect=PermanentError("이미지를 찾을 수 없습니다"))
+
+    with mock.patch("cli_onprem.commands.docker_tar._check_docker_cli"):
+        with mock.patch(
+            "cli_onprem.commands.docker_tar.PullScheduler",
+            side_effect=lambda **kw: PullScheduler(pull=failing, **kw),
+        ):
+            with mock.patch("cli_onprem.commands.docker_tar.save_image") as mock_save:
+                result = runner.invoke(
+                    app,
+                    ["docker-tar", "save-batch", "missing:1", "-d", str(tmp_path)],
+                )
+
+    assert result.exit_code == 1
+    assert "실패: missing:1 (pull 단계)" in result.output
+    mock_save.assert_not_called()
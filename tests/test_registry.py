@@ -0,0 +1,383 @@
+"""데몬 없는 레지스트리 직접 다운로드 테스트 (로컬 대역 레지스트리 사용)."""
+
+import gzip
+import hashlib
+import io
+import json
+import tarfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+from unittest import mock
+
+import pytest
+from typer.testing import CliRunner
+
+from cli_onprem.__main__ import app
+from cli_onprem.core.errors import CommandError, PermanentError
+from cli_onprem.services.blob_cache import BlobCache
+from cli_onprem.services.image_archive import read_archive_images
+from cli_onprem.services.registry import export_image, parse_registry_reference
+
+runner = CliRunner()
+
+TOKEN = "test-token"
+LAYER_GZIP = "application/vnd.docker.image.rootfs.diff.tar.gzip"
+MANIFEST_LIST = "application/vnd.docker.distribution.manifest.list.v2+json"
+
+
+def _digest(data: bytes) -> str:
+    return f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+
+def _layer(content: bytes) -> Tuple[bytes, str]:
+    """(gzip 레이어 블롭, 비압축 diff_id)를 만듭니다."""
+    raw = io.BytesIO()
+    with tarfile.open(fileobj=raw, mode="w") as tar:
+        info = tarfile.TarInfo("file.txt")
+        info.size = len(content)
+        tar.addfile(info, io.BytesIO(content))
+    return gzip.compress(raw.getvalue(), mtime=0), _digest(raw.getvalue())
+
+
+class FakeRegistry:
+    """Bearer 토큰 인증과 Range 요청을 지원하는 최소 레지스트리."""
+
+    def __init__(self) -> None:
+        self.blobs: Dict[str, bytes] = {}
+        self.manifests: Dict[str, Tuple[bytes, str]] = {}
+        self.requests: List[Tuple[str, str]] = []
+        self.interrupt_once: set = set()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.host = f"127.0.0.1:{self.server.server_address[1]}"
+
+    def add_image(self, repo: str, platform_layers: Dict[str, List[bytes]]) -> None:
+        """플랫폼별 이미지를 만들고 태그 1.0에 매니페스트 목록으로 등록합니다."""
+        entries = []
+        for platform, contents in platform_layers.items():
+            layers, diff_ids = [], []
+            for content in contents:
+                blob, diff_id = _layer(content)
+                self.blobs[_digest(blob)] = blob
+                layers.append(
+                    {
+                        "mediaType": LAYER_GZIP,
+                        "digest": _digest(blob),
+                        "size": len(blob),
+                    }
+                )
+                diff_ids.append(diff_id)
+            os_name, arch = platform.split("/")
+            config = json.dumps(
+                {
+                    "architecture": arch,
+                    "os": os_name,
+                    "rootfs": {"type": "layers", "diff_ids": diff_ids},
+                }
+            ).encode()
+            self.blobs[_digest(config)] = config
+            manifest = json.dumps(
+                {
+                    "schemaVersion": 2,
+                    "mediaType": "application/vnd.docker.distribution.manifest.v2+json",
+                    "config": {
+                        "mediaType": "application/vnd.docker.container.image.v1+json",
+                        "digest": _digest(config),
+                        "size": len(config),
+                    },
+                    "layers": layers,
+                }
+            ).encode()
+            media_type = "application/vnd.docker.distribution.manifest.v2+json"
+            self.manifests[f"{repo}@{_digest(manifest)}"] = (manifest, media_type)
+            entries.append(
+                {
+                    "mediaType": media_type,
+                    "digest": _digest(manifest),
+                    "size": len(manifest),
+                    "platform": {"os": os_name, "architecture": arch},
+                }
+            )
+
+        index = json.dumps(
+            {
+                "schemaVersion": 2,
+                "mediaType": MANIFEST_LIST,
+                "manifests": entries,
+            }
+        ).encode()
+        self.manifests[f"{repo}@1.0"] = (index, MANIFEST_LIST)
+
+    def _handler(self) -> Any:
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def _send(self, status: int, body: bytes, headers: Dict[str, str]) -> None:
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self) -> None:  # noqa: N802
+                registry.requests.append((self.path, self.headers.get("Range", "")))
+                if self.path.startswith("/token"):
+                    self._send(200, json.dumps({"token": TOKEN}).encode(), {})
+                    return
+
+                if self.headers.get("Authorization") != f"Bearer {TOKEN}":
+                    realm = f"http://{registry.host}/token"
+                    challenge = f'Bearer realm="{realm}",service="test"'
+                    self._send(401, b"{}", {"WWW-Authenticate": challenge})
+                    return
+
+                _, _, repo_path = self.path.partition("/v2/")
+                if "/manifests/" in repo_path:
+                    repo, _, ref = repo_path.partition("/manifests/")
+                    found = registry.manifests.get(f"{repo}@{ref}")
+                    if found is None:
+                        self._send(404, b"{}", {})
+                    else:
+                        self._send(200, found[0], {"Content-Type": found[1]})
+                    return
+
+                digest = repo_path.rpartition("/blobs/")[2]
+                blob = registry.blobs.get(digest)
+                if blob is None:
+                    self._send(404, b"{}", {})
+                    return
+
+                range_header = self.headers.get("Range")
+                if range_header:
+                    start = int(range_header.split("=")[1].rstrip("-"))
+                    self._send(206, blob[start:], {})
+                elif digest in registry.interrupt_once:
+                    registry.interrupt_once.discard(digest)
+                    # 전체 길이를 알린 뒤 절반만 보내고 연결을 끊는다
+                    self.send_response(200)
+                    self.send_header("Content-Length", str(len(blob)))
+                    self.end_headers()
+                    self.wfile.write(blob[: len(blob) // 2])
+                    self.wfile.flush()
+                    self.close_connection = True
+                else:
+                    self._send(200, blob, {})
+
+        return Handler
+
+
+@pytest.fixture
+def fake_registry() -> Iterator[FakeRegistry]:
+    registry = FakeRegistry()
+    thread = threading.Thread(target=registry.server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield registry
+    finally:
+        registry.server.shutdown()
+        registry.server.server_close()
+
+
+def test_parse_registry_reference() -> None:
+    """레지스트리, 저장소, 태그/다이제스트를 분해한다."""
+    assert parse_registry_reference("nginx") == ("docker.io", "library/nginx", "latest")
+    assert parse_registry_reference("bitnami/redis:7") == (
+        "docker.io",
+        "bitnami/redis",
+        "7",
+    )
+    assert parse_registry_reference("localhost:5000/team/app") == (
+        "localhost:5000",
+        "team/app",
+        "latest",
+    )
+    assert parse_registry_reference("ghcr.io/org/app@sha256:abc") == (
+        "ghcr.io",
+        "org/app",
+        "sha256:abc",
+    )
+
+
+def test_export_single_platform_with_resume(
+    fake_registry: FakeRegistry, tmp_path: Path
+) -> None:
+    """토큰 인증 후 플랫폼을 골라 내려받고, 끊긴 블롭은 Range로 이어받는다."""
+    fake_registry.add_image(
+        "team/app",
+        {"linux/amd64": [b"base", b"amd64"], "linux/arm64": [b"base", b"arm64"]},
+    )
+    big_blob, _ = _layer(b"arm64")
+    fake_registry.interrupt_once.add(_digest(big_blob))
+    reference = f"{fake_registry.host}/team/app:1.0"
+    output = tmp_path / "app.tar"
+    progress = []
+
+    with mock.patch("cli_onprem.services.registry.time.sleep"):
+        result = export_image(
+            reference,
+            ["linux/arm64"],
+            output,
+            insecure=True,
+            on_progress=lambda done, total: progress.append((done, total)),
+        )
+
+    assert result["blobs"] == 2
+    assert progress[-1] == (2, 2)
+    images = read_archive_images(output)
+    assert images[0]["repo_tags"] == [reference]
+    assert images[0]["diff_ids"] == [_layer(b"base")[1], _layer(b"arm64")[1]]
+    assert any(
+        path.endswith(_digest(big_blob)) and header.startswith("bytes=")
+        for path, header in fake_registry.requests
+    )
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["app.tar"]
+
+
+def test_export_multi_platform_oci(fake_registry: FakeRegistry, tmp_path: Path) -> None:
+    """여러 플랫폼은 공유 레이어를 한 번만 담은 OCI 인덱스로 작성한다."""
+    fake_registry.add_image(
+        "team/app",
+        {"linux/amd64": [b"base", b"amd64"], "linux/arm64": [b"base", b"arm64"]},
+    )
+    output = tmp_path / "app.tar"
+
+    result = export_image(
+        f"{fake_registry.host}/team/app:1.0",
+        ["linux/amd64", "linux/arm64"],
+        output,
+        docker_manifest=False,
+        insecure=True,
+    )
+
+    assert result["blobs"] == 3
+    base_hex = _digest(_layer(b"base")[0]).split(":")[1]
+    with tarfile.open(output) as tar:
+        names = tar.getnames()
+        top = json.load(tar.extractfile("index.json"))  # type: ignore[arg-type]
+    assert "manifest.json" not in names
+    assert names.count(f"blobs/sha256/{base_hex}") == 1
+    assert top["manifests"][0]["mediaType"].endswith("image.index.v1+json")
+
+
+def test_export_missing_platform(fake_registry: FakeRegistry, tmp_path: Path) -> None:
+    """요청 플랫폼이 없으면 사용 가능한 플랫폼과 함께 PermanentError."""
+    fake_registry.add_image("team/app", {"linux/amd64": [b"base"]})
+
+    with pytest.raises(PermanentError, match="linux/amd64"):
+        export_image(
+            f"{fake_registry.host}/team/app:1.0",
+            ["linux/arm64"],
+            tmp_path / "app.tar",
+            insecure=True,
+        )
+
+
+def test_export_corrupted_blob(fake_registry: FakeRegistry, tmp_path: Path) -> None:
+    """다이제스트와 다른 블롭은 거부하고 출력과 임시 파일을 남기지 않는다."""
+    fake_registry.add_image("team/app", {"linux/amd64": [b"base"]})
+    digest = _digest(_layer(b"base")[0])
+    fake_registry.blobs[digest] = b"x" * len(fake_registry.blobs[digest])
+
+    with pytest.raises(CommandError, match="무결성"):
+        export_image(
+            f"{fake_registry.host}/team/app:1.0",
+            ["linux/amd64"],
+            tmp_path / "app.tar",
+            insecure=True,
+        )
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_export_reuses_blob_cache(fake_registry: FakeRegistry, tmp_path: Path) -> None:
+    """공유 레이어는 캐시에서 재사용하고 새 레이어만 내려받는다."""
+    fake_registry.add_image("team/app", {"linux/amd64": [b"base", b"app-v1"]})
+    fake_registry.add_image("team/other", {"linux/amd64": [b"base", b"other"]})
+    cache = BlobCache(tmp_path / "cache")
+
+    export_image(
+        f"{fake_registry.host}/team/app:1.0",
+        ["linux/amd64"],
+        tmp_path / "app.tar",
+        insecure=True,
+        cache=cache,
+    )
+    fake_registry.requests.clear()
+    result = export_image(
+        f"{fake_registry.host}/team/other:1.0",
+        ["linux/amd64"],
+        tmp_path / "other.tar",
+        insecure=True,
+        cache=cache,
+    )
+
+    base_digest = _digest(_layer(b"base")[0])
+    assert result["cached_blobs"] == 1
+    assert not any(path.endswith(base_digest) for path, _ in fake_registry.requests)
+    assert (
+        read_archive_images(tmp_path / "other.tar")[0]["diff_ids"][0]
+        == (_layer(b"base")[1])
+    )
+
+
+def test_export_resumes_cached_partial(
+    fake_registry: FakeRegistry, tmp_path: Path
+) -> None:
+    """이전 실행이 남긴 .partial 파일은 Range 요청으로 이어받는다."""
+    fake_registry.add_image("team/app", {"linux/amd64": [b"base" * 100]})
+    blob = _layer(b"base" * 100)[0]
+    cache = BlobCache(tmp_path / "cache")
+    target = cache.path_for(_digest(blob))
+    target.parent.mkdir(parents=True)
+    target.with_name(target.name + ".partial").write_bytes(blob[:10])
+
+    result = export_image(
+        f"{fake_registry.host}/team/app:1.0",
+        ["linux/amd64"],
+        tmp_path / "app.tar",
+        insecure=True,
+        cache=cache,
+    )
+
+    assert result["downloaded_bytes"] == len(blob) - 10
+    assert (f"/v2/team/app/blobs/{_digest(blob)}", "bytes=10-") in (
+        fake_registry.requests
+    )
+    assert target.read_bytes() == blob
+
+
+def test_save_daemonless_command(
+    fake_registry: FakeRegistry, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """save --daemonless는 Docker 없이 아카이브를 작성하고 블롭을 캐시한다."""
+    fake_registry.add_image("team/app", {"linux/amd64": [b"base", b"app"]})
+    monkeypatch.setenv("CLI_ONPREM_CONFIG_DIR", str(tmp_path / "config"))
+    dest = tmp_path / "out"
+
+    with mock.patch("cli_onprem.commands.docker_tar._check_docker_cli") as check:
+        result = runner.invoke(
+            app,
+            [
+                "docker-tar",
+                "save",
+                f"{fake_registry.host}/team/app:1.0",
+                "--daemonless",
+                "--insecure-registry",
+                "--destination",
+                str(dest),
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    check.assert_not_called()
+    saved = list(dest.glob("*.tar"))
+    assert len(saved) == 1
+    assert read_archive_images(saved[0])[0]["repo_tags"] == [
+        f"{fake_registry.host}/team/app:1.0"
+    ]
+    cached = list((tmp_path / "config" / "cache" / "blobs" / "sha256").iterdir())
+    assert len(cached) == 2
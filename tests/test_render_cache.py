@@ -0,0 +1,181 @@
+"""helm-local 렌더링 캐시 테스트."""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator
+from unittest import mock
+
+import pytest
+from typer.testing import CliRunner
+
+from cli_onprem.__main__ import app
+from cli_onprem.services.render_cache import (
+    RenderCache,
+    render_cache_key,
+)
+
+runner = CliRunner()
+
+OPTIONS = {"normalize": True, "fast": False}
+
+
+@pytest.fixture(autouse=True)
+def fixed_helm_version() -> Iterator[None]:
+    with mock.patch(
+        "cli_onprem.services.render_cache.get_helm_version", return_value="v3.14.0"
+    ):
+        yield
+
+
+@pytest.fixture
+def chart_dir(tmp_path: Path) -> Path:
+    chart = tmp_path / "chart"
+    (chart / "templates").mkdir(parents=True)
+    (chart / "Chart.yaml").write_text("name: app\nversion: 1.0.0\n")
+    (chart / "values.yaml").write_text("image: nginx:1.25\n")
+    (chart / "templates" / "deploy.yaml").write_text("image: {{ .Values.image }}\n")
+    return chart
+
+
+def test_cache_key_tracks_content(chart_dir: Path, tmp_path: Path) -> None:
+    """차트/values 내용과 옵션이 바뀌면 키가 바뀐다."""
+    values = tmp_path / "prod.yaml"
+    values.write_text("image: nginx:1.26\n")
+    key = render_cache_key(chart_dir, [values], OPTIONS)
+
+    assert key == render_cache_key(chart_dir, [values], OPTIONS)
+    assert key != render_cache_key(chart_dir, [values], {**OPTIONS, "fast": True})
+    assert key != render_cache_key(chart_dir, [], OPTIONS)
+
+    values.write_text("image: nginx:1.27\n")
+    assert key != render_cache_key(chart_dir, [values], OPTIONS)
+
+    (chart_dir / "templates" / "deploy.yaml").write_text("image: changed\n")
+    assert render_cache_key(chart_dir, [values], OPTIONS) not in (key, None)
+
+
+def test_cache_key_requires_readable_inputs(chart_dir: Path, tmp_path: Path) -> None:
+    """차트나 values 파일이 없으면 캐시를 사용하지 않는다."""
+    assert render_cache_key(tmp_path / "missing.tgz", [], OPTIONS) is None
+    assert render_cache_key(chart_dir, [tmp_path / "missing.yaml"], OPTIONS) is None
+
+
+def test_vendored_subchart_edit_changes_key(chart_dir: Path) -> None:
+    """charts/ 아래 서브차트나 Chart.lock이 바뀌면 키가 바뀐다."""
+    subchart = chart_dir / "charts" / "sub"
+    (subchart / "templates").mkdir(parents=True)
+    (subchart / "Chart.yaml").write_text("name: sub\nversion: 0.1.0\n")
+    (subchart / "values.yaml").write_text("image: nginx:1.0\n")
+    key = render_cache_key(chart_dir, [], OPTIONS)
+
+    (subchart / "values.yaml").write_text("image: nginx:2.0\n")
+    edited = render_cache_key(chart_dir, [], OPTIONS)
+    assert edited not in (key, None)
+
+    (chart_dir / "Chart.lock").write_text("dependencies: []\n")
+    assert render_cache_key(chart_dir, [], OPTIONS) not in (edited, None)
+
+
+def test_render_cache_roundtrip(tmp_path: Path) -> None:
+    """저장한 이미지 목록과 매니페스트를 다시 읽는다."""
+    cache = RenderCache(root=tmp_path / "render", store_manifest=True)
+
+    assert cache.get("k1") is None
+    cache.put("k1", "chart", ["docker.io/library/nginx:1.25"], "kind: Pod\n")
+
+    assert cache.get("k1") == ["docker.io/library/nginx:1.25"]
+    assert cache.get_manifest("k1") == "kind: Pod\n"
+    assert not list((tmp_path / "render").glob(".*.tmp"))
+
+
+def test_render_cache_concurrent_put_same_key(tmp_path: Path) -> None:
+    """여러 스레드가 같은 키를 동시에 저장해도 임시 파일이 겹치지 않는다."""
+    cache = RenderCache(root=tmp_path / "render")
+    barrier = threading.Barrier(2, timeout=5)
+    real_replace = os.replace
+
+    def _replace(src: Path, dst: Path) -> None:
+        # 두 스레드가 모두 임시 파일을 쓴 뒤에 교체하도록 맞춤
+        barrier.wait()
+        real_replace(src, dst)
+
+    with mock.patch("cli_onprem.services.render_cache.os.replace", _replace):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(cache.put, "k1", "chart", ["nginx:1.25"])
+                for _ in range(2)
+            ]
+            for future in futures:
+                future.result()
+
+    assert cache.get("k1") == ["nginx:1.25"]
+    assert not list((tmp_path / "render").glob(".*.tmp"))
+
+
+def test_render_cache_ignores_corrupt_entry(tmp_path: Path) -> None:
+    """손상된 항목은 캐시 미스로 처리한다."""
+    root = tmp_path / "render"
+    root.mkdir()
+    (root / "k1.json").write_text("{not json")
+
+    assert RenderCache(root=root).get("k1") is None
+
+
+def test_render_cache_lru_eviction(tmp_path: Path) -> None:
+    """크기 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제한다."""
+    root = tmp_path / "render"
+    cache = RenderCache(root=root, max_bytes=600)
+    images = [f"registry.example.com/app-{i}:1.0" for i in range(5)]
+
+    cache.put("old", "chart", images)
+    cache.put("used", "chart", images)
+    os.utime(root / "old.json", (1, 1))
+    os.utime(root / "used.json", (2, 2))
+    assert cache.get("used") is not None  # 사용 시각 갱신
+
+    cache.put("new", "chart", images)
+
+    assert cache.get("old") is None
+    assert cache.get("used") is not None
+    assert cache.get("new") is not None
+
+
+def _invoke(chart: Path, *extra: str) -> mock.MagicMock:
+    with mock.patch("cli_onprem.services.helm.check_helm_installed"):
+        with mock.patch(
+            "cli_onprem.services.helm.prepare_chart", return_value=chart
+        ) as mock_prepare:
+            with mock.patch(
+                "cli_onprem.services.helm.render_template",
+                return_value="image: nginx:1.25\n",
+            ):
+                result = runner.invoke(
+                    app,
+                    [
+                        "helm-local",
+                        "extract-images",
+                        str(chart),
+                        "--skip-dependency-update",
+                        "--json",
+                        *extra,
+                    ],
+                )
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.stdout) == ["docker.io/library/nginx:1.25"]
+    return mock_prepare
+
+
+def test_extract_images_uses_render_cache(
+    chart_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """두 번째 실행은 렌더링 없이 캐시에서 출력하고, --no-cache는 우회한다."""
+    monkeypatch.setenv("CLI_ONPREM_CONFIG_DIR", str(tmp_path / "config"))
+
+    assert _invoke(chart_dir).call_count == 1
+    assert list((tmp_path / "config" / "cache" / "render").glob("*.json"))
+
+    assert _invoke(chart_dir).call_count == 0
+    assert _invoke(chart_dir, "--no-cache").call_count == 1
@@ -0,0 +1,232 @@
+"""boto3 병렬 sync 엔진 테스트 (moto S3 사용)."""
+
+import os
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Iterator, List
+from unittest import mock
+
+import pytest
+from botocore.exceptions import ClientError
+from typer.testing import CliRunner
+
+from cli_onprem.__main__ import app
+from cli_onprem.core.errors import CLIError
+from cli_onprem.services.s3 import (
+    DEFAULT_MAX_ATTEMPTS,
+    create_s3_client,
+    create_transfer_config,
+    sync_pool_size,
+    sync_to_s3,
+)
+from cli_onprem.services.sync_state import SyncState
+from cli_onprem.utils.hash import calculate_file_md5
+
+runner = CliRunner()
+
+CREDENTIALS = """
+test-profile:
+  aws_access_key: testing
+  aws_secret_key: testing
+  region: us-east-1
+  bucket: test-bucket
+  prefix: share
+"""
+
+
+@pytest.fixture
+def s3_client(monkeypatch: pytest.MonkeyPatch) -> Iterator[Any]:
+    moto = pytest.importorskip("moto")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with moto.mock_aws():
+        client = create_s3_client(
+            "testing", "testing", "us-east-1", max_pool_connections=sync_pool_size(4)
+        )
+        client.create_bucket(Bucket="test-bucket")
+        yield client
+
+
+def _keys(client: Any, prefix: str = "") -> List[str]:
+    response = client.list_objects_v2(Bucket="test-bucket", Prefix=prefix)
+    return sorted(obj["Key"] for obj in response.get("Contents", []))
+
+
+def _make_tree(root: Path) -> Path:
+    (root / "sub").mkdir(parents=True)
+    (root / "a.txt").write_text("a")
+    (root / "sub" / "b.txt").write_text("b")
+    # 멀티파트 업로드 경로 확인용 (파트 크기 5MB보다 큼)
+    (root / "big.bin").write_bytes(b"x" * (6 * 1024 * 1024))
+    return root
+
+
+def test_sync_uploads_in_parallel_then_skips(s3_client: Any, tmp_path: Path) -> None:
+    src = _make_tree(tmp_path / "src")
+    config = create_transfer_config(chunk_size=5 * 1024 * 1024, part_concurrency=2)
+
+    result = sync_to_s3(
+        s3_client, src, "test-bucket", "data/", workers=4, transfer_config=config
+    )
+
+    assert result == (3, 0, 0)
+    assert _keys(s3_client) == ["data/a.txt", "data/big.bin", "data/sub/b.txt"]
+
+    (src / "a.txt").write_text("changed")
+    # 멀티파트로 올린 big.bin도 같은 파트 크기의 ETag를 계산해 변경 없음으로 판단
+    assert sync_to_s3(
+        s3_client, src, "test-bucket", "data/", workers=4, transfer_config=config
+    ) == (1, 2, 0)
+
+
+def test_sync_delete_removes_stale_objects(s3_client: Any, tmp_path: Path) -> None:
+    src = _make_tree(tmp_path / "src")
+    s3_client.put_object(Bucket="test-bucket", Key="data/old.txt", Body=b"old")
+
+    result = sync_to_s3(s3_client, src, "test-bucket", "data/", delete=True)
+
+    assert result == (3, 0, 1)
+    assert "data/old.txt" not in _keys(s3_client)
+
+
+def test_sync_client_uses_botocore_standard_retries() -> None:
+    with mock.patch("boto3.client") as mock_client:
+        create_s3_client("key", "secret", "us-east-1", max_pool_connections=32)
+
+    config = mock_client.call_args.kwargs["config"]
+    assert config.max_pool_connections == 32
+    assert config.retries == {"max_attempts": DEFAULT_MAX_ATTEMPTS, "mode": "standard"}
+
+
+def test_sync_permanent_error_is_not_retried(s3_client: Any, tmp_path: Path) -> None:
+    src = _make_tree(tmp_path / "src")
+    denied = ClientError(
+        {"Error": {"Code": "AccessDenied", "Message": "Access Denied"}}, "PutObject"
+    )
+
+    with mock.patch.object(s3_client, "upload_file", side_effect=denied) as upload:
+        with pytest.raises(CLIError, match="3개 파일 업로드 실패"):
+            sync_to_s3(s3_client, src, "test-bucket", "data/")
+
+    assert upload.call_count == 3
+
+
+def test_sync_failure_skips_delete(s3_client: Any, tmp_path: Path) -> None:
+    src = _make_tree(tmp_path / "src")
+    s3_client.put_object(Bucket="test-bucket", Key="data/old.txt", Body=b"old")
+
+    def _upload(path: Path, key: str, size: int) -> None:
+        if key.endswith("b.txt"):
+            raise RuntimeError("denied")
+
+    with pytest.raises(CLIError, match="1개 파일 업로드 실패.*data/sub/b.txt"):
+        sync_to_s3(
+            s3_client,
+            src,
+            "test-bucket",
+            "data/",
+            delete=True,
+            upload_callback=_upload,
+        )
+
+    assert "data/old.txt" in _keys(s3_client)
+
+
+def _no_hashing() -> ExitStack:
+    stack = ExitStack()
+    for name in ("calculate_file_md5", "calculate_multipart_etag"):
+        stack.enter_context(
+            mock.patch(
+                f"cli_onprem.utils.hash.{name}",
+                side_effect=AssertionError("파일을 다시 읽음"),
+            )
+        )
+    return stack
+
+
+def test_sync_state_skips_unchanged_files_without_hashing(
+    s3_client: Any, tmp_path: Path
+) -> None:
+    src = _make_tree(tmp_path / "src")
+    # 다른 도구로 이미 올라간 파일도 한 번 해시로 확인한 뒤에는 메타데이터로 판단
+    s3_client.put_object(Bucket="test-bucket", Key="data/a.txt", Body=b"a")
+
+    with SyncState(tmp_path / "state.db") as state:
+        result = sync_to_s3(s3_client, src, "test-bucket", "data/", state=state)
+        assert result == (2, 1, 0)
+        with _no_hashing():
+            result = sync_to_s3(s3_client, src, "test-bucket", "data/", state=state)
+        assert result == (0, 3, 0)
+
+        # 내용은 같고 mtime만 바뀐 파일은 한 번 다시 해시하고 업로드하지 않음
+        os.utime(src / "a.txt")
+        with mock.patch(
+            "cli_onprem.utils.hash.calculate_file_md5", wraps=calculate_file_md5
+        ) as md5:
+            result = sync_to_s3(s3_client, src, "test-bucket", "data/", state=state)
+        assert result == (0, 3, 0)
+        assert md5.call_count == 1
+
+
+def test_sync_state_rehash(s3_client: Any, tmp_path: Path) -> None:
+    src = _make_tree(tmp_path / "src")
+
+    with SyncState(tmp_path / "state.db") as state:
+        sync_to_s3(s3_client, src, "test-bucket", "data/", state=state)
+        with mock.patch(
+            "cli_onprem.utils.hash.calculate_file_md5", wraps=calculate_file_md5
+        ) as md5:
+            result = sync_to_s3(
+                s3_client, src, "test-bucket", "data/", state=state, rehash=True
+            )
+
+    # 기본 설정(8MB 기준)에서는 big.bin도 단일 업로드라 세 파일 모두 MD5 계산
+    assert result == (0, 3, 0)
+    assert md5.call_count == 3
+
+
+def test_sync_command_boto3_engine(
+    s3_client: Any, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("CLI_ONPREM_CONFIG_DIR", str(tmp_path))
+    (tmp_path / "credential.yaml").write_text(CREDENTIALS)
+    src = _make_tree(tmp_path / "src")
+
+    args = [
+        "s3-share",
+        "sync",
+        str(src),
+        "--profile",
+        "test-profile",
+        "--engine",
+        "boto3",
+        "--parallel",
+        "4",
+    ]
+    result = runner.invoke(app, args)
+
+    assert result.exit_code == 0, result.output
+    assert "업로드 3개" in result.stdout
+    keys = _keys(s3_client, "share/")
+    assert len(keys) == 3
+    assert all(key.startswith("share/cli-onprem-") for key in keys)
+    assert (tmp_path / "cache" / "sync-state.db").exists()
+
+    with _no_hashing():
+        result = runner.invoke(app, args)
+    assert result.exit_code == 0, result.output
+    assert "변경 없음 3개" in result.stdout
+
+    result = runner.invoke(app, [*args, "--rehash"])
+    assert result.exit_code == 0, result.output
+    assert "업로드 0개, 변경 없음 3개" in result.stdout
+
+
+def test_sync_command_boto3_engine_rejects_aws_args(tmp_path: Path) -> None:
+    result = runner.invoke(
+        app,
+        ["s3-share", "sync", str(tmp_path), "--engine", "boto3", "--", "--size-only"],
+    )
+
+    assert result.exit_code == 1
+    assert "--size-only" in result.stdout
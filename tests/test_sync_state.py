@@ -0,0 +1,46 @@
+"""sync 로컬 상태 DB 테스트."""
+
+import os
+from pathlib import Path
+
+from cli_onprem.services.sync_state import SyncState, open_sync_state
+
+
+def test_digest_is_invalidated_when_metadata_changes(tmp_path: Path) -> None:
+    file_path = tmp_path / "a.txt"
+    file_path.write_text("a")
+
+    with SyncState(tmp_path / "state.db") as state:
+        stat = file_path.stat()
+        state.store_digest(file_path, stat, 0, "md5-a")
+        assert state.digest(file_path, stat, 0) == "md5-a"
+        assert state.digest(file_path, stat, 8 * 1024 * 1024) is None
+
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert state.digest(file_path, file_path.stat(), 0) is None
+
+
+def test_uploaded_etag_is_scoped_by_destination(tmp_path: Path) -> None:
+    file_path = tmp_path / "a.txt"
+    file_path.write_text("a")
+    stat = file_path.stat()
+
+    with SyncState(tmp_path / "state.db") as state:
+        state.record_upload("bucket", "data/a.txt", file_path, stat, "etag-1")
+
+        assert state.uploaded_etag("bucket", "data/a.txt", file_path, stat) == "etag-1"
+        assert state.uploaded_etag("other", "data/a.txt", file_path, stat) is None
+        other = tmp_path / "b.txt"
+        other.write_text("a")
+        assert state.uploaded_etag("bucket", "data/a.txt", other, stat) is None
+
+    # 다시 열어도 유지
+    with SyncState(tmp_path / "state.db") as state:
+        assert state.uploaded_etag("bucket", "data/a.txt", file_path, stat) == "etag-1"
+
+
+def test_open_sync_state_failure_returns_none(tmp_path: Path) -> None:
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+
+    assert open_sync_state(blocker / "state.db") is None
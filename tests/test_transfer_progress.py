@@ -0,0 +1,252 @@
+"""docker pull/save 진행률 및 처리량 리포트 테스트."""
+
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import List
+from unittest import mock
+
+import pytest
+from typer.testing import CliRunner
+
+from cli_onprem.__main__ import app
+from cli_onprem.core.errors import CommandError
+from cli_onprem.services.docker import PullProgressParser, save_image
+from cli_onprem.utils.progress import TransferReporter, format_transfer_report
+from cli_onprem.utils.shell import stream_command_lines, stream_command_output
+
+runner = CliRunner()
+
+
+def test_pull_progress_parser() -> None:
+    """레이어 상태 줄로 완료/전체 레이어 수를 계산한다."""
+    parser = PullProgressParser()
+    lines = [
+        "1.25: Pulling from library/nginx",
+        "a1b2c3d4e5f6: Pulling fs layer",
+        "b2c3d4e5f6a7: Already exists",
+        "a1b2c3d4e5f6: Downloading",
+        "a1b2c3d4e5f6: Pull complete",
+        "Digest: sha256:abc",
+    ]
+
+    changed = [parser.feed(line) for line in lines]
+
+    assert changed == [False, True, True, False, True, False]
+    assert (parser.completed, parser.total) == (2, 2)
+
+
+def test_stream_command_output(tmp_path: Path) -> None:
+    """명령 출력을 파일로 스트리밍하며 누적 바이트를 알린다."""
+    dest = tmp_path / "out.bin"
+    seen = []
+
+    with open(dest, "wb") as f:
+        total = stream_command_output(
+            [sys.executable, "-c", "import sys; sys.stdout.write('x' * 5000)"],
+            f,
+            on_bytes=seen.append,
+            chunk_size=1024,
+        )
+
+    assert total == 5000
+    assert dest.read_bytes() == b"x" * 5000
+    assert seen[-1] == 5000
+
+
+def test_stream_command_lines_failure() -> None:
+    """실패한 명령은 stderr를 담은 CalledProcessError를 발생시킨다."""
+    cmd = [sys.executable, "-c", "import sys; print('a'); sys.exit('boom')"]
+    lines = []
+
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        stream_command_lines(cmd, lines.append)
+
+    assert lines == ["a"]
+    assert "boom" in exc_info.value.stderr
+
+
+def test_stream_command_timeout(tmp_path: Path) -> None:
+    """타임아웃이 지나면 프로세스를 종료하고 CommandError를 발생시킨다."""
+    with open(tmp_path / "out.bin", "wb") as f:
+        with pytest.raises(CommandError, match="타임아웃"):
+            stream_command_output(
+                [sys.executable, "-c", "import time; time.sleep(5)"], f, timeout=1
+            )
+
+
+@pytest.mark.parametrize("error", [KeyboardInterrupt(), OSError(28, "No space")])
+def test_save_image_progress_interrupted_leaves_no_archive(
+    tmp_path: Path, error: BaseException
+) -> None:
+    """진행률 저장이 중단되면 잘린 tar가 최종 이름으로 남지 않는다."""
+    output = tmp_path / "app.tar"
+
+    def interrupted(cmd: List[str], f: io.BufferedWriter, **kwargs: object) -> int:
+        f.write(b"x" * 1024)
+        raise error
+
+    with mock.patch(
+        "cli_onprem.services.docker.stream_command_output", side_effect=interrupted
+    ):
+        with pytest.raises(type(error)):
+            save_image("app:1", str(output), on_progress=lambda total: None)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_save_image_progress_replaces_on_success(tmp_path: Path) -> None:
+    """끝까지 기록한 경우에만 최종 경로로 교체한다."""
+    output = tmp_path / "app.tar"
+
+    def complete(cmd: List[str], f: io.BufferedWriter, **kwargs: object) -> int:
+        f.write(b"x" * 1024)
+        return 1024
+
+    with mock.patch(
+        "cli_onprem.services.docker.stream_command_output", side_effect=complete
+    ):
+        save_image("app:1", str(output), on_progress=lambda total: None)
+
+    assert list(tmp_path.iterdir()) == [output]
+    assert output.read_bytes() == b"x" * 1024
+
+
+def test_transfer_reporter_report() -> None:
+    """pull 시간은 누적되고 save 처리량이 계산된다."""
+    reporter = TransferReporter(show_progress=False)
+    reporter.record_pull("app:1", "linux/amd64", 1.0)
+    reporter.record_pull("app:1", "linux/amd64", 0.5)
+
+    report = reporter.record_save("app:1", "linux/amd64", None, 2.0, 4 * 1024 * 1024)
+
+    assert report["pull_seconds"] == 1.5
+    assert report["save_mb_per_sec"] == 2.0
+    assert reporter.reports == [report]
+    assert format_transfer_report(report) == (
+        "app:1 (linux/amd64): pull 1.5s, save 2.0s, 4.0MB, 2.0MB/s"
+    )
+
+
+def test_transfer_reporter_progress_to_stderr_console() -> None:
+    """진행률 표시는 전달된 콘솔에만 출력된다."""
+    buffer = io.StringIO()
+    from rich.console import Console
+
+    console = Console(file=buffer, force_terminal=True)
+    with TransferReporter(show_progress=True, console=console) as reporter:
+        reporter.pull_progress("app:1", "linux/amd64", 1, 2)
+        reporter.save_progress("app:1", "linux/amd64", 0.0, 1024)
+
+    assert "pull app:1" in buffer.getvalue()
+
+
+def test_save_report_jsonl(tmp_path: Path) -> None:
+    """--report-jsonl은 이미지별 pull/save 리포트를 기록한다."""
+    report_file = tmp_path / "report.jsonl"
+
+    def fake_save(reference: str, output_path: str, **kwargs: object) -> None:
+        Path(output_path).write_bytes(b"x" * 2048)
+        on_progress = kwargs.get("on_progress")
+        if callable(on_progress):
+            on_progress(2048)
+
+    with mock.patch("cli_onprem.commands.docker_tar._check_docker_cli"):
+        with mock.patch("cli_onprem.commands.docker_tar.pull_image") as mock_pull:
+            with mock.patch(
+                "cli_onprem.commands.docker_tar.save_image", side_effect=fake_save
+            ):
+                result = runner.invoke(
+                    app,
+                    [
+                        "docker-tar",
+                        "save",
+                        "app:1",
+                        "--destination",
+                        str(tmp_path),
+                        "--no-progress",
+                        "--report-jsonl",
+                        str(report_file),
+                    ],
+                )
+
+    assert result.exit_code == 0, result.output
+    assert mock_pull.call_args.kwargs["on_progress"] is None
+    records = [json.loads(line) for line in report_file.read_text().splitlines()]
+    assert len(records) == 1
+    assert records[0]["reference"] == "app:1"
+    assert records[0]["platform"] == "linux/amd64"
+    assert records[0]["size_bytes"] == 2048
+    assert records[0]["output"] == str(tmp_path / "app__1__amd64.tar")
+    assert "app:1 (linux/amd64): pull" in result.output
+
+
+@pytest.mark.parametrize(
+    ("extra_args", "patched", "return_value", "expected"),
+    [
+        (
+            ["--known-layers", "known.txt"],
+            "create_thin_archive",
+            {"omitted": []},
+            ["app__1__amd64.tar"],
+        ),
+        (
+            ["--arch", "linux/amd64,linux/arm64", "--oci-index"],
+            "merge_to_oci_index",
+            0,
+            ["app__1__amd64-arm64.tar", "app__1__amd64-arm64.tar"],
+        ),
+    ],
+)
+def test_save_report_jsonl_records_final_path(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    extra_args: List[str],
+    patched: str,
+    return_value: object,
+    expected: List[str],
+) -> None:
+    """임시 파일을 거쳐 변환하는 경우에도 리포트에는 최종 아카이브 경로를 기록한다."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "known.txt").write_text("")
+    report_file = tmp_path / "report.jsonl"
+
+    def fake_save(reference: str, output_path: str, **kwargs: object) -> None:
+        Path(output_path).write_bytes(b"x" * 1024)
+        on_progress = kwargs.get("on_progress")
+        if callable(on_progress):
+            on_progress(1024)
+
+    with mock.patch("cli_onprem.commands.docker_tar._check_docker_cli"):
+        with mock.patch("cli_onprem.commands.docker_tar.pull_platforms"):
+            with mock.patch("cli_onprem.commands.docker_tar.pull_image"):
+                with mock.patch(
+                    "cli_onprem.commands.docker_tar.save_image", side_effect=fake_save
+                ):
+                    with mock.patch(
+                        f"cli_onprem.services.image_archive.{patched}",
+                        return_value=return_value,
+                    ):
+                        result = runner.invoke(
+                            app,
+                            [
+                                "docker-tar",
+                                "save",
+                                "app:1",
+                                "--destination",
+                                str(tmp_path),
+                                "--no-progress",
+                                "--report-jsonl",
+                                str(report_file),
+                                *extra_args,
+                            ],
+                        )
+
+    assert result.exit_code == 0, result.output
+    records = [json.loads(line) for line in report_file.read_text().splitlines()]
+    assert [record["output"] for record in records] == [
+        str(tmp_path / name) for name in expected
+    ]
+    assert all(record["size_bytes"] == 1024 for record in records)
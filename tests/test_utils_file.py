@@ -3,7 +3,18 @@
 import tempfile
 from pathlib import Path
 
-from cli_onprem.utils.file import ensure_dir, extract_tar, read_yaml, write_yaml
+import pytest
+import yaml
+
+from cli_onprem.utils import file
+from cli_onprem.utils.file import (
+    ensure_dir,
+    extract_tar,
+    load_yaml,
+    load_yaml_all,
+    read_yaml,
+    write_yaml,
+)
 
 
 def test_read_yaml_success() -> None:
@@ -143,3 +154,62 @@ def test_ensure_dir_with_file_path() -> None:
         except Exception:
             # 예외가 발생하면 테스트 통과
             pass
+
+
+def test_load_yaml_uses_c_loader_when_available() -> None:
+    """libyaml이 있으면 C 로더를, 없으면 순수 Python 로더를 사용한다."""
+    if yaml.__with_libyaml__:
+        assert file.SafeLoader is yaml.CSafeLoader
+    else:
+        assert file.SafeLoader is yaml.SafeLoader
+
+
+def test_load_yaml_all_matches_safe_load_all() -> None:
+    """C 로더 결과가 yaml.safe_load_all과 같다."""
+    content = """
+---
+apiVersion: v1
+kind: Pod
+spec:
+  containers:
+    - image: nginx:1.25
+      ports: [80, 443]
+      enabled: yes
+      ratio: 0.5
+---
+# 빈 문서
+---
+created: 2024-01-01
+"""
+    assert list(load_yaml_all(content)) == list(yaml.safe_load_all(content))
+    assert load_yaml("a: [1, 2]") == {"a": [1, 2]}
+
+
+def test_load_yaml_rejects_unsafe_tags() -> None:
+    """임의 객체 생성 태그는 거부한다."""
+    with pytest.raises(yaml.YAMLError):
+        load_yaml("!!python/object/apply:os.system ['true']")
+
+
+def test_extract_tar_rejects_path_traversal() -> None:
+    """상위 디렉터리로 벗어나는 항목이 있으면 아무것도 추출하지 않음."""
+    import io
+    import tarfile
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir_path = Path(tmpdir)
+        tar_path = tmpdir_path / "evil.tar"
+        with tarfile.open(tar_path, "w") as tar:
+            for name in ("ok.txt", "../escaped.txt"):
+                info = tarfile.TarInfo(name)
+                info.size = 2
+                tar.addfile(info, io.BytesIO(b"hi"))
+
+        extract_dir = tmpdir_path / "extracted"
+        extract_dir.mkdir()
+
+        with pytest.raises(ValueError, match="안전하지 않은"):
+            extract_tar(tar_path, extract_dir)
+
+        assert not (extract_dir / "ok.txt").exists()
+        assert not (tmpdir_path / "escaped.txt").exists()
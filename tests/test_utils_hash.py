@@ -8,6 +8,7 @@ from unittest import mock
 from cli_onprem.utils.hash import (
     calculate_file_md5,
     calculate_file_sha256,
+    calculate_multipart_etag,
     verify_file_md5,
     verify_file_sha256,
 )
@@ -150,3 +151,15 @@ def test_verify_file_sha256_failure() -> None:
             assert result is False
         finally:
             file_path.unlink()
+
+
+def test_calculate_multipart_etag(tmp_path: Path) -> None:
+    """멀티파트 ETag 계산 테스트."""
+    file_path = tmp_path / "big.bin"
+    file_path.write_bytes(b"a" * 10 + b"b" * 5)
+
+    parts = [hashlib.md5(b"a" * 10).digest(), hashlib.md5(b"b" * 5).digest()]
+    expected = f"{hashlib.md5(b''.join(parts)).hexdigest()}-2"
+
+    assert calculate_multipart_etag(file_path, 10, chunk_size=4) == expected
+    assert calculate_multipart_etag(tmp_path / "missing", 10) is None